@@ -0,0 +1,51 @@
+import sys
+import os
+import glob
+import argparse
+
+# Configurar path para importaciones
+script_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(script_dir)
+
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from source.registro_partidas import leer_partidas
+from source.transcripcion import convertir_archivos, escribir_transcripcion
+
+
+def crear_parser() -> argparse.ArgumentParser:
+    """Construye el parser de argumentos del conversor."""
+    parser = argparse.ArgumentParser(
+        description="Convierte entre transcripciones de texto y registros binarios de partidas.")
+    sub = parser.add_subparsers(dest='comando', required=True)
+
+    importar = sub.add_parser('importar', help="texto -> registros binarios")
+    importar.add_argument('archivos', nargs='+', help="archivos o patrones (p. ej. 'partidas/*.mat')")
+    importar.add_argument('-o', '--salida', required=True)
+    importar.add_argument('-t', '--trabajadores', type=int, default=None,
+                          help="procesos a usar (por defecto, uno por núcleo)")
+
+    exportar = sub.add_parser('exportar', help="registros binarios -> texto")
+    exportar.add_argument('registros')
+    exportar.add_argument('-o', '--salida', required=True)
+    return parser
+
+
+def main(argumentos=None):
+    """Función principal: ejecuta la conversión pedida e informa el resultado."""
+    args = crear_parser().parse_args(argumentos)
+    if args.comando == 'importar':
+        rutas = [ruta for patron in args.archivos for ruta in (sorted(glob.glob(patron)) or [patron])]
+        cantidad, errores = convertir_archivos(rutas, args.salida, trabajadores=args.trabajadores)
+        for ruta, mensaje in errores:
+            print(f"{ruta}: {mensaje}", file=sys.stderr)
+        print(f"Partidas importadas: {cantidad}  archivos con errores: {len(errores)}")
+    else:
+        with open(args.salida, 'w', encoding='utf-8') as destino:
+            cantidad = escribir_transcripcion(leer_partidas(args.registros), destino)
+        print(f"Partidas exportadas: {cantidad}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+import sys
+import os
+import argparse
+
+# Configurar path para importaciones
+script_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(script_dir)
+
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from source.entrenamiento import EntrenadorTD
+from source.evaluador_red import EvaluadorRed
+
+
+def crear_parser() -> argparse.ArgumentParser:
+    """Construye el parser de argumentos del entrenamiento."""
+    parser = argparse.ArgumentParser(
+        description="Entrena la red evaluadora por autojuego con TD(λ).")
+    parser.add_argument('-n', '--partidas', type=int, default=10_000)
+    parser.add_argument('-t', '--trabajadores', type=int, default=None,
+                        help="procesos de autojuego (por defecto, uno por núcleo)")
+    parser.add_argument('--pesos', default=None,
+                        help="archivo .npz desde el que continuar (por defecto, red aleatoria)")
+    parser.add_argument('--ocultas', type=int, default=40,
+                        help="neuronas ocultas de una red nueva")
+    parser.add_argument('-o', '--salida', default='checkpoints',
+                        help="directorio de checkpoints")
+    parser.add_argument('--alfa', type=float, default=0.1)
+    parser.add_argument('--lambda', dest='lambda_', type=float, default=0.7)
+    parser.add_argument('--intervalo-checkpoint', type=int, default=1000)
+    parser.add_argument('--intervalo-referencia', type=int, default=1000,
+                        help="partidas entre mediciones contra la heurística (0 = no medir)")
+    parser.add_argument('--partidas-referencia', type=int, default=200)
+    parser.add_argument('-s', '--semilla', type=int, default=0)
+    return parser
+
+
+def _imprimir(reporte):
+    """Imprime una línea de progreso (y la medición contra la referencia, si la hay)."""
+    print(f"partidas: {reporte.partidas:>8}  partidas/hora: {reporte.partidas_por_hora:>10.0f}  "
+          f"error TD: {reporte.error_td:.4f}")
+    if reporte.referencia is not None:
+        ref = reporte.referencia
+        print(f"  referencia: {ref.victorias}/{ref.partidas} victorias "
+              f"({ref.porcentaje_victorias:.1f}%)  puntos/partida: {ref.puntos_por_partida:+.3f}")
+
+
+def main(argumentos=None):
+    """Función principal: entrena e imprime el progreso."""
+    args = crear_parser().parse_args(argumentos)
+    if args.pesos:
+        red = EvaluadorRed.cargar(args.pesos)
+    else:
+        red = EvaluadorRed.aleatoria(ocultas=args.ocultas, semilla=args.semilla)
+    entrenador = EntrenadorTD(red, alfa=args.alfa, lambda_=args.lambda_,
+                              trabajadores=args.trabajadores, semilla=args.semilla,
+                              directorio_checkpoints=args.salida,
+                              intervalo_checkpoint=args.intervalo_checkpoint,
+                              intervalo_referencia=args.intervalo_referencia,
+                              partidas_referencia=args.partidas_referencia)
+
+    impresos = []
+
+    def progreso(reporte):
+        if reporte.referencia is not None:
+            _imprimir(reporte)
+            impresos.append(reporte)
+
+    final = entrenador.entrenar(args.partidas, callback=progreso)
+    if final is not None and final not in impresos[-1:]:
+        _imprimir(final)
+    os.makedirs(args.salida, exist_ok=True)
+    red.guardar(os.path.join(args.salida, 'red_final.npz'))
+
+
+if __name__ == "__main__":
+    main()
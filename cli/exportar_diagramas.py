@@ -0,0 +1,86 @@
+import sys
+import os
+import argparse
+
+# Configurar path para importaciones
+script_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(script_dir)
+
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+from game.board_renderer import export_positions
+from source.id_posicion import posicion_desde_id
+
+
+def crear_parser() -> argparse.ArgumentParser:
+    """Construye el parser de argumentos del exportador."""
+    parser = argparse.ArgumentParser(
+        description="Dibuja posiciones como imágenes PNG, sin pantalla (driver de video 'dummy').")
+    parser.add_argument('entrada',
+                        help="archivo con un Position ID por línea, opcionalmente seguido del "
+                             "turno ('blancas' o 'negras'); '-' lee de la entrada estándar")
+    parser.add_argument('-o', '--salida', required=True, help="directorio de las imágenes")
+    parser.add_argument('--ancho', type=int, default=960)
+    parser.add_argument('--alto', type=int, default=600)
+    parser.add_argument('-t', '--trabajadores', type=int, default=None,
+                        help="procesos a usar (por defecto, uno por núcleo)")
+    return parser
+
+
+def nombre_imagen(identificador: str, turno: str) -> str:
+    """Nombre del PNG de una posición: el ID en base64 'url-safe' (sin '/') y el turno."""
+    seguro = identificador.replace('+', '-').replace('/', '_')
+    return f"{seguro}-{turno}.png"
+
+
+def leer_posiciones(lineas, directorio: str) -> tuple[list, list]:
+    """
+    Interpreta las líneas de entrada (se ignoran las vacías y las que empiezan con '#').
+
+    Returns:
+        tuple[list, list]: ([(ruta del PNG, Posicion), ...], [(número de línea, mensaje), ...]).
+    """
+    items, errores = [], []
+    for numero, linea in enumerate(lineas, start=1):
+        campos = linea.split()
+        if not campos or campos[0].startswith('#'):
+            continue
+        identificador = campos[0]
+        turno = campos[1] if len(campos) > 1 else 'blancas'
+        if turno not in ('blancas', 'negras'):
+            errores.append((numero, f"turno inválido: '{turno}'"))
+            continue
+        try:
+            posicion = posicion_desde_id(identificador, turno)
+        except ValueError as e:
+            errores.append((numero, str(e)))
+            continue
+        items.append((os.path.join(directorio, nombre_imagen(identificador, turno)), posicion))
+    return items, errores
+
+
+def main(argumentos=None):
+    """Función principal: lee las posiciones, las exporta en paralelo e informa el resultado."""
+    args = crear_parser().parse_args(argumentos)
+    if args.entrada == '-':
+        items, errores = leer_posiciones(sys.stdin, args.salida)
+    else:
+        with open(args.entrada, encoding='utf-8') as archivo:
+            items, errores = leer_posiciones(archivo, args.salida)
+    for numero, mensaje in errores:
+        print(f"{args.entrada}:{numero}: {mensaje}", file=sys.stderr)
+
+    os.makedirs(args.salida, exist_ok=True)
+    fallidas = export_positions(items, width=args.ancho, height=args.alto,
+                                workers=args.trabajadores)
+    for ruta, mensaje in fallidas:
+        print(f"{ruta}: {mensaje}", file=sys.stderr)
+    print(f"Imágenes exportadas: {len(items) - len(fallidas)}  "
+          f"errores: {len(errores) + len(fallidas)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+import sys
+import os
+import asyncio
+import argparse
+
+# Configurar path para importaciones
+script_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(script_dir)
+
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from source.servidor import ServidorPartidas
+
+
+def crear_parser() -> argparse.ArgumentParser:
+    """Construye el parser de argumentos del servidor."""
+    parser = argparse.ArgumentParser(
+        description="Servidor TCP de partidas (una petición JSON por línea).")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('-p', '--puerto', type=int, default=8765)
+    parser.add_argument('--inactividad', type=float, default=600.0,
+                        help="segundos sin uso tras los que se desaloja una sesión")
+    parser.add_argument('--max-sesiones', type=int, default=10_000)
+    parser.add_argument('--profundidad', type=int, default=1,
+                        help="profundidad del motor para el comando 'sugerir'")
+    parser.add_argument('--almacen', default=None,
+                        help="archivo SQLite de posiciones analizadas para 'sugerir'")
+    return parser
+
+
+async def _servir(args):
+    servidor = ServidorPartidas(host=args.host, puerto=args.puerto,
+                                max_inactividad=args.inactividad,
+                                max_sesiones=args.max_sesiones,
+                                profundidad_motor=args.profundidad,
+                                ruta_almacen=args.almacen)
+    host, puerto = await servidor.iniciar()
+    print(f"Escuchando en {host}:{puerto}")
+    await servidor.servir_para_siempre()
+
+
+def main(argumentos=None):
+    """Función principal: atiende conexiones hasta Ctrl+C."""
+    args = crear_parser().parse_args(argumentos)
+    try:
+        asyncio.run(_servir(args))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+import sys
+import os
+import argparse
+
+# Configurar path para importaciones
+script_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(script_dir)
+
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from source.torneo import Torneo, ESTRATEGIAS
+
+
+def crear_parser() -> argparse.ArgumentParser:
+    """Construye el parser de argumentos del torneo."""
+    parser = argparse.ArgumentParser(
+        description="Juega partidas automáticas entre dos estrategias sin interfaz.")
+    parser.add_argument('-a', '--estrategia-a', default='heuristica', choices=sorted(ESTRATEGIAS))
+    parser.add_argument('-b', '--estrategia-b', default='aleatoria', choices=sorted(ESTRATEGIAS))
+    parser.add_argument('-n', '--partidas', type=int, default=100)
+    parser.add_argument('-t', '--trabajadores', type=int, default=None,
+                        help="procesos a usar (por defecto, uno por núcleo)")
+    parser.add_argument('-s', '--semilla', type=int, default=0)
+    parser.add_argument('--sin-alternar', action='store_true',
+                        help="la estrategia A juega siempre con blancas")
+    return parser
+
+
+def main(argumentos=None):
+    """Función principal: juega el torneo e imprime el resumen."""
+    args = crear_parser().parse_args(argumentos)
+    torneo = Torneo(args.estrategia_a, args.estrategia_b, partidas=args.partidas,
+                    trabajadores=args.trabajadores, semilla=args.semilla,
+                    alternar=not args.sin_alternar)
+    resumen = torneo.ejecutar()
+
+    for clave, nombre in (('a', args.estrategia_a), ('b', args.estrategia_b)):
+        print(f"{clave.upper()} {nombre:<15} victorias: {resumen.victorias[clave]:>6}  "
+              f"gammons: {resumen.gammons[clave]:>5}  backgammons: {resumen.backgammons[clave]:>5}  "
+              f"puntos: {resumen.puntos[clave]:>6}")
+    print(f"Partidas: {resumen.partidas}  turnos medios: {resumen.turnos_medios:.1f}  "
+          f"tiempo: {resumen.segundos:.2f}s  partidas/s: {resumen.partidas_por_segundo:.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,12 +2,27 @@
 import os
 import pygame
 from source.backgammon import Backgammon
+from game.board_renderer import ROOT, BoardRenderer, C_BG, C_N1, C_N2, C_N3
 
+SND = os.path.join(ROOT, "assets", "sound")
+
+SOUND_FILES = {
+    "button": "button.wav",
+    "cheer":  "cheer.wav",
+    "dice":   "dice.wav",
+    "impact": "impact.wav",
+    "home":   "todashome.mp3",
+    "win":    "win.mp3",
+}
 
 class GameUI:
     """UI de Backgammon con Pygame - Drag & Drop funcional"""
 
-    def __init__(self, game: Backgammon, width=1440, height=900):
+    # Evento del temporizador que despierta el bucle solo mientras hay animaciones
+    ANIM_TICK = pygame.USEREVENT + 1
+    ANIM_FPS  = 60
+
+    def __init__(self, game: Backgammon, width=1440, height=900, cache_dir=None):
         self.game = game
 
         # --- Pygame ---
@@ -19,64 +34,44 @@ class GameUI:
 
         # --- Ventana ---
         self.w, self.h = width, height
-        self.screen = pygame.display.set_mode((self.w, self.h))
+        self.screen = pygame.display.set_mode((self.w, self.h), pygame.RESIZABLE)
         pygame.display.set_caption("Backgammon - Computación 2025")
 
         # --- Paleta ---
-        self.C_BG = (9, 14, 28)
-        self.C_N1 = (234, 0, 217)
-        self.C_N2 = (10, 189, 198)
-        self.C_N3 = (113, 28, 145)
+        self.C_BG = C_BG
+        self.C_N1 = C_N1
+        self.C_N2 = C_N2
+        self.C_N3 = C_N3
 
         # --- Fuentes ---
         self.font_title = pygame.font.SysFont("freesansbold", 72, bold=True)
         self.font_hud   = pygame.font.SysFont("consolas", 24)
 
-        # --- Rutas de assets ---
-        ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-        IMG  = os.path.join(ROOT, "assets", "images")
-        SND  = os.path.join(ROOT, "assets", "sound")
-
-        # --- Texturas del tablero ---
-        self.img_wood         = self._load_img(os.path.join(IMG, "wood.png"))
-        self.img_line         = self._load_img(os.path.join(IMG, "v-line.png"))
-        self.img_tri_top_dark = self._load_img(os.path.join(IMG, "row1-triangle-dark.png"))
-        self.img_tri_top_light= self._load_img(os.path.join(IMG, "row1-triangle-light.png"))
-        self.img_tri_bot_dark = self._load_img(os.path.join(IMG, "row2-triangle-dark.png"))
-        self.img_tri_bot_light= self._load_img(os.path.join(IMG, "row2-triangle-light.png"))
-
-        # --- Piezas (con fallback si no están los PNG) ---
-        self.piece_white = (
-            self._load_img(os.path.join(IMG, "piece-white-2.png")) or
-            self._load_img(os.path.join(IMG, "piece-white.png")) or
-            self._create_fallback_piece((255, 255, 255))
-        )
-        self.piece_black = (
-            self._load_img(os.path.join(IMG, "piece-black-2.png")) or
-            self._load_img(os.path.join(IMG, "piece-black.png")) or
-            self._create_fallback_piece((50, 50, 50))
-        )
-
-        # --- Sonidos ---
-        self.snd_button = self._load_snd(os.path.join(SND, "button.wav"))
-        self.snd_cheer  = self._load_snd(os.path.join(SND, "cheer.wav"))
-        self.snd_dice   = self._load_snd(os.path.join(SND, "dice.wav"))
-        self.snd_impact = self._load_snd(os.path.join(SND, "impact.wav"))
-        self.snd_home   = self._load_snd(os.path.join(SND, "todashome.mp3"))
-        self.snd_win    = self._load_snd(os.path.join(SND, "win.mp3"))
-
-        # --- Geometría del tablero ---
-        self.board_rect = pygame.Rect(0, 0, int(self.w * 0.92), int(self.h * 0.78))
-        self.board_rect.center = (self.w // 2, self.h // 2 + 20)
-        self.col_w   = self.board_rect.width / 12.0
-        self.mid_gap = max(30, int(self.board_rect.height * 0.08))
-
-        # Escalado de imágenes según geometría
-        self._scale_board_assets()
-
-        # --- Apilado de fichas ---
-        ph = self.piece_white.get_height()
-        self.stack_gap = ph * 0.8  # superposición para que entren más
+        # --- Sonidos (se cargan la primera vez que suenan) ---
+        self._sounds = {}
+
+        # --- Capas cacheadas (se reconstruyen solo al cambiar el tamaño) ---
+        self._glow_cache   = {}     # (w, h) -> Surface del resaltado de un destino
+
+        # --- Repintado por regiones sucias ---
+        self._full_redraw = True    # repintar y presentar la ventana completa
+        self._dirty       = []      # rects a repintar en el próximo frame
+        self._drag_rect   = None    # última región ocupada por la ficha arrastrada
+        self._anim_rects  = []      # regiones animadas en el frame anterior
+
+        # --- Copia del estado del core (se relee solo cuando cambia su versión) ---
+        self._state_version = None
+        self._pos        = [0] * 24
+        self._barra      = {"blancas": 0, "negras": 0}
+        self._fuera      = {"blancas": 0, "negras": 0}
+        self._turno      = "blancas"
+        self._pendientes = []
+        self._hud_surf   = None
+        self._anim_timer = False    # ANIM_TICK activo
+
+        # --- Geometría del tablero, imágenes escaladas y capas (BoardRenderer) ---
+        self.renderer = BoardRenderer(self.w, self.h, cache_dir)
+        self._apply_geometry()
 
         # --- Drag & Drop ---
         self.dragging     = False
@@ -106,27 +101,6 @@ class GameUI:
         self._win_sound_played  = False
         self._win_who          = None
 
-        # --- Dígitos de dados (para mostrar pendientes / animación) ---
-        self.dice_digits = {}
-        for i in range(1, 7):
-            img = self._load_img(os.path.join(IMG, f"digit-{i}-white.png"))
-            if img:
-                self.dice_digits[i] = img
-
-    def _create_fallback_piece(self, color):
-        """Crea una pieza simple si no hay imagen"""
-        surf = pygame.Surface((40, 40), pygame.SRCALPHA)
-        pygame.draw.circle(surf, color, (20, 20), 18)
-        pygame.draw.circle(surf, (0, 0, 0), (20, 20), 18, 2)
-        return surf
-
-    def _load_img(self, path):
-        if os.path.exists(path):
-            try:
-                return pygame.image.load(path).convert_alpha()
-            except Exception:
-                pass
-        return None
 
     def _load_snd(self, path):
         if os.path.exists(path):
@@ -136,82 +110,132 @@ class GameUI:
                 pass
         return None
 
-    def _scale_board_assets(self):
-        if self.img_wood:
-            self.img_wood = pygame.transform.smoothscale(
-                self.img_wood, (self.board_rect.width, self.board_rect.height)
-            )
+    def _play(self, name):
+        """Reproduce un sonido; se decodifica (los MP3 cuestan) la primera vez que suena."""
+        if name not in self._sounds:
+            self._sounds[name] = self._load_snd(os.path.join(SND, SOUND_FILES[name]))
+        snd = self._sounds[name]
+        if snd:
+            try:
+                snd.play()
+            except Exception:
+                pass
 
-        half_h = (self.board_rect.height - self.mid_gap) // 2
+    def _apply_geometry(self):
+        """Toma la geometría del renderer (hit-testing, hints, alertas) y limpia las capas propias."""
+        r = self.renderer
+        self.board_rect = r.board_rect
+        self.col_w      = r.col_w
+        self.mid_gap    = r.mid_gap
+        self.piece_white, self.piece_black = r.piece_white, r.piece_black
+        self._glow_cache.clear()
+        self._invalidate()
+
+    def _on_resize(self, width, height):
+        """Ventana redimensionada: nueva superficie, geometría y capas."""
+        self.w, self.h = max(width, 640), max(height, 400)
+        self.screen = pygame.display.set_mode((self.w, self.h), pygame.RESIZABLE)
+        self.renderer.resize(self.w, self.h)
+        self._apply_geometry()
+
+    # ---------------- Regiones sucias ----------------
+
+    def _invalidate(self, rect=None):
+        """Marca una región para repintar; sin rect, la ventana completa."""
+        if rect is None:
+            self._full_redraw = True
+        else:
+            self._dirty.append(pygame.Rect(rect))
 
-        def scale_tri(img, target_h):
-            if not img:
-                return None
-            w = int(self.col_w * 0.8)
-            h = int(target_h * 0.95)
-            return pygame.transform.smoothscale(img, (w, h))
+    def _dice_rect(self):
+        """Región de los dados (hasta 4 pendientes, abajo a la derecha)."""
+        cell, pad, spacing = 64, 10, 10
+        w = 4 * (cell + spacing) + pad + 8
+        return pygame.Rect(self.w - w, self.h - (cell + pad) - 4, w, cell + pad + 4)
 
-        self.img_tri_top_dark = scale_tri(self.img_tri_top_dark, half_h)
-        self.img_tri_top_light = scale_tri(self.img_tri_top_light, half_h)
-        self.img_tri_bot_dark = scale_tri(self.img_tri_bot_dark, half_h)
-        self.img_tri_bot_light = scale_tri(self.img_tri_bot_light, half_h)
+    def _alert_rect(self):
+        """Región del cartel '¡TODAS EN HOME!' (incluye el glow del título)."""
+        panel_w = int(self.board_rect.width * 0.55)
+        rect = pygame.Rect(0, 0, panel_w, 110)
+        rect.center = self.board_rect.center
+        return rect.inflate(16, 60)
 
-        if self.img_line:
-            self.img_line = pygame.transform.smoothscale(self.img_line, (2, self.board_rect.height))
+    def _animation_rects(self, now):
+        """Regiones que cambian solas (sin eventos) en este frame."""
+        rects = []
+        if now < self.dice_anim_until:
+            rects.append(self._dice_rect())
+        if self._win_who:
+            rects.append(self.screen.get_rect())   # confetti
+        elif self._home_alert_active_until and now <= self._home_alert_active_until:
+            rects.append(self._alert_rect())
+        return rects
+
+    def _track_drag(self):
+        """Marca sucias la región anterior y la nueva de la ficha arrastrada."""
+        if self._drag_rect is not None:
+            self._invalidate(self._drag_rect)
+        self._drag_rect = None
+        if self.dragging and self.drag_img:
+            self._drag_rect = pygame.Rect(self.drag_pos, self.drag_img.get_size())
+            self._invalidate(self._drag_rect)
 
-        def scale_piece(img):
-            if not img:
-                return None
-            target_h = max(40, int(self.board_rect.height / 16))
-            r = target_h / img.get_height()
-            target_w = int(img.get_width() * r)
-            return pygame.transform.smoothscale(img, (target_w, target_h))
+    # ---------------- Estado derivado del core ----------------
 
-        self.piece_white = scale_piece(self.piece_white)
-        self.piece_black = scale_piece(self.piece_black)
+    def _sync_state(self):
+        """
+        Relee el estado del core y recalcula lo derivado (cartel HOME, victoria, HUD)
+        solo si cambió `Backgammon.obtener_version()` (tirada, movimiento o turno).
 
-    def _idx_to_col_row(self, idx):
-        """Convierte índice 0-23 (interno) a (col, row) visual
-        
-        Mapeo del core de Backgammon:
-        - Punto 1 (idx 0): Abajo-derecha → col=11, row=1
-        - Punto 12 (idx 11): Abajo-izquierda → col=0, row=1
-        - Punto 13 (idx 12): Arriba-izquierda → col=0, row=0
-        - Punto 24 (idx 23): Arriba-derecha → col=11, row=0
-        
-        Fila 1 (abajo): puntos 1-12 (idx 0-11), de DERECHA a IZQUIERDA
-        Fila 0 (arriba): puntos 13-24 (idx 12-23), de IZQUIERDA a DERECHA
+        Returns:
+            bool: True si hubo cambios.
         """
-        if 0 <= idx <= 11:
-            # Puntos 1-12: fila inferior, de derecha a izquierda
-            return (11 - idx, 1)
-        else:
-            # Puntos 13-24: fila superior, de izquierda a derecha
-            return (idx - 12, 0)
-
-    def _point_rect(self, idx):
-        """Retorna el rect completo de un punto (para detección de click)"""
-        col, row = self._idx_to_col_row(idx)
-        x = self.board_rect.left + col * self.col_w
-        w = self.col_w
-        half_h = (self.board_rect.height - self.mid_gap) // 2
-        
-        if row == 0:  # Arriba
-            y = self.board_rect.top
-            h = half_h
-        else:  # Abajo
-            y = self.board_rect.centery + self.mid_gap // 2
-            h = half_h
-        
-        return pygame.Rect(x, y, w, h)
-    
+        version = self.game.obtener_version()
+        if version == self._state_version:
+            return False
+        self._state_version = version
+
+        self._pos        = self.game.obtener_posiciones()
+        self._barra      = self.game.obtener_barra()
+        self._fuera      = self.game.obtener_fichas_fuera()
+        self._turno      = self.game.obtener_turno()
+        self._pendientes = self.game.obtener_movimientos_pendientes()
+
+        hud_txt = f"Turno: {self._turno}"
+        if self._pendientes:
+            hud_txt += f" | Movimientos: {len(self._pendientes)}"
+        pips = self.game.obtener_pips()
+        hud_txt += f" | Pips B: {pips['blancas']}  N: {pips['negras']}"
+        self._hud_surf = self.font_hud.render(hud_txt, True, self.C_N2)
+
+        self._update_home_alert()
+        self._update_win_state()
+        self._invalidate()
+        return True
+
+    def _update_home_alert(self):
+        """Cartel "todas en home" (3.5 s, una vez por color)."""
+        who = self._who_can_bearoff()          # "blancas" | "negras" | None
+        if who and not self._home_alert_latched.get(who, False):
+            # Primera vez que este color puede sacar -> disparar cartel
+            self._home_alert_latched[who] = True
+            self._home_alert_color = who
+            self._home_alert_active_until = pygame.time.get_ticks() + 3500  # 3.5 s
+            self._play("home")
+
+    def _set_anim_timer(self, active):
+        """Enciende o apaga el temporizador de animación (en reposo, el bucle duerme)."""
+        if active != self._anim_timer:
+            pygame.time.set_timer(self.ANIM_TICK, 1000 // self.ANIM_FPS if active else 0)
+            self._anim_timer = active
+
     def _target_rect(self, idx: int) -> pygame.Rect:
         """
         Rect grande del punto (ocupa toda la mitad superior/inferior de esa columna).
         Lo usamos sólo para pintar las zonas destino; evita que se vean corridas abajo.
         idx: 0..23 (0-based)
         """
-        col, row = self._idx_to_col_row(idx)
+        col, row = self.renderer.idx_to_col_row(idx)
         x = int(self.board_rect.left + col * self.col_w)
         w = int(self.col_w)
         half_h = (self.board_rect.height - self.mid_gap) // 2
@@ -222,11 +246,6 @@ class GameUI:
         return pygame.Rect(x, y, w, half_h)
 
 
-    def _bar_rect(self):
-        w = int(self.col_w * 1.1)
-        x = int(self.board_rect.centerx - w // 2)
-        return pygame.Rect(x, self.board_rect.top, w, self.board_rect.height)
-
     def _mouse_to_point(self, mx, my):
         """Convierte coordenadas mouse a índice 0-23 o 'barra' o 'bearoff' o None"""
         # Primero verificar zona de bear-off (a la derecha)
@@ -248,7 +267,7 @@ class GameUI:
                 return "bearoff"
         
         # Verificar barra
-        bar = self._bar_rect()
+        bar = self.renderer.bar_rect()
         if bar.collidepoint(mx, my):
             turno = self.game.obtener_turno()
             if self.game.tiene_fichas_en_barra(turno):
@@ -256,21 +275,12 @@ class GameUI:
         
         # Verificar cada punto del tablero
         for idx in range(24):
-            rect = self._point_rect(idx)
+            rect = self.renderer.point_rect(idx)
             if rect.collidepoint(mx, my):
                 return idx
         
         return None
 
-    def _get_bar_counts(self):
-        try:
-            b = self.game.obtener_barra()
-            if isinstance(b, dict):
-                return int(b.get("blancas", 0)), int(b.get("negras", 0))
-        except Exception:
-            pass
-        return 0, 0
-
     def _update_hints(self):
         """Actualiza hints desde el core"""
         try:
@@ -292,138 +302,27 @@ class GameUI:
         else:
             self.allowed_dests = set()
 
-    def _draw_board(self):
-        self.screen.fill(self.C_BG)
-        
-        if self.img_wood:
-            self.screen.blit(self.img_wood, self.board_rect.topleft)
-        else:
-            pygame.draw.rect(self.screen, (40, 40, 60), self.board_rect)
-
-        # Barra central
-        bar = self._bar_rect()
-        panel = pygame.Surface((bar.width, bar.height), pygame.SRCALPHA)
-        pygame.draw.rect(panel, (0, 0, 0, 90), panel.get_rect(), border_radius=8)
-        self.screen.blit(panel, bar.topleft)
-
-        # Gap central
-        gap_rect = pygame.Rect(
-            self.board_rect.left,
-            self.board_rect.centery - self.mid_gap // 2,
-            self.board_rect.width,
-            self.mid_gap
-        )
-        gap = pygame.Surface(gap_rect.size, pygame.SRCALPHA)
-        pygame.draw.rect(gap, (0, 0, 0, 110), gap.get_rect())
-        pygame.draw.line(gap, self.C_N3, (0, 0), (gap_rect.width, 0), 2)
-        pygame.draw.line(gap, self.C_N3, (0, gap_rect.height-1), (gap_rect.width, gap_rect.height-1), 2)
-        self.screen.blit(gap, gap_rect.topleft)
-
-        half_h = (self.board_rect.height - self.mid_gap) // 2
-
-        # Triángulos superiores
-        for c in range(12):
-            img = self.img_tri_top_light if c % 2 == 0 else self.img_tri_top_dark
-            if img:
-                x = self.board_rect.left + c * self.col_w + (self.col_w - img.get_width()) / 2
-                y = self.board_rect.top
-                self.screen.blit(img, (x, y))
-
-        # Triángulos inferiores
-        for c in range(12):
-            img = self.img_tri_bot_dark if c % 2 == 0 else self.img_tri_bot_light
-            if img:
-                x = self.board_rect.left + c * self.col_w + (self.col_w - img.get_width()) / 2
-                y = self.board_rect.centery + self.mid_gap // 2 + (half_h - img.get_height())
-                self.screen.blit(img, (x, y))
-
-        # Línea vertical central
-        if self.img_line:
-            cx = self.board_rect.centerx - self.img_line.get_width() // 2
-            self.screen.blit(self.img_line, (cx, self.board_rect.top))
-
     def _draw_pieces(self):
-        pos = self.game.obtener_posiciones()
-        pw, ph = self.piece_white.get_size()
-        
-        for idx, val in enumerate(pos):
-            if val == 0:
-                continue
-            
-            col, row = self._idx_to_col_row(idx)
-            base_x = self.board_rect.left + col * self.col_w
-            piece_x = base_x + (self.col_w - pw) / 2
-            
-            count = abs(val)
-            color_img = self.piece_white if val > 0 else self.piece_black
-            
-            # Calcular Y base según fila
-            if row == 0:  # Arriba - crecen hacia abajo
-                base_y = self.board_rect.top + 5
-                for n in range(count):
-                    if self.dragging and self.drag_from_idx == idx and n == count - 1:
-                        continue
-                    piece_y = base_y + n * self.stack_gap
-                    self.screen.blit(color_img, (piece_x, piece_y))
-            else:  # Abajo - crecen hacia arriba
-                base_y = self.board_rect.bottom - ph - 5
-                for n in range(count):
-                    if self.dragging and self.drag_from_idx == idx and n == count - 1:
-                        continue
-                    piece_y = base_y - n * self.stack_gap
-                    self.screen.blit(color_img, (piece_x, piece_y))
-        
-        # Pieza arrastrada
+        # La ficha arrastrada no se dibuja en su punto sino bajo el mouse
+        skip = self.drag_from_idx if self.dragging else None
+        self.renderer.draw_pieces(self.screen, self._pos, skip)
         if self.dragging and self.drag_img:
             self.screen.blit(self.drag_img, self.drag_pos)
 
-    def _draw_bar(self):
-        w_bar, n_bar = self._get_bar_counts()
-        if not w_bar and not n_bar:
-            return
-
-        bar = self._bar_rect()
-        half_h = (self.board_rect.height - self.mid_gap) // 2
-        top_rect = pygame.Rect(bar.x, bar.y, bar.width, half_h)
-        bot_rect = pygame.Rect(bar.x, self.board_rect.centery + self.mid_gap // 2, bar.width, half_h)
-
-        pw, ph = self.piece_white.get_size()
-        cx = bar.x + (bar.width - pw) // 2
-        overlap = ph * 0.7
-
-        # BLANCAS ABAJO (crecen hacia arriba desde bottom)
-        for i in range(w_bar):
-            x = cx
-            y = bot_rect.bottom - ph - 8 - i * overlap
-            if y < bot_rect.top + 4:
-                break
-            self.screen.blit(self.piece_white, (x, y))
-
-        # NEGRAS ARRIBA (crecen hacia abajo desde top)
-        for i in range(n_bar):
-            x = cx
-            y = top_rect.top + 8 + i * overlap
-            if y + ph > top_rect.bottom - 4:
-                break
-            self.screen.blit(self.piece_black, (x, y))
-
     def _draw_hints(self):
         """Resalta SOLO los destinos válidos (sin marcar el origen)."""
         if not self.allowed_dests:
             return
 
-        overlay = pygame.Surface((self.w, self.h), pygame.SRCALPHA)
-
         for dest in self.allowed_dests:
             # Bear-off (-1): dibujar zona de salida a la derecha según el turno
             if dest == -1:
                 zona_x = self.board_rect.right + 30
                 zona_w = 80
                 zona_h = self.board_rect.height // 2 - 40
-                turno = self.game.obtener_turno()
                 # BLANCAS sacan ARRIBA (donde se apilan las blancas fuera)
                 # NEGRAS sacan ABAJO (donde se apilan las negras fuera)
-                if turno == "blancas":
+                if self._turno == "blancas":
                     zona_y = self.board_rect.top
                 else:
                     zona_y = self.board_rect.centery + self.mid_gap // 2
@@ -435,59 +334,18 @@ class GameUI:
                     continue
                 rect = self._target_rect(idx0)
 
-            # Glow + borde neón
-            glow = pygame.Surface((rect.width, rect.height), pygame.SRCALPHA)
-            pygame.draw.rect(glow, (*self.C_N2, 70), glow.get_rect(), border_radius=10)
-            overlay.blit(glow, rect.topleft)
-            pygame.draw.rect(overlay, (*self.C_N2, 200), rect, width=3, border_radius=10)
-
-        self.screen.blit(overlay, (0, 0))
+            # Glow + borde neón (Surface cacheada por tamaño)
+            self.screen.blit(self._glow_surface(rect.size), rect.topleft)
 
-    def _draw_bear_off_zone(self):
-        """Zona de fichas ya sacadas (bear-off) a la derecha del tablero, siempre visible."""
-        try:
-            fichas_fuera = self.game.obtener_fichas_fuera() or {}
-            w_fuera = int(fichas_fuera.get("blancas", 0))
-            n_fuera = int(fichas_fuera.get("negras", 0))
-        except Exception:
-            return
-
-        if not w_fuera and not n_fuera:
-            return
-
-        pw, ph = self.piece_white.get_size()
-        overlap = int(ph * 0.6)
-
-        # Posicionar la "columna" a la derecha del tablero, pero SIN salirse de la ventana
-        pad_x = 16
-        zona_x = max(self.board_rect.right + 12, self.board_rect.right + 12)
-        zona_x = min(zona_x, self.w - pw - pad_x)   # <- clamp dentro de la pantalla
-
-        # Alto disponible de cada mitad
-        half_h = (self.board_rect.height - self.mid_gap) // 2
-
-        # Pequeños paneles para que se vean nítidas
-        col_w = pw + 10
-        panel_top = pygame.Surface((col_w, half_h), pygame.SRCALPHA)
-        panel_bot = pygame.Surface((col_w, half_h), pygame.SRCALPHA)
-        pygame.draw.rect(panel_top, (0, 0, 0, 100), panel_top.get_rect(), border_radius=8)
-        pygame.draw.rect(panel_bot, (0, 0, 0, 100), panel_bot.get_rect(), border_radius=8)
-
-        # TOP: BLANCAS (apilan hacia ABAJO desde el borde superior de la mitad superior)
-        top_x = zona_x - 5
-        top_y = self.board_rect.top
-        self.screen.blit(panel_top, (top_x, top_y))
-        for i in range(min(w_fuera, 15)):
-            y = top_y + 8 + i * overlap
-            self.screen.blit(self.piece_white, (zona_x, y))
-
-        # BOTTOM: NEGRAS (apilan hacia ARRIBA desde el borde inferior de la mitad inferior)
-        bot_x = zona_x - 5
-        bot_y = self.board_rect.centery + self.mid_gap // 2
-        self.screen.blit(panel_bot, (bot_x, bot_y))
-        for i in range(min(n_fuera, 15)):
-            y = bot_y + half_h - ph - 8 - i * overlap
-            self.screen.blit(self.piece_black, (zona_x, y))
+    def _glow_surface(self, size):
+        """Resaltado de un destino (relleno + borde), cacheado por tamaño."""
+        glow = self._glow_cache.get(size)
+        if glow is None:
+            glow = pygame.Surface(size, pygame.SRCALPHA)
+            pygame.draw.rect(glow, (*self.C_N2, 70), glow.get_rect(), border_radius=10)
+            pygame.draw.rect(glow, (*self.C_N2, 200), glow.get_rect(), width=3, border_radius=10)
+            self._glow_cache[size] = glow
+        return glow
 
     def _who_can_bearoff(self):
         """
@@ -496,32 +354,18 @@ class GameUI:
         Retorna None si ese color ya ganó (15 fichas fuera).
         """
         try:
-            posiciones = self.game.obtener_posiciones()
-            barra = self.game.obtener_barra() or {"blancas": 0, "negras": 0}
-            fichas_fuera = self.game.obtener_fichas_fuera() or {"blancas": 0, "negras": 0}
+            barra = self._barra
+            fichas_fuera = self._fuera
 
             # Si ya ganó, no mostrar cartel HOME
             if fichas_fuera.get("blancas", 0) >= 15 or fichas_fuera.get("negras", 0) >= 15:
                 return None
 
-            # Si hay fichas en barra, ese color NO puede sacar
-            if int(barra.get("blancas", 0)) > 0:
-                blancas_ok = False
-            else:
-                # Blancas: home = idx 18..23 (puntos 19..24)
-                # No debe haber fichas blancas en idx 0..17
-                blancas_fuera_home = any(posiciones[i] > 0 for i in range(18))  # 0..17
-                blancas_tienen_en_home = any(posiciones[i] > 0 for i in range(18, 24))
-                blancas_ok = (not blancas_fuera_home) and blancas_tienen_en_home
-
-            if int(barra.get("negras", 0)) > 0:
-                negras_ok = False
-            else:
-                # Negras: home = idx 0..5 (puntos 1..6)
-                # No debe haber fichas negras en idx 6..23
-                negras_fuera_home = any(posiciones[i] < 0 for i in range(6, 24))
-                negras_tienen_en_home = any(posiciones[i] < 0 for i in range(0, 6))
-                negras_ok = (not negras_fuera_home) and negras_tienen_en_home
+            # Si hay fichas en barra, ese color NO puede sacar; si no, todas deben
+            # estar en su home (blancas idx 18..23, negras idx 0..5). Como ninguno
+            # ganó, cada color tiene fichas sobre el tablero.
+            blancas_ok = int(barra.get("blancas", 0)) == 0 and self.game.todas_en_home("blancas")
+            negras_ok = int(barra.get("negras", 0)) == 0 and self.game.todas_en_home("negras")
 
             if blancas_ok and not negras_ok:
                 return "blancas"
@@ -535,7 +379,7 @@ class GameUI:
     def _update_win_state(self):
         """Detecta si ya ganó alguien (15 fichas fuera)."""
         try:
-            fichas_fuera = self.game.obtener_fichas_fuera()
+            fichas_fuera = self._fuera
             w = fichas_fuera.get("blancas", 0)
             n = fichas_fuera.get("negras", 0)
             if w >= 15:
@@ -554,11 +398,8 @@ class GameUI:
             return
 
         # Reproducir sonido una sola vez
-        if not self._win_sound_played and self.snd_win:
-            try:
-                self.snd_win.play()
-            except Exception:
-                pass
+        if not self._win_sound_played:
+            self._play("win")
             self._win_sound_played = True
 
         # Oscurecer el fondo
@@ -665,15 +506,9 @@ class GameUI:
         self.screen.blit(base, base.get_rect(center=(cx, y)))
 
     def _draw_hud(self):
-        turno = self.game.obtener_turno()
-        pendientes = self.game.obtener_movimientos_pendientes()
-        
-        # Texto principal
-        hud_txt = f"Turno: {turno}"
-        if pendientes:
-            hud_txt += f" | Movimientos: {len(pendientes)}"
-        
-        self.screen.blit(self.font_hud.render(hud_txt, True, self.C_N2), (20, self.h - 40))
+        # Texto pre-renderizado en _sync_state (cambia solo con el estado del core)
+        if self._hud_surf:
+            self.screen.blit(self._hud_surf, (20, self.h - 40))
 
     def _draw_dice(self):
         """Muestra los dados pendientes en tiempo real"""
@@ -692,7 +527,7 @@ class GameUI:
             dados_a_mostrar = [random.randint(1, 6), random.randint(1, 6)]
         else:
             # Después de animación: mostrar movimientos PENDIENTES
-            pendientes = self.game.obtener_movimientos_pendientes()
+            pendientes = self._pendientes
             if not pendientes:
                 return
             dados_a_mostrar = pendientes
@@ -704,10 +539,7 @@ class GameUI:
         
         for i, dado in enumerate(dados_a_mostrar):
             x = x_start - i * (cell + spacing)
-            surf = self.dice_digits.get(dado)
-            
-            if surf:
-                s = pygame.transform.smoothscale(surf, (cell, cell))
+            if self.renderer.has_sprite(("dado", dado)):
                 # Fondo y borde
                 pygame.draw.rect(self.screen, self.C_BG, (x-4, y-4, cell+8, cell+8), border_radius=10)
                 
@@ -718,7 +550,7 @@ class GameUI:
                     border_color = self.C_N3  # Púrpura para pendientes
                 
                 pygame.draw.rect(self.screen, border_color, (x-4, y-4, cell+8, cell+8), width=2, border_radius=10)
-                self.screen.blit(s, (x, y))
+                self.renderer.blit_sprite(self.screen, ("dado", dado), (x, y))
 
     def _draw_help(self):
         if not self.show_help:
@@ -754,6 +586,45 @@ class GameUI:
 
         self.screen.blit(panel, (28, 92))
 
+    def _draw_frame(self):
+        """Dibuja todas las capas, en orden, sobre la pantalla (respeta el clip activo)."""
+        self.renderer.draw_board(self.screen)
+        self._draw_pieces()
+        self.renderer.draw_bar(self.screen, self._barra)
+        self.renderer.draw_bear_off_zone(self.screen, self._fuera)   # blancas arriba, negras abajo
+        self._draw_hints()
+
+        # Solo mostrar cartel HOME si NO hay victoria
+        if not self._win_who:
+            self._draw_bearoff_alert()   # cartel centrado y temporizado
+
+        self._draw_title()
+        self._draw_hud()
+        self._draw_dice()
+        self._draw_help()
+
+        # Victoria siempre encima de todo
+        self._draw_win_banner()
+
+    def _render(self):
+        """
+        Repinta y presenta solo las regiones sucias: con clip, los blits fuera de la
+        región no tocan píxeles, y display.update copia solo esa región. Sin regiones
+        sucias no se dibuja nada (la GUI en reposo no consume CPU en render).
+        """
+        if self._full_redraw:
+            self.screen.set_clip(None)
+            self._draw_frame()
+            pygame.display.flip()
+        elif self._dirty:
+            area = self._dirty[0].unionall(self._dirty[1:]).clip(self.screen.get_rect())
+            self.screen.set_clip(area)
+            self._draw_frame()
+            self.screen.set_clip(None)
+            pygame.display.update(area)
+        self._full_redraw = False
+        self._dirty = []
+
     def run(self):
         clock = pygame.time.Clock()
         running = True
@@ -762,11 +633,35 @@ class GameUI:
         print("Juego iniciado. Presiona ESPACIO para tirar dados.")
 
         while running:
+            # -------------------- Estado derivado y render --------------------
+            self._sync_state()
+            now = pygame.time.get_ticks()
+
+            # Las animaciones ensucian su región mientras duran y una vez más al terminar
+            anim_rects = self._animation_rects(now)
+            for rect in anim_rects + self._anim_rects:
+                self._invalidate(rect)
+            self._anim_rects = anim_rects
+
+            self._render()
+            self.renderer.prefetch_sources()    # ya hay imagen en pantalla: decodificar en 2º plano
+            self._set_anim_timer(bool(anim_rects))
+            clock.tick(self.ANIM_FPS)
+
             # -------------------- Eventos --------------------
-            for e in pygame.event.get():
+            # Sin animaciones, wait() bloquea hasta que haya input: CPU ~0 en reposo
+            for e in [pygame.event.wait()] + pygame.event.get():
+                # Teclas y clicks pueden cambiar tablero, hints, HUD o ayuda: repintar todo
+                if e.type in (pygame.KEYDOWN, pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP,
+                              pygame.WINDOWEXPOSED):
+                    self._invalidate()
+
                 if e.type == pygame.QUIT:
                     running = False
 
+                elif e.type == pygame.VIDEORESIZE:
+                    self._on_resize(e.w, e.h)
+
                 elif e.type == pygame.KEYDOWN:
                     # Tirar dados (si no hay movimientos pendientes)
                     if e.key in (pygame.K_SPACE, pygame.K_r):
@@ -778,8 +673,7 @@ class GameUI:
                                 print(f"Dados: {self.last_roll}")
                                 print(f"Pendientes: {pendientes}")
                                 print(f"Turno: {self.game.obtener_turno()}")
-                                if self.snd_dice:
-                                    self.snd_dice.play()
+                                self._play("dice")
                                 self.dice_anim_until = pygame.time.get_ticks() + 600
                                 # limpiar selección/hints
                                 self.selected_origin = None
@@ -796,8 +690,7 @@ class GameUI:
                         try:
                             self.game.finalizar_tirada()
                             print("Tirada finalizada")
-                            if self.snd_button:
-                                self.snd_button.play()
+                            self._play("button")
                             self.selected_origin = None
                             self.allowed_dests = set()
                             self._update_hints()
@@ -839,6 +732,7 @@ class GameUI:
                         self.dragging = True
                         self.drag_from_idx = "barra"
                         self.drag_pos = (mx - self.drag_offset[0], my - self.drag_offset[1])
+                        self._track_drag()
                         continue
 
                     # Click en un punto del tablero
@@ -863,10 +757,12 @@ class GameUI:
                         self.dragging = True
                         self.drag_from_idx = idx
                         self.drag_pos = (mx - self.drag_offset[0], my - self.drag_offset[1])
+                        self._track_drag()
 
                 elif e.type == pygame.MOUSEMOTION and self.dragging:
                     mx, my = e.pos
                     self.drag_pos = (mx - self.drag_offset[0], my - self.drag_offset[1])
+                    self._track_drag()
 
                 elif e.type == pygame.MOUSEBUTTONUP and e.button == 1 and self.dragging:
                     mx, my = e.pos
@@ -895,16 +791,14 @@ class GameUI:
 
                                 # Sonidos
                                 if isinstance(res, str) and ("ganaron" in res):
-                                    if self.snd_cheer:
-                                        self.snd_cheer.play()
-                                elif self.snd_impact:
-                                    self.snd_impact.play()
+                                    self._play("cheer")
+                                else:
+                                    self._play("impact")
 
                                 # ¿Se acabó la tirada?
                                 if not self.game.movimientos_disponibles():
                                     self.game.finalizar_tirada()
-                                    if self.snd_button:
-                                        self.snd_button.play()
+                                    self._play("button")
 
                                 # Limpiar UI y refrescar hints
                                 self.selected_origin = None
@@ -922,50 +816,9 @@ class GameUI:
                         self.dragging = False
                         self.drag_from_idx = None
                         self.drag_img = None
+                        self._drag_rect = None
 
-            # -------------------- Lógica cartel "todas en home" (3.5 s, por color) --------------------
-            who = self._who_can_bearoff()          # "blancas" | "negras" | None
-            now = pygame.time.get_ticks()
-
-            if who:
-                # Se puede sacar -> verificar si ya mostramos cartel para este color
-                if not self._home_alert_latched.get(who, False):
-                    # Primera vez que este color puede sacar -> disparar cartel
-                    self._home_alert_latched[who] = True
-                    self._home_alert_color = who
-                    self._home_alert_active_until = now + 3500  # 3.5 s
-                    if self.snd_home:
-                        try: self.snd_home.play()
-                        except Exception: pass
-            else:
-                # Nadie puede sacar -> no hacer nada (mantener estados)
-                pass
-
-            # -------------------- Actualizar estado de victoria --------------------
-            self._update_win_state()
-
-            # -------------------- Render --------------------
-            self._draw_board()
-            self._draw_pieces()
-            self._draw_bar()
-            self._draw_bear_off_zone()   # blancas arriba, negras abajo
-            self._draw_hints()
-            
-            # Solo mostrar cartel HOME si NO hay victoria
-            if not self._win_who:
-                self._draw_bearoff_alert()   # cartel centrado y temporizado
-            
-            self._draw_title()
-            self._draw_hud()
-            self._draw_dice()
-            self._draw_help()
-            
-            # Victoria siempre encima de todo
-            self._draw_win_banner()
-
-            pygame.display.flip()
-            clock.tick(60)
-
+        self._set_anim_timer(False)
         pygame.quit()
 
 
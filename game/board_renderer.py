@@ -0,0 +1,646 @@
+# game/board_renderer.py
+import hashlib
+import json
+import math
+import os
+import struct
+import zlib
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+import numpy as np
+import pygame
+from source.posicion import Posicion
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+IMG  = os.path.join(ROOT, "assets", "images")
+
+# --- Paleta (compartida con GameUI) ---
+C_BG = (9, 14, 28)
+C_N1 = (234, 0, 217)
+C_N2 = (10, 189, 198)
+C_N3 = (113, 28, 145)
+
+# Imágenes originales: nombre -> archivos candidatos (se usa el primero que cargue)
+IMAGE_FILES = {
+    "wood":          ["wood.png"],
+    "line":          ["v-line.png"],
+    "tri_top_dark":  ["row1-triangle-dark.png"],
+    "tri_top_light": ["row1-triangle-light.png"],
+    "tri_bot_dark":  ["row2-triangle-dark.png"],
+    "tri_bot_light": ["row2-triangle-light.png"],
+    "piece_white":   ["piece-white-2.png", "piece-white.png"],
+    "piece_black":   ["piece-black-2.png", "piece-black.png"],
+    **{f"digit_{i}": [f"digit-{i}-white.png"] for i in range(1, 7)},
+}
+
+# Cache en disco de las imágenes ya escaladas (una entrada por tamaño de ventana)
+SCALED_CACHE_VERSION = 1
+SCALED_CACHE_MAX     = 8
+SCALED_CACHE_MAGIC   = b"BGSC"
+
+
+def default_cache_dir():
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, "backgammon")
+
+
+def _decode_images():
+    """
+    Decodifica las imágenes originales (sin convert_alpha, que necesita la ventana y el
+    hilo principal). Puede correr en un hilo aparte.
+    """
+    images = {}
+    for name, files in IMAGE_FILES.items():
+        images[name] = None
+        for f in files:
+            path = os.path.join(IMG, f)
+            if os.path.exists(path):
+                try:
+                    images[name] = pygame.image.load(path)
+                    break
+                except Exception:
+                    pass
+    return images
+
+
+def write_png(surface, path, level=1):
+    """
+    Guarda una Surface como PNG RGB: filtro "sub" (NumPy) y zlib con nivel bajo.
+
+    pygame.image.save comprime al máximo y tarda ~0.3 s en un tablero de 960x600 (la
+    textura de madera casi no se comprime); esto tarda ~5 veces menos a cambio de
+    archivos un ~6% más grandes.
+    """
+    w, h = surface.get_size()
+    rgb = np.frombuffer(pygame.image.tobytes(surface, "RGB"), dtype=np.uint8).reshape(h, w * 3)
+    rows = np.empty((h, w * 3 + 1), dtype=np.uint8)
+    rows[:, 0] = 1                              # filtro "sub": diferencia con el píxel izquierdo
+    rows[:, 1:4] = rgb[:, :3]
+    np.subtract(rgb[:, 3:], rgb[:, :-3], out=rows[:, 4:])
+
+    def chunk(kind, data):
+        return struct.pack(">I", len(data)) + kind + data + struct.pack(">I", zlib.crc32(kind + data))
+
+    with open(path, "wb") as f:
+        f.write(b"\x89PNG\r\n\x1a\n")
+        f.write(chunk(b"IHDR", struct.pack(">IIBBBBB", w, h, 8, 2, 0, 0, 0)))
+        f.write(chunk(b"IDAT", zlib.compress(rows.tobytes(), level)))
+        f.write(chunk(b"IEND", b""))
+
+
+def init_headless():
+    """
+    Prepara pygame para dibujar sin pantalla (servidores, procesos del pool): driver de
+    video "dummy" si no se eligió otro y una ventana mínima, necesaria para convert().
+    """
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    pygame.display.init()
+    if pygame.display.get_surface() is None:
+        pygame.display.set_mode((1, 1))
+
+
+class BoardRenderer:
+    """
+    Dibuja el tablero (madera, triángulos, fichas, barra y bear-off) para un tamaño dado.
+
+    Tiene la geometría, las imágenes escaladas, la capa estática y el atlas de pilas; no
+    sabe nada de eventos ni del core. Lo usan GameUI (sobre la ventana) y la exportación
+    de diagramas (sobre una Surface fuera de pantalla, ver `render`).
+    """
+
+    def __init__(self, width, height, cache_dir=None):
+        # --- Imágenes originales (sin escalar) ---
+        # Solo hacen falta si el cache en disco no tiene el tamaño pedido: se decodifican
+        # a demanda, o en segundo plano cuando se pide (ver prefetch_sources)
+        self._src        = None
+        self._src_future = None
+        self._cache_dir  = default_cache_dir() if cache_dir is None else cache_dir
+
+        # --- Capas cacheadas (se reconstruyen solo al cambiar el tamaño) ---
+        self._static_board = None   # fondo + madera + barra + gap + triángulos
+        self._atlas        = None   # Surface con todas las pilas de fichas pre-compuestas
+        self._atlas_rects  = {}     # clave de sprite -> Rect dentro del atlas
+
+        self.resize(width, height)
+
+    def resize(self, width, height):
+        """Calcula la geometría para el tamaño dado y re-escala los assets."""
+        self.w, self.h = width, height
+        self.board_rect = pygame.Rect(0, 0, int(self.w * 0.92), int(self.h * 0.78))
+        self.board_rect.center = (self.w // 2, self.h // 2 + 20)
+        self.col_w   = self.board_rect.width / 12.0
+        self.mid_gap = max(30, int(self.board_rect.height * 0.08))
+
+        # Escalado de imágenes según geometría
+        self._scale_board_assets()
+
+        # --- Apilado de fichas ---
+        ph = self.piece_white.get_height()
+        self.stack_gap = ph * 0.8  # superposición para que entren más
+
+        # Las capas cacheadas dependen de la geometría
+        self._build_atlas()
+        self._static_board = None
+
+    def render(self, posicion: Posicion, surface=None):
+        """
+        Dibuja una posición completa (tablero, fichas, barra y fichas fuera).
+
+        Args:
+            posicion (Posicion): Instantánea a dibujar.
+            surface (pygame.Surface, optional): Destino de (w, h); por defecto, una nueva.
+
+        Returns:
+            pygame.Surface: La Surface dibujada.
+        """
+        if surface is None:
+            surface = pygame.Surface((self.w, self.h)).convert()
+        self.draw_board(surface)
+        self.draw_pieces(surface, posicion.posiciones)
+        self.draw_bar(surface, posicion.barra)
+        self.draw_bear_off_zone(surface, posicion.fichas_fuera)
+        return surface
+
+    def save_png(self, posicion: Posicion, path):
+        """Dibuja una posición y la guarda como PNG."""
+        write_png(self.render(posicion), path)
+
+    # ---------------- Imágenes originales y cache de escalados ----------------
+
+    def _create_fallback_piece(self, color):
+        """Crea una pieza simple si no hay imagen"""
+        surf = pygame.Surface((40, 40), pygame.SRCALPHA)
+        pygame.draw.circle(surf, color, (20, 20), 18)
+        pygame.draw.circle(surf, (0, 0, 0), (20, 20), 18, 2)
+        return surf
+
+    def prefetch_sources(self):
+        """Empieza a decodificar las imágenes originales en un hilo (para futuros resize)."""
+        if self._src is None and self._src_future is None:
+            pool = ThreadPoolExecutor(max_workers=1)
+            self._src_future = pool.submit(_decode_images)
+            pool.shutdown(wait=False)
+
+    def _sources(self):
+        """Imágenes originales convertidas al formato de la ventana (espera al hilo si hace falta)."""
+        if self._src is None:
+            self.prefetch_sources()
+            images = self._src_future.result()
+            self._src = {name: img.convert_alpha() if img else None for name, img in images.items()}
+            # Piezas con fallback si no están los PNG
+            if not self._src["piece_white"]:
+                self._src["piece_white"] = self._create_fallback_piece((255, 255, 255))
+            if not self._src["piece_black"]:
+                self._src["piece_black"] = self._create_fallback_piece((50, 50, 50))
+        return self._src
+
+    def _scaled_cache_path(self):
+        """Archivo del cache para el tamaño actual; la clave incluye el mtime de cada asset."""
+        key = [SCALED_CACHE_VERSION, self.w, self.h]
+        for files in IMAGE_FILES.values():
+            for f in files:
+                try:
+                    st = os.stat(os.path.join(IMG, f))
+                    key.append((f, st.st_mtime_ns, st.st_size))
+                except OSError:
+                    key.append((f, None))
+        digest = hashlib.sha1(repr(key).encode()).hexdigest()[:16]
+        return os.path.join(self._cache_dir, f"escalados-{self.w}x{self.h}-{digest}.bin")
+
+    def _load_scaled_cache(self):
+        """Imágenes escaladas guardadas para este tamaño, o None si no hay (o no sirven)."""
+        path = self._scaled_cache_path()
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+            if data[:4] != SCALED_CACHE_MAGIC:
+                return None
+            (n,) = struct.unpack_from("<I", data, 4)
+            index = json.loads(data[8:8 + n])
+            offset = 8 + n
+            scaled = {}
+            for name, (w, h) in index.items():
+                size = w * h * 4
+                if offset + size > len(data):
+                    return None
+                buf = data[offset:offset + size]
+                scaled[name] = pygame.image.frombuffer(buf, (w, h), "RGBA").convert_alpha()
+                offset += size
+            os.utime(path)  # más reciente para el desalojo
+        except (OSError, ValueError, struct.error, pygame.error):
+            return None
+        return scaled
+
+    def _save_scaled_cache(self, scaled):
+        """Guarda las imágenes escaladas (RGBA crudo) y desaloja las entradas más viejas."""
+        path = self._scaled_cache_path()
+        surfaces = {name: img for name, img in scaled.items() if img}
+        index = json.dumps({name: img.get_size() for name, img in surfaces.items()}).encode()
+        try:
+            os.makedirs(self._cache_dir, exist_ok=True)
+            tmp = f"{path}.{os.getpid()}.tmp"
+            with open(tmp, "wb") as f:
+                f.write(SCALED_CACHE_MAGIC + struct.pack("<I", len(index)) + index)
+                for img in surfaces.values():
+                    f.write(pygame.image.tobytes(img, "RGBA"))
+            os.replace(tmp, path)
+
+            entries = [os.path.join(self._cache_dir, f) for f in os.listdir(self._cache_dir)
+                       if f.startswith("escalados-") and f.endswith(".bin")]
+            entries.sort(key=os.path.getmtime, reverse=True)
+            for old in entries[SCALED_CACHE_MAX:]:
+                os.remove(old)
+        except OSError:
+            pass  # sin cache: la próxima vez se vuelve a escalar
+
+    def _scale_board_assets(self):
+        scaled = self._load_scaled_cache()
+        if scaled is None:
+            scaled = self._scale_sources(self._sources())
+            self._save_scaled_cache(scaled)
+
+        self.img_wood          = scaled.get("wood")
+        self.img_tri_top_dark  = scaled.get("tri_top_dark")
+        self.img_tri_top_light = scaled.get("tri_top_light")
+        self.img_tri_bot_dark  = scaled.get("tri_bot_dark")
+        self.img_tri_bot_light = scaled.get("tri_bot_light")
+        self.img_line          = scaled.get("line")
+        self.piece_white       = scaled["piece_white"]
+        self.piece_black       = scaled["piece_black"]
+        self.img_dice          = {i: scaled[f"digit_{i}"] for i in range(1, 7) if scaled.get(f"digit_{i}")}
+
+    def _scale_sources(self, src):
+        """Escala las imágenes originales a la geometría actual."""
+        scaled = {}
+        scaled["wood"] = None
+        if src["wood"]:
+            scaled["wood"] = pygame.transform.smoothscale(
+                src["wood"], (self.board_rect.width, self.board_rect.height)
+            )
+
+        half_h = (self.board_rect.height - self.mid_gap) // 2
+
+        def scale_tri(img, target_h):
+            if not img:
+                return None
+            w = int(self.col_w * 0.8)
+            h = int(target_h * 0.95)
+            return pygame.transform.smoothscale(img, (w, h))
+
+        scaled["tri_top_dark"] = scale_tri(src["tri_top_dark"], half_h)
+        scaled["tri_top_light"] = scale_tri(src["tri_top_light"], half_h)
+        scaled["tri_bot_dark"] = scale_tri(src["tri_bot_dark"], half_h)
+        scaled["tri_bot_light"] = scale_tri(src["tri_bot_light"], half_h)
+
+        scaled["line"] = None
+        if src["line"]:
+            scaled["line"] = pygame.transform.smoothscale(src["line"], (2, self.board_rect.height))
+
+        def scale_piece(img):
+            if not img:
+                return None
+            target_h = max(40, int(self.board_rect.height / 16))
+            r = target_h / img.get_height()
+            target_w = int(img.get_width() * r)
+            return pygame.transform.smoothscale(img, (target_w, target_h))
+
+        scaled["piece_white"] = scale_piece(src["piece_white"])
+        scaled["piece_black"] = scale_piece(src["piece_black"])
+
+        # Dígitos de dados (para mostrar pendientes / animación)
+        for i in range(1, 7):
+            img = src[f"digit_{i}"]
+            scaled[f"digit_{i}"] = pygame.transform.smoothscale(img, (64, 64)) if img else None
+        return scaled
+
+    # ---------------- Atlas de sprites ----------------
+
+    def _build_atlas(self):
+        """
+        Pre-compone, para el tamaño actual, las pilas de 1 a 15 fichas de cada color en
+        ambas orientaciones (puntos, barra y zona de bear-off), el panel de bear-off y los
+        dados, y los empaqueta en una sola Surface. Así cada pila se dibuja con un blit.
+
+        Las imágenes se guardan con alfa pre-multiplicado: componer pilas sobre fondo
+        transparente con alfa "normal" oscurece los bordes anti-aliasados.
+        """
+        pw, ph = self.piece_white.get_size()
+        half_h = (self.board_rect.height - self.mid_gap) // 2
+        piezas = {"blancas": self.piece_white.premul_alpha(),
+                  "negras": self.piece_black.premul_alpha()}
+        gap_bar = ph * 0.7
+        gap_off = int(ph * 0.6)
+
+        sprites = {}
+        for n in range(1, 16):
+            for color, img in piezas.items():
+                sprites[("punto", color, False, n)] = self._compose_stack(img, n, self.stack_gap, up=False)
+                sprites[("punto", color, True, n)] = self._compose_stack(img, n, self.stack_gap, up=True)
+            # Barra: blancas abajo (crecen hacia arriba), negras arriba (hacia abajo)
+            sprites[("barra", "blancas", n)] = self._compose_stack(piezas["blancas"], n, gap_bar, up=True)
+            sprites[("barra", "negras", n)] = self._compose_stack(piezas["negras"], n, gap_bar, up=False)
+            # Fuera: blancas arriba (hacia abajo), negras abajo (hacia arriba)
+            sprites[("fuera", "blancas", n)] = self._compose_stack(piezas["blancas"], n, gap_off, up=False)
+            sprites[("fuera", "negras", n)] = self._compose_stack(piezas["negras"], n, gap_off, up=True)
+
+        panel = pygame.Surface((pw + 10, half_h), pygame.SRCALPHA)
+        pygame.draw.rect(panel, (0, 0, 0, 100), panel.get_rect(), border_radius=8)
+        sprites[("panel_fuera",)] = panel.premul_alpha()
+
+        for d, img in self.img_dice.items():
+            sprites[("dado", d)] = img.premul_alpha()
+
+        self._atlas, self._atlas_rects = self._pack_atlas(sprites)
+
+    def _compose_stack(self, img, count, gap, up):
+        """
+        Pila de `count` fichas separadas `gap` px, en el mismo orden de dibujo y con el
+        mismo redondeo que ficha a ficha. Si `up`, la ficha 0 queda abajo y la pila se
+        dibuja con su borde superior en base_y - _stack_rise(count, gap).
+        """
+        iw, ih = img.get_size()
+        rise = self._stack_rise(count, gap)
+        surf = pygame.Surface((iw, ih + rise), pygame.SRCALPHA)
+        for n in range(count):
+            y = rise - math.ceil(n * gap) if up else int(n * gap)
+            surf.blit(img, (0, y), special_flags=pygame.BLEND_PREMULTIPLIED)
+        return surf
+
+    @staticmethod
+    def _stack_rise(count, gap):
+        """Desplazamiento de la última ficha respecto de la primera en una pila."""
+        return math.ceil((count - 1) * gap)
+
+    def _pack_atlas(self, sprites, max_w=2048):
+        """Empaqueta los sprites en filas ("estantes") dentro de una sola Surface."""
+        rects, x, y, row_h = {}, 0, 0, 0
+        for key, surf in sprites.items():
+            w, h = surf.get_size()
+            if x + w > max_w:
+                x, y, row_h = 0, y + row_h, 0
+            rects[key] = pygame.Rect(x, y, w, h)
+            x += w
+            row_h = max(row_h, h)
+        atlas = pygame.Surface((max_w, max(y + row_h, 1)), pygame.SRCALPHA)
+        for key, surf in sprites.items():
+            atlas.blit(surf, rects[key], special_flags=pygame.BLEND_PREMULTIPLIED)
+        return atlas, rects
+
+    def has_sprite(self, key):
+        return key in self._atlas_rects
+
+    def blit_sprite(self, surface, key, pos):
+        """Dibuja un sprite del atlas (alfa pre-multiplicado)."""
+        surface.blit(self._atlas, pos, self._atlas_rects[key],
+                     special_flags=pygame.BLEND_PREMULTIPLIED)
+
+    # ---------------- Geometría ----------------
+
+    def idx_to_col_row(self, idx):
+        """Convierte índice 0-23 (interno) a (col, row) visual
+        
+        Mapeo del core de Backgammon:
+        - Punto 1 (idx 0): Abajo-derecha → col=11, row=1
+        - Punto 12 (idx 11): Abajo-izquierda → col=0, row=1
+        - Punto 13 (idx 12): Arriba-izquierda → col=0, row=0
+        - Punto 24 (idx 23): Arriba-derecha → col=11, row=0
+        
+        Fila 1 (abajo): puntos 1-12 (idx 0-11), de DERECHA a IZQUIERDA
+        Fila 0 (arriba): puntos 13-24 (idx 12-23), de IZQUIERDA a DERECHA
+        """
+        if 0 <= idx <= 11:
+            # Puntos 1-12: fila inferior, de derecha a izquierda
+            return (11 - idx, 1)
+        else:
+            # Puntos 13-24: fila superior, de izquierda a derecha
+            return (idx - 12, 0)
+
+    def point_rect(self, idx):
+        """Retorna el rect completo de un punto (para detección de click)"""
+        col, row = self.idx_to_col_row(idx)
+        x = self.board_rect.left + col * self.col_w
+        w = self.col_w
+        half_h = (self.board_rect.height - self.mid_gap) // 2
+        
+        if row == 0:  # Arriba
+            y = self.board_rect.top
+            h = half_h
+        else:  # Abajo
+            y = self.board_rect.centery + self.mid_gap // 2
+            h = half_h
+        
+        return pygame.Rect(x, y, w, h)
+
+    def bar_rect(self):
+        w = int(self.col_w * 1.1)
+        x = int(self.board_rect.centerx - w // 2)
+        return pygame.Rect(x, self.board_rect.top, w, self.board_rect.height)
+
+    # ---------------- Dibujo ----------------
+
+    def draw_board(self, surface):
+        """Copia la capa estática cacheada (la construye si hace falta)."""
+        if self._static_board is None:
+            self._static_board = self._build_static_board()
+        surface.blit(self._static_board, (0, 0))
+
+    def _build_static_board(self):
+        """
+        Pre-renderiza todo lo que no cambia entre frames (fondo, madera, barra, gap,
+        triángulos y línea central) en una sola Surface del tamaño de la ventana.
+        """
+        surf = pygame.Surface((self.w, self.h)).convert()
+        surf.fill(C_BG)
+
+        if self.img_wood:
+            surf.blit(self.img_wood, self.board_rect.topleft)
+        else:
+            pygame.draw.rect(surf, (40, 40, 60), self.board_rect)
+
+        # Barra central
+        bar = self.bar_rect()
+        panel = pygame.Surface((bar.width, bar.height), pygame.SRCALPHA)
+        pygame.draw.rect(panel, (0, 0, 0, 90), panel.get_rect(), border_radius=8)
+        surf.blit(panel, bar.topleft)
+
+        # Gap central
+        gap_rect = pygame.Rect(
+            self.board_rect.left,
+            self.board_rect.centery - self.mid_gap // 2,
+            self.board_rect.width,
+            self.mid_gap
+        )
+        gap = pygame.Surface(gap_rect.size, pygame.SRCALPHA)
+        pygame.draw.rect(gap, (0, 0, 0, 110), gap.get_rect())
+        pygame.draw.line(gap, C_N3, (0, 0), (gap_rect.width, 0), 2)
+        pygame.draw.line(gap, C_N3, (0, gap_rect.height-1), (gap_rect.width, gap_rect.height-1), 2)
+        surf.blit(gap, gap_rect.topleft)
+
+        half_h = (self.board_rect.height - self.mid_gap) // 2
+
+        # Triángulos superiores
+        for c in range(12):
+            img = self.img_tri_top_light if c % 2 == 0 else self.img_tri_top_dark
+            if img:
+                x = self.board_rect.left + c * self.col_w + (self.col_w - img.get_width()) / 2
+                y = self.board_rect.top
+                surf.blit(img, (x, y))
+
+        # Triángulos inferiores
+        for c in range(12):
+            img = self.img_tri_bot_dark if c % 2 == 0 else self.img_tri_bot_light
+            if img:
+                x = self.board_rect.left + c * self.col_w + (self.col_w - img.get_width()) / 2
+                y = self.board_rect.centery + self.mid_gap // 2 + (half_h - img.get_height())
+                surf.blit(img, (x, y))
+
+        # Línea vertical central
+        if self.img_line:
+            cx = self.board_rect.centerx - self.img_line.get_width() // 2
+            surf.blit(self.img_line, (cx, self.board_rect.top))
+
+        return surf
+
+    def draw_pieces(self, surface, pos, skip_idx=None):
+        """Pilas de los 24 puntos; `skip_idx` tiene una ficha menos (la que se arrastra)."""
+        pw, ph = self.piece_white.get_size()
+        
+        for idx, val in enumerate(pos):
+            if val == 0:
+                continue
+            
+            col, row = self.idx_to_col_row(idx)
+            base_x = self.board_rect.left + col * self.col_w
+            piece_x = base_x + (self.col_w - pw) / 2
+            
+            count = min(abs(val), 15)
+            # La ficha arrastrada no se dibuja en su punto
+            if skip_idx == idx:
+                count -= 1
+            if count <= 0:
+                continue
+            color = "blancas" if val > 0 else "negras"
+
+            # Una sola pila pre-compuesta por punto
+            if row == 0:  # Arriba - crecen hacia abajo
+                piece_y = self.board_rect.top + 5
+                self.blit_sprite(surface, ("punto", color, False, count), (piece_x, piece_y))
+            else:  # Abajo - crecen hacia arriba
+                base_y = self.board_rect.bottom - ph - 5
+                piece_y = base_y - self._stack_rise(count, self.stack_gap)
+                self.blit_sprite(surface, ("punto", color, True, count), (piece_x, piece_y))
+
+    def draw_bar(self, surface, barra):
+        w_bar, n_bar = int(barra.get("blancas", 0)), int(barra.get("negras", 0))
+        if not w_bar and not n_bar:
+            return
+
+        bar = self.bar_rect()
+        half_h = (self.board_rect.height - self.mid_gap) // 2
+        top_rect = pygame.Rect(bar.x, bar.y, bar.width, half_h)
+        bot_rect = pygame.Rect(bar.x, self.board_rect.centery + self.mid_gap // 2, bar.width, half_h)
+
+        pw, ph = self.piece_white.get_size()
+        cx = bar.x + (bar.width - pw) // 2
+        overlap = ph * 0.7
+
+        # Cuántas fichas entran en cada mitad (las que no entran no se dibujan)
+        max_fit = min(15, int((half_h - ph - 12) // overlap) + 1)
+
+        # BLANCAS ABAJO (crecen hacia arriba desde bottom)
+        count = min(w_bar, max_fit)
+        if count > 0:
+            y = bot_rect.bottom - ph - 8 - self._stack_rise(count, overlap)
+            self.blit_sprite(surface, ("barra", "blancas", count), (cx, y))
+
+        # NEGRAS ARRIBA (crecen hacia abajo desde top)
+        count = min(n_bar, max_fit)
+        if count > 0:
+            self.blit_sprite(surface, ("barra", "negras", count), (cx, top_rect.top + 8))
+
+    def draw_bear_off_zone(self, surface, fuera):
+        """Zona de fichas ya sacadas (bear-off) a la derecha del tablero, siempre visible."""
+        w_fuera = int(fuera.get("blancas", 0))
+        n_fuera = int(fuera.get("negras", 0))
+
+        if not w_fuera and not n_fuera:
+            return
+
+        pw, ph = self.piece_white.get_size()
+        overlap = int(ph * 0.6)
+
+        # Posicionar la "columna" a la derecha del tablero, pero SIN salirse de la ventana
+        pad_x = 16
+        zona_x = max(self.board_rect.right + 12, self.board_rect.right + 12)
+        zona_x = min(zona_x, self.w - pw - pad_x)   # <- clamp dentro de la pantalla
+
+        # Alto disponible de cada mitad
+        half_h = (self.board_rect.height - self.mid_gap) // 2
+
+        # Pequeños paneles para que se vean nítidas (pre-renderizados en el atlas)
+        # TOP: BLANCAS (apilan hacia ABAJO desde el borde superior de la mitad superior)
+        top_x = zona_x - 5
+        top_y = self.board_rect.top
+        self.blit_sprite(surface, ("panel_fuera",), (top_x, top_y))
+        if w_fuera:
+            self.blit_sprite(surface, ("fuera", "blancas", min(w_fuera, 15)), (zona_x, top_y + 8))
+
+        # BOTTOM: NEGRAS (apilan hacia ARRIBA desde el borde inferior de la mitad inferior)
+        bot_x = zona_x - 5
+        bot_y = self.board_rect.centery + self.mid_gap // 2
+        self.blit_sprite(surface, ("panel_fuera",), (bot_x, bot_y))
+        if n_fuera:
+            count = min(n_fuera, 15)
+            y = bot_y + half_h - ph - 8 - (count - 1) * overlap
+            self.blit_sprite(surface, ("fuera", "negras", count), (zona_x, y))
+
+
+# ---------------- Exportación por lotes (sin pantalla) ----------------
+
+_worker_renderer = None     # BoardRenderer de cada proceso del pool
+
+
+def _init_worker(width, height, cache_dir):
+    """Inicializador de cada proceso: pygame sin pantalla y un renderer propio."""
+    global _worker_renderer
+    init_headless()
+    _worker_renderer = BoardRenderer(width, height, cache_dir)
+
+
+def _export_one(item):
+    """Dibuja y guarda una posición; retorna el mensaje de error o None."""
+    path, posicion = item
+    try:
+        _worker_renderer.save_png(posicion, path)
+    except (OSError, pygame.error) as e:
+        return str(e)
+    return None
+
+
+def export_positions(items, width=960, height=600, workers=None, cache_dir=None, chunksize=32):
+    """
+    Dibuja muchas posiciones y las guarda como PNG, repartidas en un pool de procesos.
+
+    Cada proceso arma su renderer una sola vez (las imágenes escaladas salen del cache
+    en disco) y después solo dibuja: una posición cuesta unos pocos blits y el PNG.
+
+    Args:
+        items (Iterable[tuple[str, Posicion]]): (ruta del PNG, posición) a exportar.
+        width, height (int): Tamaño de cada imagen.
+        workers (int, optional): Procesos a usar. None = os.cpu_count(); 1 = en el proceso actual.
+        cache_dir (str, optional): Directorio del cache de imágenes escaladas.
+        chunksize (int): Posiciones por tarea enviada a un proceso.
+
+    Returns:
+        list[tuple[str, str]]: [(ruta, mensaje de error), ...] de las que no se pudieron guardar.
+    """
+    items = list(items)
+    workers = workers or os.cpu_count() or 1
+    initargs = (width, height, cache_dir)
+    if workers == 1:
+        _init_worker(*initargs)
+        results = list(map(_export_one, items))
+    else:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=initargs) as pool:
+            results = list(pool.map(_export_one, items, chunksize=chunksize))
+    return [(path, error) for (path, _), error in zip(items, results) if error]
@@ -0,0 +1,180 @@
+import sqlite3
+from typing import NamedTuple, Optional
+
+from source.cache_jugadas import CacheJugadas
+
+# Versión 2: la clave pasa de (mayor, menor) a todos los dados pendientes; las tablas
+# anteriores confundían un [5] suelto con un 5-5 y se descartan al abrir
+_VERSION_ESQUEMA = 2
+
+_ESQUEMA = """
+CREATE TABLE IF NOT EXISTS analisis (
+    id_posicion TEXT NOT NULL,
+    dados TEXT NOT NULL,
+    jugada TEXT NOT NULL,
+    equidad REAL NOT NULL,
+    profundidad INTEGER NOT NULL,
+    PRIMARY KEY (id_posicion, dados)
+) WITHOUT ROWID
+"""
+
+# Un análisis solo reemplaza a otro de igual o menor profundidad
+_GUARDAR = """
+INSERT INTO analisis (id_posicion, dados, jugada, equidad, profundidad)
+VALUES (?, ?, ?, ?, ?)
+ON CONFLICT (id_posicion, dados) DO UPDATE SET
+    jugada = excluded.jugada, equidad = excluded.equidad, profundidad = excluded.profundidad
+WHERE excluded.profundidad >= analisis.profundidad
+"""
+
+_BUSCAR = """
+SELECT jugada, equidad, profundidad FROM analisis
+WHERE id_posicion = ? AND dados = ?
+"""
+
+
+class Analisis(NamedTuple):
+    """
+    Resultado almacenado del análisis de una posición con una tirada.
+
+    Atributos:
+        jugada (tuple): Mejor jugada en la notación de `Backgammon.obtener_jugadas_posibles`.
+        equidad (float): Valor de la jugada desde el punto de vista del jugador en turno.
+        profundidad (int): Plies de búsqueda con que se obtuvo.
+    """
+    jugada: tuple
+    equidad: float
+    profundidad: int
+
+
+def _clave_dados(dados) -> str:
+    """
+    Todos los dados pendientes, de mayor a menor: [5], [5, 5, 5] y [5, 5, 5, 5] tienen
+    jugadas distintas y no pueden compartir clave.
+    """
+    return ' '.join(str(d) for d in sorted(dados, reverse=True))
+
+
+def _codificar_jugada(jugada: tuple) -> str:
+    return ' '.join(f"{origen}/{destino}/{dado}" for origen, destino, dado in jugada)
+
+
+def _decodificar_jugada(texto: str) -> tuple:
+    return tuple(tuple(int(v) for v in paso.split('/')) for paso in texto.split())
+
+
+class AlmacenPosiciones:
+    """
+    Responsabilidad: Persistir análisis de posiciones (mejor jugada, equidad, profundidad).
+    SRP: Solo guarda y consulta; no analiza (eso lo hace MotorBusqueda).
+    Justificación: Las aperturas y posiciones frecuentes se re-analizan una y otra vez;
+                   guardarlas en SQLite (biblioteca estándar) por Position ID y tirada
+                   convierte la búsqueda repetida en una consulta por clave primaria. Un
+                   CacheJugadas delante evita ir a disco en las consultas más calientes.
+    """
+
+    def __init__(self, ruta: str = ':memory:', tamano_cache: int = 10_000):
+        """
+        Abre (o crea) el almacén.
+
+        Args:
+            ruta (str): Archivo SQLite; ':memory:' para un almacén temporal.
+            tamano_cache (int): Entradas del LRU en memoria delante de la base.
+
+        Atributos privados:
+            __conexion__: sqlite3.Connection - Conexión propia (una por hilo/proceso).
+            __cache__: CacheJugadas - (id, dados) -> Analisis | None.
+        """
+        self.__conexion__ = sqlite3.connect(ruta, timeout=30.0)
+        if ruta != ':memory:':
+            # WAL permite lectores concurrentes mientras otro proceso escribe
+            self.__conexion__.execute("PRAGMA journal_mode=WAL")
+            self.__conexion__.execute("PRAGMA synchronous=NORMAL")
+        version = self.__conexion__.execute("PRAGMA user_version").fetchone()[0]
+        if version != _VERSION_ESQUEMA:
+            self.__conexion__.execute("DROP TABLE IF EXISTS analisis")
+            self.__conexion__.execute(f"PRAGMA user_version = {_VERSION_ESQUEMA}")
+        self.__conexion__.execute(_ESQUEMA)
+        self.__conexion__.commit()
+        self.__cache__ = CacheJugadas(max_entradas=tamano_cache)
+
+    def __enter__(self) -> 'AlmacenPosiciones':
+        return self
+
+    def __exit__(self, *exc):
+        self.cerrar()
+        return False
+
+    def __len__(self) -> int:
+        return self.__conexion__.execute("SELECT COUNT(*) FROM analisis").fetchone()[0]
+
+    def buscar(self, id_posicion: str, dados) -> Optional[Analisis]:
+        """
+        Busca el análisis de una posición con una tirada.
+
+        Args:
+            id_posicion (str): Position ID (ver `source.id_posicion`).
+            dados (Sequence[int]): Dados pendientes (el orden no importa, la cantidad sí).
+
+        Returns:
+            Analisis | None: El análisis guardado, o None si no hay.
+        """
+        clave = (id_posicion, _clave_dados(dados))
+        return self.__cache__.obtener(clave, lambda: self._leer(clave))
+
+    def guardar(self, id_posicion: str, dados, jugada: tuple, equidad: float,
+                profundidad: int):
+        """
+        Guarda un análisis; si ya había uno más profundo para la misma clave, se conserva.
+
+        Args:
+            id_posicion (str): Position ID.
+            dados (Sequence[int]): Dados pendientes con que se analizó.
+            jugada (tuple): Mejor jugada en notación pública.
+            equidad (float): Valor para el jugador en turno.
+            profundidad (int): Plies de la búsqueda.
+        """
+        self.guardar_lote([(id_posicion, dados, jugada, equidad, profundidad)])
+
+    def guardar_lote(self, analisis) -> int:
+        """
+        Guarda muchos análisis en una sola transacción.
+
+        Args:
+            analisis (Iterable[tuple]): Tuplas (id_posicion, dados, jugada, equidad, profundidad).
+
+        Returns:
+            int: Cantidad de análisis procesados.
+        """
+        filas = []
+        for id_posicion, dados, jugada, equidad, profundidad in analisis:
+            clave = (id_posicion, _clave_dados(dados))
+            filas.append((*clave, _codificar_jugada(jugada), float(equidad), int(profundidad)))
+            self.__cache__.descartar(clave)
+        with self.__conexion__:
+            self.__conexion__.executemany(_GUARDAR, filas)
+        return len(filas)
+
+    def obtener_estadisticas(self) -> dict:
+        """
+        Retorna los contadores del LRU en memoria.
+
+        Returns:
+            dict: {'aciertos': int, 'fallos': int, 'entradas': int}
+        """
+        return self.__cache__.obtener_estadisticas()
+
+    def cerrar(self):
+        """
+        Cierra la conexión.
+        """
+        self.__conexion__.close()
+
+    # ========== MÉTODOS PRIVADOS ==========
+
+    def _leer(self, clave: tuple) -> Optional[Analisis]:
+        fila = self.__conexion__.execute(_BUSCAR, clave).fetchone()
+        if fila is None:
+            return None
+        jugada, equidad, profundidad = fila
+        return Analisis(_decodificar_jugada(jugada), equidad, profundidad)
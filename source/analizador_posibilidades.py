@@ -1,6 +1,7 @@
 from source.tablero import Tablero
 from source.gestor_turnos import GestorTurnos
 from source.constantes import CASILLEROS
+from source.diario_movimientos import RegistroMovimiento
 
 
 class AnalizadorPosibilidades:
@@ -19,6 +20,8 @@ class AnalizadorPosibilidades:
         """
         self.__tablero__ = tablero
         self.__gestor_turnos__ = gestor_turnos
+        # Delta del último movimiento simulado (para revertirlo sin copiar el tablero)
+        self.__simulacion__ = None
 
     def puede_usar_dado(self, valor_dado: int) -> bool:
         """
@@ -128,45 +131,234 @@ class AnalizadorPosibilidades:
         for valor in set(movimientos_pendientes):
             if self.puede_usar_dado(valor):
                 return True
-        
+
         return False
-    
+
+    def generar_jugadas(self, dados: list[int]) -> list[tuple]:
+        """
+        Genera todas las jugadas completas legales para una tirada.
+
+        Una jugada es la secuencia de pasos que consume la tirada entera (2 dados,
+        o 4 si son dobles). Se aplican las reglas de uso obligatorio: se exige
+        usar la mayor cantidad posible de dados y, si solo puede usarse uno de
+        dos dados distintos, debe usarse el mayor. Las jugadas que llevan a la
+        misma posición final se colapsan en una sola.
+
+        La enumeración se hace en una única pasada sobre una copia local del
+        tablero, sin pasar por ValidadorMovimientos ni modificar el estado real.
+
+        Args:
+            dados (list[int]): Dados de la tirada (2 valores, o 4 iguales si son dobles)
+
+        Returns:
+            list[tuple]: Lista de jugadas. Cada jugada es una tupla de pasos
+                         (origen_idx, destino_idx, valor_dado) 0-based, donde
+                         origen_idx=None indica entrada desde barra y
+                         destino_idx=None indica bear-off. Si no hay ningún
+                         movimiento posible, retorna [()].
+        """
+        jugador = self.__gestor_turnos__.obtener_direccion()
+        color = "blancas" if jugador == 1 else "negras"
+        color_rival = "negras" if jugador == 1 else "blancas"
+        barra = self.__tablero__.obtener_barra()
+
+        estado_inicial = (
+            tuple(self.__tablero__.obtener_posiciones()),
+            barra[color],
+            barra[color_rival],
+        )
+
+        # posición final -> jugada (se conserva la primera secuencia encontrada)
+        finales = {}
+        visitados = set()
+        self._explorar_jugadas(estado_inicial, tuple(dados), (), jugador, finales, visitados)
+
+        max_pasos = max(len(jugada) for jugada in finales.values())
+        jugadas = [j for j in finales.values() if len(j) == max_pasos]
+
+        # Si solo puede usarse un dado de dos distintos, debe ser el mayor
+        if max_pasos == 1 and len(dados) == 2 and dados[0] != dados[1]:
+            dado_mayor = max(dados)
+            con_mayor = [j for j in jugadas if j[0][2] == dado_mayor]
+            if con_mayor:
+                jugadas = con_mayor
+
+        return jugadas
+
 
     # ========== MÉTODOS PRIVADOS ==========
 
+    def _explorar_jugadas(self, estado: tuple, dados: tuple, jugada: tuple,
+                          jugador: int, finales: dict, visitados: set):
+        """
+        Recorre en profundidad las secuencias de pasos posibles con los dados restantes.
+
+        Registra en `finales` cada posición alcanzada cuando ya no quedan pasos
+        posibles. `visitados` evita re-explorar el mismo par (estado, dados restantes)
+        alcanzado por órdenes distintos.
+
+        Args:
+            estado (tuple): (posiciones, barra_propia, barra_rival)
+            dados (tuple): Dados aún no usados
+            jugada (tuple): Pasos aplicados hasta ahora
+            jugador (int): 1 para blancas, -1 para negras
+            finales (dict): Acumulador posición final -> jugada
+            visitados (set): Pares (estado, dados) ya explorados
+        """
+        clave = (estado, tuple(sorted(dados)))
+        if clave in visitados:
+            return
+        visitados.add(clave)
+
+        hubo_paso = False
+        # Mayor dado primero: si dos secuencias llegan a la misma posición final,
+        # se conserva la que usa el dado mayor (ver regla del dado mayor)
+        for valor_dado in sorted(set(dados), reverse=True):
+            restantes = list(dados)
+            restantes.remove(valor_dado)
+            for paso in self._pasos_legales(estado, valor_dado, jugador):
+                hubo_paso = True
+                siguiente = self._aplicar_paso(estado, paso, jugador)
+                self._explorar_jugadas(siguiente, tuple(restantes), jugada + (paso,),
+                                       jugador, finales, visitados)
+
+        if not hubo_paso:
+            anterior = finales.get(estado)
+            if anterior is None or len(jugada) > len(anterior):
+                finales[estado] = jugada
+
+    def _pasos_legales(self, estado: tuple, valor_dado: int, jugador: int) -> list[tuple]:
+        """
+        Lista los pasos legales de un solo dado sobre un estado local.
+
+        Args:
+            estado (tuple): (posiciones, barra_propia, barra_rival)
+            valor_dado (int): Valor del dado
+            jugador (int): 1 para blancas, -1 para negras
+
+        Returns:
+            list[tuple]: Pasos (origen_idx, destino_idx, valor_dado)
+        """
+        pos, barra_propia, _ = estado
+
+        # Prioridad: fichas en barra
+        if barra_propia > 0:
+            destino_idx = self._calcular_indice_entrada(jugador, valor_dado)
+            if self._destino_bloqueado(pos[destino_idx], jugador):
+                return []
+            return [(None, destino_idx, valor_dado)]
+
+        pasos = []
+        en_home = self._todas_en_home_en(pos, jugador)
+        for origen_idx in range(CASILLEROS):
+            if pos[origen_idx] * jugador <= 0:
+                continue
+
+            destino_idx = origen_idx + jugador * valor_dado
+
+            # Movimiento dentro del tablero
+            if 0 <= destino_idx < CASILLEROS:
+                if not self._destino_bloqueado(pos[destino_idx], jugador):
+                    pasos.append((origen_idx, destino_idx, valor_dado))
+
+            # Bear-off
+            elif en_home and self._puede_hacer_bear_off(origen_idx, valor_dado, jugador, pos):
+                pasos.append((origen_idx, None, valor_dado))
+
+        return pasos
+
+    def _aplicar_paso(self, estado: tuple, paso: tuple, jugador: int) -> tuple:
+        """
+        Aplica un paso sobre un estado local y retorna el estado resultante.
+
+        No modifica el tablero real: trabaja sobre tuplas inmutables.
+
+        Args:
+            estado (tuple): (posiciones, barra_propia, barra_rival)
+            paso (tuple): (origen_idx, destino_idx, valor_dado)
+            jugador (int): 1 para blancas, -1 para negras
+
+        Returns:
+            tuple: Nuevo estado (posiciones, barra_propia, barra_rival)
+        """
+        pos, barra_propia, barra_rival = estado
+        origen_idx, destino_idx, _ = paso
+        pos = list(pos)
+
+        if origen_idx is None:
+            barra_propia -= 1
+        else:
+            pos[origen_idx] -= jugador
+
+        if destino_idx is not None:
+            if self._es_blot_rival(pos[destino_idx], jugador):
+                barra_rival += 1
+                pos[destino_idx] = jugador
+            else:
+                pos[destino_idx] += jugador
+
+        return (tuple(pos), barra_propia, barra_rival)
+
+    def _todas_en_home_en(self, pos, jugador: int) -> bool:
+        """
+        Verifica si todas las fichas del jugador están en home sobre unas posiciones dadas.
+
+        Args:
+            pos (Sequence[int]): Posiciones a evaluar
+            jugador (int): 1 para blancas, -1 para negras
+
+        Returns:
+            bool: True si todas están en home
+        """
+        if jugador == 1:  # blancas: home 18..23
+            return all(x <= 0 for x in pos[:18])
+        else:  # negras: home 0..5
+            return all(x >= 0 for x in pos[6:])
+
     def _puede_usar_dado_tras_simular(self, primer_dado: int, segundo_dado: int) -> bool:
         """
         Simula usar primer_dado y verifica si luego se puede usar segundo_dado.
+
+        Prueba los movimientos posibles con primer_dado en orden de origen: si tras
+        uno de ellos segundo_dado no puede usarse, simula el siguiente origen.
         
         Args:
             primer_dado (int): Dado a simular primero
             segundo_dado (int): Dado a verificar después
         
         Returns:
-            bool: True si tras usar primer_dado se puede usar segundo_dado
-        """
-        # Guardar estado original (backup para restaurar)
-        pos_backup = self.__tablero__.obtener_posiciones()
-        barra_backup = self.__tablero__.obtener_barra()
-        
-        try:
-            # Simular mejor movimiento con primer_dado
-            if self._simular_mejor_movimiento(primer_dado):
+            bool: True si tras algún movimiento con primer_dado se puede usar segundo_dado
+        """
+        desde = 0
+        while True:
+            self.__simulacion__ = None
+            try:
+                # Simular el siguiente movimiento con primer_dado
+                if not self._simular_mejor_movimiento(primer_dado, desde):
+                    return False
                 # Verificar si se puede usar segundo_dado
-                return self.puede_usar_dado(segundo_dado)
-            return False
-        finally:
-            # Restaurar estado original
-            self._restaurar_estado(pos_backup, barra_backup)
+                if self.puede_usar_dado(segundo_dado):
+                    return True
+                simulado = self.__simulacion__
+            finally:
+                # Revertir el movimiento simulado (O(1), sin backup completo)
+                self._deshacer_simulacion()
 
-    def _simular_mejor_movimiento(self, valor_dado: int) -> bool:
+            # La entrada desde barra es única; sin registro no hay siguiente origen
+            if simulado is None or simulado.origen_idx is None:
+                return False
+            desde = simulado.origen_idx + 1
+
+    def _simular_mejor_movimiento(self, valor_dado: int, desde: int = 0) -> bool:
         """
         Simula y aplica el mejor movimiento posible con el dado dado.
         
-        Modifica el estado del tablero temporalmente (debe restaurarse después).
+        Modifica el estado del tablero temporalmente y guarda el delta aplicado
+        para que `_deshacer_simulacion` lo revierta.
         
         Args:
             valor_dado (int): Valor del dado a simular
+            desde (int): Primer índice de origen a considerar (0 = todos)
         
         Returns:
             bool: True si encontró y aplicó un movimiento válido
@@ -179,12 +371,15 @@ class AnalizadorPosibilidades:
             destino_idx = self._calcular_indice_entrada(jugador, valor_dado)
             if 0 <= destino_idx < CASILLEROS:
                 if not self._destino_bloqueado(pos[destino_idx], jugador):
+                    capturo = self._es_blot_rival(pos[destino_idx], jugador)
                     self._ejecutar_entrada_simulada(destino_idx, jugador)
+                    self.__simulacion__ = RegistroMovimiento(
+                        jugador, None, destino_idx, valor_dado, capturo)
                     return True
             return False
         
         # Buscar primer movimiento válido
-        for origen_idx in range(CASILLEROS):
+        for origen_idx in range(desde, CASILLEROS):
             if pos[origen_idx] * jugador <= 0:
                 continue
             
@@ -193,13 +388,18 @@ class AnalizadorPosibilidades:
             # Movimiento dentro del tablero
             if 0 <= destino_idx < CASILLEROS:
                 if not self._destino_bloqueado(pos[destino_idx], jugador):
+                    capturo = self._es_blot_rival(pos[destino_idx], jugador)
                     self._ejecutar_movimiento_simulado(origen_idx, destino_idx, jugador)
+                    self.__simulacion__ = RegistroMovimiento(
+                        jugador, origen_idx, destino_idx, valor_dado, capturo)
                     return True
             
             # Bear-off
             elif self._todas_en_home(jugador):
                 if self._puede_hacer_bear_off(origen_idx, valor_dado, jugador, pos):
-                    pos[origen_idx] -= jugador
+                    self.__tablero__._fijar_casillero(origen_idx, pos[origen_idx] - jugador)
+                    self.__simulacion__ = RegistroMovimiento(
+                        jugador, origen_idx, None, valor_dado, False)
                     return True
         
         return False
@@ -212,20 +412,20 @@ class AnalizadorPosibilidades:
             destino_idx (int): Índice de destino
             jugador (int): 1 para blancas, -1 para negras
         """
-        pos = self.__tablero__._obtener_posiciones_ref()
-        barra = self.__tablero__._obtener_barra_ref()
+        tablero = self.__tablero__
+        pos = tablero._obtener_posiciones_ref()
         
         # Capturar si hay blot rival
         if self._es_blot_rival(pos[destino_idx], jugador):
             color_rival = "negras" if jugador == 1 else "blancas"
-            barra[color_rival] += 1
-            pos[destino_idx] = jugador
+            tablero._sumar_barra(color_rival, 1)
+            tablero._fijar_casillero(destino_idx, jugador)
         else:
-            pos[destino_idx] += jugador
+            tablero._fijar_casillero(destino_idx, pos[destino_idx] + jugador)
         
         # Decrementar barra
         color = "blancas" if jugador == 1 else "negras"
-        barra[color] -= 1
+        tablero._sumar_barra(color, -1)
 
     def _ejecutar_movimiento_simulado(self, origen_idx: int, destino_idx: int, jugador: int):
         """
@@ -236,33 +436,49 @@ class AnalizadorPosibilidades:
             destino_idx (int): Índice de destino
             jugador (int): 1 para blancas, -1 para negras
         """
-        pos = self.__tablero__._obtener_posiciones_ref()
-        barra = self.__tablero__._obtener_barra_ref()
+        tablero = self.__tablero__
+        pos = tablero._obtener_posiciones_ref()
         
         # Capturar si hay blot rival
         if self._es_blot_rival(pos[destino_idx], jugador):
             color_rival = "negras" if jugador == 1 else "blancas"
-            barra[color_rival] += 1
-            pos[destino_idx] = jugador
+            tablero._sumar_barra(color_rival, 1)
+            tablero._fijar_casillero(destino_idx, jugador)
         else:
-            pos[destino_idx] += jugador
+            tablero._fijar_casillero(destino_idx, pos[destino_idx] + jugador)
         
-        pos[origen_idx] -= jugador
+        tablero._fijar_casillero(origen_idx, pos[origen_idx] - jugador)
 
-    def _restaurar_estado(self, pos_backup: list[int], barra_backup: dict):
-        """
-        Restaura el estado del tablero después de una simulación.
-        
-        Args:
-            pos_backup (list[int]): Backup de posiciones
-            barra_backup (dict): Backup de barra
+    def _deshacer_simulacion(self):
         """
-        pos_ref = self.__tablero__._obtener_posiciones_ref()
-        barra_ref = self.__tablero__._obtener_barra_ref()
-        
-        # Restaurar valores originales
-        pos_ref[:] = pos_backup
-        barra_ref.update(barra_backup)
+        Revierte el último movimiento simulado aplicando su delta inverso.
+
+        Funcionamiento: Usa el RegistroMovimiento guardado por `_simular_mejor_movimiento`,
+        por lo que el rollback es O(1) y no requiere copias del tablero ni de la barra.
+        Si no hubo simulación, no hace nada.
+        """
+        registro = self.__simulacion__
+        if registro is None:
+            return
+        self.__simulacion__ = None
+
+        jugador = registro.jugador
+        tablero = self.__tablero__
+        pos = tablero._obtener_posiciones_ref()
+
+        if registro.destino_idx is not None:
+            if registro.capturo:
+                color_rival = "negras" if jugador == 1 else "blancas"
+                tablero._sumar_barra(color_rival, -1)
+                tablero._fijar_casillero(registro.destino_idx, -jugador)
+            else:
+                tablero._fijar_casillero(registro.destino_idx, pos[registro.destino_idx] - jugador)
+
+        if registro.origen_idx is None:
+            color = "blancas" if jugador == 1 else "negras"
+            tablero._sumar_barra(color, 1)
+        else:
+            tablero._fijar_casillero(registro.origen_idx, pos[registro.origen_idx] + jugador)
 
     def _puede_entrar_desde_barra(self, valor_dado: int, jugador: int) -> bool:
         """
@@ -322,11 +538,7 @@ class AnalizadorPosibilidades:
         Returns:
             bool: True si todas están en home
         """
-        pos = self.__tablero__.obtener_posiciones()
-        if jugador == 1:  # blancas: home 18..23
-            return all(x <= 0 for x in pos[:18])
-        else:  # negras: home 0..5
-            return all(x >= 0 for x in pos[6:])
+        return self.__tablero__.todas_en_home("blancas" if jugador == 1 else "negras")
 
     def _hay_en_barra(self, jugador: int) -> bool:
         """
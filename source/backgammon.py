@@ -4,7 +4,10 @@ from source.gestor_turnos import GestorTurnos
 from source.validador_movimientos import ValidadorMovimientos
 from source.ejecutor_movimientos import EjecutorMovimientos
 from source.analizador_posibilidades import AnalizadorPosibilidades
+from source.cache_jugadas import CacheJugadas
+from source.id_posicion import id_posicion
 from source.excepciones import *
+from source.resultado_validacion import MotivoRechazo, excepcion_para
 from source.constantes import CASILLEROS
 
 
@@ -21,7 +24,7 @@ class Backgammon:
     - DIP: Depende de clases concretas pero bien separadas
     """
 
-    def __init__(self):
+    def __init__(self, dados: Dados = None, cache: CacheJugadas = None):
         """
         Inicializa una instancia del juego Backgammon.
 
@@ -33,21 +36,29 @@ class Backgammon:
         - Ejecutor de movimientos
         - Analizador de posibilidades
         - Lista de movimientos pendientes
+        - Cache del análisis de movimientos legales
 
-        No recibe parámetros y no retorna valor.
+        Args:
+            dados (Dados, optional): Dados a usar (p. ej. sembrados o en modo replay).
+                                     Por defecto, Dados() sobre el módulo random global.
+            cache (CacheJugadas, optional): Cache de análisis a usar; puede compartirse
+                                            entre partidas. Por defecto, uno propio.
         """
         # Componentes básicos
         self.__tablero__ = Tablero()
-        self.__dados__ = Dados()
+        self.__dados__ = dados if dados is not None else Dados()
         self.__gestor_turnos__ = GestorTurnos()
         
         # Componentes especializados (inyección de dependencias)
         self.__validador__ = ValidadorMovimientos(self.__tablero__, self.__gestor_turnos__)
         self.__ejecutor__ = EjecutorMovimientos(self.__tablero__, self.__gestor_turnos__)
         self.__analizador__ = AnalizadorPosibilidades(self.__tablero__, self.__gestor_turnos__)
+        self.__cache__ = cache if cache is not None else CacheJugadas()
         
         # Estado del juego
         self.__movimientos_pendientes__ = []
+        self.__grabador__ = None
+        self.__version__ = 0
 
     # ========== API PÚBLICA - CONSULTAS DE ESTADO ==========
 
@@ -90,6 +101,43 @@ class Backgammon:
         """
         return self.__tablero__.obtener_fichas_fuera()
 
+    def obtener_pips(self) -> dict[str, int]:
+        """
+        API pública que retorna el conteo de pips de cada color (barra = 25 pips).
+
+        Delega a los contadores incrementales del Tablero (O(1)).
+
+        Returns:
+            dict[str,int]: Pips restantes con claves 'blancas' y 'negras'.
+        """
+        return {
+            'blancas': self.__tablero__.obtener_pips('blancas'),
+            'negras': self.__tablero__.obtener_pips('negras'),
+        }
+
+    def todas_en_home(self, color: str = None) -> bool:
+        """
+        Indica si todas las fichas sobre el tablero de un color están en su home.
+
+        Args:
+            color (str, optional): "blancas" o "negras". Si es None, se asume el jugador actual.
+
+        Returns:
+            bool: True si no quedan fichas del color fuera del home (sin considerar la barra).
+        """
+        if color is None:
+            color = self.obtener_turno()
+        return self.__tablero__.todas_en_home(color)
+
+    def obtener_posicion(self):
+        """
+        API pública que retorna una instantánea inmutable y hashable del tablero.
+
+        Returns:
+            Posicion: Posiciones, barra y fichas fuera empaquetadas (ver `source.posicion`).
+        """
+        return self.__tablero__.obtener_posicion()
+
     def obtener_ficha_en_posicion(self, posicion: int) -> int:
         """
         Retorna la cantidad (con signo) de fichas en una posición específica.
@@ -121,6 +169,43 @@ class Backgammon:
             color = self.obtener_turno()
         return self.__tablero__.hay_fichas_en_barra(color)
 
+    def obtener_id_posicion(self) -> str:
+        """
+        Retorna el Position ID de GNU Backgammon de la posición actual (14 caracteres).
+
+        Sirve como clave compacta y portable (caches, bases de datos, red); el turno
+        forma parte de la codificación.
+
+        Returns:
+            str: Identificador base64 (ver `source.id_posicion`).
+        """
+        return id_posicion(self.obtener_posicion(), self.obtener_turno())
+
+    def obtener_version(self) -> int:
+        """
+        Retorna un contador que aumenta con cada cambio de estado del juego.
+
+        Cambia con cada tirada, movimiento, deshacer/rehacer y cambio de turno. Las
+        interfaces lo comparan con el último valor visto para recalcular su estado
+        derivado solo cuando algo cambió, en lugar de releer el tablero en cada frame.
+
+        Returns:
+            int: Versión actual del estado.
+        """
+        return self.__version__
+
+    def obtener_clave_posicion(self) -> int:
+        """
+        Retorna el hash Zobrist de 64 bits de la posición actual (tablero y turno).
+
+        El EjecutorMovimientos lo mantiene de forma incremental, por lo que la consulta
+        es O(1) y sirve como clave de tablas de transposición.
+
+        Returns:
+            int: Hash de 64 bits.
+        """
+        return self.__ejecutor__.obtener_clave()
+
     def obtener_movimientos_pendientes(self) -> list[int]:
         """
         Retorna una copia de los movimientos pendientes de la tirada actual.
@@ -148,11 +233,16 @@ class Backgammon:
         Returns:
             bool: True si hay al menos un movimiento válido con los dados pendientes, False si no.
         """
-        return self.__analizador__.hay_movimiento_posible(self.__movimientos_pendientes__)
+        pendientes = self.__movimientos_pendientes__
+        return self._consultar_cache(
+            'hay_movimiento', lambda: self.__analizador__.hay_movimiento_posible(pendientes))
     
     def obtener_movimientos_posibles(self) -> dict:
         """
         Obtiene todos los movimientos posibles con los dados actuales.
+
+        El resultado se memoriza por posición, turno y dados pendientes, de modo que
+        las consultas repetidas (p. ej. un clic tras otro en la GUI) no revalidan.
         
         Returns:
             dict: Diccionario con estructura:
@@ -160,6 +250,27 @@ class Backgammon:
                 - Si no: {origen: [(destino, dado), ...], ...}
                 donde destino=-1 indica bear-off
         """
+        if not self.__movimientos_pendientes__:
+            return {}
+        movimientos = self._consultar_cache('movimientos', self._calcular_movimientos_posibles)
+        return {origen: list(destinos) for origen, destinos in movimientos.items()}
+
+    def obtener_estadisticas_cache(self) -> dict:
+        """
+        Retorna los contadores del cache de análisis de movimientos.
+
+        Returns:
+            dict: {'aciertos': int, 'fallos': int, 'entradas': int}
+        """
+        return self.__cache__.obtener_estadisticas()
+
+    def _calcular_movimientos_posibles(self) -> dict:
+        """
+        Calcula los movimientos de un solo dado (ver `obtener_movimientos_posibles`).
+
+        Returns:
+            dict: {origen: [(destino, dado), ...]} o {'barra': [...]}
+        """
         movimientos = {}
         pendientes = self.__movimientos_pendientes__
         
@@ -209,9 +320,46 @@ class Backgammon:
             
             if movimientos_origen:
                 movimientos[origen] = movimientos_origen
-        
+
         return movimientos
 
+    def obtener_jugadas_posibles(self) -> list[tuple]:
+        """
+        Obtiene todas las jugadas completas legales con los dados pendientes.
+
+        A diferencia de `obtener_movimientos_posibles` (que lista pasos de un solo dado),
+        cada jugada consume la tirada completa respetando las reglas de uso obligatorio.
+        Las jugadas que llevan a la misma posición final aparecen una sola vez.
+        Delega al AnalizadorPosibilidades.
+
+        Returns:
+            list[tuple]: Lista de jugadas; cada jugada es una tupla de pasos
+                         (origen, destino, dado) en notación 1-based, donde
+                         origen=0 indica entrada desde barra y destino=-1 indica
+                         bear-off. Cada paso puede aplicarse con `mover(origen, dado)`.
+                         Lista vacía si no hay dados pendientes.
+        """
+        if not self.__movimientos_pendientes__:
+            return []
+        return list(self._consultar_cache('jugadas', self._calcular_jugadas_posibles))
+
+    def _calcular_jugadas_posibles(self) -> list[tuple]:
+        """
+        Genera las jugadas completas en notación pública (ver `obtener_jugadas_posibles`).
+
+        Returns:
+            list[tuple]: Jugadas como tuplas de pasos (origen, destino, dado).
+        """
+        jugadas = []
+        for jugada in self.__analizador__.generar_jugadas(self.__movimientos_pendientes__):
+            pasos = []
+            for origen_idx, destino_idx, dado in jugada:
+                origen = 0 if origen_idx is None else origen_idx + 1
+                destino = -1 if destino_idx is None else destino_idx + 1
+                pasos.append((origen, destino, dado))
+            jugadas.append(tuple(pasos))
+        return jugadas
+
     # ========== API PÚBLICA - ACCIONES DEL JUEGO ==========
 
     def tirar_dados(self) -> tuple[int, int]:
@@ -225,14 +373,41 @@ class Backgammon:
         """
         d1, d2 = self.__dados__.tirar()
 
+        # Una tirada nueva invalida el historial de deshacer
+        self.__ejecutor__.obtener_diario().limpiar()
+
         # Preparar movimientos pendientes
         if d1 == d2:
             self.__movimientos_pendientes__ = [d1] * 4
         else:
             self.__movimientos_pendientes__ = [d1, d2]
+        self.__version__ += 1
+
+        if self.__grabador__ is not None:
+            self.__grabador__.tirada(d1, d2)
 
         return d1, d2
 
+    def grabar_en(self, escritor):
+        """
+        Empieza a grabar la partida en un escritor de registros.
+
+        Funcionamiento: Registra el inicio de partida y, desde entonces, avisa al
+        escritor de cada tirada, movimiento, deshacer/rehacer y fin de turno.
+
+        Args:
+            escritor (EscritorPartidas): Destino de los eventos.
+
+        Raises:
+            ValueError: Si la partida no está en su estado inicial (el formato siempre
+                        parte de la posición inicial con turno de blancas).
+        """
+        if (self.obtener_posicion() != Tablero().obtener_posicion()
+                or self.obtener_turno() != "blancas" or self.__movimientos_pendientes__):
+            raise ValueError("Solo se puede grabar una partida desde su estado inicial")
+        escritor.nueva_partida()
+        self.__grabador__ = escritor
+
     def cambiar_turno(self):
         """
         Cambia el turno del juego.
@@ -241,15 +416,72 @@ class Backgammon:
         No recibe parámetros y no devuelve valor.
         """
         self.__gestor_turnos__.cambiar_turno()
+        self.__version__ += 1
 
     def finalizar_tirada(self):
         """
         Finaliza la tirada actual: limpia los movimientos pendientes y cambia el turno al oponente.
 
+        Los movimientos de la tirada quedan confirmados: se vacía el historial de deshacer.
         No recibe parámetros y no retorna valor.
         """
         self.__movimientos_pendientes__.clear()
+        self.__ejecutor__.obtener_diario().limpiar()
         self.cambiar_turno()
+        if self.__grabador__ is not None:
+            self.__grabador__.fin_turno()
+
+    def deshacer_movimiento(self) -> bool:
+        """
+        Deshace el último movimiento de la tirada actual y devuelve su dado a los pendientes.
+
+        Delega al EjecutorMovimientos, que revierte el delta registrado en O(1).
+
+        Returns:
+            bool: True si se deshizo un movimiento, False si no había nada para deshacer.
+        """
+        registro = self.__ejecutor__.deshacer()
+        if registro is None:
+            return False
+        self.__movimientos_pendientes__.append(registro.valor_dado)
+        self.__version__ += 1
+        if self.__grabador__ is not None:
+            self.__grabador__.deshacer()
+        return True
+
+    def rehacer_movimiento(self) -> bool:
+        """
+        Rehace el último movimiento deshecho y vuelve a consumir su dado.
+
+        Returns:
+            bool: True si se rehízo un movimiento, False si no había nada para rehacer.
+        """
+        registro = self.__ejecutor__.rehacer()
+        if registro is None:
+            return False
+        self.consumir_movimiento(registro.valor_dado)
+        if self.__grabador__ is not None:
+            origen = 0 if registro.origen_idx is None else registro.origen_idx + 1
+            self.__grabador__.movimiento(origen, registro.valor_dado)
+        return True
+
+    def puede_deshacer(self) -> bool:
+        """
+        Indica si hay movimientos de la tirada actual que puedan deshacerse.
+
+        Returns:
+            bool: True si hay al menos un movimiento para deshacer.
+        """
+        return self.__ejecutor__.obtener_diario().puede_deshacer()
+
+    def puede_rehacer(self) -> bool:
+        """
+        Indica si hay movimientos deshechos que puedan rehacerse.
+
+        Returns:
+            bool: True si hay al menos un movimiento para rehacer.
+        """
+        return self.__ejecutor__.obtener_diario().puede_rehacer()
 
     def consumir_movimiento(self, valor: int) -> bool:
         """
@@ -263,6 +495,7 @@ class Backgammon:
         """
         if valor in self.__movimientos_pendientes__:
             self.__movimientos_pendientes__.remove(valor)
+            self.__version__ += 1  # también cubre mover y rehacer, que consumen su dado
             return True
         return False
 
@@ -311,10 +544,10 @@ class Backgammon:
             raise DadoNoDisponibleError("dado no disponible para este movimiento")
 
         # 4. VALIDAR movimiento (delega a ValidadorMovimientos)
-        es_valido, mensaje_error = self.__validador__.validar_movimiento(origen_idx, valor_dado)
+        es_valido, motivo = self.__validador__.validar_movimiento(origen_idx, valor_dado)
 
         if not es_valido:
-            self._lanzar_excepcion_apropiada(mensaje_error)
+            self._lanzar_excepcion_apropiada(motivo)
 
         # 5. EJECUTAR movimiento (delega a EjecutorMovimientos)
         resultado = self.__ejecutor__.ejecutar_movimiento(origen_idx, valor_dado)
@@ -322,6 +555,9 @@ class Backgammon:
         # 6. Consumir dado
         self.consumir_movimiento(valor_dado)
 
+        if self.__grabador__ is not None:
+            self.__grabador__.movimiento(origen, valor_dado)
+
         return resultado
 
     # ========== MÉTODOS PRIVADOS (HELPERS) ==========
@@ -331,7 +567,8 @@ class Backgammon:
         Valida la regla de dado mayor si corresponde.
 
         Si solo se puede usar uno de los dos dados, debe ser el mayor.
-        Delega al AnalizadorPosibilidades para determinar esto.
+        Delega al AnalizadorPosibilidades para determinar esto; la respuesta se
+        memoriza porque no cambia hasta que cambien el tablero o los dados.
 
         Args:
             valor_dado (int): Valor del dado que se intenta usar
@@ -339,11 +576,32 @@ class Backgammon:
         Raises:
             DadoNoDisponibleError: Si debe usar el dado mayor y no lo está usando
         """
-        if self.__analizador__.debe_usar_dado_mayor(self.__movimientos_pendientes__):
+        pendientes = self.__movimientos_pendientes__
+        if len(pendientes) == 2 and pendientes[0] != pendientes[1] and self._consultar_cache(
+                'dado_mayor', lambda: self.__analizador__.debe_usar_dado_mayor(pendientes)):
             dado_mayor = max(self.__movimientos_pendientes__)
             if valor_dado != dado_mayor:
                 raise DadoNoDisponibleError(f"debe usar el dado mayor ({dado_mayor})")
 
+    def _consultar_cache(self, consulta: str, calcular):
+        """
+        Resuelve una consulta de análisis a través del cache.
+
+        Funcionamiento: La clave es (consulta, instantánea Posicion, dirección del jugador
+        en turno, dados pendientes ordenados): todo lo que determina la respuesta.
+
+        Args:
+            consulta (str): Nombre del análisis ('dado_mayor', 'movimientos', ...).
+            calcular (callable): Función sin argumentos que calcula la respuesta.
+
+        Returns:
+            object: La respuesta (compartida: no debe mutarse).
+        """
+        clave = (consulta, self.__tablero__.obtener_posicion(),
+                 self.__gestor_turnos__.obtener_direccion(),
+                 tuple(sorted(self.__movimientos_pendientes__)))
+        return self.__cache__.obtener(clave, calcular)
+
     def _mover_desde_barra(self, valor_dado: int) -> str:
         """
         Maneja el movimiento especial de entrada desde la barra.
@@ -359,10 +617,10 @@ class Backgammon:
             DestinoBloquedoError: Si la posición de entrada está bloqueada
         """
         # Validar entrada desde barra
-        es_valido, mensaje_error = self.__validador__.validar_entrada_barra(valor_dado)
+        es_valido, motivo = self.__validador__.validar_entrada_barra(valor_dado)
 
         if not es_valido:
-            self._lanzar_excepcion_apropiada(mensaje_error)
+            self._lanzar_excepcion_apropiada(motivo)
 
         # Ejecutar entrada desde barra
         resultado = self.__ejecutor__.ejecutar_entrada_barra(valor_dado)
@@ -370,29 +628,26 @@ class Backgammon:
         # Consumir dado
         self.consumir_movimiento(valor_dado)
 
+        if self.__grabador__ is not None:
+            self.__grabador__.movimiento(0, valor_dado)
+
         return resultado
 
-    def _lanzar_excepcion_apropiada(self, mensaje_error: str):
+    def _lanzar_excepcion_apropiada(self, motivo: MotivoRechazo):
         """
-        Mapea un mensaje de error a la excepción apropiada.
+        Lanza la excepción que corresponde a un código de rechazo del validador.
+
+        Funcionamiento: Búsqueda directa en EXCEPCIONES_POR_MOTIVO; el texto del motivo
+        solo se usa como mensaje de la excepción. Un código desconocido (o un texto que no
+        coincide con ningún motivo) produce MovimientoInvalidoError.
 
         Args:
-            mensaje_error (str): Mensaje descriptivo del error
+            motivo (MotivoRechazo): Código del rechazo
 
         Raises:
-            OrigenInvalidoError: Si el error está relacionado con el origen
-            DestinoBloquedoError: Si el error está relacionado con destino bloqueado
-            BearOffInvalidoError: Si el error está relacionado con bear-off
-            MovimientoInvalidoError: Para otros errores genéricos
-        """
-        # Mapeo de palabras clave a excepciones
-        if "origen" in mensaje_error.lower():
-            raise OrigenInvalidoError(mensaje_error)
-        elif "bloqueada" in mensaje_error.lower() or "bloqueado" in mensaje_error.lower():
-            raise DestinoBloquedoError(mensaje_error)
-        elif any(palabra in mensaje_error.lower() for palabra in ["home", "insuficiente", "adelantada"]):
-            raise BearOffInvalidoError(mensaje_error)
-        elif "tablero" in mensaje_error.lower():
-            raise MovimientoInvalidoError(mensaje_error)
-        else:
-            raise MovimientoInvalidoError(mensaje_error)
\ No newline at end of file
+            OrigenInvalidoError: Si el origen no tiene fichas propias
+            DestinoBloquedoError: Si el destino o la entrada están bloqueados
+            BearOffInvalidoError: Si el bear-off no es legal
+            MovimientoInvalidoError: Para los demás rechazos
+        """
+        raise excepcion_para(motivo)
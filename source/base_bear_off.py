@@ -0,0 +1,321 @@
+import mmap
+import struct
+from math import comb
+
+from source.constantes import CASILLEROS
+
+PUNTOS_HOME = 6
+MAX_FICHAS = 15
+
+# Las 21 tiradas distintas, en orden fijo (índice de tirada en el archivo)
+TIRADAS = tuple((d1, d2) for d1 in range(1, 7) for d2 in range(d1, 7))
+_INDICE_TIRADA = {tirada: i for i, tirada in enumerate(TIRADAS)}
+
+_MAGIA = b'BGBO'
+_VERSION = 1
+_CABECERA = struct.Struct('<4sHHI')  # magia, versión, max_fichas, cantidad de posiciones
+
+
+def cantidad_posiciones(max_fichas: int = MAX_FICHAS) -> int:
+    """
+    Cantidad de distribuciones de hasta `max_fichas` fichas sobre los 6 puntos del home.
+
+    Args:
+        max_fichas (int): Máximo de fichas.
+
+    Returns:
+        int: C(6 + max_fichas, 6).
+    """
+    return comb(PUNTOS_HOME + max_fichas, PUNTOS_HOME)
+
+
+def indice_posicion(fichas: tuple, max_fichas: int = MAX_FICHAS) -> int:
+    """
+    Calcula el índice (rango combinatorio) de una distribución de fichas.
+
+    Funcionamiento: Biyección entre distribuciones y [0, cantidad_posiciones). Para cada
+    punto se cuentan las distribuciones que tienen menos fichas en ese punto y el mismo
+    prefijo; no requiere tablas auxiliares.
+
+    Args:
+        fichas (tuple[int, ...]): 6 contadores; fichas[k] = fichas a distancia k+1 de salir.
+        max_fichas (int): Máximo de fichas de la base.
+
+    Returns:
+        int: Índice de la posición.
+    """
+    indice = 0
+    restantes = max_fichas
+    for k, cantidad in enumerate(fichas):
+        puntos_siguientes = PUNTOS_HOME - k - 1
+        for v in range(cantidad):
+            indice += comb(puntos_siguientes + restantes - v, puntos_siguientes)
+        restantes -= cantidad
+    return indice
+
+
+def _sucesores(fichas: tuple, dado: int) -> list[tuple]:
+    """
+    Pasos posibles con un dado en un bear-off sin contacto.
+
+    Funcionamiento: Aplica las mismas reglas que el core (`_puede_hacer_bear_off`):
+    distancia exacta, o excedente solo si no hay fichas propias más cerca de la salida.
+
+    Args:
+        fichas (tuple): Distribución actual.
+        dado (int): Valor del dado.
+
+    Returns:
+        list[tuple]: Pares (distribución resultante, distancia de origen del paso).
+    """
+    resultado = []
+    for k, cantidad in enumerate(fichas):
+        if cantidad == 0:
+            continue
+        distancia = k + 1
+        if dado > distancia and any(fichas[:k]):
+            continue
+        nueva = list(fichas)
+        nueva[k] -= 1
+        if dado < distancia:
+            nueva[k - dado] += 1
+        resultado.append((tuple(nueva), distancia))
+    return resultado
+
+
+def _finales(fichas: tuple, d1: int, d2: int) -> dict:
+    """
+    Posiciones alcanzables con una tirada completa y una secuencia de pasos para cada una.
+
+    Args:
+        fichas (tuple): Distribución inicial.
+        d1 (int): Primer dado.
+        d2 (int): Segundo dado.
+
+    Returns:
+        dict: distribución final -> tupla de pasos (distancia_origen, dado).
+    """
+    ordenes = [(d1,) * 4] if d1 == d2 else [(d1, d2), (d2, d1)]
+    finales = {}
+    for orden in ordenes:
+        nivel = {fichas: ()}
+        for dado in orden:
+            siguiente = {}
+            for estado, pasos in nivel.items():
+                if not any(estado):
+                    siguiente.setdefault(estado, pasos)
+                    continue
+                for nuevo, distancia in _sucesores(estado, dado):
+                    siguiente.setdefault(nuevo, pasos + ((distancia, dado),))
+            nivel = siguiente
+        for estado, pasos in nivel.items():
+            finales.setdefault(estado, pasos)
+    return finales
+
+
+def _codificar_pasos(pasos: tuple) -> int:
+    """Empaqueta hasta 4 pasos (distancia, dado) en 24 bits (6 bits por paso, 0 = sin paso)."""
+    codigo = 0
+    for i, (distancia, dado) in enumerate(pasos):
+        codigo |= ((distancia - 1) * 6 + (dado - 1) + 1) << (6 * i)
+    return codigo
+
+
+def _decodificar_pasos(codigo: int) -> tuple:
+    """Inversa de `_codificar_pasos`."""
+    pasos = []
+    while codigo:
+        valor = (codigo & 0x3F) - 1
+        pasos.append((valor // 6 + 1, valor % 6 + 1))
+        codigo >>= 6
+    return tuple(pasos)
+
+
+def _todas_las_posiciones(max_fichas: int):
+    """Genera todas las distribuciones de hasta `max_fichas` fichas sobre 6 puntos."""
+    def generar(k, restantes):
+        if k == PUNTOS_HOME:
+            yield ()
+            return
+        for v in range(restantes + 1):
+            for resto in generar(k + 1, restantes - v):
+                yield (v,) + resto
+    return generar(0, max_fichas)
+
+
+class BaseBearOff:
+    """
+    Responsabilidad: Responder, para un bear-off sin contacto, cuántas tiradas se esperan para
+                     terminar y cuál es la mejor jugada para cada tirada.
+    SRP: Solo genera y consulta la tabla precalculada; no valida ni ejecuta movimientos.
+    Justificación: En el final de la partida la búsqueda es reemplazable por una consulta: la
+                   tabla se calcula una vez por programación dinámica (cada jugada reduce los
+                   pips, así que se resuelve en orden creciente de pips), se guarda en un
+                   archivo compacto y se abre con mmap, de modo que cargarla no lee el archivo.
+
+    Formato del archivo: cabecera (magia, versión, max_fichas, N), luego N float32 con las
+    tiradas esperadas y N x 21 uint32 con la mejor jugada codificada por tirada.
+    """
+
+    def __init__(self, ruta: str):
+        """
+        Abre una base generada con `generar` mapeándola en memoria.
+
+        Args:
+            ruta (str): Archivo de la base.
+
+        Raises:
+            ValueError: Si el archivo no tiene el formato esperado.
+
+        Atributos privados:
+            __mmap__: mmap.mmap - Mapeo de solo lectura del archivo.
+            __esperadas__: memoryview - float32 por posición.
+            __jugadas__: memoryview - uint32 por posición y tirada.
+            __max_fichas__: int - Fichas máximas cubiertas por la base.
+        """
+        with open(ruta, 'rb') as archivo:
+            self.__mmap__ = mmap.mmap(archivo.fileno(), 0, access=mmap.ACCESS_READ)
+        magia, version, max_fichas, cantidad = _CABECERA.unpack_from(self.__mmap__, 0)
+        if magia != _MAGIA or version != _VERSION or cantidad != cantidad_posiciones(max_fichas):
+            self.__mmap__.close()
+            raise ValueError(f"{ruta} no es una base de bear-off válida")
+        vista = memoryview(self.__mmap__)
+        inicio = _CABECERA.size
+        fin_esperadas = inicio + 4 * cantidad
+        self.__max_fichas__ = max_fichas
+        self.__esperadas__ = vista[inicio:fin_esperadas].cast('f')
+        self.__jugadas__ = vista[fin_esperadas:fin_esperadas + 4 * cantidad * len(TIRADAS)].cast('I')
+
+    @staticmethod
+    def generar(ruta: str, max_fichas: int = MAX_FICHAS):
+        """
+        Calcula la base completa y la escribe en disco.
+
+        Funcionamiento: Recorre todas las distribuciones en orden creciente de pips.
+        E(vacía) = 0 y E(p) = 1 + Σ P(tirada) · min E(p') sobre las posiciones p'
+        alcanzables con la tirada; se guarda la jugada que logra el mínimo.
+
+        Args:
+            ruta (str): Archivo de salida.
+            max_fichas (int): Máximo de fichas (15 para la base completa).
+        """
+        cantidad = cantidad_posiciones(max_fichas)
+        esperadas = [0.0] * cantidad
+        jugadas = [0] * (cantidad * len(TIRADAS))
+
+        posiciones = sorted(_todas_las_posiciones(max_fichas),
+                            key=lambda f: sum((k + 1) * c for k, c in enumerate(f)))
+        indices = {fichas: indice_posicion(fichas, max_fichas) for fichas in posiciones}
+        for fichas in posiciones:
+            if not any(fichas):
+                continue
+            indice = indices[fichas]
+            total = 0.0
+            for t, (d1, d2) in enumerate(TIRADAS):
+                mejor_valor, mejores_pasos = None, ()
+                for final, pasos in _finales(fichas, d1, d2).items():
+                    valor = esperadas[indices[final]]
+                    if mejor_valor is None or valor < mejor_valor:
+                        mejor_valor, mejores_pasos = valor, pasos
+                total += (1 if d1 == d2 else 2) * mejor_valor
+                jugadas[indice * len(TIRADAS) + t] = _codificar_pasos(mejores_pasos)
+            esperadas[indice] = 1 + total / 36
+
+        with open(ruta, 'wb') as archivo:
+            archivo.write(_CABECERA.pack(_MAGIA, _VERSION, max_fichas, cantidad))
+            archivo.write(struct.pack(f'<{cantidad}f', *esperadas))
+            archivo.write(struct.pack(f'<{len(jugadas)}I', *jugadas))
+
+    def cerrar(self):
+        """
+        Libera el mapeo en memoria del archivo.
+        """
+        self.__esperadas__.release()
+        self.__jugadas__.release()
+        self.__mmap__.close()
+
+    def tiradas_esperadas(self, fichas: tuple) -> float:
+        """
+        Retorna las tiradas esperadas para sacar todas las fichas.
+
+        Args:
+            fichas (tuple): 6 contadores por distancia a la salida (1..6).
+
+        Returns:
+            float: Número esperado de tiradas.
+        """
+        return self.__esperadas__[indice_posicion(tuple(fichas), self.__max_fichas__)]
+
+    def mejor_jugada(self, fichas: tuple, d1: int, d2: int) -> tuple:
+        """
+        Retorna la jugada que minimiza las tiradas esperadas.
+
+        Args:
+            fichas (tuple): 6 contadores por distancia a la salida (1..6).
+            d1 (int): Primer dado.
+            d2 (int): Segundo dado.
+
+        Returns:
+            tuple: Pasos (distancia_origen, dado) en el orden en que deben jugarse.
+        """
+        t = _INDICE_TIRADA[(min(d1, d2), max(d1, d2))]
+        indice = indice_posicion(tuple(fichas), self.__max_fichas__)
+        return _decodificar_pasos(self.__jugadas__[indice * len(TIRADAS) + t])
+
+    # ========== INTEGRACIÓN CON EL CORE ==========
+
+    def fichas_de(self, tablero, jugador: int):
+        """
+        Extrae la distribución de bear-off de un jugador si la posición es aplicable.
+
+        Es aplicable cuando no hay contacto: todas las fichas del jugador están en su home,
+        ninguna ficha de ningún color está en la barra y no quedan fichas rivales que
+        deban pasar por el home del jugador.
+
+        Args:
+            tablero (Tablero): Tablero del juego.
+            jugador (int): 1 para blancas, -1 para negras.
+
+        Returns:
+            tuple | None: 6 contadores por distancia, o None si no es aplicable.
+        """
+        pos = tablero._obtener_posiciones_ref()
+        barra = tablero._obtener_barra_ref()
+        if barra['blancas'] or barra['negras']:
+            return None
+        if jugador == 1:
+            home, resto, rival = pos[18:], pos[:18], pos[18:]
+            fichas = tuple(max(v, 0) for v in reversed(home))
+        else:
+            home, resto, rival = pos[:6], pos[6:], pos[:6]
+            fichas = tuple(max(-v, 0) for v in home)
+        if any(v * jugador > 0 for v in resto) or any(v * jugador < 0 for v in rival):
+            return None
+        if sum(fichas) > self.__max_fichas__:
+            return None
+        return fichas
+
+    def jugada_para(self, tablero, jugador: int, dados: list[int]):
+        """
+        Retorna la mejor jugada en la notación interna del core, si la base es aplicable.
+
+        Args:
+            tablero (Tablero): Tablero del juego.
+            jugador (int): 1 para blancas, -1 para negras.
+            dados (list[int]): Dados de la tirada (2 valores, o 4 iguales).
+
+        Returns:
+            tuple | None: Pasos (origen_idx, destino_idx, valor_dado) como en
+                          `AnalizadorPosibilidades.generar_jugadas`, o None.
+        """
+        fichas = self.fichas_de(tablero, jugador)
+        if fichas is None:
+            return None
+        jugada = []
+        for distancia, dado in self.mejor_jugada(fichas, dados[0], dados[1]):
+            origen_idx = CASILLEROS - distancia if jugador == 1 else distancia - 1
+            destino_idx = origen_idx + jugador * dado
+            if not 0 <= destino_idx < CASILLEROS:
+                destino_idx = None
+            jugada.append((origen_idx, destino_idx, dado))
+        return tuple(jugada)
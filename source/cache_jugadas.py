@@ -0,0 +1,94 @@
+from collections import OrderedDict
+
+
+class CacheJugadas:
+    """
+    Responsabilidad: Memorizar resultados del análisis de movimientos legales.
+    SRP: Solo almacena y desaloja resultados; no sabe calcularlos ni qué significan.
+    Justificación: Mientras no cambien el tablero, el jugador en turno ni los dados
+                   pendientes, la respuesta de AnalizadorPosibilidades/ValidadorMovimientos
+                   es la misma, pero `mover` y la GUI la recalculan (con simulaciones y
+                   rollbacks) en cada llamada. La clave incluye la instantánea `Posicion`,
+                   por lo que un mismo cache puede compartirse entre partidas.
+    """
+
+    def __init__(self, max_entradas: int = 4096):
+        """
+        Inicializa un cache vacío.
+
+        Args:
+            max_entradas (int): Cantidad máxima de entradas; al superarla se desaloja
+                                la usada hace más tiempo (LRU).
+
+        Raises:
+            ValueError: Si max_entradas es menor que 1.
+
+        Atributos privados:
+            __entradas__: OrderedDict - clave -> resultado, de la menos a la más reciente.
+            __aciertos__: int - Consultas resueltas desde el cache.
+            __fallos__: int - Consultas que tuvieron que calcularse.
+        """
+        if max_entradas < 1:
+            raise ValueError("max_entradas debe ser al menos 1")
+        self.__max_entradas__ = max_entradas
+        self.__entradas__ = OrderedDict()
+        self.__aciertos__ = 0
+        self.__fallos__ = 0
+
+    def __len__(self) -> int:
+        return len(self.__entradas__)
+
+    def obtener(self, clave, calcular):
+        """
+        Retorna el resultado memorizado para la clave, calculándolo si falta.
+
+        Funcionamiento: Un acierto mueve la entrada al final (la más reciente); un fallo
+        llama a `calcular()`, guarda el resultado y desaloja la entrada más antigua si se
+        superó el tamaño máximo. Los resultados se comparten: el llamador no debe mutarlos.
+
+        Args:
+            clave (Hashable): Clave del análisis (instantánea, turno, dados, tipo de consulta).
+            calcular (callable): Función sin argumentos que produce el resultado.
+
+        Returns:
+            object: El resultado memorizado o recién calculado.
+        """
+        entradas = self.__entradas__
+        try:
+            resultado = entradas[clave]
+        except KeyError:
+            self.__fallos__ += 1
+            resultado = entradas[clave] = calcular()
+            if len(entradas) > self.__max_entradas__:
+                entradas.popitem(last=False)
+            return resultado
+        self.__aciertos__ += 1
+        entradas.move_to_end(clave)
+        return resultado
+
+    def obtener_estadisticas(self) -> dict:
+        """
+        Retorna los contadores del cache.
+
+        Returns:
+            dict: {'aciertos': int, 'fallos': int, 'entradas': int}
+        """
+        return {'aciertos': self.__aciertos__, 'fallos': self.__fallos__,
+                'entradas': len(self.__entradas__)}
+
+    def descartar(self, clave):
+        """
+        Elimina la entrada de una clave, si existe (p. ej. porque su origen cambió).
+
+        Args:
+            clave (Hashable): Clave a descartar.
+        """
+        self.__entradas__.pop(clave, None)
+
+    def limpiar(self):
+        """
+        Vacía el cache y reinicia los contadores.
+        """
+        self.__entradas__.clear()
+        self.__aciertos__ = 0
+        self.__fallos__ = 0
@@ -1,5 +1,7 @@
 import random
 
+from source.excepciones import DadosAgotadosError
+
 class Dados:
     """
     Responsabilidad: Gestionar la aleatoriedad y el estado de los dos dados.
@@ -7,25 +9,68 @@ class Dados:
     Justificación: Al aislar la aleatoriedad en una sola clase, se facilita la
     testabilidad del sistema (DIP), permitiendo inyectar una clase 'Dados' simulada
     (Mock) en los tests, haciendo que la lógica del juego sea determinística.
+    La fuente de las tiradas es configurable: el módulo `random` global (por defecto),
+    un generador propio sembrado (partidas reproducibles e independientes), bloques
+    pre-generados con NumPy (simulaciones masivas) o una secuencia grabada (replay).
     """
 
-    def __init__(self):
+    def __init__(self, semilla: int = None, rng: random.Random = None, bloque: int = 0,
+                 tiradas=None):
         """
         Inicializa los dos dados con un valor aleatorio inicial.
 
-        Funcionamiento: Llama a random.randint(1, 6) para establecer un estado inicial
-        en ambos dados, asegurando que los atributos internos existan desde el principio.
-        
+        Funcionamiento: Elige la fuente de tiradas según los argumentos y tira una vez
+        para establecer un estado inicial en ambos dados, asegurando que los atributos
+        internos existan desde el principio. Sin argumentos llama a random.randint(1, 6)
+        del módulo global, como siempre. En modo replay no se consume ninguna tirada
+        grabada: los dados valen None hasta la primera tirada.
+
+        Args:
+            semilla (int, optional): Semilla de un generador propio (o del de NumPy si `bloque`).
+            rng (random.Random, optional): Generador propio ya construido.
+            bloque (int): Si es mayor que 0, tiradas pre-generadas con NumPy de a `bloque`.
+            tiradas (iterable, optional): Secuencia grabada de pares (d1, d2) a reproducir.
+
+        Raises:
+            ValueError: Si se combinan fuentes incompatibles o algún valor es inválido.
+
         Atributos privados:
             __dado1__: int - Almacena el valor del primer dado (1-6). Se accede
                        solo a través de la propiedad dado1.
             __dado2__: int - Almacena el valor del segundo dado (1-6). Se accede
                        solo a través de la propiedad dado2.
+            __rng__: Fuente de randint (módulo random o generador propio).
+            __buffer__: list - Tiradas pre-generadas pendientes (modo bloque).
+            __siguiente__: callable - Produce la próxima tirada según el modo.
         """
-        self.__dado1__ = random.randint(1, 6)
-        self.__dado2__ = random.randint(1, 6)
+        if bloque < 0:
+            raise ValueError("El tamaño de bloque no puede ser negativo")
+        if rng is not None and (semilla is not None or bloque):
+            raise ValueError("rng no se combina con semilla ni bloque")
+        if tiradas is not None and (rng is not None or semilla is not None or bloque):
+            raise ValueError("El modo replay no usa generador")
 
-    @property 
+        self.__rng__ = rng if rng is not None else (
+            random.Random(semilla) if semilla is not None else random)
+        self.__buffer__ = []
+        self.__indice_buffer__ = 0
+        self.__bloque__ = bloque
+
+        if tiradas is not None:
+            self.__tiradas__ = iter(tiradas)
+            self.__siguiente__ = self._siguiente_grabada
+            self.__dado1__ = self.__dado2__ = None
+            return
+
+        if bloque:
+            import numpy as np
+            self.__generador_np__ = np.random.default_rng(semilla)
+            self.__siguiente__ = self._siguiente_bloque
+        else:
+            self.__siguiente__ = self._siguiente_rng
+        self.__dado1__, self.__dado2__ = self.__siguiente__()
+
+    @property
     def dado1(self):
         """
         Retorna el valor actual del primer dado.
@@ -33,7 +78,7 @@ class Dados:
         Funcionamiento: Proporciona acceso de solo lectura al atributo privado __dado1__.
         Justificación: Mantiene el Encapsulamiento, impidiendo que el estado del dado
         sea modificado directamente desde fuera de la clase.
-        
+
         Returns:
             int: El valor del primer dado.
         """
@@ -46,7 +91,7 @@ class Dados:
 
         Funcionamiento: Proporciona acceso de solo lectura al atributo privado __dado2__.
         Justificación: Mantiene el Encapsulamiento.
-        
+
         Returns:
             int: El valor del segundo dado.
         """
@@ -56,15 +101,42 @@ class Dados:
         """
         Simula la tirada de los dados, actualizando sus valores internos.
 
-        Funcionamiento: Genera dos nuevos números aleatorios entre 1 y 6 y los
-        asigna a los atributos internos __dado1__ y __dado2__.
+        Funcionamiento: Obtiene dos nuevos números entre 1 y 6 de la fuente configurada
+        y los asigna a los atributos internos __dado1__ y __dado2__.
         Justificación: Es el método de acción de la clase y cumple con la
         única responsabilidad de generar aleatoriedad (SRP).
-        
+
         Returns:
             tuple[int, int]: Una tupla con los nuevos valores de (dado1, dado2).
+
+        Raises:
+            DadosAgotadosError: En modo replay, si no quedan tiradas grabadas.
         """
-        self.__dado1__ = random.randint(1, 6)
-        self.__dado2__ = random.randint(1, 6)
+        self.__dado1__, self.__dado2__ = self.__siguiente__()
         return (self.__dado1__, self.__dado2__)
 
+    # ========== MÉTODOS PRIVADOS ==========
+
+    def _siguiente_rng(self) -> tuple[int, int]:
+        """Tirada con randint del generador (el módulo global se resuelve en cada llamada)."""
+        return self.__rng__.randint(1, 6), self.__rng__.randint(1, 6)
+
+    def _siguiente_bloque(self) -> tuple[int, int]:
+        """Sirve la próxima tirada del buffer, regenerando un bloque entero al agotarse."""
+        if self.__indice_buffer__ >= len(self.__buffer__):
+            bloque = self.__generador_np__.integers(1, 7, size=(self.__bloque__, 2))
+            self.__buffer__ = [tuple(fila) for fila in bloque.tolist()]
+            self.__indice_buffer__ = 0
+        tirada = self.__buffer__[self.__indice_buffer__]
+        self.__indice_buffer__ += 1
+        return tirada
+
+    def _siguiente_grabada(self) -> tuple[int, int]:
+        """Reproduce la próxima tirada grabada, validando sus valores."""
+        try:
+            d1, d2 = next(self.__tiradas__)
+        except StopIteration:
+            raise DadosAgotadosError("no quedan tiradas grabadas para reproducir") from None
+        if not (1 <= d1 <= 6 and 1 <= d2 <= 6):
+            raise ValueError(f"Tirada grabada inválida: ({d1}, {d2})")
+        return d1, d2
@@ -0,0 +1,112 @@
+from typing import NamedTuple, Optional
+
+
+class RegistroMovimiento(NamedTuple):
+    """
+    Delta de un movimiento aplicado al tablero.
+
+    Contiene la información mínima para revertirlo o volver a aplicarlo en O(1),
+    sin guardar copias del tablero.
+
+    Atributos:
+        jugador (int): 1 para blancas, -1 para negras.
+        origen_idx (int | None): Índice 0-based de origen; None si entró desde la barra.
+        destino_idx (int | None): Índice 0-based de destino; None si fue bear-off.
+        valor_dado (int): Valor del dado consumido.
+        capturo (bool): True si el movimiento envió un blot rival a la barra.
+    """
+    jugador: int
+    origen_idx: Optional[int]
+    destino_idx: Optional[int]
+    valor_dado: int
+    capturo: bool
+
+
+class DiarioMovimientos:
+    """
+    Responsabilidad: Llevar el historial de movimientos aplicados para poder deshacerlos y rehacerlos.
+    SRP: Solo administra las pilas de deshacer/rehacer; no modifica el tablero.
+    Justificación: Guardar deltas (RegistroMovimiento) en lugar de copias completas del estado
+                   permite que la búsqueda, el cálculo de ayudas y el "deshacer" de la UI usen
+                   el mismo mecanismo de rollback en tiempo constante.
+    """
+
+    def __init__(self):
+        """
+        Inicializa el diario vacío.
+
+        Atributos privados:
+            __hechos__: list[RegistroMovimiento] - Movimientos aplicados (pila de deshacer).
+            __deshechos__: list[RegistroMovimiento] - Movimientos deshechos (pila de rehacer).
+        """
+        self.__hechos__ = []
+        self.__deshechos__ = []
+
+    def registrar(self, registro: RegistroMovimiento):
+        """
+        Registra un movimiento nuevo.
+
+        Funcionamiento: Lo apila en la pila de deshacer y descarta la pila de rehacer,
+        ya que un movimiento nuevo invalida los movimientos deshechos.
+
+        Args:
+            registro (RegistroMovimiento): Delta del movimiento aplicado.
+        """
+        self.__hechos__.append(registro)
+        self.__deshechos__.clear()
+
+    def deshacer(self) -> Optional[RegistroMovimiento]:
+        """
+        Extrae el último movimiento aplicado y lo pasa a la pila de rehacer.
+
+        Returns:
+            RegistroMovimiento | None: El movimiento a revertir, o None si no hay.
+        """
+        if not self.__hechos__:
+            return None
+        registro = self.__hechos__.pop()
+        self.__deshechos__.append(registro)
+        return registro
+
+    def rehacer(self) -> Optional[RegistroMovimiento]:
+        """
+        Extrae el último movimiento deshecho y lo vuelve a la pila de deshacer.
+
+        Returns:
+            RegistroMovimiento | None: El movimiento a reaplicar, o None si no hay.
+        """
+        if not self.__deshechos__:
+            return None
+        registro = self.__deshechos__.pop()
+        self.__hechos__.append(registro)
+        return registro
+
+    def puede_deshacer(self) -> bool:
+        """
+        Returns:
+            bool: True si hay movimientos para deshacer.
+        """
+        return bool(self.__hechos__)
+
+    def puede_rehacer(self) -> bool:
+        """
+        Returns:
+            bool: True si hay movimientos para rehacer.
+        """
+        return bool(self.__deshechos__)
+
+    def obtener_registros(self) -> list[RegistroMovimiento]:
+        """
+        Retorna una copia de los movimientos aplicados, del más antiguo al más reciente.
+
+        Returns:
+            list[RegistroMovimiento]: Movimientos en la pila de deshacer.
+        """
+        return list(self.__hechos__)
+
+    def limpiar(self):
+        """
+        Vacía ambas pilas (por ejemplo, al confirmar el fin de una tirada).
+        """
+        self.__hechos__.clear()
+        self.__deshechos__.clear()
@@ -1,6 +1,8 @@
 from source.tablero import Tablero
 from source.gestor_turnos import GestorTurnos  
 from source.constantes import CASILLEROS
+from source.zobrist import Zobrist, ZOBRIST
+from source.diario_movimientos import DiarioMovimientos, RegistroMovimiento
 
 
 class EjecutorMovimientos:
@@ -12,24 +14,63 @@ class EjecutorMovimientos:
                    facilitando la mantenibilidad del código (SRP).
     """
     
-    def __init__(self, tablero: Tablero, gestor_turnos: GestorTurnos):
+    def __init__(self, tablero: Tablero, gestor_turnos: GestorTurnos, zobrist: Zobrist = None):
         """
         Inicializa el ejecutor con sus dependencias.
 
         Funcionamiento: Recibe referencias inyectadas a Tablero y GestorTurnos. Utiliza
         métodos protegidos del Tablero (ej. `_obtener_posiciones_ref`) para modificar
-        directamente el estado.
+        directamente el estado. Calcula el hash Zobrist inicial del tablero, que luego
+        se mantiene de forma incremental en cada modificación.
         
         Args:
             tablero (Tablero): Referencia al tablero del juego.
             gestor_turnos (GestorTurnos): Referencia al gestor de turnos.
+            zobrist (Zobrist, optional): Tabla de claves. Por defecto, la compartida `ZOBRIST`.
 
         Atributos privados:
             __tablero__: Referencia a la instancia de Tablero.
             __gestor_turnos__: Referencia a la instancia de GestorTurnos.
+            __zobrist__: Tabla de claves Zobrist.
+            __clave__: int - Hash Zobrist del tablero (sin el turno), actualizado en cada movimiento.
+            __diario__: DiarioMovimientos - Historial de deltas para deshacer/rehacer.
         """
         self.__tablero__ = tablero
         self.__gestor_turnos__ = gestor_turnos
+        self.__zobrist__ = zobrist if zobrist is not None else ZOBRIST
+        self.__diario__ = DiarioMovimientos()
+        self.__clave__ = 0
+        self.recalcular_clave()
+
+    def obtener_clave(self) -> int:
+        """
+        Retorna el hash Zobrist de 64 bits de la posición actual, incluyendo el turno.
+
+        Funcionamiento: Combina el hash incremental del tablero con la clave del jugador
+        que mueve según GestorTurnos. Es O(1).
+
+        Returns:
+            int: Hash de 64 bits.
+        """
+        direccion = self.__gestor_turnos__.obtener_direccion()
+        return self.__clave__ ^ self.__zobrist__.clave_turno(direccion)
+
+    def recalcular_clave(self) -> int:
+        """
+        Recalcula desde cero el hash del tablero.
+
+        Funcionamiento: Recorre posiciones, barra y fichas fuera. Solo es necesario
+        cuando el estado se modificó sin pasar por este ejecutor (ej. restaurar un backup).
+
+        Returns:
+            int: Hash de 64 bits resultante, incluyendo el turno.
+        """
+        self.__clave__ = self.__zobrist__.calcular(
+            self.__tablero__._obtener_posiciones_ref(),
+            self.__tablero__._obtener_barra_ref(),
+            self.__tablero__._obtener_fichas_fuera_ref(),
+        )
+        return self.obtener_clave()
 
     def ejecutar_movimiento(self, origen_idx: int, valor_dado: int) -> str:
         """
@@ -39,6 +80,7 @@ class EjecutorMovimientos:
         1. Calcula el índice de destino.
         2. Determina si es un movimiento de *bear-off* (destino fuera de rango [0-23]).
         3. Delega la ejecución a `_ejecutar_bear_off` o `_ejecutar_movimiento_normal`.
+        4. Registra el delta en el diario para poder deshacerlo.
         
         Args:
             origen_idx (int): Índice 0-based de origen.
@@ -52,10 +94,18 @@ class EjecutorMovimientos:
         
         # Si es bear-off (fuera del tablero)
         if not (0 <= destino_idx < CASILLEROS):
-            return self._ejecutar_bear_off(origen_idx)
+            resultado = self._ejecutar_bear_off(origen_idx)
+            self.__diario__.registrar(
+                RegistroMovimiento(jugador, origen_idx, None, valor_dado, False))
+            return resultado
         
         # Si es movimiento normal
-        return self._ejecutar_movimiento_normal(origen_idx, destino_idx)
+        pos = self.__tablero__._obtener_posiciones_ref()
+        capturo = self._es_blot_rival(pos[destino_idx], jugador)
+        resultado = self._ejecutar_movimiento_normal(origen_idx, destino_idx)
+        self.__diario__.registrar(
+            RegistroMovimiento(jugador, origen_idx, destino_idx, valor_dado, capturo))
+        return resultado
 
     def ejecutar_entrada_barra(self, valor_dado: int) -> str:
         """
@@ -66,6 +116,7 @@ class EjecutorMovimientos:
         2. Si hay un *blot* rival en el destino, lo captura (`_capturar_ficha`).
         3. Mueve la ficha al destino (suma `jugador`).
         4. Decrementa el contador de fichas en la barra.
+        5. Registra el delta en el diario para poder deshacerlo.
         
         Args:
             valor_dado (int): Valor del dado usado para entrar.
@@ -77,21 +128,63 @@ class EjecutorMovimientos:
         destino_idx = self._calcular_indice_entrada(jugador, valor_dado)
         
         pos = self.__tablero__._obtener_posiciones_ref()
-        barra = self.__tablero__._obtener_barra_ref()
         
         # Si hay un blot rival, capturarlo
-        if self._es_blot_rival(pos[destino_idx], jugador):
+        capturo = self._es_blot_rival(pos[destino_idx], jugador)
+        if capturo:
             self._capturar_ficha(destino_idx, jugador)
-            pos[destino_idx] = jugador
+            self._fijar_casillero(pos, destino_idx, jugador)
         else:
-            pos[destino_idx] += jugador
+            self._fijar_casillero(pos, destino_idx, pos[destino_idx] + jugador)
         
         # Decrementar barra del jugador actual
         color = self.__gestor_turnos__.obtener_turno()
-        barra[color] -= 1
+        self._sumar_barra(color, -1)
+
+        self.__diario__.registrar(
+            RegistroMovimiento(jugador, None, destino_idx, valor_dado, capturo))
         
         return "entró"
 
+    def deshacer(self) -> RegistroMovimiento:
+        """
+        Revierte el último movimiento registrado en el diario.
+
+        Funcionamiento: Aplica el delta inverso (casilleros, barra, fichas fuera) en O(1),
+        manteniendo actualizado el hash Zobrist. No depende del turno actual: usa el
+        jugador guardado en el registro.
+
+        Returns:
+            RegistroMovimiento | None: El movimiento revertido, o None si no había.
+        """
+        registro = self.__diario__.deshacer()
+        if registro is not None:
+            self._revertir(registro)
+        return registro
+
+    def rehacer(self) -> RegistroMovimiento:
+        """
+        Vuelve a aplicar el último movimiento deshecho.
+
+        Funcionamiento: Reaplica el delta guardado en O(1), sin volver a validarlo.
+
+        Returns:
+            RegistroMovimiento | None: El movimiento reaplicado, o None si no había.
+        """
+        registro = self.__diario__.rehacer()
+        if registro is not None:
+            self._reaplicar(registro)
+        return registro
+
+    def obtener_diario(self) -> DiarioMovimientos:
+        """
+        Retorna el diario de movimientos del ejecutor.
+
+        Returns:
+            DiarioMovimientos: Referencia al diario (para consultar o limpiar el historial).
+        """
+        return self.__diario__
+
     # ========== MÉTODOS PRIVADOS ==========
 
     def _ejecutar_movimiento_normal(self, origen_idx: int, destino_idx: int) -> str:
@@ -117,13 +210,13 @@ class EjecutorMovimientos:
         # Si hay un blot rival en el destino, capturarlo
         if self._es_blot_rival(pos[destino_idx], jugador):
             self._capturar_ficha(destino_idx, jugador)
-            pos[destino_idx] = jugador
+            self._fijar_casillero(pos, destino_idx, jugador)
             mensaje = "movió y comió"
         else:
-            pos[destino_idx] += jugador
+            self._fijar_casillero(pos, destino_idx, pos[destino_idx] + jugador)
         
         # Mover ficha desde origen
-        pos[origen_idx] -= jugador
+        self._fijar_casillero(pos, origen_idx, pos[origen_idx] - jugador)
         
         return mensaje
 
@@ -149,10 +242,10 @@ class EjecutorMovimientos:
         fichas_fuera = self.__tablero__._obtener_fichas_fuera_ref()
         
         # Sacar ficha del origen
-        pos[origen_idx] -= jugador
+        self._fijar_casillero(pos, origen_idx, pos[origen_idx] - jugador)
         
         # Incrementar fichas fuera
-        fichas_fuera[color] += 1
+        self._sumar_fuera(color, 1)
         
         # Verificar victoria
         if fichas_fuera[color] == 15:
@@ -172,13 +265,106 @@ class EjecutorMovimientos:
             destino_idx (int): Índice donde está el blot rival (se usa para determinar el rival).
             jugador (int): 1 para blancas, -1 para negras.
         """
-        barra = self.__tablero__._obtener_barra_ref()
-        
         # Determinar color rival
         color_rival = "negras" if jugador == 1 else "blancas"
         
         # Incrementar barra del rival
-        barra[color_rival] += 1
+        self._sumar_barra(color_rival, 1)
+
+    def _revertir(self, registro: RegistroMovimiento):
+        """
+        Aplica el delta inverso de un movimiento registrado.
+
+        Args:
+            registro (RegistroMovimiento): Movimiento a revertir.
+        """
+        jugador = registro.jugador
+        color = "blancas" if jugador == 1 else "negras"
+        color_rival = "negras" if jugador == 1 else "blancas"
+        pos = self.__tablero__._obtener_posiciones_ref()
+
+        # Quitar la ficha del destino (o devolverla desde fuera)
+        if registro.destino_idx is None:
+            self._sumar_fuera(color, -1)
+        elif registro.capturo:
+            self._fijar_casillero(pos, registro.destino_idx, -jugador)
+            self._sumar_barra(color_rival, -1)
+        else:
+            self._fijar_casillero(pos, registro.destino_idx, pos[registro.destino_idx] - jugador)
+
+        # Devolver la ficha al origen (o a la barra)
+        if registro.origen_idx is None:
+            self._sumar_barra(color, 1)
+        else:
+            self._fijar_casillero(pos, registro.origen_idx, pos[registro.origen_idx] + jugador)
+
+    def _reaplicar(self, registro: RegistroMovimiento):
+        """
+        Aplica nuevamente el delta de un movimiento registrado.
+
+        Args:
+            registro (RegistroMovimiento): Movimiento a reaplicar.
+        """
+        jugador = registro.jugador
+        color = "blancas" if jugador == 1 else "negras"
+        pos = self.__tablero__._obtener_posiciones_ref()
+
+        if registro.origen_idx is None:
+            self._sumar_barra(color, -1)
+        else:
+            self._fijar_casillero(pos, registro.origen_idx, pos[registro.origen_idx] - jugador)
+
+        if registro.destino_idx is None:
+            self._sumar_fuera(color, 1)
+        elif registro.capturo:
+            self._capturar_ficha(registro.destino_idx, jugador)
+            self._fijar_casillero(pos, registro.destino_idx, jugador)
+        else:
+            self._fijar_casillero(pos, registro.destino_idx, pos[registro.destino_idx] + jugador)
+
+    def _fijar_casillero(self, pos: list[int], idx: int, nuevo_valor: int):
+        """
+        Asigna un valor a un casillero actualizando el hash Zobrist.
+
+        Funcionamiento: Quita con XOR la clave del valor anterior y agrega la del nuevo;
+        la escritura la hace el Tablero, que actualiza sus contadores por delta.
+
+        Args:
+            pos (list[int]): Referencia a las posiciones del tablero.
+            idx (int): Índice 0-based del casillero.
+            nuevo_valor (int): Valor con signo a asignar.
+        """
+        zobrist = self.__zobrist__
+        self.__clave__ ^= zobrist.clave_casillero(idx, pos[idx]) ^ zobrist.clave_casillero(idx, nuevo_valor)
+        self.__tablero__._fijar_casillero(idx, nuevo_valor)
+
+    def _sumar_barra(self, color: str, delta: int):
+        """
+        Modifica el contador de barra de un color actualizando el hash Zobrist.
+
+        Args:
+            color (str): 'blancas' o 'negras'.
+            delta (int): Cantidad a sumar (negativa para restar).
+        """
+        barra = self.__tablero__._obtener_barra_ref()
+        zobrist = self.__zobrist__
+        nuevo = barra[color] + delta
+        self.__clave__ ^= zobrist.clave_barra(color, barra[color]) ^ zobrist.clave_barra(color, nuevo)
+        self.__tablero__._sumar_barra(color, delta)
+
+    def _sumar_fuera(self, color: str, delta: int):
+        """
+        Modifica el contador de fichas fuera de un color actualizando el hash Zobrist.
+
+        Args:
+            color (str): 'blancas' o 'negras'.
+            delta (int): Cantidad a sumar (negativa para restar).
+        """
+        fichas_fuera = self.__tablero__._obtener_fichas_fuera_ref()
+        zobrist = self.__zobrist__
+        nuevo = fichas_fuera[color] + delta
+        self.__clave__ ^= zobrist.clave_fuera(color, fichas_fuera[color]) ^ zobrist.clave_fuera(color, nuevo)
+        self.__tablero__._sumar_fuera(color, delta)
 
     def _es_blot_rival(self, valor_destino: int, jugador: int) -> bool:
         """
@@ -0,0 +1,358 @@
+import os
+import random
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from typing import NamedTuple
+
+import numpy as np
+
+from source.analizador_posibilidades import AnalizadorPosibilidades
+from source.backgammon import Backgammon
+from source.dados import Dados
+from source.ejecutor_movimientos import EjecutorMovimientos
+from source.evaluador_red import EvaluadorRed, codificar
+from source.gestor_turnos import GestorTurnos
+from source.motor_busqueda import MotorBusqueda
+from source.tablero import Tablero
+from source.torneo import MAX_TURNOS, jugar_partida
+
+
+class ResultadoReferencia(NamedTuple):
+    """
+    Resultado de la red contra la estrategia de referencia fija.
+
+    Atributos:
+        partidas (int): Partidas jugadas (alternando colores).
+        victorias (int): Partidas ganadas por la red.
+        puntos_por_partida (float): Puntos netos medios de la red (gammon = 2, backgammon = 3).
+    """
+    partidas: int
+    victorias: int
+    puntos_por_partida: float
+
+    @property
+    def porcentaje_victorias(self) -> float:
+        return 100.0 * self.victorias / self.partidas if self.partidas else 0.0
+
+
+class ReporteEntrenamiento(NamedTuple):
+    """
+    Estado del entrenamiento tras incorporar un lote de partidas.
+
+    Atributos:
+        partidas (int): Partidas de autojuego incorporadas por el aprendiz.
+        segundos (float): Tiempo de reloj desde el inicio.
+        error_td (float): Error TD absoluto medio del último lote.
+        referencia (ResultadoReferencia | None): Último resultado contra la referencia,
+                                                 si en este lote tocaba medirlo.
+    """
+    partidas: int
+    segundos: float
+    error_td: float
+    referencia: ResultadoReferencia = None
+
+    @property
+    def partidas_por_hora(self) -> float:
+        return 3600.0 * self.partidas / self.segundos if self.segundos > 0 else 0.0
+
+
+def jugar_autojuego(red: EvaluadorRed, rng: random.Random,
+                    motor: MotorBusqueda = None) -> tuple[np.ndarray, float]:
+    """
+    Juega una partida de la red contra sí misma, sin entrada/salida.
+
+    Funcionamiento: Igual que `jugar_hasta_el_final` de rollout, sobre un tablero privado
+    y con la red como política de 1 ply (evaluación por lotes de las candidatas). Guarda
+    la codificación de cada posición que enfrenta el jugador en turno antes de tirar.
+
+    Args:
+        red (EvaluadorRed): Red que juega ambos colores.
+        rng (random.Random): Generador de dados.
+        motor (MotorBusqueda, optional): Política; por defecto, 1 ply con `red`.
+
+    Returns:
+        tuple: (entradas (T, 198) float32, resultado): las posiciones de la partida en
+               orden y 1.0 si ganaron las blancas o 0.0 si ganaron las negras.
+
+    Raises:
+        RuntimeError: Si la partida supera MAX_TURNOS tiradas.
+    """
+    motor = motor if motor is not None else MotorBusqueda(profundidad=1, evaluador=red)
+    tablero = Tablero()
+    gestor = GestorTurnos()
+    ejecutor = EjecutorMovimientos(tablero, gestor)
+    analizador = AnalizadorPosibilidades(tablero, gestor)
+    fuera = tablero._obtener_fichas_fuera_ref()
+    diario = ejecutor.obtener_diario()
+    entradas = [codificar(tablero, gestor.obtener_turno())]
+
+    for _ in range(MAX_TURNOS):
+        d1, d2 = rng.randint(1, 6), rng.randint(1, 6)
+        dados = [d1] * 4 if d1 == d2 else [d1, d2]
+        for origen_idx, _, valor_dado in motor.buscar(dados, tablero, gestor, ejecutor, analizador):
+            if origen_idx is None:
+                ejecutor.ejecutar_entrada_barra(valor_dado)
+            else:
+                ejecutor.ejecutar_movimiento(origen_idx, valor_dado)
+        diario.limpiar()
+
+        color = gestor.obtener_turno()
+        if fuera[color] == 15:
+            return np.stack(entradas), 1.0 if color == 'blancas' else 0.0
+        gestor.cambiar_turno()
+        entradas.append(codificar(tablero, gestor.obtener_turno()))
+    raise RuntimeError(f"La partida superó {MAX_TURNOS} tiradas")
+
+
+def actualizar_td(red: EvaluadorRed, entradas: np.ndarray, resultado: float,
+                  alfa: float, lambda_: float) -> float:
+    """
+    Aplica a la red la actualización TD(λ) de una partida completa.
+
+    Funcionamiento: Versión "offline" (pesos fijos durante la partida) de TD(λ) con
+    trazas de elegibilidad, vectorizada. Con V_t la salida de la red en la posición t
+    (y V_T = resultado), δ_t = V_{t+1} - V_t. La suma de α δ_t e_t con trazas
+    e_t = Σ_{k≤t} λ^(t-k) ∇V_k es igual a α Σ_k G_k ∇V_k con G_k = Σ_{t≥k} λ^(t-k) δ_t,
+    así que basta una recursión hacia atrás para G y una retropropagación por lotes.
+
+    Args:
+        red (EvaluadorRed): Red a ajustar (en el lugar).
+        entradas (np.ndarray): Posiciones de la partida (T, 198), en orden.
+        resultado (float): 1.0 si ganaron las blancas, 0.0 si no.
+        alfa (float): Tasa de aprendizaje.
+        lambda_ (float): Decaimiento de las trazas (0 = TD(0), 1 = Monte Carlo).
+
+    Returns:
+        float: Error TD absoluto medio de la partida.
+    """
+    pesos = red.pesos
+    ocultas, valores = red.propagar(entradas)
+    delta = np.append(valores[1:], np.float32(resultado)) - valores
+
+    retorno = np.empty_like(delta)
+    acumulado = 0.0
+    for t in range(len(delta) - 1, -1, -1):
+        acumulado = delta[t] + lambda_ * acumulado
+        retorno[t] = acumulado
+
+    # dV/dz2 = V(1 - V); dV/dh = dV/dz2 * w2; dh/dz1 = h(1 - h)
+    coeficientes = (alfa * retorno * valores * (1.0 - valores)).astype(np.float32)
+    errores_ocultas = np.outer(coeficientes, pesos['w2']) * ocultas * (1.0 - ocultas)
+    pesos['w2'] += ocultas.T @ coeficientes
+    pesos['b2'] += coeficientes.sum()
+    pesos['w1'] += entradas.T @ errores_ocultas
+    pesos['b1'] += errores_ocultas.sum(axis=0)
+    return float(np.abs(delta).mean())
+
+
+def _jugar_lote_autojuego(pesos: dict, semilla: int, inicio: int,
+                          cantidad: int) -> list[tuple[np.ndarray, float]]:
+    """
+    Juega un lote de partidas de autojuego (función de módulo para enviarse a procesos).
+
+    La partida `i` siembra sus dados con (semilla, i), como en Torneo y Rollout.
+
+    Returns:
+        list[tuple]: Una trayectoria (entradas, resultado) por partida.
+    """
+    red = EvaluadorRed(**pesos)
+    motor = MotorBusqueda(profundidad=1, evaluador=red)
+    return [jugar_autojuego(red, random.Random(semilla * 1_000_003 + indice), motor)
+            for indice in range(inicio, inicio + cantidad)]
+
+
+def _jugar_lote_referencia(pesos: dict, semilla: int, inicio: int, cantidad: int) -> list[int]:
+    """
+    Juega un lote de partidas de la red contra la referencia (heurística a 1 ply),
+    alternando colores. Los dados dependen solo de (semilla, i), así que todas las
+    mediciones usan las mismas partidas.
+
+    Returns:
+        list[int]: Puntos netos de la red por partida.
+    """
+    red = EvaluadorRed(**pesos)
+    propia = MotorBusqueda(profundidad=1, evaluador=red).elegir_jugada
+    referencia = MotorBusqueda(profundidad=1).elegir_jugada
+    puntos = []
+    for indice in range(inicio, inicio + cantidad):
+        red_con_negras = indice % 2 == 1
+        blancas, negras = (referencia, propia) if red_con_negras else (propia, referencia)
+        juego = Backgammon(dados=Dados(semilla=semilla * 1_000_003 + indice))
+        color, valor, _ = jugar_partida(blancas, negras, juego)
+        puntos.append(valor if (color == 'negras') == red_con_negras else -valor)
+    return puntos
+
+
+class EntrenadorTD:
+    """
+    Responsabilidad: Entrenar un EvaluadorRed por autojuego con TD(λ).
+    SRP: Coordina trabajadores y aprendiz, guarda checkpoints y mide contra la referencia;
+         el juego lo valida el core y la política es MotorBusqueda con la red.
+    Justificación: Jugar partidas es lo caro y es independiente entre partidas, así que
+                   varios procesos (ProcessPoolExecutor, como Torneo y Rollout) juegan con
+                   una copia reciente de los pesos y devuelven trayectorias codificadas; un
+                   único aprendiz, en el proceso principal, aplica las actualizaciones TD(λ)
+                   vectorizadas. Así los pesos nunca se comparten entre procesos y el
+                   rendimiento escala con los núcleos.
+    """
+
+    def __init__(self, red: EvaluadorRed, alfa: float = 0.1, lambda_: float = 0.7,
+                 trabajadores: int = None, semilla: int = 0, tamano_lote: int = 10,
+                 directorio_checkpoints: str = None, intervalo_checkpoint: int = 1000,
+                 intervalo_referencia: int = 1000, partidas_referencia: int = 100):
+        """
+        Inicializa la configuración del entrenamiento.
+
+        Args:
+            red (EvaluadorRed): Red a entrenar (se ajusta en el lugar).
+            alfa (float): Tasa de aprendizaje.
+            lambda_ (float): Decaimiento de las trazas de elegibilidad.
+            trabajadores (int, optional): Procesos de autojuego. None = os.cpu_count();
+                                          1 = jugar en el proceso actual.
+            semilla (int): Semilla base de los dados.
+            tamano_lote (int): Partidas por tarea enviada a un trabajador; los pesos
+                               de los trabajadores se renuevan en cada tarea.
+            directorio_checkpoints (str, optional): Dónde guardar los pesos (.npz) cada
+                                                    `intervalo_checkpoint` partidas.
+            intervalo_checkpoint (int): Partidas entre checkpoints.
+            intervalo_referencia (int): Partidas entre mediciones contra la referencia
+                                        (0 = no medir).
+            partidas_referencia (int): Partidas por medición.
+
+        Raises:
+            ValueError: Si tamano_lote o los intervalos no son válidos.
+        """
+        if tamano_lote < 1 or intervalo_checkpoint < 1 or intervalo_referencia < 0:
+            raise ValueError("tamano_lote e intervalo_checkpoint deben ser positivos; "
+                             "intervalo_referencia, no negativo")
+        self.__red__ = red
+        self.__alfa__ = alfa
+        self.__lambda__ = lambda_
+        self.__trabajadores__ = trabajadores or os.cpu_count() or 1
+        self.__semilla__ = semilla
+        self.__tamano_lote__ = tamano_lote
+        self.__directorio__ = directorio_checkpoints
+        self.__intervalo_checkpoint__ = intervalo_checkpoint
+        self.__intervalo_referencia__ = intervalo_referencia
+        self.__partidas_referencia__ = partidas_referencia
+
+    def iterar(self, partidas: int):
+        """
+        Entrena con `partidas` partidas de autojuego, informando tras cada lote.
+
+        Funcionamiento: Mantiene una tarea en curso por trabajador. Cada vez que una
+        termina, el aprendiz aplica sus trayectorias y se envía otra tarea con los
+        pesos actuales (los trabajadores juegan con pesos a lo sumo un lote atrasados).
+
+        Args:
+            partidas (int): Partidas de autojuego a jugar.
+
+        Yields:
+            ReporteEntrenamiento: Progreso tras incorporar cada lote.
+        """
+        inicio = time.perf_counter()
+        lotes = [(inicio_lote, min(self.__tamano_lote__, partidas - inicio_lote))
+                 for inicio_lote in range(0, partidas, self.__tamano_lote__)]
+        jugadas = 0
+
+        if self.__trabajadores__ == 1:
+            for inicio_lote, cantidad in lotes:
+                trayectorias = _jugar_lote_autojuego(self._copiar_pesos(), self.__semilla__,
+                                                     inicio_lote, cantidad)
+                jugadas, reporte = self._incorporar(trayectorias, jugadas, inicio, None)
+                yield reporte
+            return
+
+        with ProcessPoolExecutor(max_workers=self.__trabajadores__) as pool:
+            pendientes = iter(lotes)
+            en_curso = set()
+
+            def enviar():
+                lote = next(pendientes, None)
+                if lote is not None:
+                    en_curso.add(pool.submit(_jugar_lote_autojuego, self._copiar_pesos(),
+                                             self.__semilla__, *lote))
+
+            for _ in range(self.__trabajadores__):
+                enviar()
+            while en_curso:
+                terminados, _ = wait(en_curso, return_when=FIRST_COMPLETED)
+                for futuro in terminados:
+                    en_curso.remove(futuro)
+                    jugadas, reporte = self._incorporar(futuro.result(), jugadas, inicio, pool)
+                    enviar()
+                    yield reporte
+
+    def entrenar(self, partidas: int, callback=None) -> ReporteEntrenamiento:
+        """
+        Entrena con `partidas` partidas de autojuego.
+
+        Args:
+            partidas (int): Partidas de autojuego a jugar.
+            callback (callable, optional): Se llama con cada ReporteEntrenamiento.
+
+        Returns:
+            ReporteEntrenamiento: Estado final (con una medición final contra la referencia
+                                  si las mediciones están activadas).
+        """
+        reporte = None
+        for reporte in self.iterar(partidas):
+            if callback is not None:
+                callback(reporte)
+        if reporte is not None and reporte.referencia is None and self.__intervalo_referencia__:
+            reporte = reporte._replace(referencia=self.medir_referencia())
+        return reporte
+
+    def medir_referencia(self, pool=None) -> ResultadoReferencia:
+        """
+        Juega la red actual contra la referencia fija (MotorBusqueda heurístico de 1 ply).
+
+        Args:
+            pool (Executor, optional): Dónde repartir las partidas; por defecto, en el
+                                       proceso actual.
+
+        Returns:
+            ResultadoReferencia: Resultado de la medición.
+        """
+        cantidad = self.__partidas_referencia__
+        pesos = self._copiar_pesos()
+        lotes = [(pesos, self.__semilla__, inicio, min(self.__tamano_lote__, cantidad - inicio))
+                 for inicio in range(0, cantidad, self.__tamano_lote__)]
+        if pool is None:
+            resultados = [_jugar_lote_referencia(*lote) for lote in lotes]
+        else:
+            resultados = pool.map(_jugar_lote_referencia, *zip(*lotes))
+        puntos = [valor for lote in resultados for valor in lote]
+        return ResultadoReferencia(len(puntos), sum(valor > 0 for valor in puntos),
+                                   sum(puntos) / len(puntos) if puntos else 0.0)
+
+    # ========== MÉTODOS PRIVADOS ==========
+
+    def _copiar_pesos(self) -> dict:
+        return {nombre: arreglo.copy() for nombre, arreglo in self.__red__.pesos.items()}
+
+    def _incorporar(self, trayectorias: list, jugadas: int, inicio: float, pool) -> tuple:
+        """
+        Aplica las trayectorias de un lote, guarda checkpoint y mide si corresponde.
+
+        Returns:
+            tuple: (partidas incorporadas en total, ReporteEntrenamiento).
+        """
+        errores = [actualizar_td(self.__red__, entradas, resultado, self.__alfa__, self.__lambda__)
+                   for entradas, resultado in trayectorias]
+        antes, jugadas = jugadas, jugadas + len(trayectorias)
+
+        if self.__directorio__ is not None and self._cruza(antes, jugadas, self.__intervalo_checkpoint__):
+            os.makedirs(self.__directorio__, exist_ok=True)
+            self.__red__.guardar(os.path.join(self.__directorio__, f"red_{jugadas:08d}.npz"))
+
+        referencia = None
+        if self._cruza(antes, jugadas, self.__intervalo_referencia__):
+            referencia = self.medir_referencia(pool)
+        return jugadas, ReporteEntrenamiento(jugadas, time.perf_counter() - inicio,
+                                             float(np.mean(errores)), referencia)
+
+    @staticmethod
+    def _cruza(antes: int, despues: int, intervalo: int) -> bool:
+        """Si entre `antes` y `despues` partidas se alcanzó un múltiplo de `intervalo`."""
+        return intervalo > 0 and antes // intervalo != despues // intervalo
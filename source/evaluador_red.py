@@ -0,0 +1,199 @@
+import numpy as np
+
+from source.constantes import CASILLEROS
+from source.tablero import Tablero
+
+# Codificación de TD-Gammon: por jugador, 4 unidades por punto (desde su propio punto 1
+# al 24), fichas en la barra / 2 y fichas fuera / 15; al final, 2 unidades de turno.
+ENTRADAS = 198
+_POR_JUGADOR = CASILLEROS * 4 + 2
+_COL_FUERA_BLANCAS = _POR_JUGADOR - 1
+_COL_FUERA_NEGRAS = 2 * _POR_JUGADOR - 1
+_COL_TURNO = 2 * _POR_JUGADOR
+_FICHAS = 15
+
+# Unidades de un punto según cuántas fichas tiene: n>=1, n>=2, n>=3 y (n-3)/2 si n>3
+_UNIDADES = np.array(
+    [[n >= 1, n >= 2, n >= 3, max(n - 3, 0) / 2] for n in range(_FICHAS + 1)],
+    dtype=np.float32,
+)
+
+# Casilleros 0-based en el orden de los puntos propios de cada color
+_ORDEN_BLANCAS = np.arange(CASILLEROS - 1, -1, -1)
+
+
+def codificar(tablero: Tablero, turno: str = 'blancas', salida: np.ndarray = None) -> np.ndarray:
+    """
+    Codifica el estado de un tablero en el vector de 198 entradas de TD-Gammon.
+
+    Args:
+        tablero (Tablero): Tablero a codificar.
+        turno (str): Color que tiene el turno en esa posición.
+        salida (np.ndarray, optional): Vector float32 de 198 donde escribir (p. ej. una
+                                       fila de una matriz de lote), para no reservar memoria.
+
+    Returns:
+        np.ndarray: El vector de entradas (float32).
+    """
+    if salida is None:
+        salida = np.empty(ENTRADAS, dtype=np.float32)
+    casilleros = np.array(tablero._obtener_posiciones_ref(), dtype=np.int8)
+    barra = tablero._obtener_barra_ref()
+    fuera = tablero._obtener_fichas_fuera_ref()
+
+    blancas = np.maximum(casilleros[_ORDEN_BLANCAS], 0)
+    negras = np.maximum(-casilleros, 0)
+    salida[0:CASILLEROS * 4] = _UNIDADES[blancas].ravel()
+    salida[CASILLEROS * 4] = barra['blancas'] / 2
+    salida[_COL_FUERA_BLANCAS] = fuera['blancas'] / _FICHAS
+    salida[_POR_JUGADOR:_POR_JUGADOR + CASILLEROS * 4] = _UNIDADES[negras].ravel()
+    salida[_POR_JUGADOR + CASILLEROS * 4] = barra['negras'] / 2
+    salida[_COL_FUERA_NEGRAS] = fuera['negras'] / _FICHAS
+    salida[_COL_TURNO] = turno == 'blancas'
+    salida[_COL_TURNO + 1] = turno != 'blancas'
+    return salida
+
+
+def _sigmoide(x: np.ndarray) -> np.ndarray:
+    return 1.0 / (1.0 + np.exp(-x))
+
+
+class EvaluadorRed:
+    """
+    Responsabilidad: Evaluar posiciones con una red neuronal al estilo TD-Gammon.
+    SRP: Solo codifica y propaga; no busca jugadas (MotorBusqueda) ni entrena.
+    Justificación: Un perceptrón de una capa oculta sobre la codificación de 198 entradas
+                   es el evaluador clásico del backgammon. Evaluar las candidatas una por
+                   una en Python desperdicia a NumPy; `evaluar_lote` propaga todas las
+                   posiciones de una tirada con una sola multiplicación de matrices, y
+                   MotorBusqueda usa esa vía cuando el evaluador la ofrece.
+    """
+
+    def __init__(self, w1: np.ndarray, b1: np.ndarray, w2: np.ndarray, b2: np.ndarray):
+        """
+        Inicializa la red con sus pesos.
+
+        Args:
+            w1 (np.ndarray): Pesos entrada -> oculta, forma (198, H).
+            b1 (np.ndarray): Sesgos de la capa oculta, forma (H,).
+            w2 (np.ndarray): Pesos oculta -> salida, forma (H,).
+            b2 (np.ndarray | float): Sesgo de la salida.
+
+        Raises:
+            ValueError: Si las formas de los pesos no son compatibles.
+        """
+        w1 = np.asarray(w1, dtype=np.float32)
+        ocultas = w1.shape[1] if w1.ndim == 2 else 0
+        if (w1.ndim != 2 or w1.shape[0] != ENTRADAS or np.shape(b1) != (ocultas,)
+                or np.shape(w2) != (ocultas,)):
+            raise ValueError(f"Pesos incompatibles: se esperaba w1 ({ENTRADAS}, H), b1 (H,), w2 (H,)")
+        self.__w1__ = w1
+        self.__b1__ = np.asarray(b1, dtype=np.float32)
+        self.__w2__ = np.asarray(w2, dtype=np.float32)
+        # Arreglo 0-d (no escalar) para que el entrenamiento pueda ajustarlo en el lugar
+        self.__b2__ = np.array(b2, dtype=np.float32).reshape(())
+
+    @classmethod
+    def aleatoria(cls, ocultas: int = 40, semilla: int = None) -> 'EvaluadorRed':
+        """
+        Crea una red con pesos aleatorios pequeños (punto de partida del entrenamiento).
+
+        Args:
+            ocultas (int): Neuronas de la capa oculta.
+            semilla (int, optional): Semilla del generador.
+
+        Returns:
+            EvaluadorRed: Red nueva.
+        """
+        rng = np.random.default_rng(semilla)
+        return cls(rng.normal(0, 0.1, (ENTRADAS, ocultas)), np.zeros(ocultas),
+                   rng.normal(0, 0.1, ocultas), 0.0)
+
+    @classmethod
+    def cargar(cls, ruta) -> 'EvaluadorRed':
+        """
+        Carga los pesos desde un archivo .npz (claves w1, b1, w2, b2).
+
+        Args:
+            ruta (str | archivo): Archivo escrito por `guardar`.
+
+        Returns:
+            EvaluadorRed: Red con esos pesos.
+
+        Raises:
+            ValueError: Si falta alguna clave o las formas no son compatibles.
+        """
+        with np.load(ruta) as datos:
+            faltantes = {'w1', 'b1', 'w2', 'b2'} - set(datos.files)
+            if faltantes:
+                raise ValueError(f"Faltan pesos en el archivo: {sorted(faltantes)}")
+            return cls(datos['w1'], datos['b1'], datos['w2'], datos['b2'])
+
+    def guardar(self, ruta):
+        """
+        Guarda los pesos en un archivo .npz.
+
+        Args:
+            ruta (str | archivo): Destino.
+        """
+        np.savez(ruta, **self.pesos)
+
+    @property
+    def pesos(self) -> dict:
+        """Pesos por nombre (w1, b1, w2, b2); se comparten: modificarlos modifica la red."""
+        return {'w1': self.__w1__, 'b1': self.__b1__, 'w2': self.__w2__, 'b2': self.__b2__}
+
+    @property
+    def ocultas(self) -> int:
+        """Neuronas de la capa oculta."""
+        return self.__w1__.shape[1]
+
+    def codificar(self, tablero: Tablero, turno: str = 'blancas', salida: np.ndarray = None):
+        """Ver `codificar` (se expone en la red para que MotorBusqueda detecte la vía por lotes)."""
+        return codificar(tablero, turno, salida)
+
+    def propagar(self, entradas: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Propaga un lote de entradas por la red.
+
+        Args:
+            entradas (np.ndarray): Matriz (N, 198).
+
+        Returns:
+            tuple: (ocultas (N, H), salida (N,)): activaciones de la capa oculta y
+                   probabilidad estimada de que ganen las blancas.
+        """
+        ocultas = _sigmoide(entradas @ self.__w1__ + self.__b1__)
+        return ocultas, _sigmoide(ocultas @ self.__w2__ + self.__b2__)
+
+    def evaluar_lote(self, entradas: np.ndarray) -> np.ndarray:
+        """
+        Evalúa un lote de posiciones codificadas con una sola pasada.
+
+        Funcionamiento: Convierte la probabilidad de la red a [-1, 1]; las posiciones
+        ya ganadas (15 fichas fuera) valen ±1 sin importar la red.
+
+        Args:
+            entradas (np.ndarray): Matriz (N, 198) de `codificar`.
+
+        Returns:
+            np.ndarray: Valores (N,) desde el punto de vista de las blancas.
+        """
+        entradas = np.asarray(entradas, dtype=np.float32).reshape(-1, ENTRADAS)
+        valores = 2.0 * self.propagar(entradas)[1] - 1.0
+        valores[entradas[:, _COL_FUERA_BLANCAS] >= 1.0] = 1.0
+        valores[entradas[:, _COL_FUERA_NEGRAS] >= 1.0] = -1.0
+        return valores
+
+    def __call__(self, tablero: Tablero, turno: str = 'blancas') -> float:
+        """
+        Evalúa una sola posición (interfaz de evaluador de MotorBusqueda).
+
+        Args:
+            tablero (Tablero): Tablero a evaluar.
+            turno (str): Color que tiene el turno.
+
+        Returns:
+            float: Valor en [-1, 1]; positivo favorece a blancas.
+        """
+        return float(self.evaluar_lote(codificar(tablero, turno))[0])
@@ -26,5 +26,6 @@ class FichasEnBarraError(BackgammonError):
     """Se lanza cuando hay fichas en la barra y se debe entrar primero"""
     pass
 
-
-
+class DadosAgotadosError(BackgammonError):
+    """Se lanza cuando unos dados en modo replay no tienen más tiradas grabadas"""
+    pass
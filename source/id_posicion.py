@@ -0,0 +1,101 @@
+import base64
+import binascii
+
+from source.constantes import CASILLEROS
+from source.posicion import Posicion
+
+# Position ID de GNU Backgammon: para cada jugador, 25 puntos (del 1 propio al 24, y la
+# barra) escritos como tantos bits 1 como fichas seguidos de un 0. Primero va el jugador
+# que NO tiene el turno y luego el que lo tiene. Los 80 bits se empaquetan en 10 bytes
+# (bit k en el byte k // 8, posición k % 8) y se codifican en base64 sin relleno.
+LONGITUD_ID = 14
+_BITS = 80
+_PUNTOS = CASILLEROS + 1
+_FICHAS = 15
+
+
+def _rival(color: str) -> str:
+    return 'negras' if color == 'blancas' else 'blancas'
+
+
+def _conteos(posicion: Posicion, color: str) -> list[int]:
+    """Fichas del color en sus puntos 1..24 (desde su propio home) y en la barra."""
+    casilleros = posicion.posiciones
+    if color == 'blancas':
+        conteos = [max(casilleros[CASILLEROS - 1 - j], 0) for j in range(CASILLEROS)]
+    else:
+        conteos = [max(-casilleros[j], 0) for j in range(CASILLEROS)]
+    conteos.append(posicion.barra[color])
+    return conteos
+
+
+def id_posicion(posicion: Posicion, turno: str = 'blancas') -> str:
+    """
+    Codifica una posición como Position ID de GNU Backgammon (14 caracteres).
+
+    Args:
+        posicion (Posicion): Instantánea del tablero (p. ej. `Tablero.obtener_posicion()`).
+        turno (str): Color que tiene el turno ('blancas' o 'negras').
+
+    Returns:
+        str: Identificador base64 de 14 caracteres.
+    """
+    clave = 0
+    bit = 0
+    for color in (_rival(turno), turno):
+        for fichas in _conteos(posicion, color):
+            clave |= ((1 << fichas) - 1) << bit
+            bit += fichas + 1
+    return base64.b64encode(clave.to_bytes(10, 'little')).decode('ascii')[:LONGITUD_ID]
+
+
+def posicion_desde_id(identificador: str, turno: str = 'blancas') -> Posicion:
+    """
+    Decodifica un Position ID de GNU Backgammon.
+
+    Funcionamiento: Recorre los 80 bits contando unos por punto; las fichas fuera son
+    las que faltan para llegar a 15 por color.
+
+    Args:
+        identificador (str): Position ID de 14 caracteres.
+        turno (str): Color que tiene el turno en esa posición.
+
+    Returns:
+        Posicion: La instantánea equivalente.
+
+    Raises:
+        ValueError: Si el identificador no es base64 válido o describe una posición imposible.
+    """
+    if len(identificador) != LONGITUD_ID:
+        raise ValueError(f"El Position ID debe tener {LONGITUD_ID} caracteres")
+    try:
+        datos = base64.b64decode(identificador + '==', validate=True)
+    except binascii.Error:
+        raise ValueError(f"Position ID inválido: '{identificador}'") from None
+    clave = int.from_bytes(datos, 'little')
+
+    conteos = {}
+    bit = 0
+    for color in (_rival(turno), turno):
+        puntos = []
+        for _ in range(_PUNTOS):
+            fichas = 0
+            while bit < _BITS and clave >> bit & 1:
+                fichas += 1
+                bit += 1
+            bit += 1
+            puntos.append(fichas)
+        if bit > _BITS or sum(puntos) > _FICHAS:
+            raise ValueError(f"Position ID inválido: '{identificador}'")
+        conteos[color] = puntos
+
+    casilleros = [0] * CASILLEROS
+    for j in range(CASILLEROS):
+        casilleros[CASILLEROS - 1 - j] += conteos['blancas'][j]
+        if conteos['negras'][j]:
+            if casilleros[j]:
+                raise ValueError(f"Position ID inválido: '{identificador}' (punto compartido)")
+            casilleros[j] = -conteos['negras'][j]
+    barra = {color: conteos[color][CASILLEROS] for color in conteos}
+    fuera = {color: _FICHAS - sum(conteos[color]) for color in conteos}
+    return Posicion(casilleros, barra, fuera)
@@ -0,0 +1,407 @@
+import time
+
+from source.tablero import Tablero
+from source.gestor_turnos import GestorTurnos
+from source.ejecutor_movimientos import EjecutorMovimientos
+from source.analizador_posibilidades import AnalizadorPosibilidades
+from source.id_posicion import id_posicion
+
+# Las 21 tiradas distintas con su peso sobre 36 (dobles 1/36, resto 2/36)
+TIRADAS = tuple(
+    (d1, d2, 1 if d1 == d2 else 2)
+    for d1 in range(1, 7)
+    for d2 in range(d1, 7)
+)
+
+
+def evaluar_heuristica(tablero: Tablero) -> float:
+    """
+    Evaluación estática simple de una posición, desde el punto de vista de las blancas.
+
+    Funcionamiento: Usa la diferencia relativa de pips (contadores incrementales del
+    Tablero, con la barra a 25 pips) y una penalización por blots. Las posiciones
+    ganadas valen ±1.
+
+    Args:
+        tablero (Tablero): Tablero a evaluar.
+
+    Returns:
+        float: Valor en [-1, 1]; positivo favorece a blancas.
+    """
+    fuera = tablero._obtener_fichas_fuera_ref()
+    if fuera['blancas'] == 15:
+        return 1.0
+    if fuera['negras'] == 15:
+        return -1.0
+
+    pos = tablero._obtener_posiciones_ref()
+    pips_blancas = tablero.obtener_pips('blancas')
+    pips_negras = tablero.obtener_pips('negras')
+    blots = pos.count(-1) - pos.count(1)
+
+    total = pips_blancas + pips_negras
+    valor = (pips_negras - pips_blancas) / total if total else 0.0
+    valor += 0.02 * blots
+    return max(-0.99, min(0.99, valor))
+
+
+class _TiempoAgotado(Exception):
+    """Señal interna para abortar una iteración cuando se agota el presupuesto de tiempo."""
+
+
+class MotorBusqueda:
+    """
+    Responsabilidad: Elegir una jugada para el estado actual de un Backgammon.
+    SRP: Solo busca y evalúa; no valida ni ejecuta jugadas sobre la partida real.
+    Justificación: La búsqueda expectiminimax trabaja sobre una copia privada del tablero
+                   (Tablero.desde_posicion) y reutiliza el generador de jugadas completas,
+                   el diario de deshacer y el hash Zobrist del EjecutorMovimientos, de modo
+                   que cada nodo cuesta un delta y un rollback en lugar de copias del estado.
+                   La tabla de transposición y el presupuesto de tiempo hacen predecible
+                   el tiempo de respuesta.
+    """
+
+    def __init__(self, profundidad: int = 2, tiempo_limite: float = None,
+                 evaluador=None, max_entradas_tt: int = 200_000, base_bear_off=None,
+                 almacen=None):
+        """
+        Inicializa el motor.
+
+        Args:
+            profundidad (int): Plies máximos. 1 = evaluar cada jugada candidata;
+                               2 = además promediar la mejor respuesta rival sobre las 21 tiradas.
+            tiempo_limite (float, optional): Segundos disponibles por decisión. Con límite,
+                                             se profundiza iterativamente y se devuelve la mejor
+                                             jugada de la última profundidad completada.
+            evaluador (callable, optional): Función (Tablero) -> float desde el punto de vista
+                                            de las blancas. Por defecto `evaluar_heuristica`.
+                                            Si además ofrece `codificar(tablero, turno, salida)`
+                                            y `evaluar_lote(entradas)` (ver EvaluadorRed), las
+                                            hojas de cada tirada se evalúan en un solo lote.
+            max_entradas_tt (int): Tamaño máximo de la tabla de transposición.
+            base_bear_off (BaseBearOff, optional): Base de bear-off; en posiciones sin
+                                                   contacto reemplaza a la búsqueda.
+            almacen (AlmacenPosiciones, optional): Análisis persistidos. Se consulta antes
+                                                   de buscar y recibe cada resultado nuevo;
+                                                   debe usarse siempre con el mismo evaluador.
+
+        Raises:
+            ValueError: Si la profundidad es menor que 1.
+
+        Atributos privados:
+            __tabla__: dict - Tabla de transposición: (clave Zobrist, profundidad) -> valor.
+            __estadisticas__: dict - Nodos evaluados, aciertos de la tabla y profundidad alcanzada.
+        """
+        if profundidad < 1:
+            raise ValueError("La profundidad debe ser al menos 1")
+        self.__profundidad__ = profundidad
+        self.__tiempo_limite__ = tiempo_limite
+        self.__evaluador__ = evaluador if evaluador is not None else evaluar_heuristica
+        self.__por_lote__ = (hasattr(self.__evaluador__, 'evaluar_lote')
+                             and hasattr(self.__evaluador__, 'codificar'))
+        self.__entradas__ = None
+        self.__max_entradas_tt__ = max_entradas_tt
+        self.__base_bear_off__ = base_bear_off
+        self.__almacen__ = almacen
+        self.__tabla__ = {}
+        self.__limite__ = None
+        self.__estadisticas__ = {'nodos': 0, 'aciertos_tt': 0, 'profundidad': 0}
+
+    def elegir_jugada(self, juego) -> tuple:
+        """
+        Elige la mejor jugada completa para los dados pendientes del juego.
+
+        Funcionamiento:
+        1. Copia el estado del juego a un tablero privado.
+        2. Genera las jugadas candidatas para los dados pendientes.
+        3. Evalúa cada una con expectiminimax a la profundidad configurada
+           (con profundización iterativa si hay límite de tiempo).
+
+        Args:
+            juego (Backgammon): Partida cuyo jugador en turno debe mover.
+
+        Returns:
+            tuple: Jugada en la notación de `Backgammon.obtener_jugadas_posibles`
+                   ((origen, destino, dado), ...). Tupla vacía si no hay dados pendientes
+                   o ningún movimiento es posible.
+        """
+        dados = juego.obtener_movimientos_pendientes()
+        if not dados:
+            return ()
+
+        tablero = Tablero.desde_posicion(juego.obtener_posicion())
+        gestor = GestorTurnos()
+        if juego.obtener_turno() == "negras":
+            gestor.cambiar_turno()
+        ejecutor = EjecutorMovimientos(tablero, gestor)
+        analizador = AnalizadorPosibilidades(tablero, gestor)
+
+        return self._a_notacion_publica(self.buscar(dados, tablero, gestor, ejecutor, analizador))
+
+    def buscar(self, dados: list[int], tablero: Tablero, gestor: GestorTurnos,
+               ejecutor: EjecutorMovimientos, analizador: AnalizadorPosibilidades) -> tuple:
+        """
+        Busca la mejor jugada sobre componentes del core ya construidos.
+
+        Funcionamiento: Igual que `elegir_jugada`, pero sin copiar el estado: opera
+        directamente (aplicando y revirtiendo) sobre el tablero recibido, que queda
+        como estaba al terminar. Pensado para bucles de simulación que ya mantienen
+        su propio tablero privado. Si hay base de bear-off y la posición no tiene
+        contacto, la jugada se toma de la base sin buscar; si no, y hay almacén con un
+        análisis de al menos la profundidad configurada cuya jugada es legal con estos
+        dados, se toma del almacén. Las búsquedas completas se guardan en el almacén.
+
+        Args:
+            dados (list[int]): Dados a usar.
+            tablero (Tablero): Tablero sobre el que buscar.
+            gestor (GestorTurnos): Gestor con el jugador en turno.
+            ejecutor (EjecutorMovimientos): Ejecutor asociado al tablero.
+            analizador (AnalizadorPosibilidades): Analizador asociado al tablero.
+
+        Returns:
+            tuple: Jugada interna (pasos 0-based, ver `AnalizadorPosibilidades.generar_jugadas`).
+        """
+        self.__estadisticas__ = {'nodos': 0, 'aciertos_tt': 0, 'profundidad': 0}
+        if self.__base_bear_off__ is not None:
+            jugada = self.__base_bear_off__.jugada_para(tablero, gestor.obtener_direccion(), dados)
+            if jugada is not None:
+                return jugada
+
+        candidatas = analizador.generar_jugadas(dados)
+        if len(candidatas) == 1:
+            return candidatas[0]
+
+        clave_almacen = None
+        if self.__almacen__ is not None:
+            clave_almacen = id_posicion(tablero.obtener_posicion(), gestor.obtener_turno())
+            analisis = self.__almacen__.buscar(clave_almacen, dados)
+            if analisis is not None and analisis.profundidad >= self.__profundidad__:
+                # Solo se confía en una jugada que sea legal con estos dados
+                jugada = self._a_notacion_interna(analisis.jugada)
+                if jugada in candidatas:
+                    return jugada
+
+        inicio = time.perf_counter()
+        self.__limite__ = inicio + self.__tiempo_limite__ if self.__tiempo_limite__ else None
+        profundidades = (range(1, self.__profundidad__ + 1) if self.__limite__
+                         else (self.__profundidad__,))
+
+        mejor, mejor_valor = candidatas[0], None
+        try:
+            for profundidad in profundidades:
+                try:
+                    mejor, mejor_valor = self._mejor_jugada(candidatas, profundidad, tablero,
+                                                            gestor, ejecutor, analizador)
+                except _TiempoAgotado:
+                    break
+                self.__estadisticas__['profundidad'] = profundidad
+        finally:
+            self.__limite__ = None
+
+        if clave_almacen is not None and mejor_valor is not None:
+            self.__almacen__.guardar(clave_almacen, dados, self._a_notacion_publica(mejor),
+                                     mejor_valor * gestor.obtener_direccion(),
+                                     self.__estadisticas__['profundidad'])
+        return mejor
+
+    def obtener_estadisticas(self) -> dict:
+        """
+        Retorna las estadísticas de la última búsqueda.
+
+        Returns:
+            dict: {'nodos': int, 'aciertos_tt': int, 'profundidad': int}
+        """
+        return dict(self.__estadisticas__)
+
+    def limpiar_tabla(self):
+        """
+        Vacía la tabla de transposición.
+        """
+        self.__tabla__.clear()
+
+    # ========== MÉTODOS PRIVADOS ==========
+
+    def _mejor_jugada(self, candidatas: list, profundidad: int, tablero: Tablero,
+                      gestor: GestorTurnos, ejecutor: EjecutorMovimientos,
+                      analizador: AnalizadorPosibilidades) -> tuple:
+        """
+        Evalúa las jugadas candidatas de la raíz y retorna la mejor.
+
+        Returns:
+            tuple: (jugada, valor): la jugada interna (0-based) con mejor valor para el
+                   jugador en turno y ese valor desde el punto de vista de las blancas.
+        """
+        signo = gestor.obtener_direccion()
+        mejor, mejor_valor = None, None
+        valores = self._valores_tras_jugadas(candidatas, profundidad - 1, tablero, gestor,
+                                             ejecutor, analizador)
+        for jugada, valor in zip(candidatas, valores):
+            if mejor_valor is None or valor * signo > mejor_valor * signo:
+                mejor, mejor_valor = jugada, valor
+        return mejor, mejor_valor
+
+    def _valor_azar(self, profundidad: int, tablero: Tablero, gestor: GestorTurnos,
+                    ejecutor: EjecutorMovimientos, analizador: AnalizadorPosibilidades) -> float:
+        """
+        Valor esperado de una posición antes de tirar los dados (nodo de azar).
+
+        Funcionamiento: Promedia, ponderando por probabilidad, el valor de la mejor
+        jugada del jugador en turno para cada una de las 21 tiradas distintas.
+        Consulta y actualiza la tabla de transposición.
+
+        Returns:
+            float: Valor desde el punto de vista de las blancas.
+        """
+        self.__estadisticas__['nodos'] += 1
+        if self.__limite__ is not None and time.perf_counter() > self.__limite__:
+            raise _TiempoAgotado()
+
+        fuera = tablero._obtener_fichas_fuera_ref()
+        if profundidad == 0 or fuera['blancas'] == 15 or fuera['negras'] == 15:
+            return self.__evaluador__(tablero)
+
+        clave = (ejecutor.obtener_clave(), profundidad)
+        valor = self.__tabla__.get(clave)
+        if valor is not None:
+            self.__estadisticas__['aciertos_tt'] += 1
+            return valor
+
+        signo = gestor.obtener_direccion()
+        total = 0.0
+        for d1, d2, peso in TIRADAS:
+            dados = [d1] * 4 if d1 == d2 else [d1, d2]
+            valores = self._valores_tras_jugadas(analizador.generar_jugadas(dados),
+                                                 profundidad - 1, tablero, gestor,
+                                                 ejecutor, analizador)
+            total += peso * (max(valores) if signo > 0 else min(valores))
+        valor = total / 36
+
+        if len(self.__tabla__) >= self.__max_entradas_tt__:
+            self.__tabla__.clear()
+        self.__tabla__[clave] = valor
+        return valor
+
+    def _valores_tras_jugadas(self, jugadas: list, profundidad: int, tablero: Tablero,
+                              gestor: GestorTurnos, ejecutor: EjecutorMovimientos,
+                              analizador: AnalizadorPosibilidades):
+        """
+        Valores de las posiciones que resultan de cada jugada de una misma tirada.
+
+        Funcionamiento: En las hojas (profundidad 0) con un evaluador por lotes, aplica
+        cada jugada, codifica la posición en una fila de una matriz reutilizable y la
+        revierte; luego evalúa todas las filas con una sola llamada. En otro caso,
+        recurre a `_valor_tras_jugada` por cada jugada.
+
+        Returns:
+            Sequence[float]: Un valor por jugada, desde el punto de vista de las blancas.
+        """
+        if profundidad > 0 or not self.__por_lote__:
+            return [self._valor_tras_jugada(jugada, profundidad, tablero, gestor,
+                                            ejecutor, analizador) for jugada in jugadas]
+
+        self.__estadisticas__['nodos'] += len(jugadas)
+        if self.__limite__ is not None and time.perf_counter() > self.__limite__:
+            raise _TiempoAgotado()
+        entradas = self._matriz_entradas(len(jugadas))
+        codificar = self.__evaluador__.codificar
+        # Tras la jugada tiene el turno el rival
+        turno = 'negras' if gestor.obtener_turno() == 'blancas' else 'blancas'
+        for fila, jugada in zip(entradas, jugadas):
+            self._aplicar(jugada, ejecutor)
+            try:
+                codificar(tablero, turno, fila)
+            finally:
+                self._deshacer(jugada, ejecutor)
+        return self.__evaluador__.evaluar_lote(entradas).tolist()
+
+    def _matriz_entradas(self, filas: int) -> 'np.ndarray':
+        """
+        Vista (filas, ENTRADAS) de un buffer que crece según haga falta y se reutiliza.
+
+        Funcionamiento: Solo se llama con un evaluador por lote; NumPy y la red se importan
+        aquí para que el motor con la heurística funcione sin NumPy instalado.
+        """
+        if self.__entradas__ is None or len(self.__entradas__) < filas:
+            import numpy as np
+            from source.evaluador_red import ENTRADAS
+            self.__entradas__ = np.empty((max(filas, 64), ENTRADAS), dtype=np.float32)
+        return self.__entradas__[:filas]
+
+    def _valor_tras_jugada(self, jugada: tuple, profundidad: int, tablero: Tablero,
+                           gestor: GestorTurnos, ejecutor: EjecutorMovimientos,
+                           analizador: AnalizadorPosibilidades) -> float:
+        """
+        Aplica una jugada, evalúa el nodo de azar resultante y la revierte.
+
+        Funcionamiento: La reversión ocurre siempre (try/finally), incluso si la búsqueda
+        se aborta por tiempo, para dejar el tablero tal como estaba.
+
+        Returns:
+            float: Valor desde el punto de vista de las blancas.
+        """
+        self._aplicar(jugada, ejecutor)
+        gestor.cambiar_turno()
+        try:
+            return self._valor_azar(profundidad, tablero, gestor, ejecutor, analizador)
+        finally:
+            gestor.cambiar_turno()
+            self._deshacer(jugada, ejecutor)
+
+    def _aplicar(self, jugada: tuple, ejecutor: EjecutorMovimientos):
+        """
+        Aplica una jugada interna sobre el tablero privado.
+
+        Args:
+            jugada (tuple): Pasos (origen_idx, destino_idx, valor_dado).
+            ejecutor (EjecutorMovimientos): Ejecutor del tablero privado.
+        """
+        for origen_idx, _, valor_dado in jugada:
+            if origen_idx is None:
+                ejecutor.ejecutar_entrada_barra(valor_dado)
+            else:
+                ejecutor.ejecutar_movimiento(origen_idx, valor_dado)
+
+    def _deshacer(self, jugada: tuple, ejecutor: EjecutorMovimientos):
+        """
+        Revierte una jugada aplicada con `_aplicar` usando el diario del ejecutor.
+
+        Args:
+            jugada (tuple): Jugada aplicada.
+            ejecutor (EjecutorMovimientos): Ejecutor del tablero privado.
+        """
+        for _ in jugada:
+            ejecutor.deshacer()
+
+    def _a_notacion_publica(self, jugada: tuple) -> tuple:
+        """
+        Convierte una jugada interna (0-based) a la notación pública de Backgammon.
+
+        Args:
+            jugada (tuple): Pasos (origen_idx, destino_idx, valor_dado).
+
+        Returns:
+            tuple: Pasos (origen, destino, dado) con origen=0 para barra y destino=-1 para bear-off.
+        """
+        return tuple(
+            (0 if origen_idx is None else origen_idx + 1,
+             -1 if destino_idx is None else destino_idx + 1,
+             valor_dado)
+            for origen_idx, destino_idx, valor_dado in jugada
+        )
+
+    def _a_notacion_interna(self, jugada: tuple) -> tuple:
+        """
+        Inversa de `_a_notacion_publica`.
+
+        Args:
+            jugada (tuple): Pasos (origen, destino, dado) en notación pública.
+
+        Returns:
+            tuple: Pasos (origen_idx, destino_idx, valor_dado), con None para barra y bear-off.
+        """
+        return tuple(
+            (None if origen == 0 else origen - 1,
+             None if destino == -1 else destino - 1,
+             valor_dado)
+            for origen, destino, valor_dado in jugada
+        )
@@ -0,0 +1,127 @@
+import struct
+
+from source.constantes import CASILLEROS
+
+
+class Posicion:
+    """
+    Responsabilidad: Representar una instantánea inmutable y compacta del estado del tablero.
+    SRP: Solo almacena y expone los datos de una posición (24 casilleros, barra y fichas fuera);
+         no sabe mover ni validar.
+    Justificación: Tablero solo expone su estado como tres copias defensivas (lista + dos dicts).
+                   Empaquetar todo en un único objeto `bytes` permite usar posiciones como claves
+                   de diccionarios y caches: CPython guarda el hash de `bytes` tras calcularlo,
+                   por lo que el hash es O(1) y la igualdad es una comparación de memoria.
+    """
+
+    __slots__ = ('__datos__',)
+
+    # 24 casilleros con signo + barra (blancas, negras) + fichas fuera (blancas, negras)
+    __FORMATO__ = struct.Struct(f'{CASILLEROS + 4}b')
+
+    def __init__(self, posiciones, barra: dict, fichas_fuera: dict):
+        """
+        Construye la instantánea a partir de los datos del tablero.
+
+        Funcionamiento: Empaqueta los 28 contadores como enteros con signo de 1 byte.
+
+        Args:
+            posiciones (Sequence[int]): 24 valores con signo (+ blancas, - negras).
+            barra (dict): {'blancas': int, 'negras': int}.
+            fichas_fuera (dict): {'blancas': int, 'negras': int}.
+
+        Raises:
+            ValueError: Si no hay exactamente 24 posiciones.
+        """
+        if len(posiciones) != CASILLEROS:
+            raise ValueError(f"Se esperaban {CASILLEROS} posiciones, se recibieron {len(posiciones)}")
+        datos = Posicion.__FORMATO__.pack(
+            *posiciones,
+            barra['blancas'], barra['negras'],
+            fichas_fuera['blancas'], fichas_fuera['negras'],
+        )
+        object.__setattr__(self, '__datos__', datos)
+
+    @classmethod
+    def desde_bytes(cls, datos: bytes) -> 'Posicion':
+        """
+        Reconstruye una instantánea a partir de su representación en bytes.
+
+        Args:
+            datos (bytes): Bytes producidos por `a_bytes`.
+
+        Returns:
+            Posicion: La instantánea equivalente.
+
+        Raises:
+            ValueError: Si la longitud no corresponde al formato.
+        """
+        if len(datos) != cls.__FORMATO__.size:
+            raise ValueError(f"Se esperaban {cls.__FORMATO__.size} bytes, se recibieron {len(datos)}")
+        posicion = cls.__new__(cls)
+        object.__setattr__(posicion, '__datos__', bytes(datos))
+        return posicion
+
+    def __setattr__(self, nombre, valor):
+        raise AttributeError("Posicion es inmutable")
+
+    def __delattr__(self, nombre):
+        raise AttributeError("Posicion es inmutable")
+
+    def __hash__(self) -> int:
+        return hash(self.__datos__)
+
+    def __eq__(self, otra) -> bool:
+        if not isinstance(otra, Posicion):
+            return NotImplemented
+        return self.__datos__ == otra.__datos__
+
+    def __repr__(self) -> str:
+        return (f"Posicion(posiciones={list(self.posiciones)}, "
+                f"barra={self.barra}, fichas_fuera={self.fichas_fuera})")
+
+    def __reduce__(self):
+        return (Posicion.desde_bytes, (self.__datos__,))
+
+    # ========== CONSULTAS ==========
+
+    @property
+    def posiciones(self) -> tuple:
+        """
+        Retorna los 24 casilleros con signo.
+
+        Returns:
+            tuple[int, ...]: Valores de los casilleros 0..23.
+        """
+        return Posicion.__FORMATO__.unpack(self.__datos__)[:CASILLEROS]
+
+    @property
+    def barra(self) -> dict:
+        """
+        Retorna las fichas en la barra por color.
+
+        Returns:
+            dict: {'blancas': int, 'negras': int}.
+        """
+        datos = self.__datos__
+        return {'blancas': datos[CASILLEROS], 'negras': datos[CASILLEROS + 1]}
+
+    @property
+    def fichas_fuera(self) -> dict:
+        """
+        Retorna las fichas que ya salieron del tablero por color.
+
+        Returns:
+            dict: {'blancas': int, 'negras': int}.
+        """
+        datos = self.__datos__
+        return {'blancas': datos[CASILLEROS + 2], 'negras': datos[CASILLEROS + 3]}
+
+    def a_bytes(self) -> bytes:
+        """
+        Retorna la representación compacta (28 bytes) de la posición.
+
+        Returns:
+            bytes: Datos empaquetados, aptos para persistir o enviar.
+        """
+        return self.__datos__
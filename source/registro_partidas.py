@@ -0,0 +1,229 @@
+import struct
+from typing import NamedTuple
+
+from source.backgammon import Backgammon
+from source.dados import Dados
+
+# Cabecera del archivo: magia y versión. Luego, registros de 2 bytes: (tipo, dato).
+_CABECERA = struct.Struct('<4sB')
+_MAGIA = b'BGPR'
+_VERSION = 1
+
+# Tipos de registro
+INICIO = 0        # Comienza una partida nueva (posición inicial, mueven blancas)
+TIRADA = 1        # dato = d1 << 3 | d2
+MOVIMIENTO = 2    # dato = origen << 3 | dado (origen 1-based, 0 = barra)
+FIN_TURNO = 3     # finalizar_tirada
+
+_FIN = (FIN_TURNO, 0, 0)
+
+
+class PartidaGrabada(NamedTuple):
+    """
+    Una partida leída de un archivo de registros.
+
+    Atributos:
+        eventos (list[tuple]): Eventos en orden, como tuplas (tipo, a, b):
+                               (TIRADA, d1, d2), (MOVIMIENTO, origen, dado) o (FIN_TURNO, 0, 0).
+    """
+    eventos: list
+
+    @property
+    def tiradas(self) -> list[tuple[int, int]]:
+        """Tiradas de la partida en orden."""
+        return [(a, b) for tipo, a, b in self.eventos if tipo == TIRADA]
+
+    def reproducir(self, juego=None):
+        """
+        Reproduce la partida a través del core, validando cada movimiento.
+
+        Funcionamiento: Usa Dados en modo replay con las tiradas grabadas y aplica los
+        eventos con tirar_dados, mover y finalizar_tirada.
+
+        Args:
+            juego (Backgammon, optional): Partida nueva sobre la que reproducir. Por
+                                          defecto, una con Dados en modo replay.
+
+        Returns:
+            Backgammon: La partida en su estado final.
+
+        Raises:
+            MovimientoInvalidoError: Si un movimiento grabado no es legal.
+        """
+        if juego is None:
+            juego = Backgammon(dados=Dados(tiradas=self.tiradas))
+        for tipo, a, b in self.eventos:
+            if tipo == MOVIMIENTO:
+                juego.mover(a, b)
+            elif tipo == TIRADA:
+                juego.tirar_dados()
+            else:
+                juego.finalizar_tirada()
+        return juego
+
+
+class EscritorPartidas:
+    """
+    Responsabilidad: Escribir partidas en el formato binario compacto de registros.
+    SRP: Solo codifica eventos; no valida reglas (eso lo hace el core al jugar o reproducir).
+    Justificación: Cada tirada o movimiento ocupa 2 bytes, frente a decenas en un log de
+                   texto, y los registros de ancho fijo se decodifican sin parsear. Backgammon
+                   alimenta al escritor a medida que se juega (ver `Backgammon.grabar_en`); los
+                   movimientos del turno en curso quedan en memoria hasta confirmarse, para
+                   que deshacer/rehacer no ensucien el archivo.
+    """
+
+    def __init__(self, destino, tamano_buffer: int = 1 << 16):
+        """
+        Abre el destino y escribe la cabecera.
+
+        Args:
+            destino (str | archivo binario): Ruta a crear o archivo abierto para escritura.
+            tamano_buffer (int): Bytes a acumular antes de escribir al archivo.
+
+        Atributos privados:
+            __buffer__: bytearray - Registros confirmados aún no escritos.
+            __turno__: list[int] - Datos de los movimientos del turno en curso.
+        """
+        self.__propio__ = isinstance(destino, str)
+        self.__archivo__ = open(destino, 'wb') if self.__propio__ else destino
+        self.__tamano_buffer__ = tamano_buffer
+        self.__buffer__ = bytearray(_CABECERA.pack(_MAGIA, _VERSION))
+        self.__turno__ = []
+        self.__partidas__ = 0
+
+    def __enter__(self) -> 'EscritorPartidas':
+        return self
+
+    def __exit__(self, *exc):
+        self.cerrar()
+        return False
+
+    @property
+    def partidas(self) -> int:
+        """Cantidad de partidas iniciadas."""
+        return self.__partidas__
+
+    def nueva_partida(self):
+        """Registra el comienzo de una partida desde la posición inicial."""
+        self._agregar(INICIO, 0)
+        self.__partidas__ += 1
+
+    def tirada(self, d1: int, d2: int):
+        """Registra una tirada de dados."""
+        self._agregar(TIRADA, d1 << 3 | d2)
+
+    def movimiento(self, origen: int, dado: int):
+        """
+        Registra un movimiento del turno en curso (notación de `Backgammon.mover`).
+
+        Args:
+            origen (int): Posición 1-based de origen; 0 para la barra.
+            dado (int): Dado usado.
+        """
+        self.__turno__.append(origen << 3 | dado)
+
+    def deshacer(self):
+        """Descarta el último movimiento del turno en curso."""
+        if self.__turno__:
+            self.__turno__.pop()
+
+    def fin_turno(self):
+        """Registra el final del turno."""
+        self._agregar(FIN_TURNO, 0)
+
+    def escribir_partida(self, partida: PartidaGrabada):
+        """
+        Escribe una partida completa ya grabada (p. ej. leída o importada de otro formato).
+
+        Args:
+            partida (PartidaGrabada): Partida a escribir.
+        """
+        self.nueva_partida()
+        for tipo, a, b in partida.eventos:
+            self._agregar(tipo, a << 3 | b)
+
+    def vaciar(self):
+        """Confirma los movimientos pendientes y escribe el buffer al archivo."""
+        self._confirmar_turno()
+        self.__archivo__.write(self.__buffer__)
+        self.__buffer__.clear()
+        self.__archivo__.flush()
+
+    def cerrar(self):
+        """Vacía el buffer y, si el escritor abrió el archivo, lo cierra."""
+        if self.__archivo__ is None:
+            return
+        self.vaciar()
+        if self.__propio__:
+            self.__archivo__.close()
+        self.__archivo__ = None
+
+    # ========== MÉTODOS PRIVADOS ==========
+
+    def _confirmar_turno(self):
+        """Pasa al buffer los movimientos del turno en curso."""
+        for dato in self.__turno__:
+            self.__buffer__ += bytes((MOVIMIENTO, dato))
+        self.__turno__.clear()
+
+    def _agregar(self, tipo: int, dato: int):
+        """Agrega un registro (confirmando antes el turno) y escribe si el buffer se llenó."""
+        self._confirmar_turno()
+        self.__buffer__ += bytes((tipo, dato))
+        if len(self.__buffer__) >= self.__tamano_buffer__:
+            self.__archivo__.write(self.__buffer__)
+            self.__buffer__.clear()
+
+
+def leer_partidas(origen, tamano_bloque: int = 1 << 16):
+    """
+    Lee un archivo de registros partida por partida, sin cargarlo entero en memoria.
+
+    Funcionamiento: Lee bloques de `tamano_bloque` bytes y decodifica los registros de
+    2 bytes; produce cada partida al encontrar el INICIO de la siguiente o el final.
+
+    Args:
+        origen (str | archivo binario): Ruta o archivo abierto para lectura.
+        tamano_bloque (int): Bytes por lectura (se redondea a par).
+
+    Yields:
+        PartidaGrabada: Cada partida del archivo, en orden.
+
+    Raises:
+        ValueError: Si la cabecera, un tipo de registro o la longitud son inválidos.
+    """
+    propio = isinstance(origen, str)
+    archivo = open(origen, 'rb') if propio else origen
+    tamano_bloque += tamano_bloque % 2
+    try:
+        cabecera = archivo.read(_CABECERA.size)
+        if len(cabecera) < _CABECERA.size or _CABECERA.unpack(cabecera) != (_MAGIA, _VERSION):
+            raise ValueError("no es un archivo de registros de partidas válido")
+        eventos = None
+        while True:
+            bloque = archivo.read(tamano_bloque)
+            if not bloque:
+                break
+            if len(bloque) % 2:
+                raise ValueError("archivo de registros truncado")
+            if eventos is None and bloque[0] != INICIO:
+                raise ValueError("registro fuera de una partida")
+            for tipo, dato in zip(bloque[::2], bloque[1::2]):
+                if tipo == MOVIMIENTO:
+                    eventos.append((MOVIMIENTO, dato >> 3, dato & 7))
+                elif tipo == TIRADA:
+                    eventos.append((TIRADA, dato >> 3, dato & 7))
+                elif tipo == FIN_TURNO:
+                    eventos.append(_FIN)
+                elif tipo == INICIO:
+                    if eventos is not None:
+                        yield PartidaGrabada(eventos)
+                    eventos = []
+                else:
+                    raise ValueError(f"tipo de registro desconocido: {tipo}")
+        if eventos is not None:
+            yield PartidaGrabada(eventos)
+    finally:
+        if propio:
+            archivo.close()
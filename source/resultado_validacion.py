@@ -0,0 +1,87 @@
+from enum import Enum
+from typing import NamedTuple
+
+from source.excepciones import (
+    MovimientoInvalidoError,
+    OrigenInvalidoError,
+    DestinoBloquedoError,
+    BearOffInvalidoError,
+)
+
+
+class MotivoRechazo(str, Enum):
+    """
+    Código de la razón por la que ValidadorMovimientos rechaza un movimiento.
+
+    Cada miembro es también un str cuyo valor es el texto a mostrar, de modo que el
+    código se puede comparar, serializar (por `name`) y mostrar sin construir mensajes.
+    """
+    NINGUNO = ""
+    ORIGEN_INVALIDO = "origen inválido o sin fichas propias"
+    DESTINO_BLOQUEADO = "posición de destino bloqueada"
+    ENTRADA_BLOQUEADA = "posición de entrada bloqueada"
+    FUERA_DEL_TABLERO = "movimiento fuera del tablero"
+    DADO_INVALIDO = "dado inválido (1..6)"
+    NO_TODAS_EN_HOME = "no todas las fichas están en home"
+    VALOR_INSUFICIENTE = "valor insuficiente para sacar la ficha"
+    FICHA_MAS_ADELANTADA = "debe mover ficha más adelantada"
+
+    def __str__(self) -> str:
+        return self.value
+
+
+class ResultadoValidacion(NamedTuple):
+    """
+    Resultado de validar un movimiento.
+
+    Se desempaqueta como la tupla (es_valido, motivo) de siempre; `motivo` es un
+    MotivoRechazo (NINGUNO si el movimiento es válido).
+
+    Atributos:
+        valido (bool): Si el movimiento es legal.
+        motivo (MotivoRechazo): Código del rechazo.
+    """
+    valido: bool
+    motivo: MotivoRechazo
+
+    @property
+    def mensaje(self) -> str:
+        """Texto del motivo, solo para mostrar."""
+        return self.motivo.value
+
+
+# Resultados inmutables precalculados: validar no construye objetos ni strings
+VALIDO = ResultadoValidacion(True, MotivoRechazo.NINGUNO)
+RECHAZOS = {motivo: ResultadoValidacion(False, motivo)
+            for motivo in MotivoRechazo if motivo is not MotivoRechazo.NINGUNO}
+
+# Código de rechazo -> excepción que lanza Backgammon.mover
+EXCEPCIONES_POR_MOTIVO = {
+    MotivoRechazo.ORIGEN_INVALIDO: OrigenInvalidoError,
+    MotivoRechazo.DESTINO_BLOQUEADO: DestinoBloquedoError,
+    MotivoRechazo.ENTRADA_BLOQUEADA: DestinoBloquedoError,
+    MotivoRechazo.FUERA_DEL_TABLERO: MovimientoInvalidoError,
+    MotivoRechazo.DADO_INVALIDO: MovimientoInvalidoError,
+    MotivoRechazo.NO_TODAS_EN_HOME: BearOffInvalidoError,
+    MotivoRechazo.VALOR_INSUFICIENTE: BearOffInvalidoError,
+    MotivoRechazo.FICHA_MAS_ADELANTADA: BearOffInvalidoError,
+}
+
+
+def excepcion_para(motivo: MotivoRechazo) -> MovimientoInvalidoError:
+    """
+    Construye la excepción correspondiente a un código de rechazo.
+
+    Funcionamiento: Busca la clase en EXCEPCIONES_POR_MOTIVO (MovimientoInvalidoError si
+    el código no está mapeado) y le adjunta el código en el atributo `motivo`, para que
+    los clientes de la API no dependan del texto.
+
+    Args:
+        motivo (MotivoRechazo): Código del rechazo.
+
+    Returns:
+        MovimientoInvalidoError: Instancia lista para lanzar.
+    """
+    error = EXCEPCIONES_POR_MOTIVO.get(motivo, MovimientoInvalidoError)(str(motivo))
+    error.motivo = motivo
+    return error
@@ -0,0 +1,242 @@
+import math
+import os
+import random
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import NamedTuple
+
+from source.tablero import Tablero
+from source.gestor_turnos import GestorTurnos
+from source.ejecutor_movimientos import EjecutorMovimientos
+from source.analizador_posibilidades import AnalizadorPosibilidades
+from source.motor_busqueda import MotorBusqueda
+from source.posicion import Posicion
+
+Z_95 = 1.96
+
+
+class ResultadoRollout(NamedTuple):
+    """
+    Estimación parcial o final de la equity de una posición.
+
+    Atributos:
+        partidas (int): Partidas jugadas hasta el momento.
+        media (float): Equity media para el jugador en turno (victoria simple = 1,
+                       gammon = 2, backgammon = 3; negativo si pierde).
+        desvio (float): Desvío estándar muestral de las muestras.
+        intervalo (tuple[float, float]): Intervalo de confianza del 95% para la media.
+    """
+    partidas: int
+    media: float
+    desvio: float
+    intervalo: tuple
+
+
+def jugar_hasta_el_final(posicion: Posicion, direccion: int, rng: random.Random,
+                         espejo: bool = False, motor: MotorBusqueda = None) -> int:
+    """
+    Juega una partida completa desde una posición y retorna su resultado.
+
+    Funcionamiento: Reconstruye el tablero desde la instantánea y alterna turnos
+    tirando dados con `rng`. Cada jugador elige su jugada con `motor` (por defecto,
+    búsqueda de 1 ply con la evaluación heurística). Con `espejo=True` cada dado d
+    se reemplaza por 7 - d, lo que produce la secuencia "espejada" de la misma
+    semilla (variable antitética para reducir la varianza).
+
+    Args:
+        posicion (Posicion): Posición inicial.
+        direccion (int): Jugador en turno (1 blancas, -1 negras), aún sin tirar.
+        rng (random.Random): Generador de dados.
+        espejo (bool): Si se usan los dados espejados.
+        motor (MotorBusqueda, optional): Política de juego.
+
+    Returns:
+        int: Puntos para el jugador que empezaba en turno (±1, ±2 gammon, ±3 backgammon).
+    """
+    motor = motor if motor is not None else MotorBusqueda(profundidad=1)
+    tablero = Tablero.desde_posicion(posicion)
+    gestor = GestorTurnos()
+    if direccion == -1:
+        gestor.cambiar_turno()
+    ejecutor = EjecutorMovimientos(tablero, gestor)
+    analizador = AnalizadorPosibilidades(tablero, gestor)
+    fuera = tablero._obtener_fichas_fuera_ref()
+    diario = ejecutor.obtener_diario()
+
+    while True:
+        d1, d2 = rng.randint(1, 6), rng.randint(1, 6)
+        if espejo:
+            d1, d2 = 7 - d1, 7 - d2
+        dados = [d1] * 4 if d1 == d2 else [d1, d2]
+
+        for origen_idx, _, valor_dado in motor.buscar(dados, tablero, gestor, ejecutor, analizador):
+            if origen_idx is None:
+                ejecutor.ejecutar_entrada_barra(valor_dado)
+            else:
+                ejecutor.ejecutar_movimiento(origen_idx, valor_dado)
+        diario.limpiar()
+
+        color = gestor.obtener_turno()
+        if fuera[color] == 15:
+            puntos = puntos_victoria(tablero, color)
+            return puntos if gestor.obtener_direccion() == direccion else -puntos
+        gestor.cambiar_turno()
+
+
+def puntos_victoria(tablero: Tablero, ganador: str) -> int:
+    """
+    Calcula los puntos de una victoria (sin cubo).
+
+    Args:
+        tablero (Tablero): Tablero final.
+        ganador (str): 'blancas' o 'negras'.
+
+    Returns:
+        int: 1 simple, 2 gammon (el perdedor no sacó fichas), 3 backgammon
+             (además tiene fichas en la barra o en el home del ganador).
+    """
+    perdedor = "negras" if ganador == "blancas" else "blancas"
+    if tablero._obtener_fichas_fuera_ref()[perdedor] > 0:
+        return 1
+    pos = tablero._obtener_posiciones_ref()
+    if ganador == "blancas":
+        atrapadas = any(x < 0 for x in pos[18:])
+    else:
+        atrapadas = any(x > 0 for x in pos[:6])
+    if atrapadas or tablero._obtener_barra_ref()[perdedor] > 0:
+        return 3
+    return 2
+
+
+def _ejecutar_lote(datos_posicion: bytes, direccion: int, semilla: int, inicio: int,
+                   cantidad: int, espejo: bool, profundidad: int) -> list[float]:
+    """
+    Juega un lote de muestras (función de nivel de módulo para poder enviarse a procesos).
+
+    Cada muestra `i` usa su propio generador sembrado con (semilla, i), por lo que el
+    resultado no depende de cómo se repartan los lotes entre procesos.
+
+    Returns:
+        list[float]: Una muestra por índice; con espejo, el promedio del par de partidas.
+    """
+    posicion = Posicion.desde_bytes(datos_posicion)
+    motor = MotorBusqueda(profundidad=profundidad)
+    muestras = []
+    for indice in range(inicio, inicio + cantidad):
+        semilla_muestra = semilla * 1_000_003 + indice
+        valor = jugar_hasta_el_final(posicion, direccion, random.Random(semilla_muestra),
+                                     motor=motor)
+        if espejo:
+            espejada = jugar_hasta_el_final(posicion, direccion, random.Random(semilla_muestra),
+                                            espejo=True, motor=motor)
+            valor = (valor + espejada) / 2
+        muestras.append(valor)
+    return muestras
+
+
+class Rollout:
+    """
+    Responsabilidad: Estimar la equity de una posición jugando muchas partidas hasta el final.
+    SRP: Solo reparte las partidas y acumula estadísticas; la política de juego es MotorBusqueda.
+    Justificación: Las partidas son independientes, así que se reparten en lotes sobre un
+                   ProcessPoolExecutor para usar todos los núcleos. Cada muestra tiene su
+                   propia semilla (reproducibilidad) y, opcionalmente, se juega también con
+                   los dados espejados para reducir la varianza.
+    """
+
+    def __init__(self, partidas: int = 1296, trabajadores: int = None, semilla: int = 0,
+                 espejo: bool = True, tamano_lote: int = 36, profundidad: int = 1):
+        """
+        Inicializa la configuración del rollout.
+
+        Args:
+            partidas (int): Cantidad de muestras (con espejo, cada muestra son dos partidas).
+            trabajadores (int, optional): Procesos a usar. None = os.cpu_count();
+                                          1 = ejecutar en el proceso actual.
+            semilla (int): Semilla base de los dados.
+            espejo (bool): Si se usa reducción de varianza con dados espejados.
+            tamano_lote (int): Muestras por tarea enviada a un proceso.
+            profundidad (int): Profundidad de búsqueda de la política de juego.
+
+        Raises:
+            ValueError: Si partidas o tamano_lote no son positivos.
+        """
+        if partidas < 1 or tamano_lote < 1:
+            raise ValueError("partidas y tamano_lote deben ser positivos")
+        self.__partidas__ = partidas
+        self.__trabajadores__ = trabajadores or os.cpu_count() or 1
+        self.__semilla__ = semilla
+        self.__espejo__ = espejo
+        self.__tamano_lote__ = tamano_lote
+        self.__profundidad__ = profundidad
+
+    def iterar(self, juego):
+        """
+        Ejecuta el rollout y produce estimaciones parciales a medida que terminan los lotes.
+
+        Args:
+            juego (Backgammon): Partida cuya posición (jugador en turno, antes de tirar) se evalúa.
+
+        Yields:
+            ResultadoRollout: Estimación acumulada tras cada lote completado.
+        """
+        direccion = 1 if juego.obtener_turno() == "blancas" else -1
+        datos = juego.obtener_posicion().a_bytes()
+        lotes = [
+            (datos, direccion, self.__semilla__, inicio,
+             min(self.__tamano_lote__, self.__partidas__ - inicio),
+             self.__espejo__, self.__profundidad__)
+            for inicio in range(0, self.__partidas__, self.__tamano_lote__)
+        ]
+
+        acumulador = _Acumulador()
+        if self.__trabajadores__ == 1:
+            for lote in lotes:
+                acumulador.agregar(_ejecutar_lote(*lote))
+                yield acumulador.resultado()
+            return
+
+        with ProcessPoolExecutor(max_workers=self.__trabajadores__) as pool:
+            futuros = [pool.submit(_ejecutar_lote, *lote) for lote in lotes]
+            for futuro in as_completed(futuros):
+                acumulador.agregar(futuro.result())
+                yield acumulador.resultado()
+
+    def ejecutar(self, juego, callback=None) -> ResultadoRollout:
+        """
+        Ejecuta el rollout completo.
+
+        Args:
+            juego (Backgammon): Partida a evaluar.
+            callback (callable, optional): Se llama con cada ResultadoRollout parcial.
+
+        Returns:
+            ResultadoRollout: Estimación final.
+        """
+        resultado = None
+        for resultado in self.iterar(juego):
+            if callback is not None:
+                callback(resultado)
+        return resultado
+
+
+class _Acumulador:
+    """Media y varianza incrementales (algoritmo de Welford)."""
+
+    def __init__(self):
+        self.__n__ = 0
+        self.__media__ = 0.0
+        self.__m2__ = 0.0
+
+    def agregar(self, muestras: list[float]):
+        for x in muestras:
+            self.__n__ += 1
+            delta = x - self.__media__
+            self.__media__ += delta / self.__n__
+            self.__m2__ += delta * (x - self.__media__)
+
+    def resultado(self) -> ResultadoRollout:
+        n = self.__n__
+        desvio = math.sqrt(self.__m2__ / (n - 1)) if n > 1 else 0.0
+        margen = Z_95 * desvio / math.sqrt(n) if n else 0.0
+        return ResultadoRollout(n, self.__media__, desvio,
+                                (self.__media__ - margen, self.__media__ + margen))
@@ -0,0 +1,422 @@
+import asyncio
+import json
+import logging
+import secrets
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor
+
+from source.almacen_posiciones import AlmacenPosiciones
+from source.backgammon import Backgammon
+from source.cache_jugadas import CacheJugadas
+from source.dados import Dados
+from source.motor_busqueda import MotorBusqueda
+from source.excepciones import (
+    BackgammonError,
+    DadoNoDisponibleError,
+    FichasEnBarraError,
+    DadosAgotadosError,
+)
+
+_log = logging.getLogger(__name__)
+
+# Códigos de error de excepciones sin MotivoRechazo adjunto
+_CODIGOS_EXCEPCION = {
+    DadoNoDisponibleError: 'DADO_NO_DISPONIBLE',
+    FichasEnBarraError: 'FICHAS_EN_BARRA',
+    DadosAgotadosError: 'DADOS_AGOTADOS',
+}
+
+
+class ErrorProtocolo(Exception):
+    """Petición rechazada por el servidor; `codigo` viaja en la respuesta."""
+
+    def __init__(self, codigo: str, mensaje: str):
+        super().__init__(mensaje)
+        self.codigo = codigo
+
+
+class _VistaPartida:
+    """
+    Copia mínima (serializable) del estado que MotorBusqueda.elegir_jugada lee de un
+    Backgammon, para poder buscar en otro proceso sin enviar la partida entera.
+    """
+
+    def __init__(self, juego: Backgammon):
+        self.posicion = juego.obtener_posicion()
+        self.turno = juego.obtener_turno()
+        self.pendientes = juego.obtener_movimientos_pendientes()
+
+    def obtener_posicion(self):
+        return self.posicion
+
+    def obtener_turno(self) -> str:
+        return self.turno
+
+    def obtener_movimientos_pendientes(self) -> list[int]:
+        return list(self.pendientes)
+
+
+# Almacén de posiciones abierto por cada hilo/proceso del ejecutor (sqlite3 no comparte
+# conexiones entre hilos)
+_locales = threading.local()
+
+
+def _almacen_local(ruta: str) -> AlmacenPosiciones:
+    almacenes = _locales.__dict__.setdefault('almacenes', {})
+    if ruta not in almacenes:
+        almacenes[ruta] = AlmacenPosiciones(ruta)
+    return almacenes[ruta]
+
+
+def _sugerir_jugada(vista: _VistaPartida, profundidad: int, ruta_almacen: str = None) -> tuple:
+    """Busca la mejor jugada (función de módulo para poder enviarse a procesos)."""
+    almacen = _almacen_local(ruta_almacen) if ruta_almacen is not None else None
+    return MotorBusqueda(profundidad=profundidad, almacen=almacen).elegir_jugada(vista)
+
+
+class _Sesion:
+    """Una partida alojada en el servidor."""
+
+    def __init__(self, juego: Backgammon, ahora: float):
+        self.juego = juego
+        self.ultimo_uso = ahora
+        self.lock = asyncio.Lock()
+
+
+class ServidorPartidas:
+    """
+    Responsabilidad: Alojar muchas partidas en un proceso y exponerlas por TCP.
+    SRP: Solo traduce el protocolo JSON-lines a llamadas de Backgammon y administra las
+         sesiones; las reglas las valida el core y las jugadas sugeridas, MotorBusqueda.
+    Justificación: Con asyncio cada conexión es una corrutina, no un hilo, y las
+                   sesiones no están atadas a la conexión (un cliente puede reconectarse).
+                   Las búsquedas del motor van a un Executor para no bloquear el bucle de
+                   eventos, y las sesiones inactivas se desalojan periódicamente.
+
+    Protocolo: una petición JSON por línea, {"cmd": ..., "sesion": ..., ...}; una respuesta
+    JSON por línea, {"ok": true, ...} o {"ok": false, "error": CODIGO, "mensaje": texto}.
+    Comandos: nueva (semilla opcional), tirar, mover (origen, dado), movimientos,
+    jugadas, finalizar, estado, sugerir, cerrar.
+    """
+
+    def __init__(self, host: str = '127.0.0.1', puerto: int = 0,
+                 max_inactividad: float = 600.0, intervalo_limpieza: float = 30.0,
+                 max_sesiones: int = 10_000, profundidad_motor: int = 1,
+                 ejecutor: Executor = None, ruta_almacen: str = None):
+        """
+        Inicializa el servidor (no abre el socket hasta `iniciar`).
+
+        Args:
+            host (str): Interfaz donde escuchar.
+            puerto (int): Puerto TCP; 0 elige uno libre.
+            max_inactividad (float): Segundos sin uso tras los que se desaloja una sesión.
+            intervalo_limpieza (float): Segundos entre barridos de sesiones inactivas.
+            max_sesiones (int): Sesiones simultáneas admitidas.
+            profundidad_motor (int): Profundidad de MotorBusqueda para 'sugerir'.
+            ejecutor (Executor, optional): Dónde correr las búsquedas. Por defecto, un
+                                           ProcessPoolExecutor creado al primer uso.
+            ruta_almacen (str, optional): Archivo de AlmacenPosiciones que 'sugerir'
+                                          consulta antes de buscar (y alimenta).
+
+        Atributos privados:
+            __sesiones__: dict - id de sesión -> _Sesion.
+            __cache__: CacheJugadas - Cache de análisis compartido por todas las partidas.
+        """
+        self.__host__ = host
+        self.__puerto__ = puerto
+        self.__max_inactividad__ = max_inactividad
+        self.__intervalo_limpieza__ = intervalo_limpieza
+        self.__max_sesiones__ = max_sesiones
+        self.__profundidad_motor__ = profundidad_motor
+        self.__ejecutor__ = ejecutor
+        self.__ruta_almacen__ = ruta_almacen
+        self.__ejecutor_propio__ = False
+        self.__sesiones__ = {}
+        self.__cache__ = CacheJugadas(max_entradas=65_536)
+        self.__servidor__ = None
+        self.__limpieza__ = None
+        self.__conexiones__ = set()
+        self.__comandos__ = {
+            'nueva': self._cmd_nueva,
+            'tirar': self._cmd_tirar,
+            'mover': self._cmd_mover,
+            'movimientos': self._cmd_movimientos,
+            'jugadas': self._cmd_jugadas,
+            'finalizar': self._cmd_finalizar,
+            'estado': self._cmd_estado,
+            'sugerir': self._cmd_sugerir,
+            'cerrar': self._cmd_cerrar,
+        }
+
+    # ========== API PÚBLICA ==========
+
+    async def iniciar(self) -> tuple[str, int]:
+        """
+        Abre el socket y arranca el barrido de sesiones inactivas.
+
+        Returns:
+            tuple[str, int]: (host, puerto) efectivos.
+        """
+        self.__servidor__ = await asyncio.start_server(
+            self._atender_conexion, self.__host__, self.__puerto__)
+        self.__limpieza__ = asyncio.create_task(self._barrer_periodicamente())
+        return self.__servidor__.sockets[0].getsockname()[:2]
+
+    async def servir_para_siempre(self):
+        """
+        Inicia el servidor (si hace falta) y atiende conexiones hasta ser cancelado.
+        """
+        if self.__servidor__ is None:
+            await self.iniciar()
+        try:
+            await self.__servidor__.serve_forever()
+        finally:
+            await self.detener()
+
+    async def detener(self):
+        """
+        Cierra el socket y las conexiones abiertas, detiene el barrido y libera el
+        ejecutor propio. Las sesiones se conservan.
+        """
+        if self.__limpieza__ is not None:
+            self.__limpieza__.cancel()
+            self.__limpieza__ = None
+        if self.__servidor__ is not None:
+            self.__servidor__.close()
+            for tarea in self.__conexiones__:
+                tarea.cancel()
+            await asyncio.gather(*self.__conexiones__, return_exceptions=True)
+            await self.__servidor__.wait_closed()
+            self.__servidor__ = None
+        if self.__ejecutor_propio__:
+            self.__ejecutor__.shutdown(cancel_futures=True)
+            self.__ejecutor__ = None
+            self.__ejecutor_propio__ = False
+
+    def cantidad_sesiones(self) -> int:
+        """
+        Retorna la cantidad de sesiones alojadas.
+
+        Returns:
+            int: Sesiones activas.
+        """
+        return len(self.__sesiones__)
+
+    def desalojar_inactivas(self) -> int:
+        """
+        Elimina las sesiones sin uso durante más de `max_inactividad` segundos.
+
+        Returns:
+            int: Cantidad de sesiones eliminadas.
+        """
+        limite = asyncio.get_running_loop().time() - self.__max_inactividad__
+        vencidas = [sid for sid, sesion in self.__sesiones__.items()
+                    if sesion.ultimo_uso < limite and not sesion.lock.locked()]
+        for sid in vencidas:
+            del self.__sesiones__[sid]
+        return len(vencidas)
+
+    async def procesar(self, peticion: dict) -> dict:
+        """
+        Ejecuta una petición ya decodificada y arma su respuesta.
+
+        Funcionamiento: Despacha por `cmd`; los comandos sobre una sesión se serializan
+        con el lock de esa sesión. Los errores del core se informan con el nombre del
+        MotivoRechazo cuando lo hay, de modo que el cliente no depende del texto.
+
+        Args:
+            peticion (dict): Petición del cliente.
+
+        Returns:
+            dict: Respuesta con "ok" y los datos del comando o el error.
+        """
+        try:
+            if not isinstance(peticion, dict):
+                raise ErrorProtocolo('PETICION_INVALIDA', "la petición debe ser un objeto JSON")
+            comando = self.__comandos__.get(peticion.get('cmd'))
+            if comando is None:
+                raise ErrorProtocolo('COMANDO_DESCONOCIDO',
+                                     f"comando desconocido: {peticion.get('cmd')!r}")
+            datos = await comando(peticion)
+        except ErrorProtocolo as e:
+            return {'ok': False, 'error': e.codigo, 'mensaje': str(e)}
+        except BackgammonError as e:
+            motivo = getattr(e, 'motivo', None)
+            codigo = (motivo.name if motivo is not None
+                      else _CODIGOS_EXCEPCION.get(type(e), 'MOVIMIENTO_INVALIDO'))
+            return {'ok': False, 'error': codigo, 'mensaje': str(e)}
+        except Exception:
+            # Un fallo inesperado no debe cerrar la conexión ni afectar a otras sesiones;
+            # el detalle queda en el log del servidor y no viaja al cliente
+            _log.exception("Error procesando la petición %r", peticion.get('cmd')
+                           if isinstance(peticion, dict) else peticion)
+            return {'ok': False, 'error': 'ERROR_INTERNO', 'mensaje': "error interno del servidor"}
+        return {'ok': True, **datos}
+
+    # ========== COMANDOS ==========
+
+    async def _cmd_nueva(self, peticion: dict) -> dict:
+        if len(self.__sesiones__) >= self.__max_sesiones__:
+            raise ErrorProtocolo('DEMASIADAS_SESIONES', "se alcanzó el máximo de sesiones")
+        semilla = peticion.get('semilla')
+        if semilla is not None and type(semilla) is not int:
+            raise ErrorProtocolo('ARGUMENTOS_INVALIDOS', "la semilla debe ser un entero")
+        sid = secrets.token_hex(8)
+        dados = Dados(semilla=semilla) if semilla is not None else None
+        juego = Backgammon(dados=dados, cache=self.__cache__)
+        self.__sesiones__[sid] = _Sesion(juego, asyncio.get_running_loop().time())
+        return {'sesion': sid, **self._estado(juego)}
+
+    async def _cmd_tirar(self, peticion: dict) -> dict:
+        async with self._sesion(peticion) as juego:
+            if self._ganador(juego) is not None:
+                raise ErrorProtocolo('PARTIDA_TERMINADA', "la partida ya terminó")
+            if juego.movimientos_disponibles():
+                raise ErrorProtocolo('TIRADA_EN_CURSO', "quedan dados de la tirada actual")
+            dados = juego.tirar_dados()
+            return {'dados': list(dados), 'pendientes': juego.obtener_movimientos_pendientes(),
+                    'hay_movimiento': juego.hay_movimiento_posible()}
+
+    async def _cmd_mover(self, peticion: dict) -> dict:
+        origen, dado = peticion.get('origen'), peticion.get('dado')
+        if type(origen) is not int or type(dado) is not int:
+            raise ErrorProtocolo('ARGUMENTOS_INVALIDOS', "origen y dado deben ser enteros")
+        async with self._sesion(peticion) as juego:
+            resultado = juego.mover(origen, dado)
+            return {'resultado': resultado, 'pendientes': juego.obtener_movimientos_pendientes(),
+                    'ganador': self._ganador(juego)}
+
+    async def _cmd_movimientos(self, peticion: dict) -> dict:
+        async with self._sesion(peticion) as juego:
+            movimientos = [
+                [0 if origen == 'barra' else origen, destino, dado]
+                for origen, destinos in juego.obtener_movimientos_posibles().items()
+                for destino, dado in destinos
+            ]
+            return {'movimientos': movimientos}
+
+    async def _cmd_jugadas(self, peticion: dict) -> dict:
+        async with self._sesion(peticion) as juego:
+            return {'jugadas': [[list(paso) for paso in jugada]
+                                for jugada in juego.obtener_jugadas_posibles()]}
+
+    async def _cmd_finalizar(self, peticion: dict) -> dict:
+        async with self._sesion(peticion) as juego:
+            if juego.movimientos_disponibles() and juego.hay_movimiento_posible():
+                raise ErrorProtocolo('MOVIMIENTOS_PENDIENTES',
+                                     "quedan movimientos posibles en la tirada")
+            juego.finalizar_tirada()
+            return {'turno': juego.obtener_turno()}
+
+    async def _cmd_estado(self, peticion: dict) -> dict:
+        async with self._sesion(peticion) as juego:
+            return self._estado(juego)
+
+    async def _cmd_sugerir(self, peticion: dict) -> dict:
+        async with self._sesion(peticion) as juego:
+            vista = _VistaPartida(juego)
+            jugada = await asyncio.get_running_loop().run_in_executor(
+                self._obtener_ejecutor(), _sugerir_jugada, vista,
+                self.__profundidad_motor__, self.__ruta_almacen__)
+            return {'jugada': [list(paso) for paso in jugada]}
+
+    async def _cmd_cerrar(self, peticion: dict) -> dict:
+        if self.__sesiones__.pop(peticion.get('sesion'), None) is None:
+            raise ErrorProtocolo('SESION_INEXISTENTE', "sesión inexistente")
+        return {}
+
+    # ========== MÉTODOS PRIVADOS ==========
+
+    def _sesion(self, peticion: dict) -> '_UsoSesion':
+        """Busca la sesión de la petición; lanza ErrorProtocolo si no existe."""
+        sesion = self.__sesiones__.get(peticion.get('sesion'))
+        if sesion is None:
+            raise ErrorProtocolo('SESION_INEXISTENTE', "sesión inexistente")
+        return _UsoSesion(sesion)
+
+    def _obtener_ejecutor(self) -> Executor:
+        """Retorna el ejecutor de búsquedas, creando el propio al primer uso."""
+        if self.__ejecutor__ is None:
+            self.__ejecutor__ = ProcessPoolExecutor()
+            self.__ejecutor_propio__ = True
+        return self.__ejecutor__
+
+    def _estado(self, juego: Backgammon) -> dict:
+        """Arma la descripción JSON del estado de una partida."""
+        return {
+            'turno': juego.obtener_turno(),
+            'posiciones': juego.obtener_posiciones(),
+            'barra': juego.obtener_barra(),
+            'fuera': juego.obtener_fichas_fuera(),
+            'pendientes': juego.obtener_movimientos_pendientes(),
+            'pips': juego.obtener_pips(),
+            'id_posicion': juego.obtener_id_posicion(),
+            'ganador': self._ganador(juego),
+        }
+
+    def _ganador(self, juego: Backgammon):
+        """Color que sacó sus 15 fichas, o None."""
+        for color, fuera in juego.obtener_fichas_fuera().items():
+            if fuera == 15:
+                return color
+        return None
+
+    async def _atender_conexion(self, lector: asyncio.StreamReader,
+                                escritor: asyncio.StreamWriter):
+        """Atiende una conexión: una respuesta por cada línea recibida."""
+        tarea = asyncio.current_task()
+        self.__conexiones__.add(tarea)
+        try:
+            while True:
+                try:
+                    linea = await lector.readline()
+                except (asyncio.LimitOverrunError, ValueError):
+                    respuesta = {'ok': False, 'error': 'PETICION_INVALIDA',
+                                 'mensaje': "línea demasiado larga"}
+                    escritor.write(json.dumps(respuesta).encode() + b'\n')
+                    break
+                if not linea:
+                    break
+                if not linea.strip():
+                    continue
+                try:
+                    peticion = json.loads(linea)
+                except ValueError:
+                    respuesta = {'ok': False, 'error': 'JSON_INVALIDO',
+                                 'mensaje': "la línea no es JSON válido"}
+                else:
+                    respuesta = await self.procesar(peticion)
+                escritor.write(json.dumps(respuesta, ensure_ascii=False).encode() + b'\n')
+                await escritor.drain()
+        except ConnectionError:
+            # Cliente desconectado: la sesión sigue viva
+            pass
+        finally:
+            self.__conexiones__.discard(tarea)
+            escritor.close()
+            try:
+                await escritor.wait_closed()
+            except ConnectionError:
+                pass
+
+    async def _barrer_periodicamente(self):
+        """Tarea de fondo que desaloja sesiones inactivas."""
+        while True:
+            await asyncio.sleep(self.__intervalo_limpieza__)
+            self.desalojar_inactivas()
+
+
+class _UsoSesion:
+    """Context manager asíncrono: toma el lock de la sesión y actualiza su último uso."""
+
+    def __init__(self, sesion: _Sesion):
+        self.__sesion__ = sesion
+
+    async def __aenter__(self) -> Backgammon:
+        await self.__sesion__.lock.acquire()
+        return self.__sesion__.juego
+
+    async def __aexit__(self, *exc) -> bool:
+        self.__sesion__.ultimo_uso = asyncio.get_running_loop().time()
+        self.__sesion__.lock.release()
+        return False
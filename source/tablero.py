@@ -1,4 +1,21 @@
 from source.constantes import CASILLEROS
+from source.posicion import Posicion
+
+
+class _Casilleros(list):
+    """
+    Lista de los 24 casilleros que avisa al tablero cuando se escribe desde afuera.
+
+    Las escrituras directas sobre la referencia (p. ej. `pos[i] = x` en tests o
+    simulaciones) invalidan los contadores incrementales; el propio Tablero escribe
+    con `list.__setitem__` y actualiza los contadores por delta.
+    """
+    __slots__ = ('__tablero__',)
+
+    def __setitem__(self, indice, valor):
+        list.__setitem__(self, indice, valor)
+        self.__tablero__._invalidar_contadores()
+
 
 class Tablero:
     """
@@ -24,10 +41,19 @@ class Tablero:
             __barra__: dict - Contadores de fichas capturadas: {'blancas': int, 'negras': int}.
             __fichas_fuera__: dict - Contadores de fichas que han salido (*bear-off*):
                               {'blancas': int, 'negras': int}.
+            __pips__: dict - Pips de las fichas sobre el tablero por color (sin la barra).
+            __fuera_de_home__: dict - Fichas sobre el tablero fuera del home por color.
+            __mas_lejana__: dict - Índice de la ficha más lejana a la salida por color
+                            (None si no quedan fichas sobre el tablero).
+            __contadores_validos__: bool - False si hubo escrituras externas y los
+                                    contadores deben recalcularse.
         """
-        self.__posiciones__ = self.inicializar_posiciones()
         self.__barra__ = { 'blancas': 0, 'negras': 0 }
         self.__fichas_fuera__ = { 'blancas': 0, 'negras': 0 }
+        self.__pips__ = { 'blancas': 0, 'negras': 0 }
+        self.__fuera_de_home__ = { 'blancas': 0, 'negras': 0 }
+        self.__mas_lejana__ = { 'blancas': None, 'negras': None }
+        self._asignar_posiciones(self.inicializar_posiciones())
 
     def inicializar_posiciones(self):
         """
@@ -89,6 +115,40 @@ class Tablero:
         """
         return dict(self.__fichas_fuera__)
     
+    def obtener_posicion(self) -> Posicion:
+        """
+        API Pública. Obtiene una instantánea inmutable y hashable del estado completo.
+
+        Funcionamiento: Empaqueta posiciones, barra y fichas fuera en un único objeto
+        `Posicion` sin pasar por las copias defensivas.
+        Justificación: Permite comparar posiciones o usarlas como clave de caches con
+                       hash O(1), sin construir una lista y dos diccionarios por consulta.
+
+        Returns:
+            Posicion: Instantánea del estado actual.
+        """
+        return Posicion(self.__posiciones__, self.__barra__, self.__fichas_fuera__)
+
+    @classmethod
+    def desde_posicion(cls, posicion: Posicion) -> 'Tablero':
+        """
+        Construye un Tablero cuyo estado es el de la instantánea dada.
+
+        Funcionamiento: Crea un tablero estándar y reemplaza su estado interno por
+        los valores de la instantánea.
+
+        Args:
+            posicion (Posicion): Instantánea de origen.
+
+        Returns:
+            Tablero: Nuevo tablero independiente de la instantánea.
+        """
+        tablero = cls()
+        tablero._asignar_posiciones(posicion.posiciones)
+        tablero.__barra__ = posicion.barra
+        tablero.__fichas_fuera__ = posicion.fichas_fuera
+        return tablero
+
     def hay_fichas_en_barra(self, color: str) -> bool:
         """
         Verifica si hay fichas del color especificado en la barra.
@@ -127,7 +187,174 @@ class Tablero:
         if not 0 <= posicion < CASILLEROS:
             raise IndexError(f"Posición {posicion} fuera de rango [0, 23]")
         return self.__posiciones__[posicion]
-    
+
+    # ========== CONTADORES INCREMENTALES ==========
+
+    def obtener_pips(self, color: str) -> int:
+        """
+        Retorna el conteo de pips de un color (cada ficha en la barra cuenta 25).
+
+        Funcionamiento: O(1): suma los pips mantenidos sobre el tablero y la barra.
+
+        Args:
+            color (str): 'blancas' o 'negras'.
+
+        Returns:
+            int: Pips que le faltan al color para sacar todas sus fichas.
+        """
+        self._validar_contadores()
+        return self.__pips__[color] + 25 * self.__barra__[color]
+
+    def fichas_fuera_de_home(self, color: str) -> int:
+        """
+        Retorna cuántas fichas del color están sobre el tablero fuera de su home.
+
+        No cuenta la barra (igual que `_todas_en_home` de los validadores).
+
+        Args:
+            color (str): 'blancas' o 'negras'.
+
+        Returns:
+            int: Cantidad de fichas fuera del home.
+        """
+        self._validar_contadores()
+        return self.__fuera_de_home__[color]
+
+    def todas_en_home(self, color: str) -> bool:
+        """
+        Indica si todas las fichas del color sobre el tablero están en su home.
+
+        Args:
+            color (str): 'blancas' o 'negras'.
+
+        Returns:
+            bool: True si no hay fichas del color fuera del home (sin considerar la barra).
+        """
+        return self.fichas_fuera_de_home(color) == 0
+
+    def obtener_mas_lejana(self, color: str):
+        """
+        Retorna el índice 0-based de la ficha del color más lejana a la salida.
+
+        Para blancas es el menor índice ocupado; para negras, el mayor.
+
+        Args:
+            color (str): 'blancas' o 'negras'.
+
+        Returns:
+            int | None: Índice del casillero, o None si no hay fichas sobre el tablero.
+        """
+        self._validar_contadores()
+        return self.__mas_lejana__[color]
+
+    def _fijar_casillero(self, idx: int, nuevo_valor: int):
+        """
+        MÉTODO PROTEGIDO: Asigna un casillero actualizando los contadores por delta.
+
+        Funcionamiento: Resta la contribución del valor anterior y suma la del nuevo
+        (pips y fichas fuera del home). La ficha más lejana solo se recorre si se
+        vacía el casillero que la contenía.
+        ⚠️ SOLO para uso interno del CORE (EjecutorMovimientos, AnalizadorPosibilidades).
+
+        Args:
+            idx (int): Índice 0-based del casillero.
+            nuevo_valor (int): Valor con signo a asignar.
+        """
+        pos = self.__posiciones__
+        anterior = pos[idx]
+        list.__setitem__(pos, idx, nuevo_valor)
+        if not self.__contadores_validos__:
+            return
+
+        blancas = max(nuevo_valor, 0) - max(anterior, 0)
+        if blancas:
+            self.__pips__['blancas'] += blancas * (CASILLEROS - idx)
+            if idx < 18:
+                self.__fuera_de_home__['blancas'] += blancas
+            lejana = self.__mas_lejana__['blancas']
+            if nuevo_valor > 0 and (lejana is None or idx < lejana):
+                self.__mas_lejana__['blancas'] = idx
+            elif nuevo_valor <= 0 and idx == lejana:
+                self.__mas_lejana__['blancas'] = next(
+                    (i for i in range(idx + 1, CASILLEROS) if pos[i] > 0), None)
+
+        negras = max(-nuevo_valor, 0) - max(-anterior, 0)
+        if negras:
+            self.__pips__['negras'] += negras * (idx + 1)
+            if idx > 5:
+                self.__fuera_de_home__['negras'] += negras
+            lejana = self.__mas_lejana__['negras']
+            if nuevo_valor < 0 and (lejana is None or idx > lejana):
+                self.__mas_lejana__['negras'] = idx
+            elif nuevo_valor >= 0 and idx == lejana:
+                self.__mas_lejana__['negras'] = next(
+                    (i for i in range(idx - 1, -1, -1) if pos[i] < 0), None)
+
+    def _sumar_barra(self, color: str, delta: int):
+        """
+        MÉTODO PROTEGIDO: Suma `delta` fichas a la barra de un color.
+
+        Args:
+            color (str): 'blancas' o 'negras'.
+            delta (int): Cantidad a sumar (negativa para restar).
+        """
+        self.__barra__[color] += delta
+
+    def _sumar_fuera(self, color: str, delta: int):
+        """
+        MÉTODO PROTEGIDO: Suma `delta` fichas al contador de bear-off de un color.
+
+        Args:
+            color (str): 'blancas' o 'negras'.
+            delta (int): Cantidad a sumar (negativa para restar).
+        """
+        self.__fichas_fuera__[color] += delta
+
+    def _asignar_posiciones(self, valores):
+        """
+        Reemplaza los 24 casilleros y recalcula los contadores.
+
+        Args:
+            valores (Iterable[int]): Valores con signo de los casilleros.
+        """
+        casilleros = _Casilleros(valores)
+        casilleros.__tablero__ = self
+        self.__posiciones__ = casilleros
+        self._recalcular_contadores()
+
+    def _invalidar_contadores(self):
+        """Marca los contadores para recálculo (escritura externa sobre los casilleros)."""
+        self.__contadores_validos__ = False
+
+    def _validar_contadores(self):
+        """Recalcula los contadores si fueron invalidados."""
+        if not self.__contadores_validos__:
+            self._recalcular_contadores()
+
+    def _recalcular_contadores(self):
+        """
+        Recalcula pips, fichas fuera del home y fichas más lejanas recorriendo el tablero.
+        """
+        pips = { 'blancas': 0, 'negras': 0 }
+        fuera_de_home = { 'blancas': 0, 'negras': 0 }
+        mas_lejana = { 'blancas': None, 'negras': None }
+        for idx, valor in enumerate(self.__posiciones__):
+            if valor > 0:
+                pips['blancas'] += valor * (CASILLEROS - idx)
+                if idx < 18:
+                    fuera_de_home['blancas'] += valor
+                if mas_lejana['blancas'] is None:
+                    mas_lejana['blancas'] = idx
+            elif valor < 0:
+                pips['negras'] += -valor * (idx + 1)
+                if idx > 5:
+                    fuera_de_home['negras'] += -valor
+                mas_lejana['negras'] = idx
+        self.__pips__ = pips
+        self.__fuera_de_home__ = fuera_de_home
+        self.__mas_lejana__ = mas_lejana
+        self.__contadores_validos__ = True
+
     def _obtener_posiciones_ref(self) -> list[int]:
         """
         MÉTODO PROTEGIDO: Retorna la REFERENCIA directa a `__posiciones__`.
@@ -136,6 +363,9 @@ class Tablero:
         Justificación: Permite a los servicios de lógica (EjecutorMovimientos,
                        AnalizadorPosibilidades) realizar modificaciones de estado
                        de alto rendimiento sin la sobrecarga de copiar el array de 24 posiciones.
+                       Las escrituras directas invalidan los contadores incrementales
+                       (se recalculan en la próxima consulta); para mantenerlos por
+                       delta, escribir con `_fijar_casillero`.
         ⚠️ SOLO para uso interno del CORE del juego. NO usar desde código externo.
         """
         return self.__posiciones__
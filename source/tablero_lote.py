@@ -0,0 +1,269 @@
+import numpy as np
+
+from source.constantes import CASILLEROS
+from source.posicion import Posicion
+from source.tablero import Tablero
+
+# Columnas del arreglo (mismo orden que los bytes de Posicion)
+COL_BARRA_BLANCAS = CASILLEROS
+COL_BARRA_NEGRAS = CASILLEROS + 1
+COL_FUERA_BLANCAS = CASILLEROS + 2
+COL_FUERA_NEGRAS = CASILLEROS + 3
+COLUMNAS = CASILLEROS + 4
+
+# Origen que indica entrada desde la barra en `aplicar_movimientos`
+ORIGEN_BARRA = -1
+
+_INDICES = np.arange(CASILLEROS)
+
+
+class TableroLote:
+    """
+    Responsabilidad: Mantener N posiciones en un único arreglo int8 y operar sobre todas a la vez.
+    SRP: Solo representa el estado y ofrece consultas/aplicación de movimientos vectorizadas;
+         no decide qué jugada hacer.
+    Justificación: Simular miles de partidas con un Tablero por partida implica miles de grafos
+                   de objetos y bucles por casillero en Python. Con un arreglo (N, 28) las
+                   reglas se expresan como operaciones de NumPy sobre el lote completo.
+                   Las reglas replican las de ValidadorMovimientos/AnalizadorPosibilidades.
+    """
+
+    def __init__(self, datos: np.ndarray):
+        """
+        Inicializa el lote a partir de un arreglo existente.
+
+        Args:
+            datos (np.ndarray): Arreglo de forma (N, 28): 24 casilleros con signo,
+                                barra (blancas, negras) y fichas fuera (blancas, negras).
+
+        Raises:
+            ValueError: Si la forma del arreglo no es (N, 28).
+
+        Atributos privados:
+            __datos__: np.ndarray - Arreglo int8 (N, 28) con el estado de cada partida.
+        """
+        datos = np.asarray(datos, dtype=np.int8)
+        if datos.ndim != 2 or datos.shape[1] != COLUMNAS:
+            raise ValueError(f"Se esperaba un arreglo (N, {COLUMNAS}), se recibió {datos.shape}")
+        self.__datos__ = datos
+
+    @classmethod
+    def inicial(cls, cantidad: int) -> 'TableroLote':
+        """
+        Crea un lote de `cantidad` partidas en la posición inicial estándar.
+
+        Args:
+            cantidad (int): Número de partidas.
+
+        Returns:
+            TableroLote: Lote nuevo.
+        """
+        fila = np.frombuffer(Tablero().obtener_posicion().a_bytes(), dtype=np.int8)
+        return cls(np.tile(fila, (cantidad, 1)))
+
+    @classmethod
+    def desde_posiciones(cls, posiciones: list[Posicion]) -> 'TableroLote':
+        """
+        Crea un lote a partir de instantáneas Posicion.
+
+        Args:
+            posiciones (list[Posicion]): Posiciones a cargar.
+
+        Returns:
+            TableroLote: Lote con una fila por posición.
+        """
+        datos = b''.join(p.a_bytes() for p in posiciones)
+        return cls(np.frombuffer(datos, dtype=np.int8).reshape(len(posiciones), COLUMNAS).copy())
+
+    def obtener_posicion(self, indice: int) -> Posicion:
+        """
+        Retorna la instantánea de una partida del lote.
+
+        Args:
+            indice (int): Fila del lote.
+
+        Returns:
+            Posicion: Instantánea de la partida.
+        """
+        return Posicion.desde_bytes(self.__datos__[indice].tobytes())
+
+    def obtener_datos(self) -> np.ndarray:
+        """
+        Retorna una copia del arreglo interno.
+
+        Returns:
+            np.ndarray: Arreglo int8 (N, 28).
+        """
+        return self.__datos__.copy()
+
+    def __len__(self) -> int:
+        return self.__datos__.shape[0]
+
+    # ========== CONSULTAS VECTORIZADAS ==========
+
+    def hay_en_barra(self, jugador) -> np.ndarray:
+        """
+        Indica, por partida, si el jugador tiene fichas en la barra.
+
+        Args:
+            jugador (int | np.ndarray): 1 blancas, -1 negras (escalar o uno por partida).
+
+        Returns:
+            np.ndarray: bool (N,).
+        """
+        j = self._jugadores(jugador)
+        return self.__datos__[np.arange(len(self)), self._col_barra(j)] > 0
+
+    def todas_en_home(self, jugador) -> np.ndarray:
+        """
+        Indica, por partida, si todas las fichas del tablero del jugador están en su home.
+
+        Equivale a `_todas_en_home` del core (no considera la barra).
+
+        Args:
+            jugador (int | np.ndarray): 1 blancas, -1 negras.
+
+        Returns:
+            np.ndarray: bool (N,).
+        """
+        j = self._jugadores(jugador)
+        pos = self.__datos__[:, :CASILLEROS]
+        blancas = np.all(pos[:, :18] <= 0, axis=1)
+        negras = np.all(pos[:, 6:] >= 0, axis=1)
+        return np.where(j == 1, blancas, negras)
+
+    def puede_entrar(self, jugador, dados) -> np.ndarray:
+        """
+        Indica, por partida, si el jugador tiene fichas en la barra y puede entrar con su dado.
+
+        Args:
+            jugador (int | np.ndarray): 1 blancas, -1 negras.
+            dados (int | np.ndarray): Valor del dado (escalar o uno por partida).
+
+        Returns:
+            np.ndarray: bool (N,).
+        """
+        j = self._jugadores(jugador)
+        d = self._dados(dados)
+        filas = np.arange(len(self))
+        destino = np.where(j == 1, d - 1, CASILLEROS - d)
+        valor = self.__datos__[filas, destino].astype(np.int16)
+        bloqueado = (valor * j < 0) & (np.abs(valor) >= 2)
+        return self.hay_en_barra(j) & ~bloqueado
+
+    def mascara_legal(self, jugador, dados) -> np.ndarray:
+        """
+        Calcula, por partida y casillero, si mover desde ese origen con el dado es legal.
+
+        Funcionamiento: Replica `ValidadorMovimientos.validar_movimiento` sobre el lote:
+        origen propio, destino no bloqueado y, si sale del tablero, las condiciones de
+        bear-off (todas en home, valor exacto o excedente sin fichas más adelantadas).
+        Si el jugador tiene fichas en la barra, ningún origen del tablero es legal
+        (ver `puede_entrar`).
+
+        Args:
+            jugador (int | np.ndarray): 1 blancas, -1 negras.
+            dados (int | np.ndarray): Valor del dado.
+
+        Returns:
+            np.ndarray: bool (N, 24).
+        """
+        j = self._jugadores(jugador)[:, None]
+        d = self._dados(dados)[:, None]
+        pos = self.__datos__[:, :CASILLEROS].astype(np.int16)
+
+        propias = pos * j > 0
+        destino = _INDICES[None, :] + j * d
+        dentro = (destino >= 0) & (destino < CASILLEROS)
+        valor_destino = np.take_along_axis(pos, np.clip(destino, 0, CASILLEROS - 1), axis=1)
+        bloqueado = (valor_destino * j < 0) & (np.abs(valor_destino) >= 2)
+        normal = dentro & ~bloqueado
+
+        # Bear-off: distancia necesaria y fichas "más adelantadas" según el core
+        necesario = np.where(j == 1, CASILLEROS - _INDICES[None, :], _INDICES[None, :] + 1)
+        cuenta = propias.astype(np.int16)
+        despues = np.cumsum(cuenta[:, ::-1], axis=1)[:, ::-1] - cuenta  # propias en i > origen
+        antes = np.cumsum(cuenta, axis=1) - cuenta                        # propias en i < origen
+        adelantadas = np.where(j == 1, despues, antes) > 0
+        bear_off = (self.todas_en_home(j[:, 0])[:, None] & ~dentro
+                    & ((d == necesario) | ((d > necesario) & ~adelantadas)))
+
+        return propias & (normal | bear_off) & ~self.hay_en_barra(j[:, 0])[:, None]
+
+    def pips(self) -> np.ndarray:
+        """
+        Calcula el conteo de pips de cada color en cada partida (barra = 25 pips).
+
+        Returns:
+            np.ndarray: int (N, 2) con columnas (blancas, negras).
+        """
+        pos = self.__datos__[:, :CASILLEROS].astype(np.int32)
+        blancas = (np.clip(pos, 0, None) * (CASILLEROS - _INDICES)).sum(axis=1)
+        negras = (np.clip(-pos, 0, None) * (_INDICES + 1)).sum(axis=1)
+        barra = self.__datos__[:, [COL_BARRA_BLANCAS, COL_BARRA_NEGRAS]].astype(np.int32)
+        blancas += 25 * barra[:, 0]
+        negras += 25 * barra[:, 1]
+        return np.stack([blancas, negras], axis=1)
+
+    # ========== MOVIMIENTOS VECTORIZADOS ==========
+
+    def aplicar_movimientos(self, jugador, origenes, dados, activos=None):
+        """
+        Aplica un movimiento (ya validado) en cada partida activa del lote.
+
+        Funcionamiento: Equivale a EjecutorMovimientos sobre todas las filas a la vez:
+        entrada desde barra (origen = ORIGEN_BARRA), movimiento normal con captura de
+        blots, o bear-off cuando el destino sale del tablero.
+
+        Args:
+            jugador (int | np.ndarray): 1 blancas, -1 negras.
+            origenes (np.ndarray): Índice 0-based de origen por partida (ORIGEN_BARRA = barra).
+            dados (int | np.ndarray): Valor del dado por partida.
+            activos (np.ndarray, optional): bool (N,) con las partidas a mover. Por defecto, todas.
+        """
+        n = len(self)
+        filas = np.arange(n) if activos is None else np.flatnonzero(activos)
+        if filas.size == 0:
+            return
+
+        datos = self.__datos__
+        j = self._jugadores(jugador)[filas].astype(np.int16)
+        d = self._dados(dados)[filas].astype(np.int16)
+        o = np.broadcast_to(np.asarray(origenes, dtype=np.int16), (n,))[filas]
+
+        entrada = o == ORIGEN_BARRA
+        destino = np.where(entrada, np.where(j == 1, d - 1, CASILLEROS - d), o + j * d)
+        bear_off = ~entrada & ((destino < 0) | (destino >= CASILLEROS))
+
+        # Quitar la ficha de su origen
+        col_barra = self._col_barra(j)
+        datos[filas[entrada], col_barra[entrada]] -= 1
+        normales = ~entrada
+        datos[filas[normales], o[normales]] -= j[normales].astype(np.int8)
+
+        # Bear-off
+        col_fuera = np.where(j == 1, COL_FUERA_BLANCAS, COL_FUERA_NEGRAS)
+        datos[filas[bear_off], col_fuera[bear_off]] += 1
+
+        # Llegada al destino (con captura de blot)
+        llegan = ~bear_off
+        f, dst, jj = filas[llegan], destino[llegan], j[llegan]
+        valor = datos[f, dst].astype(np.int16)
+        captura = (valor * jj < 0) & (np.abs(valor) == 1)
+        col_barra_rival = np.where(jj == 1, COL_BARRA_NEGRAS, COL_BARRA_BLANCAS)
+        datos[f[captura], col_barra_rival[captura]] += 1
+        datos[f, dst] = np.where(captura, jj, valor + jj).astype(np.int8)
+
+    # ========== MÉTODOS PRIVADOS ==========
+
+    def _jugadores(self, jugador) -> np.ndarray:
+        """Normaliza el jugador a un arreglo int16 (N,)."""
+        return np.broadcast_to(np.asarray(jugador, dtype=np.int16), (len(self),))
+
+    def _dados(self, dados) -> np.ndarray:
+        """Normaliza los dados a un arreglo int16 (N,)."""
+        return np.broadcast_to(np.asarray(dados, dtype=np.int16), (len(self),))
+
+    def _col_barra(self, j: np.ndarray) -> np.ndarray:
+        """Columna de barra del jugador de cada fila."""
+        return np.where(j == 1, COL_BARRA_BLANCAS, COL_BARRA_NEGRAS)
@@ -0,0 +1,251 @@
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import NamedTuple
+
+from source.backgammon import Backgammon
+from source.cache_jugadas import CacheJugadas
+from source.dados import Dados
+from source.tablero import Tablero
+from source.motor_busqueda import MotorBusqueda
+from source.rollout import puntos_victoria
+
+# Tope de turnos por partida (protege contra estrategias que no progresan)
+MAX_TURNOS = 10_000
+
+
+def estrategia_aleatoria(rng: random.Random):
+    """
+    Crea una estrategia que elige al azar entre las jugadas legales.
+
+    Args:
+        rng (random.Random): Generador para elegir la jugada.
+
+    Returns:
+        callable: Función (Backgammon) -> jugada en notación pública.
+    """
+    def elegir(juego: Backgammon) -> tuple:
+        jugadas = juego.obtener_jugadas_posibles()
+        return rng.choice(jugadas) if jugadas else ()
+    return elegir
+
+
+def estrategia_motor(profundidad: int):
+    """
+    Crea una fábrica de estrategias basadas en MotorBusqueda.
+
+    Args:
+        profundidad (int): Plies de búsqueda.
+
+    Returns:
+        callable: Fábrica (rng) -> estrategia; el motor es determinista y no usa `rng`.
+    """
+    def fabrica(rng: random.Random):
+        return MotorBusqueda(profundidad=profundidad).elegir_jugada
+    return fabrica
+
+
+# Estrategias disponibles por nombre: nombre -> fábrica (random.Random) -> estrategia.
+# Se referencian por nombre para poder enviarlas a otros procesos.
+ESTRATEGIAS = {
+    'aleatoria': estrategia_aleatoria,
+    'heuristica': estrategia_motor(1),
+    'expectiminimax': estrategia_motor(2),
+}
+
+
+class ResultadoPartida(NamedTuple):
+    """
+    Resultado de una partida entre dos estrategias.
+
+    Atributos:
+        ganador (str): 'a' o 'b', la estrategia ganadora.
+        color (str): Color con el que jugó la ganadora ('blancas' o 'negras').
+        puntos (int): 1 simple, 2 gammon, 3 backgammon.
+        turnos (int): Tiradas jugadas en total.
+    """
+    ganador: str
+    color: str
+    puntos: int
+    turnos: int
+
+
+class ResumenTorneo(NamedTuple):
+    """
+    Estadísticas agregadas de un torneo.
+
+    Atributos:
+        partidas (int): Partidas jugadas.
+        victorias (dict): Victorias por estrategia ('a', 'b').
+        gammons (dict): Gammons ganados por estrategia (incluye backgammons).
+        backgammons (dict): Backgammons ganados por estrategia.
+        puntos (dict): Puntos totales por estrategia.
+        turnos_medios (float): Duración media de las partidas en tiradas.
+        segundos (float): Tiempo total de reloj.
+    """
+    partidas: int
+    victorias: dict
+    gammons: dict
+    backgammons: dict
+    puntos: dict
+    turnos_medios: float
+    segundos: float
+
+    @property
+    def partidas_por_segundo(self) -> float:
+        return self.partidas / self.segundos if self.segundos > 0 else 0.0
+
+
+def jugar_partida(estrategia_blancas, estrategia_negras, juego: Backgammon = None) -> tuple:
+    """
+    Juega una partida completa sin entrada/salida, usando la API pública de Backgammon.
+
+    Funcionamiento: Cada turno tira los dados, pide la jugada a la estrategia del color en
+    turno y la aplica paso a paso con `mover`, de modo que el core valida cada movimiento.
+
+    Args:
+        estrategia_blancas (callable): (Backgammon) -> jugada en notación pública.
+        estrategia_negras (callable): Ídem para las negras.
+        juego (Backgammon, optional): Partida a jugar. Por defecto, una nueva.
+
+    Returns:
+        tuple: (color ganador, puntos, turnos).
+
+    Raises:
+        RuntimeError: Si la partida supera MAX_TURNOS tiradas.
+    """
+    juego = juego if juego is not None else Backgammon()
+    estrategias = {'blancas': estrategia_blancas, 'negras': estrategia_negras}
+    for turnos in range(1, MAX_TURNOS + 1):
+        color = juego.obtener_turno()
+        juego.tirar_dados()
+        for origen, _, dado in estrategias[color](juego):
+            juego.mover(origen, dado)
+        if juego.obtener_fichas_fuera()[color] == 15:
+            tablero = Tablero.desde_posicion(juego.obtener_posicion())
+            return color, puntos_victoria(tablero, color), turnos
+        juego.finalizar_tirada()
+    raise RuntimeError(f"La partida superó {MAX_TURNOS} tiradas")
+
+
+def _jugar_lote(estrategia_a: str, estrategia_b: str, semilla: int, inicio: int,
+                cantidad: int, alternar: bool) -> list[ResultadoPartida]:
+    """
+    Juega un lote de partidas (función de nivel de módulo para poder enviarse a procesos).
+
+    La partida `i` siembra sus dados y sus estrategias con (semilla, i), de modo que el
+    torneo es reproducible; si `alternar`, en las partidas impares la estrategia 'a'
+    juega con negras. Las partidas del lote comparten un CacheJugadas.
+
+    Returns:
+        list[ResultadoPartida]: Un resultado por partida.
+    """
+    resultados = []
+    cache = CacheJugadas()
+    for indice in range(inicio, inicio + cantidad):
+        semilla_partida = semilla * 1_000_003 + indice
+        rng = random.Random(semilla_partida)
+        a = ESTRATEGIAS[estrategia_a](rng)
+        b = ESTRATEGIAS[estrategia_b](rng)
+        a_con_negras = alternar and indice % 2 == 1
+        blancas, negras = (b, a) if a_con_negras else (a, b)
+        juego = Backgammon(dados=Dados(semilla=semilla_partida), cache=cache)
+        color, puntos, turnos = jugar_partida(blancas, negras, juego)
+        gano_a = (color == 'negras') == a_con_negras
+        resultados.append(ResultadoPartida('a' if gano_a else 'b', color, puntos, turnos))
+    return resultados
+
+
+class Torneo:
+    """
+    Responsabilidad: Jugar N partidas completas entre dos estrategias y resumir los resultados.
+    SRP: Solo reparte partidas y acumula estadísticas; las jugadas las eligen las estrategias
+         y las valida el core.
+    Justificación: Es el arnés para medir el rendimiento del core y comparar motores. Las
+                   partidas son independientes, así que se reparten en lotes sobre un
+                   ProcessPoolExecutor (igual que Rollout); las estrategias viajan por nombre.
+    """
+
+    def __init__(self, estrategia_a: str, estrategia_b: str, partidas: int = 100,
+                 trabajadores: int = None, semilla: int = 0, alternar: bool = True,
+                 tamano_lote: int = 10):
+        """
+        Inicializa la configuración del torneo.
+
+        Args:
+            estrategia_a (str): Nombre en ESTRATEGIAS de la primera estrategia.
+            estrategia_b (str): Nombre en ESTRATEGIAS de la segunda estrategia.
+            partidas (int): Cantidad de partidas.
+            trabajadores (int, optional): Procesos a usar. None = os.cpu_count();
+                                          1 = ejecutar en el proceso actual.
+            semilla (int): Semilla base de los dados y las estrategias.
+            alternar (bool): Si las estrategias alternan colores entre partidas.
+            tamano_lote (int): Partidas por tarea enviada a un proceso.
+
+        Raises:
+            ValueError: Si una estrategia no existe o partidas/tamano_lote no son positivos.
+        """
+        for nombre in (estrategia_a, estrategia_b):
+            if nombre not in ESTRATEGIAS:
+                raise ValueError(f"Estrategia desconocida: '{nombre}'")
+        if partidas < 1 or tamano_lote < 1:
+            raise ValueError("partidas y tamano_lote deben ser positivos")
+        self.__estrategias__ = (estrategia_a, estrategia_b)
+        self.__partidas__ = partidas
+        self.__trabajadores__ = trabajadores or os.cpu_count() or 1
+        self.__semilla__ = semilla
+        self.__alternar__ = alternar
+        self.__tamano_lote__ = tamano_lote
+
+    def iterar(self):
+        """
+        Juega el torneo y produce los resultados a medida que terminan los lotes.
+
+        Yields:
+            ResultadoPartida: Resultado de cada partida (el orden depende de los procesos).
+        """
+        lotes = [
+            (*self.__estrategias__, self.__semilla__, inicio,
+             min(self.__tamano_lote__, self.__partidas__ - inicio), self.__alternar__)
+            for inicio in range(0, self.__partidas__, self.__tamano_lote__)
+        ]
+
+        if self.__trabajadores__ == 1:
+            for lote in lotes:
+                yield from _jugar_lote(*lote)
+            return
+
+        with ProcessPoolExecutor(max_workers=self.__trabajadores__) as pool:
+            futuros = [pool.submit(_jugar_lote, *lote) for lote in lotes]
+            for futuro in as_completed(futuros):
+                yield from futuro.result()
+
+    def ejecutar(self, callback=None) -> ResumenTorneo:
+        """
+        Juega el torneo completo.
+
+        Args:
+            callback (callable, optional): Se llama con cada ResultadoPartida.
+
+        Returns:
+            ResumenTorneo: Estadísticas del torneo.
+        """
+        inicio = time.perf_counter()
+        victorias = {'a': 0, 'b': 0}
+        gammons = {'a': 0, 'b': 0}
+        backgammons = {'a': 0, 'b': 0}
+        puntos = {'a': 0, 'b': 0}
+        turnos = 0
+        for resultado in self.iterar():
+            victorias[resultado.ganador] += 1
+            puntos[resultado.ganador] += resultado.puntos
+            if resultado.puntos >= 2:
+                gammons[resultado.ganador] += 1
+            if resultado.puntos == 3:
+                backgammons[resultado.ganador] += 1
+            turnos += resultado.turnos
+            if callback is not None:
+                callback(resultado)
+        return ResumenTorneo(self.__partidas__, victorias, gammons, backgammons, puntos,
+                             turnos / self.__partidas__, time.perf_counter() - inicio)
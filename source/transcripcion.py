@@ -0,0 +1,450 @@
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from typing import NamedTuple
+
+from source.backgammon import Backgammon
+from source.dados import Dados
+from source.posicion import Posicion
+from source.constantes import CASILLEROS
+from source.excepciones import BackgammonError
+from source.registro_partidas import (
+    EscritorPartidas,
+    PartidaGrabada,
+    TIRADA,
+    MOVIMIENTO,
+    FIN_TURNO,
+)
+from source.rollout import puntos_victoria
+from source.tablero import Tablero
+
+# Transcripción de partidas en texto plano (formato "match" de Jellyfish/GNU Backgammon):
+#
+#  7 point match
+#
+#  Game 1
+#  Ana : 0                            Beto : 0
+#   1) 31: 8/5 6/5                    52: 13/11 24/19
+#   2) 64: 24/14                      ...
+#       Wins 1 point
+#
+# Cada jugador numera los puntos desde su propio home (1..24); 'bar' es la barra y
+# 'off' el bear-off. El jugador de la columna que mueve primero juega con blancas.
+
+_BAR = 25
+_OFF = 0
+_ANCHO_COLUMNA = 34
+
+_RE_JUEGO = re.compile(r'^\s*Game\s+(\d+)', re.IGNORECASE)
+_RE_JUGADORES = re.compile(r'^\s*(.+?)\s*:\s*(\d+)\s+(.+?)\s*:\s*(\d+)\s*$')
+_RE_TURNO = re.compile(r'^\s*(\d+)\)')
+_RE_ENTRADA = re.compile(r'([1-6])([1-6]):|Doubles|Takes|Drops|Beavers', re.IGNORECASE)
+_RE_FICHA = re.compile(r'^(.+?)(?:\((\d+)\))?$')
+
+
+class TurnoTranscripto(NamedTuple):
+    """
+    Una tirada de la transcripción.
+
+    Atributos:
+        columna (int): 0 si es del jugador de la izquierda, 1 si es del de la derecha.
+        dados (tuple[int, int]): Dados de la tirada.
+        jugada (str): Jugada en notación de puntos (p. ej. "8/5 6/5", "bar/22*", "6/off(2)").
+    """
+    columna: int
+    dados: tuple
+    jugada: str
+
+
+class PartidaTranscripta(NamedTuple):
+    """
+    Una partida leída de una transcripción, aún sin validar.
+
+    Atributos:
+        numero (int): Número de partida dentro del match.
+        jugadores (tuple[str, str]): Nombres de las columnas izquierda y derecha.
+        turnos (list[TurnoTranscripto]): Tiradas en orden.
+    """
+    numero: int
+    jugadores: tuple
+    turnos: list
+
+
+# ========== LECTURA ==========
+
+def leer_transcripcion(lineas):
+    """
+    Lee una transcripción partida por partida.
+
+    Funcionamiento: Recorre las líneas una sola vez y produce cada partida al encontrar
+    el encabezado de la siguiente o el final. Las acciones del cubo (Doubles, Takes,
+    ...) se ignoran: este juego no modela el cubo.
+
+    Args:
+        lineas (Iterable[str]): Líneas del texto (p. ej. un archivo abierto).
+
+    Yields:
+        PartidaTranscripta: Cada partida, en orden.
+
+    Raises:
+        ValueError: Si una línea de tirada aparece fuera de una partida.
+    """
+    partida = None
+    for numero_linea, linea in enumerate(lineas, 1):
+        linea = linea.rstrip('\r\n')
+        juego = _RE_JUEGO.match(linea)
+        if juego:
+            if partida is not None:
+                yield partida
+            partida = PartidaTranscripta(int(juego.group(1)), ('', ''), [])
+            continue
+        if partida is None:
+            if _RE_TURNO.match(linea):
+                raise ValueError(f"línea {numero_linea}: tirada fuera de una partida")
+            continue
+        turno = _RE_TURNO.match(linea)
+        if turno:
+            _leer_linea_turnos(linea[turno.end():], partida.turnos)
+            continue
+        jugadores = _RE_JUGADORES.match(linea)
+        if jugadores and not partida.turnos:
+            partida = partida._replace(jugadores=(jugadores.group(1), jugadores.group(3)))
+    if partida is not None:
+        yield partida
+
+
+def _leer_linea_turnos(resto: str, turnos: list):
+    """Agrega a `turnos` las tiradas de una línea "N) ..." (una o dos columnas)."""
+    entradas = list(_RE_ENTRADA.finditer(resto))
+    for i, entrada in enumerate(entradas):
+        if entrada.group(1) is None:
+            continue
+        # La columna izquierda empieza junto al "N)" y la derecha _ANCHO_COLUMNA más allá;
+        # la mitad de ese ancho separa ambas aunque otro programa use columnas más angostas
+        columna = 0 if entrada.start() < _ANCHO_COLUMNA // 2 else 1
+        fin = entradas[i + 1].start() if i + 1 < len(entradas) else len(resto)
+        dados = (int(entrada.group(1)), int(entrada.group(2)))
+        turnos.append(TurnoTranscripto(columna, dados, resto[entrada.end():fin].strip()))
+
+
+# ========== IMPORTACIÓN (VALIDADA POR EL CORE) ==========
+
+def importar_partida(partida: PartidaTranscripta) -> PartidaGrabada:
+    """
+    Juega una partida transcripta a través de Backgammon y la devuelve como registro.
+
+    Funcionamiento: La columna que mueve primero juega con blancas. Cada jugada se
+    traduce a pasos `mover(origen, dado)`; si la notación no se puede aplicar paso a
+    paso (movimientos compuestos como 24/13), se busca entre las jugadas legales del
+    core la que lleva a la misma posición final.
+
+    Args:
+        partida (PartidaTranscripta): Partida leída con `leer_transcripcion`.
+
+    Returns:
+        PartidaGrabada: Eventos validados, listos para EscritorPartidas.
+
+    Raises:
+        ValueError: Si los turnos no alternan o una jugada es ilegal o ilegible.
+    """
+    turnos = partida.turnos
+    juego = Backgammon(dados=Dados(tiradas=[turno.dados for turno in turnos]))
+    eventos = []
+    for numero, turno in enumerate(turnos):
+        if numero and turno.columna == turnos[numero - 1].columna:
+            raise ValueError(f"partida {partida.numero}: el turno {numero + 1} no alterna de jugador")
+        if eventos:
+            juego.finalizar_tirada()
+            eventos.append((FIN_TURNO, 0, 0))
+        juego.tirar_dados()
+        eventos.append((TIRADA, *turno.dados))
+        try:
+            pasos = _resolver_jugada(juego, turno.jugada)
+        except (ValueError, BackgammonError) as e:
+            raise ValueError(f"partida {partida.numero}, turno {numero + 1} "
+                             f"({turno.dados[0]}{turno.dados[1]}: {turno.jugada}): {e}") from None
+        eventos.extend((MOVIMIENTO, origen, dado) for origen, dado in pasos)
+    return PartidaGrabada(eventos)
+
+
+def _resolver_jugada(juego: Backgammon, texto: str) -> list[tuple[int, int]]:
+    """
+    Aplica la jugada en notación de puntos sobre el juego y retorna los pasos usados.
+
+    Returns:
+        list[tuple[int, int]]: Pasos (origen 1-based, dado) aplicados con `mover`.
+
+    Raises:
+        ValueError: Si ninguna jugada legal corresponde a la notación.
+    """
+    color = juego.obtener_turno()
+    segmentos = _segmentos(texto)
+    objetivo = _posicion_tras(juego.obtener_posicion(), color, segmentos)
+
+    pasos = _pasos_directos(segmentos, color, juego.obtener_movimientos_pendientes())
+    if pasos is not None and _aplicar(juego, pasos) and _jugada_completa(juego, objetivo):
+        return pasos
+    while juego.deshacer_movimiento():
+        pass
+
+    for jugada in juego.obtener_jugadas_posibles():
+        candidatos = [(origen, dado) for origen, _, dado in jugada]
+        if _aplicar(juego, candidatos) and juego.obtener_posicion() == objetivo:
+            return candidatos
+        while juego.deshacer_movimiento():
+            pass
+    raise ValueError("la jugada no es legal en esta posición")
+
+
+def _segmentos(texto: str) -> list[tuple[int, int]]:
+    """Convierte "24/18*/13 6/off(2)" en [(24, 18), (18, 13), (6, 0), (6, 0)]."""
+    segmentos = []
+    for ficha in texto.lower().split():
+        coincidencia = _RE_FICHA.match(ficha)
+        veces = int(coincidencia.group(2) or 1)
+        puntos = [_leer_punto(p.rstrip('*')) for p in coincidencia.group(1).split('/')]
+        if len(puntos) < 2:
+            raise ValueError(f"movimiento ilegible: '{ficha}'")
+        for _ in range(veces):
+            segmentos.extend(zip(puntos, puntos[1:]))
+    return segmentos
+
+
+def _leer_punto(texto: str) -> int:
+    if texto in ('bar', '25'):
+        return _BAR
+    if texto == 'off':
+        return _OFF
+    if texto.isdigit() and 1 <= int(texto) <= 24:
+        return int(texto)
+    raise ValueError(f"punto inválido: '{texto}'")
+
+
+def _indice(color: str, punto: int) -> int:
+    """Índice 0-based del tablero para el punto (1..24) desde la perspectiva del color."""
+    return CASILLEROS - punto if color == 'blancas' else punto - 1
+
+
+def _punto(color: str, indice: int) -> int:
+    """Punto (1..24) desde la perspectiva del color para un índice 0-based."""
+    return CASILLEROS - indice if color == 'blancas' else indice + 1
+
+
+def _posicion_tras(posicion: Posicion, color: str, segmentos: list) -> Posicion:
+    """
+    Posición que resulta de mover las fichas según los segmentos (sin validar reglas).
+
+    Los segmentos cuyo origen todavía está vacío se posponen, porque las transcripciones
+    no siempre listan los movimientos en el orden en que se hicieron.
+    """
+    jugador = 1 if color == 'blancas' else -1
+    rival = 'negras' if color == 'blancas' else 'blancas'
+    casilleros = list(posicion.posiciones)
+    barra, fuera = posicion.barra, posicion.fichas_fuera
+    pendientes = list(segmentos)
+    while pendientes:
+        aplicable = next((s for s in pendientes if _hay_ficha(casilleros, barra, color, jugador, s[0])),
+                         None)
+        if aplicable is None:
+            desde = pendientes[0][0]
+            if desde == _OFF:
+                raise ValueError("un movimiento no puede salir de 'off'")
+            raise ValueError("no hay fichas en la barra" if desde == _BAR
+                             else f"no hay fichas propias en el punto {desde}")
+        pendientes.remove(aplicable)
+        desde, hasta = aplicable
+        if desde == _BAR:
+            barra[color] -= 1
+        else:
+            casilleros[_indice(color, desde)] -= jugador
+        if hasta == _OFF:
+            fuera[color] += 1
+        elif hasta == _BAR:
+            raise ValueError("un movimiento no puede terminar en la barra")
+        else:
+            idx = _indice(color, hasta)
+            if casilleros[idx] == -jugador:
+                casilleros[idx] = 0
+                barra[rival] += 1
+            casilleros[idx] += jugador
+    return Posicion(casilleros, barra, fuera)
+
+
+def _hay_ficha(casilleros: list, barra: dict, color: str, jugador: int, punto: int) -> bool:
+    if punto == _BAR:
+        return barra[color] > 0
+    return punto != _OFF and casilleros[_indice(color, punto)] * jugador > 0
+
+
+def _pasos_directos(segmentos: list, color: str, dados: list[int]):
+    """
+    Traduce cada segmento a un único dado, si es posible.
+
+    Returns:
+        list[tuple[int, int]] | None: Pasos (origen 1-based, dado) para `mover`, o None
+                                      si algún segmento necesita más de un dado.
+    """
+    disponibles = list(dados)
+    pasos = []
+    for desde, hasta in segmentos:
+        distancia = desde - hasta
+        if distancia in disponibles:
+            dado = distancia
+        elif hasta == _OFF and any(d > distancia for d in disponibles):
+            dado = min(d for d in disponibles if d > distancia)
+        else:
+            return None
+        disponibles.remove(dado)
+        pasos.append((0 if desde == _BAR else _indice(color, desde) + 1, dado))
+    return pasos
+
+
+def _aplicar(juego: Backgammon, pasos: list) -> bool:
+    """
+    Aplica pasos (origen, dado) con `mover`.
+
+    Returns:
+        bool: False si el core rechazó algún paso (los aplicados quedan para deshacer).
+    """
+    try:
+        for origen, dado in pasos:
+            juego.mover(origen, dado)
+    except BackgammonError:
+        return False
+    return True
+
+
+def _jugada_completa(juego: Backgammon, objetivo: Posicion) -> bool:
+    """Si se llegó al objetivo usando tantos dados como exigen las reglas."""
+    return (juego.obtener_posicion() == objetivo
+            and not (juego.movimientos_disponibles() and juego.hay_movimiento_posible()))
+
+
+# ========== EXPORTACIÓN ==========
+
+def escribir_transcripcion(partidas, destino, jugadores: tuple = ('Blancas', 'Negras'),
+                           puntos_partido: int = 0) -> int:
+    """
+    Escribe partidas grabadas como transcripción de texto, una a una.
+
+    Funcionamiento: Reproduce cada PartidaGrabada a través del core para conocer las
+    capturas y el resultado, y escribe una línea por par de tiradas (blancas a la
+    izquierda). Las partidas se consumen de a una, por lo que sirve con `leer_partidas`.
+
+    Args:
+        partidas (Iterable[PartidaGrabada]): Partidas a exportar.
+        destino (archivo de texto): Donde escribir.
+        jugadores (tuple[str, str]): Nombres de blancas y negras.
+        puntos_partido (int): Longitud del match para el encabezado (0 = sin límite).
+
+    Returns:
+        int: Cantidad de partidas escritas.
+    """
+    destino.write(f" {puntos_partido} point match\n")
+    marcador = [0, 0]
+    cantidad = 0
+    for cantidad, partida in enumerate(partidas, 1):
+        destino.write(f"\n Game {cantidad}\n")
+        izquierda = f" {jugadores[0]} : {marcador[0]}"
+        destino.write(f"{izquierda:<{_ANCHO_COLUMNA + 5}}{jugadores[1]} : {marcador[1]}\n")
+
+        juego = Backgammon(dados=Dados(tiradas=partida.tiradas))
+        textos = []
+        for tipo, a, b in partida.eventos:
+            if tipo == TIRADA:
+                juego.tirar_dados()
+                textos.append([f"{a}{b}:", []])
+            elif tipo == MOVIMIENTO:
+                textos[-1][1].append(_notacion_paso(juego, a, b))
+            else:
+                juego.finalizar_tirada()
+        for i in range(0, len(textos), 2):
+            columnas = [f"{tirada} {_agrupar(fichas)}".rstrip() for tirada, fichas in textos[i:i + 2]]
+            linea = f"{i // 2 + 1:>3}) {columnas[0]:<{_ANCHO_COLUMNA}}"
+            destino.write((linea + (columnas[1] if len(columnas) > 1 else '')).rstrip() + "\n")
+
+        for columna, color in enumerate(('blancas', 'negras')):
+            if juego.obtener_fichas_fuera()[color] == 15:
+                puntos = puntos_victoria(Tablero.desde_posicion(juego.obtener_posicion()), color)
+                marcador[columna] += puntos
+                sangria = 6 + columna * _ANCHO_COLUMNA
+                destino.write(f"{'':<{sangria}}Wins {puntos} point{'s' if puntos > 1 else ''}\n")
+    return cantidad
+
+
+def _notacion_paso(juego: Backgammon, origen: int, dado: int) -> str:
+    """Aplica un paso y lo describe en la notación de puntos del jugador ("13/7*")."""
+    color = juego.obtener_turno()
+    rival = 'negras' if color == 'blancas' else 'blancas'
+    en_barra = juego.obtener_barra()[rival]
+    desde = _BAR if origen == 0 else _punto(color, origen - 1)
+    juego.mover(origen, dado)
+    hasta = desde - dado
+    captura = '*' if juego.obtener_barra()[rival] > en_barra else ''
+    return f"{'bar' if desde == _BAR else desde}/{'off' if hasta <= 0 else hasta}{captura}"
+
+
+def _agrupar(fichas: list[str]) -> str:
+    """Une los movimientos repetidos consecutivos: ['8/5', '8/5'] -> '8/5(2)'."""
+    grupos = []
+    for ficha in fichas:
+        if grupos and grupos[-1][0] == ficha:
+            grupos[-1][1] += 1
+        else:
+            grupos.append([ficha, 1])
+    return ' '.join(f if n == 1 else f"{f}({n})" for f, n in grupos)
+
+
+# ========== CONVERSIÓN MASIVA ==========
+
+def _importar_archivo(ruta: str) -> tuple:
+    """Importa todas las partidas de un archivo (función de módulo para enviarse a procesos)."""
+    try:
+        with open(ruta, encoding='utf-8', errors='replace') as archivo:
+            return [importar_partida(p) for p in leer_transcripcion(archivo)], None
+    except (OSError, ValueError) as e:
+        return [], str(e)
+
+
+def convertir_archivos(rutas, destino, trabajadores: int = None,
+                       tamano_lote: int = 16) -> tuple[int, list]:
+    """
+    Convierte transcripciones de texto a un único archivo de registros binarios.
+
+    Funcionamiento: Cada archivo se importa (y valida) en un proceso del pool; el
+    proceso principal escribe las partidas en el orden de `rutas`. Un archivo con
+    errores se omite entero y se informa.
+
+    Args:
+        rutas (Iterable[str]): Archivos de transcripción.
+        destino (str | archivo binario): Archivo de registros a crear.
+        trabajadores (int, optional): Procesos a usar. None = os.cpu_count();
+                                      1 = en el proceso actual.
+        tamano_lote (int): Archivos por tarea enviada a un proceso.
+
+    Returns:
+        tuple[int, list]: (partidas escritas, [(ruta, mensaje de error), ...]).
+    """
+    rutas = list(rutas)
+    trabajadores = trabajadores or os.cpu_count() or 1
+    errores = []
+    with EscritorPartidas(destino) as escritor:
+        if trabajadores == 1:
+            resultados = map(_importar_archivo, rutas)
+            for ruta, (partidas, error) in zip(rutas, resultados):
+                _escribir_resultado(escritor, ruta, partidas, error, errores)
+        else:
+            with ProcessPoolExecutor(max_workers=trabajadores) as pool:
+                resultados = pool.map(_importar_archivo, rutas, chunksize=tamano_lote)
+                for ruta, (partidas, error) in zip(rutas, resultados):
+                    _escribir_resultado(escritor, ruta, partidas, error, errores)
+        return escritor.partidas, errores
+
+
+def _escribir_resultado(escritor: EscritorPartidas, ruta: str, partidas: list, error,
+                        errores: list):
+    if error is not None:
+        errores.append((ruta, error))
+        return
+    for partida in partidas:
+        escritor.escribir_partida(partida)
@@ -1,6 +1,7 @@
 from source.tablero import Tablero
 from source.gestor_turnos import GestorTurnos
 from source.constantes import CASILLEROS
+from source.resultado_validacion import MotivoRechazo, ResultadoValidacion, VALIDO, RECHAZOS
 
 class ValidadorMovimientos:
     """
@@ -18,7 +19,7 @@ class ValidadorMovimientos:
         self.__tablero__ = tablero
         self.__gestor_turnos__ = gestor_turnos
 
-    def validar_movimiento(self, origen: int, valor_dado: int) -> tuple[bool, str]:
+    def validar_movimiento(self, origen: int, valor_dado: int) -> ResultadoValidacion:
         """
         Valida si un movimiento es legal según todas las reglas del backgammon.
         
@@ -27,16 +28,16 @@ class ValidadorMovimientos:
             valor_dado (int): Valor del dado a usar (1-6)
         
         Returns:
-            tuple[bool, str]: (es_valido, mensaje_error)
-                            Si es_valido=True, mensaje_error=""
-                            Si es_valido=False, mensaje_error contiene razón
+            ResultadoValidacion: (es_valido, motivo)
+                            Si es_valido=True, motivo=MotivoRechazo.NINGUNO
+                            Si es_valido=False, motivo es el código del rechazo
         """
         jugador = self.__gestor_turnos__.obtener_direccion()
         posiciones = self.__tablero__.obtener_posiciones()
         
         # 1. Validar que el origen tenga fichas propias
         if not self._origen_valido(posiciones, origen, jugador):
-            return False, "origen inválido o sin fichas propias"
+            return RECHAZOS[MotivoRechazo.ORIGEN_INVALIDO]
         
         # 2. Calcular destino
         destino = origen + jugador * valor_dado
@@ -49,12 +50,12 @@ class ValidadorMovimientos:
         valor_destino = posiciones[destino]
         
         if self._destino_bloqueado(valor_destino, jugador):
-            return False, "posición de destino bloqueada"
+            return RECHAZOS[MotivoRechazo.DESTINO_BLOQUEADO]
         
         # Movimiento válido
-        return True, ""
+        return VALIDO
 
-    def validar_entrada_barra(self, valor_dado: int) -> tuple[bool, str]:
+    def validar_entrada_barra(self, valor_dado: int) -> ResultadoValidacion:
         """
         Valida si es posible entrar desde la barra con el dado dado.
         
@@ -62,27 +63,26 @@ class ValidadorMovimientos:
             valor_dado (int): Valor del dado (1-6)
         
         Returns:
-            tuple[bool, str]: (es_valido, mensaje_error)
+            ResultadoValidacion: (es_valido, motivo)
         """
         jugador = self.__gestor_turnos__.obtener_direccion()
         
-        try:
-            destino_idx = self.indice_entrada(jugador, valor_dado)
-        except ValueError as e:
-            return False, str(e)
+        if not 1 <= valor_dado <= 6:
+            return RECHAZOS[MotivoRechazo.DADO_INVALIDO]
+        destino_idx = self.indice_entrada(jugador, valor_dado)
         
         # Validar que el destino esté dentro del tablero
         if self._es_fuera(destino_idx):
-            return False, "movimiento fuera del tablero"
+            return RECHAZOS[MotivoRechazo.FUERA_DEL_TABLERO]
         
         posiciones = self.__tablero__.obtener_posiciones()
         valor_destino = posiciones[destino_idx]
         
         # Validar que no esté bloqueado
         if self._destino_bloqueado(valor_destino, jugador):
-            return False, "posición de entrada bloqueada"
+            return RECHAZOS[MotivoRechazo.ENTRADA_BLOQUEADA]
         
-        return True, ""
+        return VALIDO
 
     def indice_entrada(self, jugador: int, valor_dado: int) -> int:
         """
@@ -99,12 +99,12 @@ class ValidadorMovimientos:
             ValueError: Si valor_dado no está en el rango 1..6.
         """
         if not 1 <= valor_dado <= 6:
-            raise ValueError("dado inválido (1..6)")
+            raise ValueError(MotivoRechazo.DADO_INVALIDO.value)
         return valor_dado - 1 if jugador == 1 else CASILLEROS - valor_dado
 
     # ========== MÉTODOS PRIVADOS ==========
 
-    def _validar_bear_off(self, origen: int, valor_dado: int, jugador: int) -> tuple[bool, str]:
+    def _validar_bear_off(self, origen: int, valor_dado: int, jugador: int) -> ResultadoValidacion:
         """
         Valida si un bear-off es legal.
         
@@ -114,11 +114,11 @@ class ValidadorMovimientos:
             jugador (int): 1 para blancas, -1 para negras
         
         Returns:
-            tuple[bool, str]: (es_valido, mensaje_error)
+            ResultadoValidacion: (es_valido, motivo)
         """
         # 1. Verificar que todas las fichas estén en home
         if not self._todas_en_home(jugador):
-            return False, "no todas las fichas están en home"
+            return RECHAZOS[MotivoRechazo.NO_TODAS_EN_HOME]
         
         posiciones = self.__tablero__.obtener_posiciones()
         
@@ -127,18 +127,18 @@ class ValidadorMovimientos:
         
         # 3. Valor insuficiente
         if valor_dado < needed:
-            return False, "valor insuficiente para sacar la ficha"
+            return RECHAZOS[MotivoRechazo.VALOR_INSUFICIENTE]
         
         # 4. Overshoot: solo permitido si no hay fichas más adelantadas
         if valor_dado > needed:
             if jugador == 1:
                 if any(posiciones[i] > 0 for i in range(origen + 1, CASILLEROS)):
-                    return False, "debe mover ficha más adelantada"
+                    return RECHAZOS[MotivoRechazo.FICHA_MAS_ADELANTADA]
             else:
                 if any(posiciones[i] < 0 for i in range(0, origen)):
-                    return False, "debe mover ficha más adelantada"
+                    return RECHAZOS[MotivoRechazo.FICHA_MAS_ADELANTADA]
         
-        return True, ""
+        return VALIDO
 
     def _todas_en_home(self, jugador: int) -> bool:
         """
@@ -150,11 +150,7 @@ class ValidadorMovimientos:
         Returns:
             bool: True si todas las fichas están en home, False en caso contrario
         """
-        pos = self.__tablero__.obtener_posiciones()
-        if jugador == 1:  # blancas: home 18..23
-            return all(x <= 0 for x in pos[:18])
-        else:  # negras: home 0..5
-            return all(x >= 0 for x in pos[6:])
+        return self.__tablero__.todas_en_home("blancas" if jugador == 1 else "negras")
 
     def _origen_valido(self, posiciones: list[int], origen_idx: int, jugador: int) -> bool:
         """
@@ -0,0 +1,170 @@
+from source.constantes import CASILLEROS
+
+MASCARA_64 = (1 << 64) - 1
+MAX_FICHAS = 15
+
+
+def _splitmix64(x: int) -> int:
+    """
+    Mezcla un entero en un valor pseudoaleatorio de 64 bits (SplitMix64).
+
+    Args:
+        x (int): Valor de entrada.
+
+    Returns:
+        int: Entero de 64 bits bien distribuido.
+    """
+    x = (x + 0x9E3779B97F4A7C15) & MASCARA_64
+    x = ((x ^ (x >> 30)) * 0xBF58476D1CE4E5B9) & MASCARA_64
+    x = ((x ^ (x >> 27)) * 0x94D049BB133111EB) & MASCARA_64
+    return x ^ (x >> 31)
+
+
+class Zobrist:
+    """
+    Responsabilidad: Proveer las claves aleatorias de 64 bits para el hashing Zobrist de posiciones.
+    SRP: Solo genera claves y calcula hashes completos; no conoce el flujo del juego.
+    Justificación: El hash Zobrist es el XOR de una clave por cada componente del estado
+                   (valor de cada casillero, barra, fichas fuera y turno). Un cambio de un
+                   componente se refleja con dos XOR, lo que permite a EjecutorMovimientos
+                   mantener el hash en O(1) por movimiento en lugar de recorrer el tablero.
+    """
+
+    # Desplazamientos de las "ranuras" usadas para derivar claves
+    __RANURA_BARRA__ = CASILLEROS
+    __RANURA_FUERA__ = CASILLEROS + 2
+    __RANURA_TURNO__ = CASILLEROS + 4
+
+    def __init__(self, semilla: int = 0x5EED_BAC6):
+        """
+        Inicializa las tablas de claves de forma determinística.
+
+        Funcionamiento: Deriva cada clave con SplitMix64 a partir de la semilla, de modo
+        que el mismo hash se obtenga en cualquier proceso o ejecución.
+
+        Args:
+            semilla (int): Semilla de generación de claves.
+
+        Atributos privados:
+            __semilla__: int - Semilla usada para derivar claves.
+            __casilleros__: list[list[int]] - Clave por casillero y valor con signo (-15..15).
+            __barra__: dict - Clave por color y cantidad de fichas en barra (0..15).
+            __fuera__: dict - Clave por color y cantidad de fichas fuera (0..15).
+            __turno__: int - Clave que se aplica cuando mueven las negras.
+        """
+        self.__semilla__ = semilla
+        rango = range(-MAX_FICHAS, MAX_FICHAS + 1)
+        self.__casilleros__ = [
+            [self._derivar(idx, valor) if valor != 0 else 0 for valor in rango]
+            for idx in range(CASILLEROS)
+        ]
+        self.__barra__ = {
+            color: [self._derivar(Zobrist.__RANURA_BARRA__ + i, n) if n else 0
+                    for n in range(MAX_FICHAS + 1)]
+            for i, color in enumerate(('blancas', 'negras'))
+        }
+        self.__fuera__ = {
+            color: [self._derivar(Zobrist.__RANURA_FUERA__ + i, n) if n else 0
+                    for n in range(MAX_FICHAS + 1)]
+            for i, color in enumerate(('blancas', 'negras'))
+        }
+        self.__turno__ = self._derivar(Zobrist.__RANURA_TURNO__, 1)
+
+    def clave_casillero(self, idx: int, valor: int) -> int:
+        """
+        Retorna la clave de un casillero con un valor dado (0 si está vacío).
+
+        Args:
+            idx (int): Índice 0-based del casillero.
+            valor (int): Valor con signo del casillero.
+
+        Returns:
+            int: Clave de 64 bits.
+        """
+        if -MAX_FICHAS <= valor <= MAX_FICHAS:
+            return self.__casilleros__[idx][valor + MAX_FICHAS]
+        return self._derivar(idx, valor)
+
+    def clave_barra(self, color: str, cantidad: int) -> int:
+        """
+        Retorna la clave de la barra de un color con una cantidad dada.
+
+        Args:
+            color (str): 'blancas' o 'negras'.
+            cantidad (int): Fichas en la barra.
+
+        Returns:
+            int: Clave de 64 bits.
+        """
+        if 0 <= cantidad <= MAX_FICHAS:
+            return self.__barra__[color][cantidad]
+        return self._derivar(Zobrist.__RANURA_BARRA__ + (color == 'negras'), cantidad)
+
+    def clave_fuera(self, color: str, cantidad: int) -> int:
+        """
+        Retorna la clave de fichas fuera de un color con una cantidad dada.
+
+        Args:
+            color (str): 'blancas' o 'negras'.
+            cantidad (int): Fichas fuera del tablero.
+
+        Returns:
+            int: Clave de 64 bits.
+        """
+        if 0 <= cantidad <= MAX_FICHAS:
+            return self.__fuera__[color][cantidad]
+        return self._derivar(Zobrist.__RANURA_FUERA__ + (color == 'negras'), cantidad)
+
+    def clave_turno(self, direccion: int) -> int:
+        """
+        Retorna la clave del jugador que mueve.
+
+        Args:
+            direccion (int): 1 para blancas, -1 para negras.
+
+        Returns:
+            int: Clave de 64 bits (0 para blancas).
+        """
+        return self.__turno__ if direccion == -1 else 0
+
+    def calcular(self, posiciones, barra: dict, fichas_fuera: dict, direccion: int = 1) -> int:
+        """
+        Calcula el hash completo de una posición desde cero.
+
+        Funcionamiento: XOR de las claves de los 24 casilleros, la barra, las fichas
+        fuera y el turno. Se usa para inicializar o resincronizar el hash incremental.
+
+        Args:
+            posiciones (Sequence[int]): 24 valores con signo.
+            barra (dict): {'blancas': int, 'negras': int}.
+            fichas_fuera (dict): {'blancas': int, 'negras': int}.
+            direccion (int): 1 si mueven blancas, -1 si mueven negras.
+
+        Returns:
+            int: Hash de 64 bits.
+        """
+        clave = 0
+        for idx, valor in enumerate(posiciones):
+            clave ^= self.clave_casillero(idx, valor)
+        for color in ('blancas', 'negras'):
+            clave ^= self.clave_barra(color, barra[color])
+            clave ^= self.clave_fuera(color, fichas_fuera[color])
+        return clave ^ self.clave_turno(direccion)
+
+    # ========== MÉTODOS PRIVADOS ==========
+
+    def _derivar(self, ranura: int, valor: int) -> int:
+        """
+        Deriva la clave de una ranura (componente del estado) y un valor.
+
+        Args:
+            ranura (int): Identificador del componente (casillero, barra, fuera, turno).
+            valor (int): Valor del componente.
+
+        Returns:
+            int: Clave de 64 bits distinta de cero.
+        """
+        return _splitmix64(self.__semilla__ ^ _splitmix64((ranura << 16) ^ (valor & 0xFFFF))) or 1
+
+
+ZOBRIST = Zobrist()
@@ -0,0 +1,166 @@
+import os
+import sqlite3
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from source.almacen_posiciones import AlmacenPosiciones, Analisis
+from source.backgammon import Backgammon
+from source.motor_busqueda import MotorBusqueda
+
+ID_INICIAL = '4HPwATDgc/ABMA'
+JUGADA = ((13, 10, 3), (24, 23, 1))
+
+
+class TestAlmacenPosiciones(unittest.TestCase):
+    """Tests para el almacén SQLite de análisis de posiciones"""
+
+    def setUp(self):
+        self.almacen = AlmacenPosiciones()
+
+    def tearDown(self):
+        self.almacen.cerrar()
+
+    def test_busqueda_vacia(self):
+        """Verifica que un almacén nuevo no tiene análisis"""
+        self.assertIsNone(self.almacen.buscar(ID_INICIAL, (3, 1)))
+        self.assertEqual(len(self.almacen), 0)
+
+    def test_guardar_y_buscar(self):
+        """Verifica que un análisis guardado se recupera completo"""
+        self.almacen.guardar(ID_INICIAL, (3, 1), JUGADA, 0.25, 2)
+        self.assertEqual(self.almacen.buscar(ID_INICIAL, (3, 1)), Analisis(JUGADA, 0.25, 2))
+
+    def test_orden_de_los_dados_indistinto(self):
+        """Verifica que la clave no depende del orden de los dados"""
+        self.almacen.guardar(ID_INICIAL, (1, 3), JUGADA, 0.25, 2)
+        self.assertIsNotNone(self.almacen.buscar(ID_INICIAL, (3, 1)))
+        self.almacen.guardar(ID_INICIAL, [4, 4, 4, 4], (), 0.5, 1)
+        self.assertEqual(self.almacen.buscar(ID_INICIAL, [4, 4, 4, 4]).equidad, 0.5)
+
+    def test_la_cantidad_de_dados_pendientes_importa(self):
+        """Verifica que distintos dados pendientes del mismo valor no comparten entrada"""
+        self.almacen.guardar(ID_INICIAL, [5], ((13, 8, 5),), 0.1, 1)
+        self.assertIsNone(self.almacen.buscar(ID_INICIAL, [5, 5, 5, 5]))
+        self.assertIsNone(self.almacen.buscar(ID_INICIAL, [5, 5]))
+        self.almacen.guardar(ID_INICIAL, [6], ((24, 18, 6),), 0.1, 1)
+        self.assertIsNone(self.almacen.buscar(ID_INICIAL, [6, 6]))
+
+    def test_descarta_tablas_de_otra_version(self):
+        """Verifica que al abrir se descarta una tabla de una versión anterior del esquema"""
+        with tempfile.TemporaryDirectory() as directorio:
+            ruta = os.path.join(directorio, 'viejo.db')
+            conexion = sqlite3.connect(ruta)
+            conexion.execute("CREATE TABLE analisis (id_posicion TEXT, dado1 INTEGER, dado2 INTEGER,"
+                             " jugada TEXT, equidad REAL, profundidad INTEGER)")
+            conexion.execute("INSERT INTO analisis VALUES (?, 5, 5, '13/8/5', 0.1, 1)", (ID_INICIAL,))
+            conexion.commit()
+            conexion.close()
+            with AlmacenPosiciones(ruta) as almacen:
+                self.assertEqual(len(almacen), 0)
+                almacen.guardar(ID_INICIAL, (3, 1), JUGADA, 0.25, 2)
+                self.assertEqual(almacen.buscar(ID_INICIAL, (3, 1)).jugada, JUGADA)
+
+    def test_no_reemplaza_un_analisis_mas_profundo(self):
+        """Verifica que solo un análisis de mayor profundidad reemplaza al guardado"""
+        self.almacen.guardar(ID_INICIAL, (3, 1), JUGADA, 0.25, 2)
+        self.almacen.guardar(ID_INICIAL, (3, 1), ((8, 5, 3), (6, 5, 1)), 0.1, 1)
+        self.assertEqual(self.almacen.buscar(ID_INICIAL, (3, 1)).jugada, JUGADA)
+        self.almacen.guardar(ID_INICIAL, (3, 1), ((8, 5, 3), (6, 5, 1)), 0.3, 3)
+        self.assertEqual(self.almacen.buscar(ID_INICIAL, (3, 1)).profundidad, 3)
+
+    def test_guardar_invalida_el_cache(self):
+        """Verifica que guardar no deja en el cache una búsqueda fallida anterior"""
+        self.assertIsNone(self.almacen.buscar(ID_INICIAL, (3, 1)))
+        self.almacen.guardar(ID_INICIAL, (3, 1), JUGADA, 0.25, 2)
+        self.assertIsNotNone(self.almacen.buscar(ID_INICIAL, (3, 1)))
+
+    def test_cache_en_memoria(self):
+        """Verifica que la segunda búsqueda se resuelve desde el cache en memoria"""
+        self.almacen.guardar(ID_INICIAL, (3, 1), JUGADA, 0.25, 2)
+        self.almacen.buscar(ID_INICIAL, (3, 1))
+        self.almacen.buscar(ID_INICIAL, (3, 1))
+        self.assertEqual(self.almacen.obtener_estadisticas()['aciertos'], 1)
+
+    def test_guardar_lote(self):
+        """Verifica que guardar_lote inserta todas las filas"""
+        filas = [(ID_INICIAL, (d, 1), ((24, 24 - d, d),), d / 10, 1) for d in range(2, 7)]
+        self.assertEqual(self.almacen.guardar_lote(filas), 5)
+        self.assertEqual(len(self.almacen), 5)
+        self.assertEqual(self.almacen.buscar(ID_INICIAL, (1, 6)).jugada, ((24, 18, 6),))
+
+    def test_barra_y_bear_off(self):
+        """Verifica que se guardan jugadas desde la barra y de bear-off"""
+        jugada = ((0, 22, 3), (3, -1, 3))
+        self.almacen.guardar(ID_INICIAL, (3, 3), jugada, -0.5, 1)
+        self.assertEqual(self.almacen.buscar(ID_INICIAL, (3, 3)).jugada, jugada)
+
+    def test_persistencia_en_archivo(self):
+        """Verifica que los análisis persisten al reabrir el archivo"""
+        with tempfile.TemporaryDirectory() as directorio:
+            ruta = os.path.join(directorio, 'posiciones.db')
+            with AlmacenPosiciones(ruta) as almacen:
+                almacen.guardar(ID_INICIAL, (3, 1), JUGADA, 0.25, 2)
+            with AlmacenPosiciones(ruta) as almacen:
+                self.assertEqual(almacen.buscar(ID_INICIAL, (3, 1)), Analisis(JUGADA, 0.25, 2))
+
+
+class TestMotorConAlmacen(unittest.TestCase):
+    """Tests de la integración de MotorBusqueda con el almacén"""
+
+    def setUp(self):
+        self.almacen = AlmacenPosiciones()
+        self.juego = Backgammon()
+        with patch.object(self.juego.__dados__, 'tirar', return_value=(3, 1)):
+            self.juego.tirar_dados()
+
+    def tearDown(self):
+        self.almacen.cerrar()
+
+    def test_guarda_el_resultado_de_la_busqueda(self):
+        """Verifica que el motor guarda la jugada que eligió"""
+        jugada = MotorBusqueda(profundidad=1, almacen=self.almacen).elegir_jugada(self.juego)
+        analisis = self.almacen.buscar(self.juego.obtener_id_posicion(), (3, 1))
+        self.assertEqual(analisis.jugada, jugada)
+        self.assertEqual(analisis.profundidad, 1)
+
+    def test_consulta_el_almacen_antes_de_buscar(self):
+        """Verifica que el motor usa un análisis guardado suficientemente profundo sin buscar"""
+        jugada = self.juego.obtener_jugadas_posibles()[-1]
+        self.almacen.guardar(self.juego.obtener_id_posicion(), (3, 1), jugada, 1.0, 5)
+        evaluador = lambda tablero: self.fail("no debería buscar")
+        motor = MotorBusqueda(profundidad=2, evaluador=evaluador, almacen=self.almacen)
+        self.assertEqual(motor.elegir_jugada(self.juego), jugada)
+
+    def test_ignora_analisis_menos_profundos(self):
+        """Verifica que un análisis menos profundo se recalcula y se reemplaza"""
+        jugada = self.juego.obtener_jugadas_posibles()[-1]
+        self.almacen.guardar(self.juego.obtener_id_posicion(), (3, 1), jugada, 1.0, 0)
+        llamadas = []
+        evaluador = lambda tablero: llamadas.append(1) or 0.0
+        MotorBusqueda(profundidad=1, evaluador=evaluador, almacen=self.almacen).elegir_jugada(self.juego)
+        self.assertTrue(llamadas)
+        self.assertEqual(self.almacen.buscar(self.juego.obtener_id_posicion(), (3, 1)).profundidad, 1)
+
+    def test_no_usa_la_jugada_de_otros_dados_pendientes(self):
+        """Verifica que la jugada de un solo dado no se reutiliza para un doble"""
+        motor = MotorBusqueda(profundidad=1, almacen=self.almacen)
+        tablero = self.juego.__tablero__
+        gestor = self.juego.__gestor_turnos__
+        ejecutor = self.juego.__ejecutor__
+        analizador = self.juego.__analizador__
+        una = motor.buscar([5], tablero, gestor, ejecutor, analizador)
+        self.assertEqual(len(una), 1)
+        cuatro = motor.buscar([5, 5, 5, 5], tablero, gestor, ejecutor, analizador)
+        self.assertEqual(len(cuatro), 4)
+        self.assertIn(cuatro, analizador.generar_jugadas([5, 5, 5, 5]))
+
+    def test_ignora_jugadas_ilegales_almacenadas(self):
+        """Verifica que una jugada guardada que no es legal con estos dados se descarta y se busca"""
+        id_actual = self.juego.obtener_id_posicion()
+        self.almacen.guardar(id_actual, (3, 1), ((13, 8, 5),), 1.0, 5)
+        motor = MotorBusqueda(profundidad=1, almacen=self.almacen)
+        self.assertIn(motor.elegir_jugada(self.juego), self.juego.obtener_jugadas_posibles())
+
+if __name__ == '__main__':
+    unittest.main()
@@ -120,6 +120,18 @@ class TestAnalizadorPuedeUsarAmbos(unittest.TestCase):
             resultado = self.analizador.puede_usar_ambos_dados(3, 5)
             self.assertFalse(resultado)
 
+    def test_puede_usar_ambos_con_otro_primer_movimiento(self):
+        """Verifica que no se limite al primer movimiento encontrado"""
+        pos = self.tablero._obtener_posiciones_ref()
+        for i in range(24):
+            pos[i] = 0
+        pos[16], pos[19] = 1, 1
+        pos[17], pos[20] = -2, -2
+        # 16->19 con el 3 bloquea el 1; 19->22->23 usa ambos
+        self.assertTrue(self.analizador.puede_usar_ambos_dados(3, 1))
+        self.assertFalse(self.analizador.debe_usar_dado_mayor([3, 1]))
+        self.assertEqual(self.tablero.obtener_posiciones()[16:21], [1, -2, 0, 1, -2])
+
 
 class TestAnalizadorDebeUsarDadoMayor(unittest.TestCase):
     """Tests para debe_usar_dado_mayor"""
@@ -369,19 +381,51 @@ class TestAnalizadorEjecucionesSimuladas(unittest.TestCase):
         self.assertEqual(pos[3], 1)
         self.assertEqual(barra['negras'], 1)
     
-    def test_restaurar_estado(self):
-        """Verifica restauración de estado"""
+    def test_deshacer_simulacion_sin_simulacion(self):
+        """Verifica que sin simulación previa no cambie el estado"""
+        antes = self.tablero.obtener_posiciones()
+        self.analizador._deshacer_simulacion()
+        self.assertEqual(self.tablero.obtener_posiciones(), antes)
+
+    def test_deshacer_simulacion_movimiento_con_captura(self):
+        """Verifica que se revierta una captura simulada"""
         pos = self.tablero._obtener_posiciones_ref()
-        barra = self.tablero._obtener_barra_ref()
-        
-        pos_backup = [1, 2, 3] + [0] * 21
-        barra_backup = {'blancas': 2, 'negras': 3}
-        
-        self.analizador._restaurar_estado(pos_backup, barra_backup)
-        
-        self.assertEqual(pos[:3], [1, 2, 3])
-        self.assertEqual(barra['blancas'], 2)
-        self.assertEqual(barra['negras'], 3)
+        for i in range(24):
+            pos[i] = 0
+        pos[0] = 2
+        pos[3] = -1
+        pos_inicial = self.tablero.obtener_posiciones()
+
+        self.assertTrue(self.analizador._simular_mejor_movimiento(3))
+        self.assertEqual(self.tablero.obtener_barra()['negras'], 1)
+
+        self.analizador._deshacer_simulacion()
+        self.assertEqual(self.tablero.obtener_posiciones(), pos_inicial)
+        self.assertEqual(self.tablero.obtener_barra(), {'blancas': 0, 'negras': 0})
+
+    def test_deshacer_simulacion_entrada_barra(self):
+        """Verifica que se revierta una entrada simulada desde barra"""
+        self.tablero._obtener_barra_ref()['blancas'] = 1
+        pos_inicial = self.tablero.obtener_posiciones()
+
+        self.assertTrue(self.analizador._simular_mejor_movimiento(3))
+        self.analizador._deshacer_simulacion()
+
+        self.assertEqual(self.tablero.obtener_posiciones(), pos_inicial)
+        self.assertEqual(self.tablero.obtener_barra(), {'blancas': 1, 'negras': 0})
+
+    def test_deshacer_simulacion_bear_off(self):
+        """Verifica que se revierta un bear-off simulado"""
+        pos = self.tablero._obtener_posiciones_ref()
+        for i in range(24):
+            pos[i] = 0
+        pos[22] = 2
+        pos_inicial = self.tablero.obtener_posiciones()
+
+        self.assertTrue(self.analizador._simular_mejor_movimiento(2))
+        self.analizador._deshacer_simulacion()
+
+        self.assertEqual(self.tablero.obtener_posiciones(), pos_inicial)
 
 
 class TestAnalizadorMetodosAuxiliares(unittest.TestCase):
@@ -585,5 +629,111 @@ class TestAnalizadorMetodosAuxiliares(unittest.TestCase):
         self.assertEqual(self.analizador._calcular_indice_entrada(-1, 6), 18)
 
 
+class TestAnalizadorGenerarJugadas(unittest.TestCase):
+    """Tests para generar_jugadas"""
+
+    def setUp(self):
+        self.tablero = Tablero()
+        self.gestor = GestorTurnos()
+        self.analizador = AnalizadorPosibilidades(self.tablero, self.gestor)
+        self.pos = self.tablero._obtener_posiciones_ref()
+
+    def _vaciar(self):
+        for i in range(24):
+            self.pos[i] = 0
+
+    def test_generar_jugadas_apertura_sin_dobles(self):
+        """Verifica la cantidad de jugadas distintas para un 3-1 inicial"""
+        jugadas = self.analizador.generar_jugadas([3, 1])
+        self.assertEqual(len(jugadas), 16)
+        for jugada in jugadas:
+            self.assertEqual(len(jugada), 2)
+            self.assertEqual(sorted(paso[2] for paso in jugada), [1, 3])
+
+    def test_generar_jugadas_colapsa_duplicados(self):
+        """Verifica que órdenes distintos con igual resultado aparezcan una vez"""
+        self._vaciar()
+        self.pos[0] = 1
+        self.pos[23] = -2
+        jugadas = self.analizador.generar_jugadas([1, 2])
+        self.assertEqual(len(jugadas), 1)
+        self.assertEqual(jugadas[0][-1][1], 3)
+
+    def test_generar_jugadas_dobles_usa_cuatro_dados(self):
+        """Verifica que con dobles las jugadas consuman cuatro dados"""
+        jugadas = self.analizador.generar_jugadas([6, 6, 6, 6])
+        self.assertTrue(jugadas)
+        self.assertTrue(all(len(jugada) == 4 for jugada in jugadas))
+
+    def test_generar_jugadas_ultima_ficha_usa_dado_mayor(self):
+        """Verifica que al sacar la última ficha se conserve la jugada con el dado mayor"""
+        self._vaciar()
+        self.pos[23] = 1
+        self.pos[0] = -15
+        self.tablero._obtener_fichas_fuera_ref()['blancas'] = 14
+        self.assertEqual(self.analizador.generar_jugadas([1, 4]), [((23, None, 4),)])
+
+    def test_generar_jugadas_no_modifica_tablero(self):
+        """Verifica que la enumeración no altere el estado real"""
+        antes = self.tablero.obtener_posiciones()
+        self.analizador.generar_jugadas([5, 5, 5, 5])
+        self.assertEqual(self.tablero.obtener_posiciones(), antes)
+        self.assertEqual(self.tablero.obtener_barra(), {'blancas': 0, 'negras': 0})
+
+    def test_generar_jugadas_entrada_barra_con_captura(self):
+        """Verifica entrada obligatoria desde barra capturando un blot"""
+        self._vaciar()
+        self.pos[10] = 1
+        self.pos[2] = -1
+        self.pos[3] = -2
+        self.tablero._obtener_barra_ref()['blancas'] = 1
+        jugadas = self.analizador.generar_jugadas([3, 4])
+        self.assertTrue(jugadas)
+        for jugada in jugadas:
+            self.assertEqual(jugada[0], (None, 2, 3))
+
+    def test_generar_jugadas_barra_bloqueada(self):
+        """Verifica que sin entrada posible la jugada sea vacía"""
+        self._vaciar()
+        self.pos[10] = 1
+        self.pos[2] = -2
+        self.pos[3] = -2
+        self.tablero._obtener_barra_ref()['blancas'] = 1
+        self.assertEqual(self.analizador.generar_jugadas([3, 4]), [()])
+
+    def test_generar_jugadas_bear_off(self):
+        """Verifica que se generen bear-offs cuando todas están en home"""
+        self._vaciar()
+        self.pos[22] = 1
+        self.pos[23] = 1
+        jugadas = self.analizador.generar_jugadas([2, 1])
+        self.assertEqual(len(jugadas), 2)
+        self.assertTrue(any(all(paso[1] is None for paso in jugada) for jugada in jugadas))
+
+    def test_generar_jugadas_obliga_dado_mayor(self):
+        """Verifica que si solo se puede usar un dado se use el mayor"""
+        self._vaciar()
+        self.pos[0] = 1
+        # Con 2 llega a 2 y el 3 queda bloqueado en 5; con 3 llega a 3 y el 2 también
+        # queda bloqueado en 5: solo se puede usar un dado y debe ser el 3
+        self.pos[4] = -2
+        self.pos[5] = -2
+        self.pos[6] = -2
+        self.pos[8] = -2
+        self.pos[9] = -2
+        jugadas = self.analizador.generar_jugadas([2, 3])
+        self.assertEqual(jugadas, [((0, 3, 3),)])
+
+    def test_generar_jugadas_negras(self):
+        """Verifica generación para negras (dirección negativa)"""
+        self.gestor.cambiar_turno()
+        self._vaciar()
+        self.pos[23] = -1
+        self.pos[0] = 2
+        jugadas = self.analizador.generar_jugadas([6, 5])
+        self.assertEqual(len(jugadas), 1)
+        self.assertEqual(jugadas[0][-1][1], 12)
+
+
 if __name__ == '__main__':
     unittest.main(verbosity=2) 
\ No newline at end of file
@@ -1,6 +1,8 @@
 import unittest
 from unittest.mock import patch, MagicMock
 from source.backgammon import Backgammon
+from source.dados import Dados
+from source.cache_jugadas import CacheJugadas
 from source.excepciones import (
     DadoNoDisponibleError,
     OrigenInvalidoError,
@@ -8,6 +10,7 @@ from source.excepciones import (
     BearOffInvalidoError,
     MovimientoInvalidoError
 )
+from source.resultado_validacion import MotivoRechazo
 
 
 class TestBackgammonInicializacion(unittest.TestCase):
@@ -175,6 +178,32 @@ class TestBackgammonConsultasEstado(unittest.TestCase):
             self.assertTrue(resultado)
 
 
+class TestBackgammonPipsYHome(unittest.TestCase):
+    """Tests para las consultas de pips y home"""
+
+    def test_pips_iniciales(self):
+        """Verifica los 167 pips de cada color al comenzar"""
+        self.assertEqual(Backgammon().obtener_pips(), {'blancas': 167, 'negras': 167})
+
+    def test_pips_tras_mover(self):
+        """Verifica que mover 3 puntos descuenta 3 pips solo al jugador que movió"""
+        juego = Backgammon(dados=Dados(tiradas=[(3, 1)]))
+        juego.tirar_dados()
+        juego.mover(1, 3)
+        self.assertEqual(juego.obtener_pips(), {'blancas': 164, 'negras': 167})
+
+    def test_todas_en_home(self):
+        """Verifica todas_en_home para el turno actual y para un color indicado"""
+        juego = Backgammon()
+        self.assertFalse(juego.todas_en_home())
+        pos = juego.__tablero__._obtener_posiciones_ref()
+        for i in range(18):
+            if pos[i] > 0:
+                pos[i] = 0
+        self.assertTrue(juego.todas_en_home('blancas'))
+        self.assertFalse(juego.todas_en_home('negras'))
+
+
 class TestBackgammonTiradaDados(unittest.TestCase):
     """Tests para tirada de dados"""
 
@@ -214,6 +243,14 @@ class TestBackgammonTiradaDados(unittest.TestCase):
             self.assertEqual(len(movimientos), 4)
             self.assertEqual(movimientos, [4, 4, 4, 4])
 
+    def test_tirar_dados_inyectados(self):
+        """Verifica que se usen los dados inyectados (modo replay)"""
+        juego = Backgammon(dados=Dados(tiradas=[(2, 6), (5, 5)]))
+        self.assertEqual(juego.tirar_dados(), (2, 6))
+        juego.finalizar_tirada()
+        self.assertEqual(juego.tirar_dados(), (5, 5))
+        self.assertEqual(juego.obtener_movimientos_pendientes(), [5, 5, 5, 5])
+
 
 class TestBackgammonCambioTurno(unittest.TestCase):
     """Tests para gestión de turnos"""
@@ -316,7 +353,7 @@ class TestBackgammonValidarDadoMayor(unittest.TestCase):
 
 
 class TestBackgammonExcepciones(unittest.TestCase):
-    """Tests para mapeo de excepciones"""
+    """Tests para mapeo de códigos de rechazo a excepciones"""
 
     def setUp(self):
         self.juego = Backgammon()
@@ -324,63 +361,51 @@ class TestBackgammonExcepciones(unittest.TestCase):
     def test_excepcion_origen_invalido(self):
         """Verifica OrigenInvalidoError"""
         with self.assertRaises(OrigenInvalidoError):
-            self.juego._lanzar_excepcion_apropiada("origen sin fichas")
+            self.juego._lanzar_excepcion_apropiada(MotivoRechazo.ORIGEN_INVALIDO)
 
     def test_excepcion_destino_bloqueado(self):
-        """Verifica DestinoBloquedoError con 'bloqueada'"""
+        """Verifica DestinoBloquedoError por destino bloqueado"""
         with self.assertRaises(DestinoBloquedoError):
-            self.juego._lanzar_excepcion_apropiada("posición bloqueada")
+            self.juego._lanzar_excepcion_apropiada(MotivoRechazo.DESTINO_BLOQUEADO)
 
-    def test_excepcion_destino_bloqueado_variante(self):
-        """Verifica DestinoBloquedoError con 'bloqueado'"""
+    def test_excepcion_entrada_bloqueada(self):
+        """Verifica DestinoBloquedoError por entrada bloqueada"""
         with self.assertRaises(DestinoBloquedoError):
-            self.juego._lanzar_excepcion_apropiada("destino bloqueado")
+            self.juego._lanzar_excepcion_apropiada(MotivoRechazo.ENTRADA_BLOQUEADA)
 
-    def test_excepcion_bearoff_home(self):
-        """Verifica BearOffInvalidoError por home"""
-        with self.assertRaises(BearOffInvalidoError):
-            self.juego._lanzar_excepcion_apropiada("no todas en home")
-
-    def test_excepcion_bearoff_insuficiente(self):
-        """Verifica BearOffInvalidoError por dado insuficiente"""
-        with self.assertRaises(BearOffInvalidoError):
-            self.juego._lanzar_excepcion_apropiada("dado insuficiente")
-
-    def test_excepcion_bearoff_adelantada(self):
-        """Verifica BearOffInvalidoError por ficha adelantada"""
-        with self.assertRaises(BearOffInvalidoError):
-            self.juego._lanzar_excepcion_apropiada("ficha adelantada")
+    def test_excepcion_bearoff_todas_variantes(self):
+        """Verifica BearOffInvalidoError para todos los rechazos de bear-off"""
+        for motivo in (MotivoRechazo.NO_TODAS_EN_HOME, MotivoRechazo.VALOR_INSUFICIENTE,
+                       MotivoRechazo.FICHA_MAS_ADELANTADA):
+            with self.assertRaises(BearOffInvalidoError):
+                self.juego._lanzar_excepcion_apropiada(motivo)
 
     def test_excepcion_movimiento_fuera_tablero(self):
         """Verifica MovimientoInvalidoError para movimiento fuera"""
-        with self.assertRaises(MovimientoInvalidoError):
-            self.juego._lanzar_excepcion_apropiada("movimiento fuera del tablero")
+        with self.assertRaises(MovimientoInvalidoError) as ctx:
+            self.juego._lanzar_excepcion_apropiada(MotivoRechazo.FUERA_DEL_TABLERO)
+        self.assertNotIsInstance(ctx.exception, DestinoBloquedoError)
 
     def test_excepcion_generica(self):
-        """Verifica MovimientoInvalidoError para errores desconocidos"""
-        with self.assertRaises(MovimientoInvalidoError):
+        """Verifica MovimientoInvalidoError para textos que no son un código"""
+        with self.assertRaises(MovimientoInvalidoError) as ctx:
             self.juego._lanzar_excepcion_apropiada("error desconocido")
-
-    def test_excepcion_origen_con_mayuscula(self):
-        """Verifica OrigenInvalidoError con mayúscula"""
-        with self.assertRaises(OrigenInvalidoError):
-            self.juego._lanzar_excepcion_apropiada("Origen sin fichas")
-
-    def test_excepcion_bearoff_todas_variantes(self):
-        """Verifica BearOffInvalidoError con todas las palabras clave"""
-        with self.assertRaises(BearOffInvalidoError):
-            self.juego._lanzar_excepcion_apropiada("no en home")
-        
-        with self.assertRaises(BearOffInvalidoError):
-            self.juego._lanzar_excepcion_apropiada("valor insuficiente")
-        
-        with self.assertRaises(BearOffInvalidoError):
-            self.juego._lanzar_excepcion_apropiada("ficha más adelantada")
-
-    def test_excepcion_movimiento_con_tablero_mayuscula(self):
-        """Verifica MovimientoInvalidoError con 'Tablero'"""
-        with self.assertRaises(MovimientoInvalidoError):
-            self.juego._lanzar_excepcion_apropiada("fuera del Tablero")
+        self.assertIs(type(ctx.exception), MovimientoInvalidoError)
+
+    def test_excepcion_lleva_codigo_y_texto(self):
+        """Verifica que la excepción exponga el código y el texto para mostrar"""
+        with self.assertRaises(OrigenInvalidoError) as ctx:
+            self.juego._lanzar_excepcion_apropiada(MotivoRechazo.ORIGEN_INVALIDO)
+        self.assertIs(ctx.exception.motivo, MotivoRechazo.ORIGEN_INVALIDO)
+        self.assertEqual(str(ctx.exception), "origen inválido o sin fichas propias")
+
+    def test_mover_real_lanza_codigo(self):
+        """Verifica el código adjunto a un rechazo real de mover"""
+        with patch.object(self.juego.__dados__, 'tirar', return_value=(5, 3)):
+            self.juego.tirar_dados()
+        with self.assertRaises(DestinoBloquedoError) as ctx:
+            self.juego.mover(1, 5)
+        self.assertIs(ctx.exception.motivo, MotivoRechazo.DESTINO_BLOQUEADO)
 
 
 class TestBackgammonMoverDesdeBarra(unittest.TestCase):
@@ -405,7 +430,7 @@ class TestBackgammonMoverDesdeBarra(unittest.TestCase):
         self.juego.__movimientos_pendientes__ = [3, 5]
         
         with patch.object(self.juego.__validador__, 'validar_entrada_barra', 
-                         return_value=(False, "posición bloqueada")):
+                         return_value=(False, MotivoRechazo.DESTINO_BLOQUEADO)):
             with self.assertRaises(DestinoBloquedoError):
                 self.juego._mover_desde_barra(3)
 
@@ -414,7 +439,7 @@ class TestBackgammonMoverDesdeBarra(unittest.TestCase):
         self.juego.__movimientos_pendientes__ = [3, 5]
         
         with patch.object(self.juego.__validador__, 'validar_entrada_barra', 
-                        return_value=(False, "movimiento fuera del tablero")):
+                        return_value=(False, MotivoRechazo.FUERA_DEL_TABLERO)):
             with self.assertRaises(MovimientoInvalidoError):
                 self.juego._mover_desde_barra(3)
 
@@ -470,7 +495,7 @@ class TestBackgammonMover(unittest.TestCase):
         with patch.object(self.juego, 'tiene_fichas_en_barra', return_value=False):
             with patch.object(self.juego, '_validar_dado_mayor'):
                 with patch.object(self.juego.__validador__, 'validar_movimiento', 
-                                 return_value=(False, "origen sin fichas")):
+                                 return_value=(False, MotivoRechazo.ORIGEN_INVALIDO)):
                     movimientos_antes = len(self.juego.obtener_movimientos_pendientes())
                     
                     with self.assertRaises(OrigenInvalidoError):
@@ -487,7 +512,7 @@ class TestBackgammonMover(unittest.TestCase):
         with patch.object(self.juego, 'tiene_fichas_en_barra', return_value=False):
             with patch.object(self.juego, '_validar_dado_mayor'):
                 with patch.object(self.juego.__validador__, 'validar_movimiento', 
-                                 return_value=(False, "posición bloqueada")):
+                                 return_value=(False, MotivoRechazo.DESTINO_BLOQUEADO)):
                     with self.assertRaises(DestinoBloquedoError):
                         self.juego.mover(6, 3)
 
@@ -654,7 +679,7 @@ class TestBackgammonMoverCasosCompletos(unittest.TestCase):
         with patch.object(self.juego.__analizador__, 'debe_usar_dado_mayor', return_value=False):
             with patch.object(self.juego.__tablero__, 'hay_fichas_en_barra', return_value=False):
                 with patch.object(self.juego.__validador__, 'validar_movimiento', 
-                                return_value=(False, "origen inválido")):
+                                return_value=(False, MotivoRechazo.ORIGEN_INVALIDO)):
                     with self.assertRaises(OrigenInvalidoError):
                         self.juego.mover(1, 3)
     
@@ -806,12 +831,33 @@ class TestBackgammonMoverCasosCompletos(unittest.TestCase):
             
             with patch.object(self.juego, 'obtener_posiciones', return_value=posiciones):
                 # Todos los movimientos son inválidos
-                with patch.object(self.juego.__validador__, 'validar_movimiento', return_value=(False, "bloqueado")):
+                with patch.object(self.juego.__validador__, 'validar_movimiento', return_value=(False, MotivoRechazo.DESTINO_BLOQUEADO)):
                     movimientos = self.juego.obtener_movimientos_posibles()
                     
                     # No debe haber movimientos para posición 1
                     self.assertNotIn(1, movimientos)
 
+    def test_obtener_jugadas_sin_dados_pendientes(self):
+        """Verifica lista vacía sin dados pendientes"""
+        self.assertEqual(self.juego.obtener_jugadas_posibles(), [])
+
+    def test_obtener_jugadas_convierte_a_1_based(self):
+        """Verifica conversión de barra y bear-off a la notación pública"""
+        self.juego.__movimientos_pendientes__ = [3, 5]
+        jugada_interna = ((None, 2, 3), (20, None, 5))
+        with patch.object(self.juego.__analizador__, 'generar_jugadas', return_value=[jugada_interna]):
+            jugadas = self.juego.obtener_jugadas_posibles()
+        self.assertEqual(jugadas, [((0, 3, 3), (21, -1, 5))])
+
+    def test_obtener_jugadas_aplicables_con_mover(self):
+        """Verifica que cada paso de una jugada pueda ejecutarse con mover"""
+        with patch.object(self.juego.__dados__, 'tirar', return_value=(6, 4)):
+            self.juego.tirar_dados()
+        jugada = self.juego.obtener_jugadas_posibles()[0]
+        for origen, _, dado in jugada:
+            self.juego.mover(origen, dado)
+        self.assertFalse(self.juego.movimientos_disponibles())
+
 
 class TestBackgammonCasosEspeciales(unittest.TestCase):
     """Tests para casos especiales y edge cases"""
@@ -844,5 +890,134 @@ class TestBackgammonCasosEspeciales(unittest.TestCase):
         self.assertNotIn(2, self.juego.__movimientos_pendientes__)
 
 
+
+class TestBackgammonDeshacerRehacer(unittest.TestCase):
+    """Tests para deshacer/rehacer movimientos"""
+
+    def setUp(self):
+        self.juego = Backgammon()
+        with patch.object(self.juego.__dados__, 'tirar', return_value=(3, 5)):
+            self.juego.tirar_dados()
+
+    def test_deshacer_sin_movimientos(self):
+        """Verifica que no se pueda deshacer sin movimientos"""
+        self.assertFalse(self.juego.puede_deshacer())
+        self.assertFalse(self.juego.deshacer_movimiento())
+        self.assertFalse(self.juego.rehacer_movimiento())
+
+    def test_deshacer_devuelve_dado_y_posicion(self):
+        """Verifica que deshacer restaure tablero y dado pendiente"""
+        posiciones = self.juego.obtener_posiciones()
+        clave = self.juego.obtener_clave_posicion()
+
+        self.juego.mover(1, 3)
+        self.assertTrue(self.juego.deshacer_movimiento())
+
+        self.assertEqual(self.juego.obtener_posiciones(), posiciones)
+        self.assertEqual(self.juego.obtener_clave_posicion(), clave)
+        self.assertEqual(sorted(self.juego.obtener_movimientos_pendientes()), [3, 5])
+        self.assertTrue(self.juego.puede_rehacer())
+
+    def test_rehacer_vuelve_a_consumir_dado(self):
+        """Verifica que rehacer reaplique el movimiento y consuma el dado"""
+        self.juego.mover(1, 3)
+        posiciones = self.juego.obtener_posiciones()
+        self.juego.deshacer_movimiento()
+
+        self.assertTrue(self.juego.rehacer_movimiento())
+        self.assertEqual(self.juego.obtener_posiciones(), posiciones)
+        self.assertEqual(self.juego.obtener_movimientos_pendientes(), [5])
+
+    def test_finalizar_tirada_confirma_movimientos(self):
+        """Verifica que al finalizar la tirada no se pueda deshacer"""
+        self.juego.mover(1, 3)
+        self.juego.finalizar_tirada()
+        self.assertFalse(self.juego.puede_deshacer())
+        self.assertFalse(self.juego.deshacer_movimiento())
+
+class TestBackgammonCacheJugadas(unittest.TestCase):
+    """Tests para la memorización del análisis de movimientos"""
+
+    def setUp(self):
+        self.juego = Backgammon(dados=Dados(tiradas=[(6, 4), (6, 4)]))
+        self.juego.tirar_dados()
+
+    def test_consultas_repetidas_aciertan(self):
+        """Verifica que repetir la consulta en el mismo estado no vuelve a validar"""
+        primera = self.juego.obtener_movimientos_posibles()
+        with patch.object(self.juego.__validador__, 'validar_movimiento') as mock_validar:
+            segunda = self.juego.obtener_movimientos_posibles()
+            mock_validar.assert_not_called()
+        self.assertEqual(primera, segunda)
+        self.assertEqual(self.juego.obtener_estadisticas_cache()['aciertos'], 1)
+
+    def test_resultado_devuelto_es_copia(self):
+        """Verifica que modificar el resultado devuelto no altera el cache"""
+        movimientos = self.juego.obtener_movimientos_posibles()
+        movimientos.clear()
+        self.assertTrue(self.juego.obtener_movimientos_posibles())
+        self.juego.obtener_jugadas_posibles().clear()
+        self.assertTrue(self.juego.obtener_jugadas_posibles())
+
+    def test_mover_invalida_por_cambio_de_posicion(self):
+        """Verifica que tras mover se recalculan los movimientos con el dado restante"""
+        antes = self.juego.obtener_movimientos_posibles()
+        self.juego.mover(1, 6)
+        despues = self.juego.obtener_movimientos_posibles()
+        self.assertNotEqual(antes, despues)
+        self.assertTrue(all(dado == 4 for destinos in despues.values() for _, dado in destinos))
+
+    def test_dado_mayor_se_calcula_una_vez_por_estado(self):
+        """Verifica que la regla del dado mayor se evalúa una sola vez por estado"""
+        with patch.object(self.juego.__analizador__, 'debe_usar_dado_mayor',
+                          return_value=False) as mock_regla:
+            self.juego._validar_dado_mayor(6)
+            self.juego._validar_dado_mayor(4)
+            self.assertEqual(mock_regla.call_count, 1)
+
+    def test_cache_compartido_entre_partidas(self):
+        """Verifica que dos partidas con el mismo cache comparten el análisis"""
+        cache = CacheJugadas()
+        for _ in range(2):
+            juego = Backgammon(dados=Dados(tiradas=[(6, 4)]), cache=cache)
+            juego.tirar_dados()
+            juego.obtener_jugadas_posibles()
+        self.assertEqual(cache.obtener_estadisticas()['aciertos'], 1)
+
+
+class TestBackgammonVersion(unittest.TestCase):
+    """Tests para el contador de versión del estado"""
+
+    def setUp(self):
+        self.juego = Backgammon(dados=Dados(tiradas=[(3, 5)]))
+
+    def test_consultas_no_cambian_la_version(self):
+        """Verifica que las consultas no cambian la versión"""
+        version = self.juego.obtener_version()
+        self.juego.obtener_posiciones()
+        self.juego.obtener_movimientos_posibles()
+        self.assertEqual(self.juego.obtener_version(), version)
+
+    def test_cada_cambio_aumenta_la_version(self):
+        """Verifica que tirar, mover, deshacer, rehacer y finalizar aumentan la versión"""
+        versiones = [self.juego.obtener_version()]
+        for accion in (self.juego.tirar_dados,
+                       lambda: self.juego.mover(1, 3),
+                       self.juego.deshacer_movimiento,
+                       self.juego.rehacer_movimiento,
+                       self.juego.finalizar_tirada):
+            accion()
+            versiones.append(self.juego.obtener_version())
+        self.assertEqual(versiones, sorted(set(versiones)))
+
+    def test_movimiento_rechazado_no_cambia_la_version(self):
+        """Verifica que un movimiento rechazado no cambia la versión"""
+        self.juego.tirar_dados()
+        version = self.juego.obtener_version()
+        with self.assertRaises(OrigenInvalidoError):
+            self.juego.mover(6, 5)  # punto 6 sin fichas blancas
+        self.assertEqual(self.juego.obtener_version(), version)
+
+
 if __name__ == '__main__':
-    unittest.main(verbosity=2)
\ No newline at end of file
+    unittest.main(verbosity=2)
@@ -0,0 +1,137 @@
+import os
+import tempfile
+import unittest
+from math import comb
+
+from source.tablero import Tablero
+from source.gestor_turnos import GestorTurnos
+from source.ejecutor_movimientos import EjecutorMovimientos
+from source.analizador_posibilidades import AnalizadorPosibilidades
+from source.motor_busqueda import MotorBusqueda
+from source.base_bear_off import (
+    BaseBearOff, cantidad_posiciones, indice_posicion, _todas_las_posiciones,
+    _codificar_pasos, _decodificar_pasos,
+)
+
+MAX_FICHAS_TEST = 4
+
+
+class TestIndicePosicion(unittest.TestCase):
+    """Tests para el rango combinatorio de distribuciones"""
+
+    def test_cantidad_posiciones(self):
+        """Verifica que hay C(21, 6) distribuciones de hasta 15 fichas en el home"""
+        self.assertEqual(cantidad_posiciones(), comb(21, 6))
+        self.assertEqual(cantidad_posiciones(), 54264)
+
+    def test_indice_es_biyectivo(self):
+        """Verifica que el índice recorre sin huecos ni repeticiones todas las distribuciones"""
+        indices = {indice_posicion(f, MAX_FICHAS_TEST) for f in _todas_las_posiciones(MAX_FICHAS_TEST)}
+        self.assertEqual(indices, set(range(cantidad_posiciones(MAX_FICHAS_TEST))))
+
+    def test_codificacion_de_pasos(self):
+        """Verifica la ida y vuelta de la codificación compacta de pasos"""
+        pasos = ((6, 5), (1, 6), (3, 3), (2, 1))
+        self.assertEqual(_decodificar_pasos(_codificar_pasos(pasos)), pasos)
+        self.assertEqual(_decodificar_pasos(0), ())
+
+
+class TestBaseBearOff(unittest.TestCase):
+    """Tests para la base de bear-off generada y mapeada en memoria"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.directorio = tempfile.TemporaryDirectory()
+        cls.ruta = os.path.join(cls.directorio.name, 'bear_off.bin')
+        BaseBearOff.generar(cls.ruta, MAX_FICHAS_TEST)
+        cls.base = BaseBearOff(cls.ruta)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.base.cerrar()
+        cls.directorio.cleanup()
+
+    def _tablero_bear_off(self, fichas, jugador):
+        tablero = Tablero()
+        gestor = GestorTurnos()
+        if jugador == -1:
+            gestor.cambiar_turno()
+        pos = tablero._obtener_posiciones_ref()
+        for i in range(24):
+            pos[i] = 0
+        for k, cantidad in enumerate(fichas):
+            pos[23 - k if jugador == 1 else k] = cantidad * jugador
+        tablero._obtener_fichas_fuera_ref()['blancas' if jugador == 1 else 'negras'] = 15 - sum(fichas)
+        return tablero, gestor
+
+    def test_una_ficha_sale_en_una_tirada(self):
+        """Verifica las tiradas esperadas para una sola ficha en el home"""
+        for k in range(3):
+            fichas = tuple(1 if i == k else 0 for i in range(6))
+            self.assertEqual(self.base.tiradas_esperadas(fichas), 1.0)
+        # Desde el 6 no alcanzan 1-1, 2-1, 3-1, 4-1 ni 3-2 (9 de 36)
+        self.assertAlmostEqual(self.base.tiradas_esperadas((0, 0, 0, 0, 0, 1)), 1 + 9 / 36, places=6)
+
+    def test_dos_fichas_en_el_punto_uno(self):
+        """Verifica que dos fichas en el punto 1 salen con cualquier tirada"""
+        self.assertEqual(self.base.tiradas_esperadas((2, 0, 0, 0, 0, 0)), 1.0)
+
+    def test_mas_fichas_requieren_mas_tiradas(self):
+        """Verifica que más fichas en el mismo punto requieren más tiradas"""
+        self.assertGreater(self.base.tiradas_esperadas((0, 0, 0, 0, 0, 4)),
+                           self.base.tiradas_esperadas((0, 0, 0, 0, 0, 2)))
+
+    def test_mejor_jugada_con_seis_cinco(self):
+        """Verifica que con dos fichas en el 6 y 6-5 se mueve 6/1 y se saca la otra"""
+        self.assertEqual(self.base.mejor_jugada((0, 0, 0, 0, 0, 2), 6, 5), ((6, 5), (6, 6)))
+        self.assertEqual(self.base.mejor_jugada((0, 0, 0, 0, 0, 2), 5, 6), ((6, 5), (6, 6)))
+
+    def test_archivo_invalido(self):
+        """Verifica que un archivo sin la cabecera de la base lanza ValueError"""
+        ruta = os.path.join(self.directorio.name, 'invalido.bin')
+        with open(ruta, 'wb') as archivo:
+            archivo.write(b'\x00' * 64)
+        with self.assertRaises(ValueError):
+            BaseBearOff(ruta)
+
+    def test_jugadas_legales_en_el_core(self):
+        """Verifica que la jugada de la base sea una de las legales del core"""
+        for jugador in (1, -1):
+            for fichas in ((0, 1, 0, 2, 0, 1), (1, 0, 0, 0, 0, 3), (0, 0, 2, 0, 2, 0)):
+                for d1, d2 in ((6, 1), (4, 2), (3, 3), (5, 5)):
+                    tablero, gestor = self._tablero_bear_off(fichas, jugador)
+                    analizador = AnalizadorPosibilidades(tablero, gestor)
+                    dados = [d1] * 4 if d1 == d2 else [d1, d2]
+                    jugada = self.base.jugada_para(tablero, jugador, dados)
+                    ejecutor = EjecutorMovimientos(tablero, gestor)
+                    legales = analizador.generar_jugadas(dados)
+                    finales = set()
+                    for legal in legales:
+                        for origen, _, dado in legal:
+                            ejecutor.ejecutar_movimiento(origen, dado)
+                        finales.add(tablero.obtener_posicion())
+                        for _ in legal:
+                            ejecutor.deshacer()
+                    for origen, _, dado in jugada:
+                        ejecutor.ejecutar_movimiento(origen, dado)
+                    self.assertIn(tablero.obtener_posicion(), finales)
+
+    def test_no_aplicable_con_contacto(self):
+        """Verifica que la base no se aplica si queda contacto o fichas fuera del home"""
+        tablero, _ = self._tablero_bear_off((0, 0, 0, 0, 0, 1), 1)
+        tablero._obtener_posiciones_ref()[20] = -1
+        self.assertIsNone(self.base.fichas_de(tablero, 1))
+        self.assertIsNone(self.base.fichas_de(Tablero(), 1))
+
+    def test_motor_usa_la_base(self):
+        """Verifica que el motor toma la jugada de la base sin evaluar nodos"""
+        tablero, gestor = self._tablero_bear_off((0, 0, 0, 0, 0, 2), 1)
+        motor = MotorBusqueda(profundidad=2, base_bear_off=self.base)
+        jugada = motor.buscar([6, 5], tablero, gestor, EjecutorMovimientos(tablero, gestor),
+                              AnalizadorPosibilidades(tablero, gestor))
+        self.assertEqual(jugada, ((18, 23, 5), (18, None, 6)))
+        self.assertEqual(motor.obtener_estadisticas()['nodos'], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
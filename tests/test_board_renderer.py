@@ -0,0 +1,106 @@
+import os
+import tempfile
+import unittest
+
+import pygame
+
+from game.board_renderer import BoardRenderer, export_positions, init_headless, write_png
+from source.posicion import Posicion
+from source.tablero import Tablero
+
+VACIA = Posicion([0] * 24, {'blancas': 0, 'negras': 0}, {'blancas': 0, 'negras': 0})
+
+
+def _pixeles(surface):
+    return pygame.image.tobytes(surface, "RGB")
+
+
+class TestBoardRenderer(unittest.TestCase):
+    """Tests para el dibujo fuera de pantalla"""
+
+    @classmethod
+    def setUpClass(cls):
+        init_headless()
+        cls.cache = tempfile.TemporaryDirectory()
+        cls.renderer = BoardRenderer(640, 400, cache_dir=cls.cache.name)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.cache.cleanup()
+
+    def test_tamano(self):
+        """Verifica que la imagen tiene el tamaño del renderer"""
+        self.assertEqual(self.renderer.render(VACIA).get_size(), (640, 400))
+
+    def test_dibuja_las_fichas(self):
+        """Verifica que la posición inicial se dibuja distinta del tablero vacío"""
+        inicial = Tablero().obtener_posicion()
+        self.assertNotEqual(_pixeles(self.renderer.render(inicial)),
+                            _pixeles(self.renderer.render(VACIA)))
+
+    def test_barra_y_fuera(self):
+        """Verifica que se dibujan las fichas en la barra y en la zona de bear-off"""
+        r = self.renderer
+        bar = r.bar_rect()
+        con_barra = r.render(Posicion([0] * 24, {'blancas': 2, 'negras': 1}, {'blancas': 0, 'negras': 0}))
+        vacia = r.render(VACIA)
+        self.assertNotEqual(_pixeles(con_barra.subsurface(bar)), _pixeles(vacia.subsurface(bar)))
+
+        fuera = r.render(Posicion([0] * 24, {'blancas': 0, 'negras': 0}, {'blancas': 15, 'negras': 15}))
+        zona = pygame.Rect(r.board_rect.right, 0, r.w - r.board_rect.right, r.h)
+        self.assertNotEqual(_pixeles(fuera.subsurface(zona)), _pixeles(vacia.subsurface(zona)))
+
+    def test_skip_idx_quita_una_ficha(self):
+        """Verifica que skip_idx omite la ficha del casillero indicado"""
+        r = self.renderer
+        una = Posicion([1] + [0] * 23, {'blancas': 0, 'negras': 0}, {'blancas': 0, 'negras': 0})
+        sin_ficha = r.render(VACIA)
+        con_skip = r.render(VACIA)
+        r.draw_pieces(con_skip, una.posiciones, skip_idx=0)
+        self.assertEqual(_pixeles(con_skip), _pixeles(sin_ficha))
+
+    def test_otro_renderer_usa_el_cache_en_disco(self):
+        """Verifica que un segundo renderer usa el cache en disco y dibuja igual"""
+        r = BoardRenderer(640, 400, cache_dir=self.cache.name)
+        self.assertIsNone(r._src)   # no hizo falta decodificar las imágenes originales
+        inicial = Tablero().obtener_posicion()
+        self.assertEqual(_pixeles(r.render(inicial)), _pixeles(self.renderer.render(inicial)))
+
+
+class TestExportacion(unittest.TestCase):
+    """Tests para write_png y la exportación por lotes"""
+
+    def setUp(self):
+        init_headless()
+        self.directorio = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directorio.cleanup)
+
+    def test_write_png_sin_perdida(self):
+        """Verifica que write_png guarda los píxeles exactos"""
+        surface = pygame.Surface((37, 11))
+        surface.fill((200, 10, 90))
+        pygame.draw.line(surface, (0, 255, 3), (0, 0), (36, 10))
+        ruta = os.path.join(self.directorio.name, "x.png")
+        write_png(surface, ruta)
+        self.assertEqual(_pixeles(pygame.image.load(ruta)), _pixeles(surface))
+
+    def test_exporta_en_paralelo(self):
+        """Verifica que la exportación con dos procesos escribe todas las imágenes"""
+        posiciones = [Tablero().obtener_posicion(), VACIA, VACIA]
+        items = [(os.path.join(self.directorio.name, f"{i}.png"), p) for i, p in enumerate(posiciones)]
+        errores = export_positions(items, width=640, height=400, workers=2,
+                                   cache_dir=self.directorio.name, chunksize=1)
+        self.assertEqual(errores, [])
+        for ruta, _ in items:
+            self.assertEqual(pygame.image.load(ruta).get_size(), (640, 400))
+
+    def test_informa_errores(self):
+        """Verifica que un destino inválido se informa como error sin interrumpir la exportación"""
+        ruta = os.path.join(self.directorio.name, "no-existe", "x.png")
+        errores = export_positions([(ruta, VACIA)], width=640, height=400, workers=1,
+                                   cache_dir=self.directorio.name)
+        self.assertEqual([r for r, _ in errores], [ruta])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,44 @@
+import unittest
+
+from source.cache_jugadas import CacheJugadas
+
+
+class TestCacheJugadas(unittest.TestCase):
+    """Tests para el cache LRU de análisis de movimientos"""
+
+    def test_fallo_y_acierto(self):
+        """Verifica que la segunda consulta de una clave no recalcula y cuenta un acierto"""
+        cache = CacheJugadas()
+        llamadas = []
+        calcular = lambda: llamadas.append(1) or 'resultado'
+        self.assertEqual(cache.obtener('k', calcular), 'resultado')
+        self.assertEqual(cache.obtener('k', calcular), 'resultado')
+        self.assertEqual(len(llamadas), 1)
+        self.assertEqual(cache.obtener_estadisticas(), {'aciertos': 1, 'fallos': 1, 'entradas': 1})
+
+    def test_desaloja_la_menos_reciente(self):
+        """Verifica que al llenarse se desaloja la entrada usada hace más tiempo"""
+        cache = CacheJugadas(max_entradas=2)
+        cache.obtener('a', lambda: 1)
+        cache.obtener('b', lambda: 2)
+        cache.obtener('a', lambda: 1)  # 'a' pasa a ser la más reciente
+        cache.obtener('c', lambda: 3)
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(cache.obtener('a', lambda: 'nuevo'), 1)
+        self.assertEqual(cache.obtener('b', lambda: 'nuevo'), 'nuevo')
+
+    def test_limpiar(self):
+        """Verifica que limpiar vacía las entradas y reinicia las estadísticas"""
+        cache = CacheJugadas()
+        cache.obtener('a', lambda: 1)
+        cache.limpiar()
+        self.assertEqual(cache.obtener_estadisticas(), {'aciertos': 0, 'fallos': 0, 'entradas': 0})
+
+    def test_tamano_invalido(self):
+        """Verifica que un tamaño máximo menor a 1 lanza ValueError"""
+        with self.assertRaises(ValueError):
+            CacheJugadas(max_entradas=0)
+
+
+if __name__ == '__main__':
+    unittest.main()
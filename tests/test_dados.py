@@ -1,6 +1,7 @@
 import unittest
 from unittest.mock import patch
 from source.dados import Dados
+from source.excepciones import DadosAgotadosError
 
 class TestDados(unittest.TestCase):
     
@@ -112,5 +113,62 @@ class TestDados(unittest.TestCase):
             d1, d2 = dados.tirar()
             self.assertNotEqual(d1, d2)
 
+
+class TestDadosFuentes(unittest.TestCase):
+    """Tests para las fuentes configurables de tiradas"""
+
+    def test_semilla_reproducible(self):
+        """Test que la misma semilla produce la misma secuencia"""
+        a, b = Dados(semilla=42), Dados(semilla=42)
+        self.assertEqual([a.tirar() for _ in range(20)], [b.tirar() for _ in range(20)])
+
+    def test_semilla_no_usa_random_global(self):
+        """Test que un generador propio no consume el módulo random global"""
+        with patch('random.randint') as mock_randint:
+            dados = Dados(semilla=1)
+            dados.tirar()
+            mock_randint.assert_not_called()
+
+    def test_rng_inyectado(self):
+        """Test que se use el generador recibido"""
+        class Fijo:
+            def randint(self, a, b):
+                return 5
+        dados = Dados(rng=Fijo())
+        self.assertEqual(dados.tirar(), (5, 5))
+
+    def test_bloque_reproducible_y_en_rango(self):
+        """Test que el modo bloque sirva tiradas válidas y reproducibles entre bloques"""
+        a, b = Dados(semilla=7, bloque=16), Dados(semilla=7, bloque=16)
+        tiradas = [a.tirar() for _ in range(50)]
+        self.assertEqual(tiradas, [b.tirar() for _ in range(50)])
+        for d1, d2 in tiradas:
+            self.assertTrue(1 <= d1 <= 6 and 1 <= d2 <= 6)
+            self.assertIsInstance(d1, int)
+
+    def test_replay(self):
+        """Test que el modo replay reproduzca la secuencia grabada"""
+        dados = Dados(tiradas=[(3, 1), (6, 6)])
+        self.assertIsNone(dados.dado1)
+        self.assertEqual(dados.tirar(), (3, 1))
+        self.assertEqual(dados.tirar(), (6, 6))
+        self.assertEqual((dados.dado1, dados.dado2), (6, 6))
+        with self.assertRaises(DadosAgotadosError):
+            dados.tirar()
+
+    def test_replay_tirada_invalida(self):
+        """Test que se rechacen valores grabados fuera de rango"""
+        with self.assertRaises(ValueError):
+            Dados(tiradas=[(0, 7)]).tirar()
+
+    def test_combinaciones_invalidas(self):
+        """Test que se rechacen fuentes incompatibles"""
+        with self.assertRaises(ValueError):
+            Dados(tiradas=[(1, 2)], semilla=1)
+        with self.assertRaises(ValueError):
+            Dados(rng=object(), bloque=10)
+        with self.assertRaises(ValueError):
+            Dados(bloque=-1)
+
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,54 @@
+import unittest
+from source.diario_movimientos import DiarioMovimientos, RegistroMovimiento
+
+
+class TestDiarioMovimientos(unittest.TestCase):
+    """Tests para el diario de deshacer/rehacer"""
+
+    def setUp(self):
+        self.diario = DiarioMovimientos()
+        self.r1 = RegistroMovimiento(1, 0, 3, 3, False)
+        self.r2 = RegistroMovimiento(1, 11, 16, 5, True)
+
+    def test_diario_vacio(self):
+        """Verifica que un diario vacío no tiene nada para deshacer ni rehacer"""
+        self.assertFalse(self.diario.puede_deshacer())
+        self.assertFalse(self.diario.puede_rehacer())
+        self.assertIsNone(self.diario.deshacer())
+        self.assertIsNone(self.diario.rehacer())
+
+    def test_deshacer_en_orden_inverso(self):
+        """Verifica que deshacer devuelve los registros en orden inverso"""
+        self.diario.registrar(self.r1)
+        self.diario.registrar(self.r2)
+        self.assertEqual(self.diario.deshacer(), self.r2)
+        self.assertEqual(self.diario.deshacer(), self.r1)
+        self.assertFalse(self.diario.puede_deshacer())
+
+    def test_rehacer_tras_deshacer(self):
+        """Verifica que rehacer devuelve el último registro deshecho"""
+        self.diario.registrar(self.r1)
+        self.diario.deshacer()
+        self.assertTrue(self.diario.puede_rehacer())
+        self.assertEqual(self.diario.rehacer(), self.r1)
+        self.assertEqual(self.diario.obtener_registros(), [self.r1])
+
+    def test_registrar_descarta_rehacer(self):
+        """Verifica que registrar un movimiento nuevo descarta la pila de rehacer"""
+        self.diario.registrar(self.r1)
+        self.diario.deshacer()
+        self.diario.registrar(self.r2)
+        self.assertFalse(self.diario.puede_rehacer())
+
+    def test_limpiar(self):
+        """Verifica que limpiar vacía ambas pilas"""
+        self.diario.registrar(self.r1)
+        self.diario.registrar(self.r2)
+        self.diario.deshacer()
+        self.diario.limpiar()
+        self.assertFalse(self.diario.puede_deshacer())
+        self.assertFalse(self.diario.puede_rehacer())
+
+
+if __name__ == '__main__':
+    unittest.main()
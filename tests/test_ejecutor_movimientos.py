@@ -2,6 +2,7 @@ from source.tablero import Tablero
 from source.gestor_turnos import GestorTurnos  
 from source.ejecutor_movimientos import EjecutorMovimientos
 import unittest
+from source.zobrist import ZOBRIST
 
 class TestEjecutorMovimientos(unittest.TestCase):
     """
@@ -159,3 +160,149 @@ class TestEjecutorMovimientos(unittest.TestCase):
         posiciones_final = self.__tablero__.obtener_posiciones()
         self.assertEqual(posiciones_final[2], 1)  # Blanca capturó
 
+
+
+class TestEjecutorClaveZobrist(unittest.TestCase):
+    """Tests para el hash Zobrist incremental"""
+
+    def setUp(self):
+        self.tablero = Tablero()
+        self.gestor = GestorTurnos()
+        self.ejecutor = EjecutorMovimientos(self.tablero, self.gestor)
+
+    def _clave_desde_cero(self):
+        return ZOBRIST.calcular(self.tablero.obtener_posiciones(),
+                                self.tablero.obtener_barra(),
+                                self.tablero.obtener_fichas_fuera(),
+                                self.gestor.obtener_direccion())
+
+    def test_clave_inicial_coincide_con_calculo_completo(self):
+        """Verifica que la clave inicial coincide con el cálculo desde cero"""
+        self.assertEqual(self.ejecutor.obtener_clave(), self._clave_desde_cero())
+
+    def test_clave_incremental_movimiento_y_captura(self):
+        """Verifica que la clave incremental tras una captura coincide con el cálculo desde cero"""
+        posiciones = self.tablero._obtener_posiciones_ref()
+        posiciones[3] = -1
+        self.ejecutor.recalcular_clave()
+        clave_antes = self.ejecutor.obtener_clave()
+
+        self.ejecutor.ejecutar_movimiento(0, 3)
+
+        self.assertNotEqual(self.ejecutor.obtener_clave(), clave_antes)
+        self.assertEqual(self.ejecutor.obtener_clave(), self._clave_desde_cero())
+
+    def test_clave_incremental_entrada_barra(self):
+        """Verifica que la clave incremental tras entrar desde la barra coincide con el cálculo desde cero"""
+        self.tablero._obtener_barra_ref()['blancas'] = 1
+        self.tablero._obtener_posiciones_ref()[2] = -1
+        self.ejecutor.recalcular_clave()
+
+        self.ejecutor.ejecutar_entrada_barra(3)
+
+        self.assertEqual(self.ejecutor.obtener_clave(), self._clave_desde_cero())
+
+    def test_clave_incremental_bear_off(self):
+        """Verifica que la clave incremental tras sacar una ficha coincide con el cálculo desde cero"""
+        posiciones = self.tablero._obtener_posiciones_ref()
+        for i in range(24):
+            posiciones[i] = 0
+        posiciones[20] = 2
+        self.ejecutor.recalcular_clave()
+
+        self.ejecutor.ejecutar_movimiento(20, 4)
+
+        self.assertEqual(self.ejecutor.obtener_clave(), self._clave_desde_cero())
+
+    def test_clave_depende_del_turno(self):
+        """Verifica que cambiar el turno cambia la clave y volver lo restaura"""
+        clave_blancas = self.ejecutor.obtener_clave()
+        self.gestor.cambiar_turno()
+        self.assertNotEqual(self.ejecutor.obtener_clave(), clave_blancas)
+        self.assertEqual(self.ejecutor.obtener_clave(), self._clave_desde_cero())
+        self.gestor.cambiar_turno()
+        self.assertEqual(self.ejecutor.obtener_clave(), clave_blancas)
+
+    def test_transposicion_misma_clave(self):
+        """Verifica que dos órdenes de movimientos que llegan a la misma posición dan la misma clave"""
+        otro_tablero = Tablero()
+        otro = EjecutorMovimientos(otro_tablero, GestorTurnos())
+
+        self.ejecutor.ejecutar_movimiento(11, 3)
+        self.ejecutor.ejecutar_movimiento(14, 2)
+        otro.ejecutar_movimiento(11, 2)
+        otro.ejecutar_movimiento(13, 3)
+
+        self.assertEqual(self.tablero.obtener_posiciones(), otro_tablero.obtener_posiciones())
+        self.assertEqual(self.ejecutor.obtener_clave(), otro.obtener_clave())
+
+
+class TestEjecutorDeshacerRehacer(unittest.TestCase):
+    """Tests para deshacer/rehacer movimientos con el diario"""
+
+    def setUp(self):
+        self.tablero = Tablero()
+        self.gestor = GestorTurnos()
+        self.ejecutor = EjecutorMovimientos(self.tablero, self.gestor)
+
+    def _estado(self):
+        return (self.tablero.obtener_posiciones(), self.tablero.obtener_barra(),
+                self.tablero.obtener_fichas_fuera(), self.ejecutor.obtener_clave())
+
+    def test_deshacer_sin_movimientos(self):
+        """Verifica que deshacer y rehacer sin movimientos retornan None"""
+        self.assertIsNone(self.ejecutor.deshacer())
+        self.assertIsNone(self.ejecutor.rehacer())
+
+    def test_deshacer_y_rehacer_captura(self):
+        """Verifica que deshacer una captura restaura el estado y la clave, y rehacer la repite"""
+        self.tablero._obtener_posiciones_ref()[3] = -1
+        self.ejecutor.recalcular_clave()
+        inicial = self._estado()
+
+        self.ejecutor.ejecutar_movimiento(0, 3)
+        despues = self._estado()
+
+        registro = self.ejecutor.deshacer()
+        self.assertTrue(registro.capturo)
+        self.assertEqual(self._estado(), inicial)
+
+        self.ejecutor.rehacer()
+        self.assertEqual(self._estado(), despues)
+
+    def test_deshacer_entrada_barra(self):
+        """Verifica que deshacer una entrada devuelve la ficha a la barra"""
+        self.tablero._obtener_barra_ref()['blancas'] = 1
+        self.tablero._obtener_posiciones_ref()[2] = -1
+        self.ejecutor.recalcular_clave()
+        inicial = self._estado()
+
+        self.ejecutor.ejecutar_entrada_barra(3)
+        registro = self.ejecutor.deshacer()
+
+        self.assertIsNone(registro.origen_idx)
+        self.assertEqual(self._estado(), inicial)
+
+    def test_deshacer_bear_off(self):
+        """Verifica que deshacer un bear-off devuelve la ficha al tablero"""
+        posiciones = self.tablero._obtener_posiciones_ref()
+        for i in range(24):
+            posiciones[i] = 0
+        posiciones[20] = 2
+        self.ejecutor.recalcular_clave()
+        inicial = self._estado()
+
+        self.ejecutor.ejecutar_movimiento(20, 4)
+        registro = self.ejecutor.deshacer()
+
+        self.assertIsNone(registro.destino_idx)
+        self.assertEqual(self._estado(), inicial)
+
+    def test_deshacer_no_depende_del_turno(self):
+        """Verifica que se deshace correctamente aunque el turno haya cambiado"""
+        inicial = self._estado()
+        self.ejecutor.ejecutar_movimiento(0, 3)
+        self.gestor.cambiar_turno()
+        self.ejecutor.deshacer()
+        self.gestor.cambiar_turno()
+        self.assertEqual(self._estado(), inicial)
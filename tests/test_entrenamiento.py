@@ -0,0 +1,114 @@
+import os
+import random
+import tempfile
+import unittest
+
+import numpy as np
+
+from source.entrenamiento import (
+    EntrenadorTD,
+    ReporteEntrenamiento,
+    ResultadoReferencia,
+    actualizar_td,
+    jugar_autojuego,
+)
+from source.evaluador_red import ENTRADAS, EvaluadorRed, codificar
+from source.tablero import Tablero
+
+
+class TestAutojuego(unittest.TestCase):
+    """Tests para la partida de autojuego sin interfaz"""
+
+    def test_trayectoria(self):
+        """Verifica que el autojuego devuelve las posiciones codificadas y un resultado de 0 o 1"""
+        red = EvaluadorRed.aleatoria(ocultas=4, semilla=1)
+        entradas, resultado = jugar_autojuego(red, random.Random(7))
+        self.assertEqual(entradas.shape[1], ENTRADAS)
+        self.assertIn(resultado, (0.0, 1.0))
+        np.testing.assert_array_equal(entradas[0], codificar(Tablero()))
+        # Las posiciones alternan el turno
+        np.testing.assert_array_equal(entradas[1, -2:], [0, 1])
+
+    def test_reproducible(self):
+        """Verifica que con la misma semilla el autojuego se repite exactamente"""
+        red = EvaluadorRed.aleatoria(ocultas=4, semilla=1)
+        a = jugar_autojuego(red, random.Random(3))
+        b = jugar_autojuego(red, random.Random(3))
+        np.testing.assert_array_equal(a[0], b[0])
+        self.assertEqual(a[1], b[1])
+
+
+class TestActualizarTD(unittest.TestCase):
+    """Tests para la actualización TD(λ)"""
+
+    def setUp(self):
+        self.red = EvaluadorRed.aleatoria(ocultas=6, semilla=2)
+        self.entradas = np.stack([codificar(Tablero()), codificar(Tablero(), 'negras')])
+
+    def test_acerca_la_ultima_posicion_al_resultado(self):
+        """Verifica que con λ=0 la última posición se acerca al resultado final"""
+        for resultado in (1.0, 0.0):
+            antes = self.red.propagar(self.entradas)[1][-1]
+            actualizar_td(self.red, self.entradas, resultado, alfa=0.5, lambda_=0.0)
+            despues = self.red.propagar(self.entradas)[1][-1]
+            self.assertLess(abs(despues - resultado), abs(antes - resultado))
+
+    def test_lambda_uno_acerca_todas_las_posiciones(self):
+        """Verifica que con λ=1 todas las posiciones se acercan al resultado"""
+        antes = self.red.propagar(self.entradas)[1]
+        actualizar_td(self.red, self.entradas, 1.0, alfa=0.5, lambda_=1.0)
+        self.assertTrue(np.all(self.red.propagar(self.entradas)[1] > antes))
+
+    def test_retorna_el_error_medio(self):
+        """Verifica que actualizar_td retorna el error temporal medio"""
+        valores = self.red.propagar(self.entradas)[1]
+        error = actualizar_td(self.red, self.entradas, 1.0, alfa=0.0, lambda_=0.7)
+        esperado = (abs(valores[1] - valores[0]) + abs(1.0 - valores[1])) / 2
+        self.assertAlmostEqual(error, esperado, places=5)
+
+
+class TestEntrenadorTD(unittest.TestCase):
+    """Tests para el entrenador por autojuego"""
+
+    def test_parametros_invalidos(self):
+        """Verifica que un tamaño de lote menor a 1 lanza ValueError"""
+        with self.assertRaises(ValueError):
+            EntrenadorTD(EvaluadorRed.aleatoria(ocultas=2), tamano_lote=0)
+
+    def test_entrena_guarda_checkpoints_y_mide(self):
+        """Verifica que entrenar actualiza la red, guarda checkpoints y mide contra la referencia"""
+        red = EvaluadorRed.aleatoria(ocultas=4, semilla=0)
+        w1 = red.pesos['w1'].copy()
+        reportes = []
+        with tempfile.TemporaryDirectory() as directorio:
+            entrenador = EntrenadorTD(red, trabajadores=1, tamano_lote=2,
+                                      directorio_checkpoints=directorio, intervalo_checkpoint=2,
+                                      intervalo_referencia=4, partidas_referencia=2)
+            final = entrenador.entrenar(4, callback=reportes.append)
+            archivos = sorted(os.listdir(directorio))
+            cargada = EvaluadorRed.cargar(os.path.join(directorio, archivos[-1]))
+
+        self.assertEqual([r.partidas for r in reportes], [2, 4])
+        self.assertEqual(archivos, ['red_00000002.npz', 'red_00000004.npz'])
+        np.testing.assert_array_equal(cargada.pesos['w1'], red.pesos['w1'])
+        self.assertFalse(np.array_equal(red.pesos['w1'], w1))
+        self.assertIsNone(reportes[0].referencia)
+        self.assertEqual(final.referencia.partidas, 2)
+        self.assertGreater(final.partidas_por_hora, 0)
+
+
+class TestReportes(unittest.TestCase):
+    """Tests para las propiedades derivadas de los reportes"""
+
+    def test_partidas_por_hora(self):
+        """Verifica el cálculo de partidas por hora, incluso con tiempo cero"""
+        self.assertEqual(ReporteEntrenamiento(10, 36.0, 0.1).partidas_por_hora, 1000.0)
+        self.assertEqual(ReporteEntrenamiento(0, 0.0, 0.0).partidas_por_hora, 0.0)
+
+    def test_porcentaje_victorias(self):
+        """Verifica el porcentaje de victorias contra la referencia"""
+        self.assertEqual(ResultadoReferencia(4, 1, -0.5).porcentaje_victorias, 25.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,136 @@
+import io
+import unittest
+from unittest.mock import patch
+
+import numpy as np
+
+from source.backgammon import Backgammon
+from source.evaluador_red import ENTRADAS, EvaluadorRed, codificar
+from source.motor_busqueda import MotorBusqueda
+from source.tablero import Tablero
+
+
+class TestCodificar(unittest.TestCase):
+    """Tests para la codificación de 198 entradas"""
+
+    def test_posicion_inicial(self):
+        """Verifica el tamaño y las unidades codificadas de la posición inicial"""
+        entradas = codificar(Tablero())
+        self.assertEqual(entradas.shape, (ENTRADAS,))
+        # 2, 5, 3 y 5 fichas -> 2 + 4 + 3 + 4 unidades por color, más el turno
+        self.assertEqual(entradas.sum(), 27)
+        np.testing.assert_array_equal(entradas[:4], [0, 0, 0, 0])
+        np.testing.assert_array_equal(entradas[23 * 4:24 * 4], [1, 1, 0, 0])
+        np.testing.assert_array_equal(entradas[-2:], [1, 0])
+
+    def test_simetria_entre_colores(self):
+        """Verifica que la posición inicial codifica igual a ambos colores y marca el turno"""
+        entradas = codificar(Tablero(), 'negras')
+        np.testing.assert_array_equal(entradas[:98], entradas[98:196])
+        np.testing.assert_array_equal(entradas[-2:], [0, 1])
+
+    def test_barra_fuera_y_pilas_altas(self):
+        """Verifica la codificación de pilas de más de tres fichas, la barra y las fichas fuera"""
+        tablero = Tablero()
+        pos = tablero._obtener_posiciones_ref()
+        pos[23] = 0
+        pos[18] = 7
+        tablero._obtener_barra_ref()['blancas'] = 1
+        tablero._obtener_fichas_fuera_ref()['blancas'] = 1
+        entradas = codificar(tablero)
+        np.testing.assert_array_equal(entradas[5 * 4:6 * 4], [1, 1, 1, 2])
+        self.assertEqual(entradas[96], 0.5)
+        self.assertAlmostEqual(entradas[97], 1 / 15)
+
+    def test_escribe_en_la_salida(self):
+        """Verifica que codificar escribe en la fila de salida indicada y no en otras"""
+        matriz = np.zeros((2, ENTRADAS), dtype=np.float32)
+        codificar(Tablero(), 'blancas', matriz[1])
+        self.assertEqual(matriz[0].sum(), 0)
+        self.assertEqual(matriz[1].sum(), 27)
+
+
+class TestEvaluadorRed(unittest.TestCase):
+    """Tests para la red evaluadora"""
+
+    def setUp(self):
+        self.red = EvaluadorRed.aleatoria(ocultas=8, semilla=3)
+
+    def test_pesos_incompatibles(self):
+        """Verifica que pesos de formas incompatibles lanzan ValueError"""
+        with self.assertRaises(ValueError):
+            EvaluadorRed(np.zeros((10, 4)), np.zeros(4), np.zeros(4), 0.0)
+        with self.assertRaises(ValueError):
+            EvaluadorRed(np.zeros((ENTRADAS, 4)), np.zeros(3), np.zeros(4), 0.0)
+
+    def test_lote_coincide_con_evaluacion_individual(self):
+        """Verifica que evaluar_lote coincide con evaluar cada tablero por separado"""
+        tableros = [Tablero(), Tablero()]
+        tableros[1]._obtener_barra_ref()['negras'] = 1
+        tableros[1]._obtener_posiciones_ref()[23] = 1
+        lote = self.red.evaluar_lote(np.stack([codificar(t) for t in tableros]))
+        self.assertEqual(lote.shape, (2,))
+        for tablero, valor in zip(tableros, lote):
+            self.assertAlmostEqual(self.red(tablero), valor, places=6)
+            self.assertTrue(-1 < valor < 1)
+
+    def test_posiciones_ganadas(self):
+        """Verifica que una partida terminada vale exactamente +1 o -1"""
+        tablero = Tablero()
+        tablero._obtener_fichas_fuera_ref()['negras'] = 15
+        self.assertEqual(self.red(tablero), -1.0)
+        tablero._obtener_fichas_fuera_ref()['negras'] = 0
+        tablero._obtener_fichas_fuera_ref()['blancas'] = 15
+        self.assertEqual(self.red(tablero), 1.0)
+
+    def test_guardar_y_cargar(self):
+        """Verifica que una red guardada y cargada evalúa igual"""
+        archivo = io.BytesIO()
+        self.red.guardar(archivo)
+        archivo.seek(0)
+        cargada = EvaluadorRed.cargar(archivo)
+        self.assertEqual(cargada.ocultas, 8)
+        self.assertEqual(cargada(Tablero()), self.red(Tablero()))
+
+    def test_cargar_sin_pesos(self):
+        """Verifica que cargar un archivo sin todos los pesos lanza ValueError"""
+        archivo = io.BytesIO()
+        np.savez(archivo, w1=np.zeros((ENTRADAS, 2)))
+        archivo.seek(0)
+        with self.assertRaises(ValueError):
+            EvaluadorRed.cargar(archivo)
+
+
+class TestMotorConRed(unittest.TestCase):
+    """Tests de la evaluación por lotes dentro de MotorBusqueda"""
+
+    def setUp(self):
+        self.red = EvaluadorRed.aleatoria(ocultas=8, semilla=5)
+        self.juego = Backgammon()
+        with patch.object(self.juego.__dados__, 'tirar', return_value=(6, 4)):
+            self.juego.tirar_dados()
+
+    def test_evalua_las_candidatas_en_un_lote(self):
+        """Verifica que a profundidad 1 el motor evalúa todas las candidatas en una sola llamada"""
+        with patch.object(self.red, 'evaluar_lote', wraps=self.red.evaluar_lote) as espia:
+            jugada = MotorBusqueda(profundidad=1, evaluador=self.red).elegir_jugada(self.juego)
+        self.assertEqual(espia.call_count, 1)
+        self.assertIn(jugada, self.juego.obtener_jugadas_posibles())
+
+    def test_misma_eleccion_que_la_evaluacion_individual(self):
+        """Verifica que la evaluación por lote elige la misma jugada que la individual"""
+        individual = lambda tablero: self.red(tablero, 'negras')
+        esperada = MotorBusqueda(profundidad=1, evaluador=individual).elegir_jugada(self.juego)
+        elegida = MotorBusqueda(profundidad=1, evaluador=self.red).elegir_jugada(self.juego)
+        self.assertEqual(elegida, esperada)
+
+    def test_profundidad_dos_deja_el_juego_intacto(self):
+        """Verifica que a profundidad 2 la búsqueda con la red deja el juego intacto"""
+        posicion = self.juego.obtener_posicion()
+        jugada = MotorBusqueda(profundidad=2, evaluador=self.red).elegir_jugada(self.juego)
+        self.assertIn(jugada, self.juego.obtener_jugadas_posibles())
+        self.assertEqual(self.juego.obtener_posicion(), posicion)
+
+
+if __name__ == '__main__':
+    unittest.main()
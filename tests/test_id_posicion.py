@@ -0,0 +1,67 @@
+import random
+import unittest
+
+from source.backgammon import Backgammon
+from source.dados import Dados
+from source.id_posicion import id_posicion, posicion_desde_id, LONGITUD_ID
+from source.posicion import Posicion
+from source.tablero import Tablero
+
+
+class TestIdPosicion(unittest.TestCase):
+    """Tests del Position ID de GNU Backgammon"""
+
+    def test_posicion_inicial(self):
+        """Verifica el ID conocido de la posición inicial y su decodificación"""
+        inicial = Tablero().obtener_posicion()
+        self.assertEqual(id_posicion(inicial, 'blancas'), '4HPwATDgc/ABMA')
+        self.assertEqual(id_posicion(inicial, 'negras'), '4HPwATDgc/ABMA')
+        self.assertEqual(posicion_desde_id('4HPwATDgc/ABMA'), inicial)
+
+    def test_depende_del_turno(self):
+        """Verifica que el ID cambia con el turno y se decodifica con el mismo turno"""
+        juego = Backgammon(dados=Dados(tiradas=[(3, 1)]))
+        juego.tirar_dados()
+        juego.mover(17, 3)
+        juego.mover(19, 1)
+        posicion = juego.obtener_posicion()
+        self.assertNotEqual(id_posicion(posicion, 'blancas'), id_posicion(posicion, 'negras'))
+        for turno in ('blancas', 'negras'):
+            self.assertEqual(posicion_desde_id(id_posicion(posicion, turno), turno), posicion)
+
+    def test_barra_y_fuera_ida_y_vuelta(self):
+        """Verifica la ida y vuelta de una posición con fichas en la barra y fuera"""
+        casilleros = [0] * 24
+        casilleros[23] = 3
+        casilleros[0] = -2
+        casilleros[10] = -1
+        posicion = Posicion(casilleros, {'blancas': 2, 'negras': 1}, {'blancas': 10, 'negras': 11})
+        identificador = id_posicion(posicion, 'negras')
+        self.assertEqual(len(identificador), LONGITUD_ID)
+        self.assertEqual(posicion_desde_id(identificador, 'negras'), posicion)
+
+    def test_ida_y_vuelta_en_partidas(self):
+        """Verifica la ida y vuelta del ID en cada turno de una partida aleatoria"""
+        rng = random.Random(5)
+        juego = Backgammon(dados=Dados(semilla=5))
+        for _ in range(60):
+            juego.tirar_dados()
+            jugadas = juego.obtener_jugadas_posibles()
+            for origen, _, dado in rng.choice(jugadas):
+                juego.mover(origen, dado)
+            if 15 in juego.obtener_fichas_fuera().values():
+                break
+            juego.finalizar_tirada()
+            turno = juego.obtener_turno()
+            identificador = juego.obtener_id_posicion()
+            self.assertEqual(posicion_desde_id(identificador, turno), juego.obtener_posicion())
+
+    def test_ids_invalidos(self):
+        """Verifica que un ID mal formado o con demasiadas fichas lanza ValueError"""
+        for invalido in ('corto', '4HPwATDgc/AB!A', '//////////////'):
+            with self.assertRaises(ValueError):
+                posicion_desde_id(invalido)
+
+
+if __name__ == '__main__':
+    unittest.main()
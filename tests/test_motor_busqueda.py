@@ -0,0 +1,165 @@
+import unittest
+from unittest.mock import patch
+from source.backgammon import Backgammon
+from source.tablero import Tablero
+from source.motor_busqueda import MotorBusqueda, evaluar_heuristica, TIRADAS
+
+
+class TestEvaluarHeuristica(unittest.TestCase):
+    """Tests para la evaluación estática"""
+
+    def test_posicion_inicial_simetrica(self):
+        """Verifica que la posición inicial vale cero para ambos colores"""
+        self.assertAlmostEqual(evaluar_heuristica(Tablero()), 0.0)
+
+    def test_victorias(self):
+        """Verifica que quince fichas fuera valen +1 para blancas y -1 para negras"""
+        tablero = Tablero()
+        tablero._obtener_fichas_fuera_ref()['blancas'] = 15
+        self.assertEqual(evaluar_heuristica(tablero), 1.0)
+        tablero._obtener_fichas_fuera_ref()['blancas'] = 0
+        tablero._obtener_fichas_fuera_ref()['negras'] = 15
+        self.assertEqual(evaluar_heuristica(tablero), -1.0)
+
+    def test_ventaja_en_pips(self):
+        """Verifica que una ficha rival en la barra favorece a las blancas"""
+        tablero = Tablero()
+        tablero._obtener_barra_ref()['negras'] = 1
+        tablero._obtener_posiciones_ref()[23] = -1
+        self.assertGreater(evaluar_heuristica(tablero), 0)
+
+
+class TestMotorBusqueda(unittest.TestCase):
+    """Tests para el motor expectiminimax"""
+
+    def setUp(self):
+        self.juego = Backgammon()
+
+    def _tirar(self, d1, d2):
+        with patch.object(self.juego.__dados__, 'tirar', return_value=(d1, d2)):
+            self.juego.tirar_dados()
+
+    def test_tiradas_suman_36(self):
+        """Verifica que las 21 tiradas distintas suman peso 36"""
+        self.assertEqual(len(TIRADAS), 21)
+        self.assertEqual(sum(peso for _, _, peso in TIRADAS), 36)
+
+    def test_profundidad_invalida(self):
+        """Verifica que una profundidad menor a 1 lanza ValueError"""
+        with self.assertRaises(ValueError):
+            MotorBusqueda(profundidad=0)
+
+    def test_sin_dados_pendientes(self):
+        """Verifica que sin dados pendientes la jugada es vacía"""
+        self.assertEqual(MotorBusqueda().elegir_jugada(self.juego), ())
+
+    def test_jugada_elegida_es_legal(self):
+        """Verifica que la jugada elegida está entre las jugadas posibles"""
+        self._tirar(3, 1)
+        jugada = MotorBusqueda(profundidad=1).elegir_jugada(self.juego)
+        self.assertIn(jugada, self.juego.obtener_jugadas_posibles())
+
+    def test_prefiere_capturar(self):
+        """Verifica que el motor captura la ficha expuesta del rival"""
+        pos = self.juego.__tablero__._obtener_posiciones_ref()
+        for i in range(24):
+            pos[i] = 0
+        pos[0] = 2
+        pos[4] = -1
+        pos[20] = -2
+        self._tirar(4, 4)
+        jugada = MotorBusqueda(profundidad=1).elegir_jugada(self.juego)
+        self.assertIn((1, 5, 4), jugada)
+
+    def test_no_modifica_el_juego(self):
+        """Verifica que la búsqueda deja posición, clave y dados como estaban"""
+        self._tirar(6, 5)
+        posicion = self.juego.obtener_posicion()
+        clave = self.juego.obtener_clave_posicion()
+        MotorBusqueda(profundidad=2).elegir_jugada(self.juego)
+        self.assertEqual(self.juego.obtener_posicion(), posicion)
+        self.assertEqual(self.juego.obtener_clave_posicion(), clave)
+        self.assertEqual(self.juego.obtener_movimientos_pendientes(), [6, 5])
+
+    def test_negras_eligen_jugada_legal(self):
+        """Verifica que con turno de negras la jugada elegida es legal"""
+        self.juego.cambiar_turno()
+        self._tirar(6, 4)
+        jugada = MotorBusqueda(profundidad=1).elegir_jugada(self.juego)
+        self.assertIn(jugada, self.juego.obtener_jugadas_posibles())
+
+    def test_tabla_de_transposicion_registra_aciertos(self):
+        """Verifica que a profundidad 3 la tabla de transposición registra aciertos"""
+        pos = self.juego.__tablero__._obtener_posiciones_ref()
+        for i in range(24):
+            pos[i] = 0
+        pos[20] = 2
+        pos[21] = 1
+        pos[3] = -2
+        self._tirar(2, 1)
+        motor = MotorBusqueda(profundidad=3)
+        motor.elegir_jugada(self.juego)
+        estadisticas = motor.obtener_estadisticas()
+        self.assertEqual(estadisticas['profundidad'], 3)
+        self.assertGreater(estadisticas['aciertos_tt'], 0)
+
+    def test_limite_de_tiempo_devuelve_jugada(self):
+        """Verifica que al agotarse el tiempo se devuelve la jugada de la última profundidad completa"""
+        self._tirar(3, 1)
+        motor = MotorBusqueda(profundidad=4, tiempo_limite=0.05)
+        jugada = motor.elegir_jugada(self.juego)
+        self.assertIn(jugada, self.juego.obtener_jugadas_posibles())
+        self.assertLess(motor.obtener_estadisticas()['profundidad'], 4)
+
+    def test_evaluador_inyectado(self):
+        """Verifica que el evaluador inyectado se llama una vez por jugada a profundidad 1"""
+        self._tirar(3, 1)
+        llamadas = []
+
+        def evaluador(tablero):
+            llamadas.append(1)
+            return 0.0
+
+        MotorBusqueda(profundidad=1, evaluador=evaluador).elegir_jugada(self.juego)
+        self.assertEqual(len(llamadas), len(self.juego.obtener_jugadas_posibles()))
+
+    def test_buscar_deja_el_tablero_intacto_si_se_agota_el_tiempo(self):
+        """Verifica que abortar por tiempo revierte las jugadas aplicadas"""
+        from source.gestor_turnos import GestorTurnos
+        from source.ejecutor_movimientos import EjecutorMovimientos
+        from source.analizador_posibilidades import AnalizadorPosibilidades
+
+        tablero = Tablero()
+        gestor = GestorTurnos()
+        ejecutor = EjecutorMovimientos(tablero, gestor)
+        analizador = AnalizadorPosibilidades(tablero, gestor)
+        posicion = tablero.obtener_posicion()
+
+        MotorBusqueda(profundidad=3, tiempo_limite=0.01).buscar(
+            [3, 1], tablero, gestor, ejecutor, analizador)
+
+        self.assertEqual(tablero.obtener_posicion(), posicion)
+        self.assertEqual(gestor.obtener_direccion(), 1)
+
+    def test_heuristica_sin_numpy(self):
+        """Verifica que el motor con la heurística funciona sin NumPy instalado"""
+        import os
+        import subprocess
+        import sys
+        codigo = (
+            "import sys; sys.modules['numpy'] = None\n"
+            "from unittest.mock import patch\n"
+            "from source.backgammon import Backgammon\n"
+            "from source.motor_busqueda import MotorBusqueda\n"
+            "juego = Backgammon()\n"
+            "with patch.object(juego.__dados__, 'tirar', return_value=(3, 1)):\n"
+            "    juego.tirar_dados()\n"
+            "assert MotorBusqueda(profundidad=1).elegir_jugada(juego) in juego.obtener_jugadas_posibles()\n"
+        )
+        raiz = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        resultado = subprocess.run([sys.executable, '-c', codigo], cwd=raiz,
+                                   capture_output=True, text=True)
+        self.assertEqual(resultado.returncode, 0, resultado.stderr)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,89 @@
+import pickle
+import unittest
+from source.posicion import Posicion
+from source.tablero import Tablero
+from source.constantes import CASILLEROS
+
+
+class TestPosicion(unittest.TestCase):
+    """Tests para la instantánea inmutable de posición"""
+
+    def setUp(self):
+        self.tablero = Tablero()
+
+    def test_obtener_posicion_refleja_estado(self):
+        """Verifica que la instantánea contenga el estado del tablero"""
+        posicion = self.tablero.obtener_posicion()
+        self.assertEqual(list(posicion.posiciones), self.tablero.obtener_posiciones())
+        self.assertEqual(posicion.barra, {'blancas': 0, 'negras': 0})
+        self.assertEqual(posicion.fichas_fuera, {'blancas': 0, 'negras': 0})
+
+    def test_igualdad_y_hash(self):
+        """Verifica que posiciones iguales sean iguales y compartan hash"""
+        p1 = self.tablero.obtener_posicion()
+        p2 = Tablero().obtener_posicion()
+        self.assertEqual(p1, p2)
+        self.assertEqual(hash(p1), hash(p2))
+        self.assertEqual(len({p1, p2}), 1)
+
+    def test_posiciones_distintas(self):
+        """Verifica que un cambio de estado produzca otra posición"""
+        p1 = self.tablero.obtener_posicion()
+        self.tablero._obtener_barra_ref()['negras'] = 1
+        p2 = self.tablero.obtener_posicion()
+        self.assertNotEqual(p1, p2)
+        self.assertEqual(p2.barra['negras'], 1)
+
+    def test_es_inmutable(self):
+        """Verifica que no se puedan asignar atributos"""
+        posicion = self.tablero.obtener_posicion()
+        with self.assertRaises(AttributeError):
+            posicion.barra = {}
+        with self.assertRaises(AttributeError):
+            posicion.otro = 1
+
+    def test_instantanea_independiente_del_tablero(self):
+        """Verifica que mutar el tablero no altere una instantánea previa"""
+        posicion = self.tablero.obtener_posicion()
+        self.tablero._obtener_posiciones_ref()[0] = 0
+        self.assertEqual(posicion.posiciones[0], 2)
+
+    def test_bytes_ida_y_vuelta(self):
+        """Verifica la serialización compacta"""
+        posicion = self.tablero.obtener_posicion()
+        datos = posicion.a_bytes()
+        self.assertEqual(len(datos), CASILLEROS + 4)
+        self.assertEqual(Posicion.desde_bytes(datos), posicion)
+
+    def test_desde_bytes_longitud_invalida(self):
+        """Verifica error con bytes de longitud incorrecta"""
+        with self.assertRaises(ValueError):
+            Posicion.desde_bytes(b'\x00' * 3)
+
+    def test_constructor_longitud_invalida(self):
+        """Verifica error con cantidad de casilleros incorrecta"""
+        with self.assertRaises(ValueError):
+            Posicion([0] * 10, {'blancas': 0, 'negras': 0}, {'blancas': 0, 'negras': 0})
+
+    def test_pickle(self):
+        """Verifica que la instantánea pueda enviarse entre procesos"""
+        posicion = self.tablero.obtener_posicion()
+        self.assertEqual(pickle.loads(pickle.dumps(posicion)), posicion)
+
+    def test_tablero_desde_posicion(self):
+        """Verifica la reconstrucción de un Tablero desde una instantánea"""
+        pos = self.tablero._obtener_posiciones_ref()
+        pos[0] = 1
+        self.tablero._obtener_barra_ref()['blancas'] = 1
+        self.tablero._obtener_fichas_fuera_ref()['negras'] = 3
+        posicion = self.tablero.obtener_posicion()
+
+        nuevo = Tablero.desde_posicion(posicion)
+        self.assertEqual(nuevo.obtener_posiciones(), self.tablero.obtener_posiciones())
+        self.assertEqual(nuevo.obtener_barra(), {'blancas': 1, 'negras': 0})
+        self.assertEqual(nuevo.obtener_fichas_fuera(), {'blancas': 0, 'negras': 3})
+        self.assertEqual(nuevo.obtener_posicion(), posicion)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,121 @@
+import io
+import os
+import random
+import tempfile
+import unittest
+
+from source.backgammon import Backgammon
+from source.dados import Dados
+from source.registro_partidas import (
+    EscritorPartidas,
+    leer_partidas,
+    TIRADA,
+    MOVIMIENTO,
+    FIN_TURNO,
+)
+from source.torneo import jugar_partida, estrategia_aleatoria
+
+
+class TestRegistroPartidas(unittest.TestCase):
+    """Tests del formato binario de registros de partidas"""
+
+    def _jugar_grabando(self, escritor, semilla):
+        juego = Backgammon(dados=Dados(semilla=semilla))
+        juego.grabar_en(escritor)
+        rng = random.Random(semilla)
+        jugar_partida(estrategia_aleatoria(rng), estrategia_aleatoria(rng), juego)
+        return juego
+
+    def test_ida_y_vuelta_con_reproduccion(self):
+        """Verifica que reproducir cada partida leída llega a la misma posición final"""
+        buffer = io.BytesIO()
+        escritor = EscritorPartidas(buffer)
+        finales = [self._jugar_grabando(escritor, semilla).obtener_posicion()
+                   for semilla in range(5)]
+        escritor.cerrar()
+
+        buffer.seek(0)
+        partidas = list(leer_partidas(buffer, tamano_bloque=7))
+        self.assertEqual(len(partidas), 5)
+        for partida, final in zip(partidas, finales):
+            self.assertEqual(partida.reproducir().obtener_posicion(), final)
+
+    def test_registros_de_dos_bytes(self):
+        """Verifica que cada evento ocupa dos bytes y se lee en orden"""
+        buffer = io.BytesIO()
+        with EscritorPartidas(buffer) as escritor:
+            juego = Backgammon(dados=Dados(tiradas=[(6, 4)]))
+            juego.grabar_en(escritor)
+            juego.tirar_dados()
+            juego.mover(1, 6)
+            juego.mover(1, 4)
+            juego.finalizar_tirada()
+            self.assertEqual(escritor.partidas, 1)
+        # cabecera (5) + INICIO, TIRADA, 2 MOVIMIENTO, FIN_TURNO
+        self.assertEqual(len(buffer.getvalue()), 5 + 5 * 2)
+        buffer.seek(0)
+        (partida,) = leer_partidas(buffer)
+        self.assertEqual(partida.eventos, [(TIRADA, 6, 4), (MOVIMIENTO, 1, 6),
+                                           (MOVIMIENTO, 1, 4), (FIN_TURNO, 0, 0)])
+
+    def test_deshacer_no_queda_grabado(self):
+        """Verifica que los movimientos deshechos no quedan en el registro"""
+        buffer = io.BytesIO()
+        with EscritorPartidas(buffer) as escritor:
+            juego = Backgammon(dados=Dados(tiradas=[(6, 4)]))
+            juego.grabar_en(escritor)
+            juego.tirar_dados()
+            juego.mover(1, 6)
+            juego.deshacer_movimiento()
+            juego.mover(12, 6)
+            juego.deshacer_movimiento()
+            juego.rehacer_movimiento()
+        buffer.seek(0)
+        (partida,) = leer_partidas(buffer)
+        self.assertEqual(partida.eventos, [(TIRADA, 6, 4), (MOVIMIENTO, 12, 6)])
+
+    def test_entrada_desde_barra_graba_origen_cero(self):
+        """Verifica que un movimiento desde la barra se graba con origen 0"""
+        buffer = io.BytesIO()
+        with EscritorPartidas(buffer) as escritor:
+            juego = Backgammon(dados=Dados(tiradas=[(3, 1)]))
+            juego.grabar_en(escritor)
+            juego.__tablero__._sumar_barra('blancas', 1)
+            juego.__tablero__._fijar_casillero(0, 1)
+            juego.tirar_dados()
+            juego.mover(5, 3)
+        buffer.seek(0)
+        (partida,) = leer_partidas(buffer)
+        self.assertIn((MOVIMIENTO, 0, 3), partida.eventos)
+
+    def test_solo_desde_estado_inicial(self):
+        """Verifica que grabar una partida ya empezada lanza ValueError"""
+        juego = Backgammon(dados=Dados(tiradas=[(6, 4)]))
+        juego.tirar_dados()
+        with self.assertRaises(ValueError):
+            juego.grabar_en(EscritorPartidas(io.BytesIO()))
+
+    def test_archivo_en_disco(self):
+        """Verifica la escritura y lectura de un archivo con un buffer chico"""
+        with tempfile.TemporaryDirectory() as directorio:
+            ruta = os.path.join(directorio, 'partidas.bgr')
+            with EscritorPartidas(ruta, tamano_buffer=16) as escritor:
+                final = self._jugar_grabando(escritor, 42).obtener_posicion()
+            partidas = list(leer_partidas(ruta))
+        self.assertEqual(len(partidas), 1)
+        self.assertEqual(partidas[0].reproducir().obtener_posicion(), final)
+
+    def test_archivos_invalidos(self):
+        """Verifica que una cabecera o un evento inválido lanza ValueError"""
+        with self.assertRaises(ValueError):
+            list(leer_partidas(io.BytesIO(b'XXXX\x01')))
+        with self.assertRaises(ValueError):
+            list(leer_partidas(io.BytesIO(b'BGPR\x01\x00\x00\x01')))
+        with self.assertRaises(ValueError):
+            list(leer_partidas(io.BytesIO(b'BGPR\x01\x01\x21')))
+        with self.assertRaises(ValueError):
+            list(leer_partidas(io.BytesIO(b'BGPR\x01\x00\x00\x09\x00')))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,92 @@
+import random
+import unittest
+from source.backgammon import Backgammon
+from source.tablero import Tablero
+from source.rollout import Rollout, ResultadoRollout, jugar_hasta_el_final, puntos_victoria
+
+
+class TestPuntosVictoria(unittest.TestCase):
+    """Tests para el cálculo de puntos de una victoria"""
+
+    def setUp(self):
+        self.tablero = Tablero()
+        pos = self.tablero._obtener_posiciones_ref()
+        for i in range(24):
+            pos[i] = 0
+        self.tablero._obtener_fichas_fuera_ref()['blancas'] = 15
+
+    def test_victoria_simple(self):
+        """Verifica que vale 1 punto si el rival sacó alguna ficha"""
+        self.tablero._obtener_fichas_fuera_ref()['negras'] = 1
+        self.assertEqual(puntos_victoria(self.tablero, 'blancas'), 1)
+
+    def test_gammon(self):
+        """Verifica que vale 2 puntos si el rival no sacó ninguna ficha"""
+        self.tablero._obtener_posiciones_ref()[5] = -15
+        self.assertEqual(puntos_victoria(self.tablero, 'blancas'), 2)
+
+    def test_backgammon(self):
+        """Verifica que vale 3 puntos si el rival tiene fichas en el home del ganador"""
+        self.tablero._obtener_posiciones_ref()[20] = -1
+        self.assertEqual(puntos_victoria(self.tablero, 'blancas'), 3)
+
+
+class TestRollout(unittest.TestCase):
+    """Tests para el rollout Monte Carlo"""
+
+    def setUp(self):
+        self.juego = Backgammon()
+
+    def test_partida_termina_con_resultado_valido(self):
+        """Verifica que una partida simulada termina con 1, 2 o 3 puntos"""
+        resultado = jugar_hasta_el_final(self.juego.obtener_posicion(), 1, random.Random(1))
+        self.assertIn(abs(resultado), (1, 2, 3))
+
+    def test_partida_reproducible_con_semilla(self):
+        """Verifica que con la misma semilla la partida simulada se repite"""
+        posicion = self.juego.obtener_posicion()
+        self.assertEqual(jugar_hasta_el_final(posicion, 1, random.Random(7)),
+                         jugar_hasta_el_final(posicion, 1, random.Random(7)))
+
+    def test_carrera_ganada(self):
+        """Verifica que una carrera ya ganada da siempre gammon, sin desvío"""
+        pos = self.juego.__tablero__._obtener_posiciones_ref()
+        for i in range(24):
+            pos[i] = 0
+        pos[23] = 1
+        pos[0] = -15
+        self.juego.__tablero__._obtener_fichas_fuera_ref()['blancas'] = 14
+        resultado = Rollout(partidas=4, trabajadores=1, espejo=False).ejecutar(self.juego)
+        self.assertEqual(resultado.media, 2)
+        self.assertEqual(resultado.desvio, 0)
+
+    def test_iterar_reporta_progreso(self):
+        """Verifica que iterar reporta un resultado parcial por lote con su intervalo"""
+        parciales = list(Rollout(partidas=4, trabajadores=1, tamano_lote=2).iterar(self.juego))
+        self.assertEqual([r.partidas for r in parciales], [2, 4])
+        final = parciales[-1]
+        self.assertIsInstance(final, ResultadoRollout)
+        self.assertLessEqual(final.intervalo[0], final.media)
+        self.assertGreaterEqual(final.intervalo[1], final.media)
+
+    def test_resultado_independiente_de_los_procesos(self):
+        """Verifica que con la misma semilla el resultado no depende de la cantidad de procesos"""
+        local = Rollout(partidas=4, trabajadores=1, tamano_lote=2, semilla=3).ejecutar(self.juego)
+        paralelo = Rollout(partidas=4, trabajadores=2, tamano_lote=2, semilla=3).ejecutar(self.juego)
+        self.assertEqual(local.media, paralelo.media)
+        self.assertEqual(local.partidas, paralelo.partidas)
+
+    def test_callback(self):
+        """Verifica que el callback se llama una vez por lote"""
+        vistos = []
+        Rollout(partidas=2, trabajadores=1, tamano_lote=1).ejecutar(self.juego, vistos.append)
+        self.assertEqual(len(vistos), 2)
+
+    def test_parametros_invalidos(self):
+        """Verifica que una cantidad de partidas menor a 1 lanza ValueError"""
+        with self.assertRaises(ValueError):
+            Rollout(partidas=0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,162 @@
+import asyncio
+import json
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+from source.servidor import ServidorPartidas
+
+
+class TestServidorPartidas(unittest.IsolatedAsyncioTestCase):
+    """Tests del servidor JSON-lines sobre localhost"""
+
+    async def asyncSetUp(self):
+        self.ejecutor = ThreadPoolExecutor(max_workers=2)
+        self.servidor = ServidorPartidas(ejecutor=self.ejecutor, intervalo_limpieza=3600)
+        self.host, self.puerto = await self.servidor.iniciar()
+
+    async def asyncTearDown(self):
+        await self.servidor.detener()
+        self.ejecutor.shutdown()
+
+    async def _conectar(self):
+        return await asyncio.open_connection(self.host, self.puerto)
+
+    async def _pedir(self, conexion, **peticion):
+        lector, escritor = conexion
+        escritor.write(json.dumps(peticion).encode() + b'\n')
+        await escritor.drain()
+        return json.loads(await lector.readline())
+
+    async def _cerrar(self, conexion):
+        conexion[1].close()
+        await conexion[1].wait_closed()
+
+    async def test_partida_basica(self):
+        """Verifica crear una partida, tirar, mover y consultar el estado por TCP"""
+        conexion = await self._conectar()
+        nueva = await self._pedir(conexion, cmd='nueva', semilla=7)
+        self.assertTrue(nueva['ok'])
+        self.assertEqual(nueva['turno'], 'blancas')
+        sid = nueva['sesion']
+
+        tirada = await self._pedir(conexion, cmd='tirar', sesion=sid)
+        self.assertTrue(tirada['ok'])
+        movimientos = (await self._pedir(conexion, cmd='movimientos', sesion=sid))['movimientos']
+        self.assertTrue(movimientos)
+
+        origen, _, dado = movimientos[0]
+        movida = await self._pedir(conexion, cmd='mover', sesion=sid, origen=origen, dado=dado)
+        self.assertTrue(movida['ok'])
+        self.assertEqual(len(movida['pendientes']), len(tirada['pendientes']) - 1)
+
+        jugadas = (await self._pedir(conexion, cmd='jugadas', sesion=sid))['jugadas']
+        for paso in jugadas[0] if jugadas else []:
+            self.assertTrue((await self._pedir(conexion, cmd='mover', sesion=sid,
+                                               origen=paso[0], dado=paso[2]))['ok'])
+        final = await self._pedir(conexion, cmd='finalizar', sesion=sid)
+        self.assertEqual(final['turno'], 'negras')
+        self.assertEqual((await self._pedir(conexion, cmd='estado', sesion=sid))['turno'], 'negras')
+        await self._cerrar(conexion)
+
+    async def test_errores_con_codigo(self):
+        """Verifica que cada error se informa con su código estable"""
+        conexion = await self._conectar()
+        sid = (await self._pedir(conexion, cmd='nueva', semilla=1))['sesion']
+        respuesta = await self._pedir(conexion, cmd='volar', sesion=sid)
+        self.assertEqual(respuesta['error'], 'COMANDO_DESCONOCIDO')
+        respuesta = await self._pedir(conexion, cmd='estado', sesion='nada')
+        self.assertEqual(respuesta['error'], 'SESION_INEXISTENTE')
+        respuesta = await self._pedir(conexion, cmd='mover', sesion=sid, origen='1', dado=3)
+        self.assertEqual(respuesta['error'], 'ARGUMENTOS_INVALIDOS')
+
+        dados = (await self._pedir(conexion, cmd='tirar', sesion=sid))['dados']
+        self.assertEqual((await self._pedir(conexion, cmd='tirar', sesion=sid))['error'],
+                         'TIRADA_EN_CURSO')
+        respuesta = await self._pedir(conexion, cmd='mover', sesion=sid, origen=2, dado=dados[0])
+        self.assertFalse(respuesta['ok'])
+        self.assertIn(respuesta['error'], ('ORIGEN_INVALIDO', 'DADO_NO_DISPONIBLE'))
+
+        lector, escritor = conexion
+        escritor.write(b'{no es json\n')
+        self.assertEqual(json.loads(await lector.readline())['error'], 'JSON_INVALIDO')
+        await self._cerrar(conexion)
+
+    async def test_error_interno_no_expone_detalles(self):
+        """Verifica que un error inesperado se registra en el log y no llega al cliente"""
+        async def falla(peticion):
+            raise RuntimeError("detalle secreto")
+
+        with patch.dict(self.servidor.__comandos__, {'estado': falla}), \
+                self.assertLogs('source.servidor', level='ERROR') as registro:
+            respuesta = await self.servidor.procesar({'cmd': 'estado'})
+        self.assertEqual(respuesta['error'], 'ERROR_INTERNO')
+        self.assertNotIn('secreto', respuesta['mensaje'])
+        self.assertNotIn('RuntimeError', respuesta['mensaje'])
+        self.assertIn('detalle secreto', '\n'.join(registro.output))
+
+    async def test_cancelar_la_conexion_propaga_la_cancelacion(self):
+        """Verifica que cancelar la tarea de una conexión la cancela y cierra el socket"""
+        conexion = await self._conectar()
+        await self._pedir(conexion, cmd='nueva')
+        tarea, = self.servidor.__conexiones__
+        tarea.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await tarea
+        self.assertTrue(tarea.cancelled())
+        self.assertEqual(self.servidor.__conexiones__, set())
+        self.assertEqual(await conexion[0].readline(), b'')   # el servidor cerró el socket
+        await self._cerrar(conexion)
+
+    async def test_clientes_concurrentes(self):
+        """Verifica que veinte clientes simultáneos obtienen sesiones distintas"""
+        async def cliente(semilla):
+            conexion = await self._conectar()
+            sid = (await self._pedir(conexion, cmd='nueva', semilla=semilla))['sesion']
+            await self._pedir(conexion, cmd='tirar', sesion=sid)
+            estado = await self._pedir(conexion, cmd='estado', sesion=sid)
+            await self._cerrar(conexion)
+            return sid, estado
+
+        resultados = await asyncio.gather(*(cliente(i) for i in range(20)))
+        self.assertEqual(len({sid for sid, _ in resultados}), 20)
+        self.assertTrue(all(estado['ok'] for _, estado in resultados))
+        self.assertEqual(self.servidor.cantidad_sesiones(), 20)
+
+    async def test_sesion_sobrevive_a_la_conexion(self):
+        """Verifica que una sesión sigue disponible desde otra conexión"""
+        conexion = await self._conectar()
+        sid = (await self._pedir(conexion, cmd='nueva'))['sesion']
+        await self._cerrar(conexion)
+        conexion = await self._conectar()
+        self.assertTrue((await self._pedir(conexion, cmd='estado', sesion=sid))['ok'])
+        self.assertTrue((await self._pedir(conexion, cmd='cerrar', sesion=sid))['ok'])
+        self.assertEqual(self.servidor.cantidad_sesiones(), 0)
+        await self._cerrar(conexion)
+
+    async def test_sugerir_usa_el_ejecutor(self):
+        """Verifica que la jugada sugerida está entre las jugadas posibles"""
+        sid = (await self.servidor.procesar({'cmd': 'nueva', 'semilla': 3}))['sesion']
+        await self.servidor.procesar({'cmd': 'tirar', 'sesion': sid})
+        jugadas = (await self.servidor.procesar({'cmd': 'jugadas', 'sesion': sid}))['jugadas']
+        sugerida = await self.servidor.procesar({'cmd': 'sugerir', 'sesion': sid})
+        self.assertIn(sugerida['jugada'], jugadas)
+
+    async def test_desaloja_sesiones_inactivas(self):
+        """Verifica que se desalojan las sesiones que superan la inactividad máxima"""
+        servidor = ServidorPartidas(max_inactividad=0.0)
+        await servidor.procesar({'cmd': 'nueva'})
+        await asyncio.sleep(0.01)
+        self.assertEqual(servidor.desalojar_inactivas(), 1)
+        self.assertEqual(servidor.cantidad_sesiones(), 0)
+
+    async def test_limite_de_sesiones(self):
+        """Verifica que superar el máximo de sesiones devuelve DEMASIADAS_SESIONES"""
+        servidor = ServidorPartidas(max_sesiones=1)
+        await servidor.procesar({'cmd': 'nueva'})
+        respuesta = await servidor.procesar({'cmd': 'nueva'})
+        self.assertEqual(respuesta['error'], 'DEMASIADAS_SESIONES')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -248,4 +248,93 @@ class TestTablero(TestCase):
         
         barra = self.tablero.obtener_barra()
         self.assertEqual(barra['blancas'], 7)
-        self.assertEqual(barra['negras'], 2)
\ No newline at end of file
+        self.assertEqual(barra['negras'], 2)
+
+class TestTableroContadores(TestCase):
+    """Tests para los contadores incrementales (pips, fuera del home, más lejana)"""
+
+    def setUp(self):
+        self.tablero = Tablero()
+
+    def _esperados(self):
+        pos = self.tablero.obtener_posiciones()
+        barra = self.tablero.obtener_barra()
+        blancas = [i for i, v in enumerate(pos) if v > 0]
+        negras = [i for i, v in enumerate(pos) if v < 0]
+        return (
+            sum(v * (CASILLEROS - i) for i, v in enumerate(pos) if v > 0) + 25 * barra['blancas'],
+            sum(-v * (i + 1) for i, v in enumerate(pos) if v < 0) + 25 * barra['negras'],
+            sum(v for v in pos[:18] if v > 0),
+            sum(-v for v in pos[6:] if v < 0),
+            min(blancas) if blancas else None,
+            max(negras) if negras else None,
+        )
+
+    def _actuales(self):
+        t = self.tablero
+        return (t.obtener_pips('blancas'), t.obtener_pips('negras'),
+                t.fichas_fuera_de_home('blancas'), t.fichas_fuera_de_home('negras'),
+                t.obtener_mas_lejana('blancas'), t.obtener_mas_lejana('negras'))
+
+    def test_posicion_inicial(self):
+        """Verifica pips, fichas fuera del home y fichas más lejanas de la posición inicial"""
+        self.assertEqual(self._actuales(), (167, 167, 10, 10, 0, 23))
+        self.assertFalse(self.tablero.todas_en_home('blancas'))
+
+    def test_barra_suma_25_pips(self):
+        """Verifica que cada ficha en la barra suma 25 pips"""
+        self.tablero._sumar_barra('negras', 2)
+        self.assertEqual(self.tablero.obtener_pips('negras'), 217)
+
+    def test_fijar_casillero_actualiza_por_delta(self):
+        """Verifica que _fijar_casillero mantiene los contadores sin recalcular"""
+        self.tablero._fijar_casillero(0, 0)
+        self.tablero._fijar_casillero(11, 7)
+        self.tablero._fijar_casillero(23, 0)
+        self.tablero._fijar_casillero(12, 1)
+        self.assertEqual(self._actuales(), self._esperados())
+        self.assertEqual(self.tablero.obtener_mas_lejana('blancas'), 11)
+        self.assertEqual(self.tablero.obtener_mas_lejana('negras'), 7)
+
+    def test_escritura_externa_invalida_contadores(self):
+        """Verifica que escribir en la referencia de posiciones obliga a recalcular los contadores"""
+        pos = self.tablero._obtener_posiciones_ref()
+        self.assertEqual(self.tablero.obtener_pips('blancas'), 167)
+        for i in range(18):
+            pos[i] = 0
+        self.assertEqual(self._actuales(), self._esperados())
+        self.assertTrue(self.tablero.todas_en_home('blancas'))
+
+    def test_tablero_vacio(self):
+        """Verifica los contadores de un tablero sin fichas"""
+        for i in range(CASILLEROS):
+            self.tablero._fijar_casillero(i, 0)
+        self.assertEqual(self._actuales(), (0, 0, 0, 0, None, None))
+
+    def test_consistencia_en_partidas_aleatorias(self):
+        """Verifica los contadores contra un recálculo completo tras cada movimiento"""
+        import random
+        from source.gestor_turnos import GestorTurnos
+        from source.ejecutor_movimientos import EjecutorMovimientos
+        from source.analizador_posibilidades import AnalizadorPosibilidades
+
+        rng = random.Random(5)
+        for _ in range(5):
+            self.tablero = Tablero()
+            gestor = GestorTurnos()
+            ejecutor = EjecutorMovimientos(self.tablero, gestor)
+            analizador = AnalizadorPosibilidades(self.tablero, gestor)
+            for _ in range(60):
+                d1, d2 = rng.randint(1, 6), rng.randint(1, 6)
+                jugada = rng.choice(analizador.generar_jugadas([d1] * 4 if d1 == d2 else [d1, d2]))
+                for origen, _, dado in jugada:
+                    if origen is None:
+                        ejecutor.ejecutar_entrada_barra(dado)
+                    else:
+                        ejecutor.ejecutar_movimiento(origen, dado)
+                    # El ejecutor actualiza por delta: no hace falta recalcular
+                    self.assertTrue(self.tablero.__contadores_validos__)
+                    self.assertEqual(self._actuales(), self._esperados())
+                if 15 in self.tablero.obtener_fichas_fuera().values():
+                    break
+                gestor.cambiar_turno()
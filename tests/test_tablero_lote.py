@@ -0,0 +1,147 @@
+import random
+import unittest
+import numpy as np
+from source.tablero import Tablero
+from source.gestor_turnos import GestorTurnos
+from source.validador_movimientos import ValidadorMovimientos
+from source.ejecutor_movimientos import EjecutorMovimientos
+from source.analizador_posibilidades import AnalizadorPosibilidades
+from source.tablero_lote import TableroLote, ORIGEN_BARRA, COLUMNAS
+
+
+def posiciones_de_partidas(cantidad: int, semilla: int = 0):
+    """Genera (posicion, direccion) variadas jugando movimientos aleatorios con el core."""
+    rng = random.Random(semilla)
+    resultado = []
+    while len(resultado) < cantidad:
+        tablero = Tablero()
+        gestor = GestorTurnos()
+        ejecutor = EjecutorMovimientos(tablero, gestor)
+        analizador = AnalizadorPosibilidades(tablero, gestor)
+        for _ in range(rng.randint(0, 80)):
+            d1, d2 = rng.randint(1, 6), rng.randint(1, 6)
+            jugada = rng.choice(analizador.generar_jugadas([d1] * 4 if d1 == d2 else [d1, d2]))
+            for origen_idx, _, dado in jugada:
+                if origen_idx is None:
+                    ejecutor.ejecutar_entrada_barra(dado)
+                else:
+                    ejecutor.ejecutar_movimiento(origen_idx, dado)
+            if 15 in tablero.obtener_fichas_fuera().values():
+                break
+            gestor.cambiar_turno()
+        resultado.append((tablero.obtener_posicion(), gestor.obtener_direccion()))
+    return resultado
+
+
+class TestTableroLote(unittest.TestCase):
+    """Tests para el tablero vectorizado"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.muestras = posiciones_de_partidas(60)
+
+    def _lote(self):
+        return TableroLote.desde_posiciones([p for p, _ in self.muestras])
+
+    def _jugadores(self):
+        return np.array([j for _, j in self.muestras])
+
+    def test_forma_invalida(self):
+        """Verifica que una matriz de forma incorrecta lanza ValueError"""
+        with self.assertRaises(ValueError):
+            TableroLote(np.zeros((3, 5)))
+
+    def test_inicial(self):
+        """Verifica que el lote inicial repite la posición inicial del tablero"""
+        lote = TableroLote.inicial(4)
+        self.assertEqual(len(lote), 4)
+        self.assertEqual(lote.obtener_posicion(3), Tablero().obtener_posicion())
+
+    def test_ida_y_vuelta_posiciones(self):
+        """Verifica que cada posición cargada se recupera igual"""
+        lote = self._lote()
+        for i, (posicion, _) in enumerate(self.muestras):
+            self.assertEqual(lote.obtener_posicion(i), posicion)
+        self.assertEqual(lote.obtener_datos().shape, (len(self.muestras), COLUMNAS))
+
+    def test_mascara_coincide_con_validador(self):
+        """Verifica que la máscara de orígenes legales coincide con ValidadorMovimientos"""
+        lote = self._lote()
+        jugadores = self._jugadores()
+        for dado in range(1, 7):
+            mascara = lote.mascara_legal(jugadores, dado)
+            for i, (posicion, jugador) in enumerate(self.muestras):
+                tablero = Tablero.desde_posicion(posicion)
+                gestor = GestorTurnos()
+                if jugador == -1:
+                    gestor.cambiar_turno()
+                validador = ValidadorMovimientos(tablero, gestor)
+                en_barra = tablero.hay_fichas_en_barra(gestor.obtener_turno())
+                for origen in range(24):
+                    esperado = (not en_barra) and validador.validar_movimiento(origen, dado)[0]
+                    self.assertEqual(bool(mascara[i, origen]), esperado, (i, dado, origen))
+
+    def test_entrada_y_home_coinciden_con_core(self):
+        """Verifica que la entrada desde la barra y el home completo coinciden con el core"""
+        lote = self._lote()
+        jugadores = self._jugadores()
+        home = lote.todas_en_home(jugadores)
+        for dado in range(1, 7):
+            entrar = lote.puede_entrar(jugadores, dado)
+            for i, (posicion, jugador) in enumerate(self.muestras):
+                tablero = Tablero.desde_posicion(posicion)
+                gestor = GestorTurnos()
+                if jugador == -1:
+                    gestor.cambiar_turno()
+                analizador = AnalizadorPosibilidades(tablero, gestor)
+                validador = ValidadorMovimientos(tablero, gestor)
+                esperado = (tablero.hay_fichas_en_barra(gestor.obtener_turno())
+                            and validador.validar_entrada_barra(dado)[0])
+                self.assertEqual(bool(entrar[i]), esperado)
+                self.assertEqual(bool(home[i]), analizador._todas_en_home(jugador))
+
+    def test_aplicar_movimientos_coincide_con_ejecutor(self):
+        """Verifica que aplicar un movimiento por fila deja las mismas posiciones que el ejecutor"""
+        rng = random.Random(5)
+        lote = self._lote()
+        jugadores = self._jugadores()
+        dados = np.array([rng.randint(1, 6) for _ in self.muestras])
+        origenes = np.full(len(self.muestras), ORIGEN_BARRA)
+        activos = np.zeros(len(self.muestras), dtype=bool)
+        mascara = lote.mascara_legal(jugadores, dados)
+        entrar = lote.puede_entrar(jugadores, dados)
+        esperadas = []
+        for i, (posicion, jugador) in enumerate(self.muestras):
+            tablero = Tablero.desde_posicion(posicion)
+            gestor = GestorTurnos()
+            if jugador == -1:
+                gestor.cambiar_turno()
+            ejecutor = EjecutorMovimientos(tablero, gestor)
+            if entrar[i]:
+                activos[i] = True
+                ejecutor.ejecutar_entrada_barra(int(dados[i]))
+            elif mascara[i].any():
+                activos[i] = True
+                origenes[i] = int(np.flatnonzero(mascara[i])[0])
+                ejecutor.ejecutar_movimiento(int(origenes[i]), int(dados[i]))
+            esperadas.append(tablero.obtener_posicion())
+
+        self.assertTrue(activos.any())
+        lote.aplicar_movimientos(jugadores, origenes, dados, activos)
+        for i, esperada in enumerate(esperadas):
+            self.assertEqual(lote.obtener_posicion(i), esperada)
+
+    def test_pips_posicion_inicial(self):
+        """Verifica los 167 pips de cada color en la posición inicial"""
+        pips = TableroLote.inicial(2).pips()
+        self.assertEqual(pips.tolist(), [[167, 167], [167, 167]])
+
+    def test_pips_con_barra_no_desborda(self):
+        """Verifica que 15 fichas en la barra suman 375 pips sin desbordar int8"""
+        datos = np.zeros((1, COLUMNAS), dtype=np.int8)
+        datos[0, 24] = 15
+        self.assertEqual(TableroLote(datos).pips().tolist(), [[375, 0]])
+
+
+if __name__ == '__main__':
+    unittest.main()
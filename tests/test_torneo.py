@@ -0,0 +1,83 @@
+import random
+import unittest
+from unittest.mock import patch
+from source.backgammon import Backgammon
+from source.torneo import (
+    Torneo, ResultadoPartida, ResumenTorneo, ESTRATEGIAS, jugar_partida, _jugar_lote,
+)
+
+
+class TestJugarPartida(unittest.TestCase):
+    """Tests para una partida completa sin interfaz"""
+
+    def test_partida_aleatoria_termina(self):
+        """Verifica que una partida aleatoria termina con un ganador y 1, 2 o 3 puntos"""
+        estrategia = ESTRATEGIAS['aleatoria'](random.Random(1))
+        color, puntos, turnos = jugar_partida(estrategia, estrategia)
+        self.assertIn(color, ('blancas', 'negras'))
+        self.assertIn(puntos, (1, 2, 3))
+        self.assertGreater(turnos, 0)
+
+    def test_carrera_ganada_en_un_turno(self):
+        """Verifica que una carrera ganada termina en un turno con gammon"""
+        juego = Backgammon()
+        pos = juego.__tablero__._obtener_posiciones_ref()
+        for i in range(24):
+            pos[i] = 0
+        pos[23] = 1
+        pos[0] = -15
+        juego.__tablero__._obtener_fichas_fuera_ref()['blancas'] = 14
+        estrategia = ESTRATEGIAS['heuristica'](random.Random(0))
+        with patch.object(juego.__dados__, 'tirar', return_value=(4, 1)):
+            self.assertEqual(jugar_partida(estrategia, estrategia, juego), ('blancas', 2, 1))
+
+
+class TestTorneo(unittest.TestCase):
+    """Tests para el torneo entre estrategias"""
+
+    def test_estrategia_desconocida(self):
+        """Verifica que una estrategia inexistente lanza ValueError"""
+        with self.assertRaises(ValueError):
+            Torneo('heuristica', 'inexistente')
+
+    def test_partidas_invalidas(self):
+        """Verifica que una cantidad de partidas menor a 1 lanza ValueError"""
+        with self.assertRaises(ValueError):
+            Torneo('aleatoria', 'aleatoria', partidas=0)
+
+    def test_lote_alterna_colores(self):
+        """Verifica que el lote alterna qué estrategia juega con blancas"""
+        with patch('source.torneo.jugar_partida', return_value=('blancas', 1, 10)):
+            resultados = _jugar_lote('aleatoria', 'aleatoria', 0, 0, 2, True)
+        self.assertEqual(resultados, [ResultadoPartida('a', 'blancas', 1, 10),
+                                      ResultadoPartida('b', 'blancas', 1, 10)])
+
+    def test_resumen(self):
+        """Verifica el conteo de victorias, gammons, backgammons, puntos y turnos del resumen"""
+        resultados = [ResultadoPartida('a', 'blancas', 2, 40), ResultadoPartida('b', 'negras', 3, 60)]
+        with patch('source.torneo._jugar_lote', return_value=resultados):
+            resumen = Torneo('aleatoria', 'aleatoria', partidas=2, trabajadores=1,
+                             tamano_lote=2).ejecutar()
+        self.assertIsInstance(resumen, ResumenTorneo)
+        self.assertEqual(resumen.victorias, {'a': 1, 'b': 1})
+        self.assertEqual(resumen.gammons, {'a': 1, 'b': 1})
+        self.assertEqual(resumen.backgammons, {'a': 0, 'b': 1})
+        self.assertEqual(resumen.puntos, {'a': 2, 'b': 3})
+        self.assertEqual(resumen.turnos_medios, 50)
+        self.assertGreater(resumen.partidas_por_segundo, 0)
+
+    def test_torneo_reproducible_con_semilla(self):
+        """Verifica que un lote con la misma semilla se repite"""
+        a = _jugar_lote('aleatoria', 'aleatoria', 3, 0, 2, True)
+        self.assertEqual(a, _jugar_lote('aleatoria', 'aleatoria', 3, 0, 2, True))
+
+    def test_torneo_completo_con_callback(self):
+        """Verifica que el callback se llama por partida y el resumen las cuenta todas"""
+        vistos = []
+        resumen = Torneo('heuristica', 'aleatoria', partidas=2, trabajadores=1).ejecutar(vistos.append)
+        self.assertEqual(len(vistos), 2)
+        self.assertEqual(sum(resumen.victorias.values()), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
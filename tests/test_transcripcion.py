@@ -0,0 +1,148 @@
+import io
+import os
+import random
+import tempfile
+import unittest
+
+from source.backgammon import Backgammon
+from source.dados import Dados
+from source.registro_partidas import EscritorPartidas, leer_partidas
+from source.torneo import jugar_partida, estrategia_aleatoria
+from source.transcripcion import (
+    leer_transcripcion,
+    importar_partida,
+    escribir_transcripcion,
+    convertir_archivos,
+)
+
+MATCH = """\
+ 3 point match
+
+ Game 1
+ Ana : 0                              Beto : 0
+  1)                                  31: 8/5 6/5
+  2) 65: 24/13                        64: 24/14
+  3)  Doubles => 2                    Takes
+  4) 52: 13/11* 6/1*
+      Wins 2 points
+
+ Game 2
+ Ana : 2                              Beto : 0
+  1) 42: 8/4 6/4                      63: 24/18 13/10
+  2) 11: 8/7*(2) 6/5(2)
+"""
+
+
+class TestLecturaTranscripcion(unittest.TestCase):
+    """Tests del lector de transcripciones"""
+
+    def test_lee_partidas_y_columnas(self):
+        """Verifica que se leen las partidas, los jugadores y la columna de cada tirada"""
+        partidas = list(leer_transcripcion(io.StringIO(MATCH)))
+        self.assertEqual([p.numero for p in partidas], [1, 2])
+        self.assertEqual(partidas[0].jugadores, ('Ana', 'Beto'))
+        primera = partidas[0].turnos
+        self.assertEqual([t.columna for t in primera], [1, 0, 1, 0])
+        self.assertEqual(primera[0].dados, (3, 1))
+        self.assertEqual(primera[1].jugada, '24/13')
+        self.assertEqual(len(partidas[1].turnos), 3)
+
+    def test_primera_linea_solo_con_columna_derecha(self):
+        """Verifica que una primera línea con solo la columna derecha se asigna a la derecha"""
+        texto = " Game 1\n  1)                                  52: 13/11 24/19\n"
+        (partida,) = leer_transcripcion(io.StringIO(texto))
+        self.assertEqual(partida.turnos, [(1, (5, 2), '13/11 24/19')])
+
+    def test_turno_de_tres_cifras(self):
+        """Verifica las columnas cuando el número de turno tiene tres cifras"""
+        texto = (" Game 1\n"
+                 " 99) 31: 8/5 6/5                      52: 13/11 24/19\n"
+                 "100) 64: 24/14                        11: 8/7(2) 6/5(2)\n"
+                 "101)                                  21: 13/11 6/5\n")
+        (partida,) = leer_transcripcion(io.StringIO(texto))
+        self.assertEqual([t.columna for t in partida.turnos], [0, 1, 0, 1, 1])
+        self.assertEqual(partida.turnos[3], (1, (1, 1), '8/7(2) 6/5(2)'))
+
+    def test_tirada_fuera_de_partida(self):
+        """Verifica que una tirada antes de cualquier 'Game' lanza ValueError"""
+        with self.assertRaises(ValueError):
+            list(leer_transcripcion(io.StringIO("  1) 31: 8/5 6/5\n")))
+
+
+class TestImportacionTranscripcion(unittest.TestCase):
+    """Tests de la importación validada por el core"""
+
+    def setUp(self):
+        self.partidas = list(leer_transcripcion(io.StringIO(MATCH)))
+
+    def test_primera_columna_en_mover_juega_con_blancas(self):
+        """Verifica que la columna que mueve primero juega con blancas"""
+        juego = importar_partida(self.partidas[0]).reproducir()
+        # Beto (derecha) movió primero: es blancas y recibió dos capturas
+        self.assertEqual(juego.obtener_barra(), {'blancas': 2, 'negras': 0})
+        self.assertEqual(juego.obtener_ficha_en_posicion(13), -5)
+        self.assertEqual(juego.obtener_ficha_en_posicion(11), -1)
+
+    def test_captura_y_repeticion(self):
+        """Verifica la importación de capturas y de movimientos repetidos como 6/5(2)"""
+        juego = importar_partida(self.partidas[1]).reproducir()
+        self.assertEqual(juego.obtener_barra()['negras'], 1)
+        self.assertEqual(juego.obtener_ficha_en_posicion(18), 2)
+        self.assertEqual(juego.obtener_ficha_en_posicion(20), 2)
+
+    def test_jugada_ilegal(self):
+        """Verifica que una jugada ilegal lanza ValueError indicando el turno"""
+        texto = " Game 1\n  1) 31: 8/3\n"
+        (partida,) = leer_transcripcion(io.StringIO(texto))
+        with self.assertRaises(ValueError) as ctx:
+            importar_partida(partida)
+        self.assertIn("turno 1", str(ctx.exception))
+
+    def test_jugada_incompleta(self):
+        """Verifica que una jugada que no usa todos los dados posibles lanza ValueError"""
+        (partida,) = leer_transcripcion(io.StringIO(" Game 1\n  1) 31: 8/5\n"))
+        with self.assertRaises(ValueError):
+            importar_partida(partida)
+
+    def test_ida_y_vuelta(self):
+        """Verifica que partidas escritas como texto se importan hasta las mismas posiciones finales"""
+        buffer = io.BytesIO()
+        finales = []
+        with EscritorPartidas(buffer) as escritor:
+            for semilla in range(5):
+                juego = Backgammon(dados=Dados(semilla=semilla))
+                juego.grabar_en(escritor)
+                rng = random.Random(semilla)
+                jugar_partida(estrategia_aleatoria(rng), estrategia_aleatoria(rng), juego)
+                finales.append(juego.obtener_posicion())
+        buffer.seek(0)
+        texto = io.StringIO()
+        self.assertEqual(escribir_transcripcion(leer_partidas(buffer), texto), 5)
+        texto.seek(0)
+        importadas = [importar_partida(p) for p in leer_transcripcion(texto)]
+        self.assertEqual([p.reproducir().obtener_posicion() for p in importadas], finales)
+
+
+class TestConversionMasiva(unittest.TestCase):
+    """Tests de la conversión de archivos de texto a registros binarios"""
+
+    def test_convierte_y_reporta_errores(self):
+        """Verifica que la conversión sigue tras un archivo inválido, con uno o varios procesos"""
+        with tempfile.TemporaryDirectory() as directorio:
+            rutas = []
+            for nombre, contenido in (('a.mat', MATCH), ('b.mat', " Game 1\n  1) 31: 8/3\n"),
+                                      ('c.mat', MATCH)):
+                ruta = os.path.join(directorio, nombre)
+                with open(ruta, 'w', encoding='utf-8') as archivo:
+                    archivo.write(contenido)
+                rutas.append(ruta)
+            for trabajadores in (1, 2):
+                salida = os.path.join(directorio, f'salida{trabajadores}.bgr')
+                cantidad, errores = convertir_archivos(rutas, salida, trabajadores=trabajadores)
+                self.assertEqual(cantidad, 4)
+                self.assertEqual([ruta for ruta, _ in errores], [rutas[1]])
+                self.assertEqual(len(list(leer_partidas(salida))), 4)
+
+
+if __name__ == '__main__':
+    unittest.main()
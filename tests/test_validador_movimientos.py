@@ -1,6 +1,7 @@
 from source.tablero import Tablero
 from source.gestor_turnos import GestorTurnos
 from source.validador_movimientos import ValidadorMovimientos
+from source.resultado_validacion import MotivoRechazo, ResultadoValidacion
 import unittest
 
 class TestValidadorMovimientos(unittest.TestCase):
@@ -154,4 +155,56 @@ class TestValidadorMovimientos(unittest.TestCase):
         
         es_valido, mensaje = self.__validador__.validar_entrada_barra(6)
         self.assertFalse(es_valido)
-        self.assertIn("bloqueada", mensaje.lower())
\ No newline at end of file
+        self.assertIn("bloqueada", mensaje.lower())
+
+
+class TestValidadorCodigos(unittest.TestCase):
+    """Tests para los códigos de rechazo estructurados"""
+
+    def setUp(self):
+        self.__tablero__ = Tablero()
+        self.__validador__ = ValidadorMovimientos(self.__tablero__, GestorTurnos())
+
+    def test_valido_sin_motivo(self):
+        """Verifica que un movimiento válido tiene motivo NINGUNO y mensaje vacío"""
+        resultado = self.__validador__.validar_movimiento(0, 3)
+        self.assertIsInstance(resultado, ResultadoValidacion)
+        self.assertTrue(resultado.valido)
+        self.assertIs(resultado.motivo, MotivoRechazo.NINGUNO)
+        self.assertEqual(resultado.mensaje, "")
+
+    def test_codigos_de_movimiento(self):
+        """Verifica los códigos de origen inválido, destino bloqueado y fichas fuera del home"""
+        self.assertIs(self.__validador__.validar_movimiento(1, 3).motivo,
+                      MotivoRechazo.ORIGEN_INVALIDO)
+        self.assertIs(self.__validador__.validar_movimiento(0, 5).motivo,
+                      MotivoRechazo.DESTINO_BLOQUEADO)
+        self.assertIs(self.__validador__.validar_movimiento(18, 6).motivo,
+                      MotivoRechazo.NO_TODAS_EN_HOME)
+
+    def test_codigos_de_bear_off(self):
+        """Verifica que sacar con un dado mayor exige que no haya fichas más adelantadas"""
+        posiciones = self.__tablero__._obtener_posiciones_ref()
+        for i in range(18):
+            if posiciones[i] > 0:
+                posiciones[i] = 0
+        posiciones[20] = 1
+        posiciones[22] = 1
+        self.assertIs(self.__validador__.validar_movimiento(20, 6).motivo,
+                      MotivoRechazo.FICHA_MAS_ADELANTADA)
+        self.assertIs(self.__validador__.validar_movimiento(18, 6).motivo,
+                      MotivoRechazo.NINGUNO)
+
+    def test_codigos_de_entrada(self):
+        """Verifica los códigos de entrada bloqueada y de dado inválido desde la barra"""
+        self.__tablero__._obtener_barra_ref()['blancas'] = 1
+        self.__tablero__._obtener_posiciones_ref()[5] = -2
+        self.assertIs(self.__validador__.validar_entrada_barra(6).motivo,
+                      MotivoRechazo.ENTRADA_BLOQUEADA)
+        self.assertIs(self.__validador__.validar_entrada_barra(7).motivo,
+                      MotivoRechazo.DADO_INVALIDO)
+
+    def test_motivo_se_muestra_como_texto(self):
+        """Verifica que str y format de un motivo muestran su mensaje"""
+        self.assertEqual(str(MotivoRechazo.DESTINO_BLOQUEADO), "posición de destino bloqueada")
+        self.assertEqual(f"{MotivoRechazo.ORIGEN_INVALIDO}", "origen inválido o sin fichas propias")
@@ -0,0 +1,54 @@
+import unittest
+from source.zobrist import Zobrist, ZOBRIST
+from source.tablero import Tablero
+
+
+class TestZobrist(unittest.TestCase):
+    """Tests para las claves Zobrist"""
+
+    def setUp(self):
+        self.tablero = Tablero()
+
+    def _calcular(self, zobrist, direccion=1):
+        return zobrist.calcular(self.tablero.obtener_posiciones(),
+                                self.tablero.obtener_barra(),
+                                self.tablero.obtener_fichas_fuera(),
+                                direccion)
+
+    def test_deterministico_entre_instancias(self):
+        """Verifica que la misma semilla genere el mismo hash"""
+        self.assertEqual(self._calcular(Zobrist()), self._calcular(ZOBRIST))
+
+    def test_semilla_distinta_cambia_hash(self):
+        """Verifica que otra semilla produzca otras claves"""
+        self.assertNotEqual(self._calcular(Zobrist(semilla=1)), self._calcular(ZOBRIST))
+
+    def test_clave_de_valor_cero_es_neutra(self):
+        """Verifica que casilleros vacíos y contadores en cero no aporten"""
+        self.assertEqual(ZOBRIST.clave_casillero(4, 0), 0)
+        self.assertEqual(ZOBRIST.clave_barra('blancas', 0), 0)
+        self.assertEqual(ZOBRIST.clave_fuera('negras', 0), 0)
+        self.assertEqual(ZOBRIST.clave_turno(1), 0)
+
+    def test_claves_de_64_bits(self):
+        """Verifica el rango de las claves"""
+        clave = self._calcular(ZOBRIST, -1)
+        self.assertTrue(0 <= clave < 2 ** 64)
+        self.assertNotEqual(ZOBRIST.clave_turno(-1), 0)
+
+    def test_valores_fuera_de_rango(self):
+        """Verifica que valores fuera de -15..15 tengan clave estable"""
+        self.assertEqual(ZOBRIST.clave_casillero(0, 99), ZOBRIST.clave_casillero(0, 99))
+        self.assertNotEqual(ZOBRIST.clave_casillero(0, 99), ZOBRIST.clave_casillero(0, 98))
+        self.assertEqual(ZOBRIST.clave_barra('negras', 20), ZOBRIST.clave_barra('negras', 20))
+        self.assertEqual(ZOBRIST.clave_fuera('blancas', 16), ZOBRIST.clave_fuera('blancas', 16))
+
+    def test_posiciones_distintas_hash_distinto(self):
+        """Verifica que un cambio en un casillero altere el hash"""
+        antes = self._calcular(ZOBRIST)
+        self.tablero._obtener_posiciones_ref()[1] = 1
+        self.assertNotEqual(self._calcular(ZOBRIST), antes)
+
+
+if __name__ == '__main__':
+    unittest.main()